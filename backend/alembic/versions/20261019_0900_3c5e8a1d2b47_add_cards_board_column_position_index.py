@@ -0,0 +1,28 @@
+"""Add composite index for per-column card pagination
+
+Revision ID: 3c5e8a1d2b47
+Revises: 9f081ea649fe
+Create Date: 2026-10-19 09:00:00.000000
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = '3c5e8a1d2b47'
+down_revision = '9f081ea649fe'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        'ix_cards_board_column_position',
+        'cards',
+        ['board_id', 'column_id', 'position', 'id'],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_cards_board_column_position', table_name='cards')
@@ -0,0 +1,27 @@
+"""Add version columns to cards and boards for optimistic concurrency
+
+Revision ID: 5d7f9b2c4e61
+Revises: 3c5e8a1d2b47
+Create Date: 2026-10-19 10:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '5d7f9b2c4e61'
+down_revision = '3c5e8a1d2b47'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # A constant server default lets Postgres add the columns without a table rewrite
+    op.add_column('cards', sa.Column('version', sa.Integer(), server_default='1', nullable=False))
+    op.add_column('boards', sa.Column('version', sa.Integer(), server_default='1', nullable=False))
+
+
+def downgrade() -> None:
+    op.drop_column('boards', 'version')
+    op.drop_column('cards', 'version')
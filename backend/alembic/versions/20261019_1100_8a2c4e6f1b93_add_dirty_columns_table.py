@@ -0,0 +1,34 @@
+"""Add dirty_columns table for incremental card position repair
+
+Revision ID: 8a2c4e6f1b93
+Revises: 5d7f9b2c4e61
+Create Date: 2026-10-19 11:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision = '8a2c4e6f1b93'
+down_revision = '5d7f9b2c4e61'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'dirty_columns',
+        sa.Column('board_id', postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column('column_id', postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column('marked_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+        sa.ForeignKeyConstraint(['board_id'], ['boards.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('board_id', 'column_id'),
+    )
+    op.create_index(op.f('ix_dirty_columns_marked_at'), 'dirty_columns', ['marked_at'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index(op.f('ix_dirty_columns_marked_at'), table_name='dirty_columns')
+    op.drop_table('dirty_columns')
@@ -0,0 +1,43 @@
+"""Add deleted_at to boards and workspaces for soft delete
+
+Revision ID: b4e1d7a9c352
+Revises: 8a2c4e6f1b93
+Create Date: 2026-10-19 12:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'b4e1d7a9c352'
+down_revision = '8a2c4e6f1b93'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column('boards', sa.Column('deleted_at', sa.DateTime(timezone=True), nullable=True))
+    op.add_column('workspaces', sa.Column('deleted_at', sa.DateTime(timezone=True), nullable=True))
+    # Partial indexes: only rows waiting to be purged are indexed
+    op.create_index(
+        'ix_boards_deleted_at',
+        'boards',
+        ['deleted_at'],
+        unique=False,
+        postgresql_where=sa.text('deleted_at IS NOT NULL'),
+    )
+    op.create_index(
+        'ix_workspaces_deleted_at',
+        'workspaces',
+        ['deleted_at'],
+        unique=False,
+        postgresql_where=sa.text('deleted_at IS NOT NULL'),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_workspaces_deleted_at', table_name='workspaces')
+    op.drop_index('ix_boards_deleted_at', table_name='boards')
+    op.drop_column('workspaces', 'deleted_at')
+    op.drop_column('boards', 'deleted_at')
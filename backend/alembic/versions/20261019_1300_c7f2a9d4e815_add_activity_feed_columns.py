@@ -0,0 +1,80 @@
+"""Add board/workspace scope and feed indexes to card_activities
+
+Revision ID: c7f2a9d4e815
+Revises: b4e1d7a9c352
+Create Date: 2026-10-19 13:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision = 'c7f2a9d4e815'
+down_revision = 'b4e1d7a9c352'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column('card_activities', sa.Column('board_id', postgresql.UUID(as_uuid=True), nullable=True))
+    op.add_column('card_activities', sa.Column('workspace_id', postgresql.UUID(as_uuid=True), nullable=True))
+    op.execute(
+        """
+        UPDATE card_activities AS a
+        SET board_id = b.id, workspace_id = b.workspace_id
+        FROM cards AS c
+        JOIN boards AS b ON b.id = c.board_id
+        WHERE c.id = a.card_id
+        """
+    )
+    op.alter_column('card_activities', 'board_id', nullable=False)
+    op.alter_column('card_activities', 'workspace_id', nullable=False)
+    op.create_foreign_key(
+        'card_activities_board_id_fkey', 'card_activities', 'boards',
+        ['board_id'], ['id'], ondelete='CASCADE',
+    )
+    op.create_foreign_key(
+        'card_activities_workspace_id_fkey', 'card_activities', 'workspaces',
+        ['workspace_id'], ['id'], ondelete='CASCADE',
+    )
+
+    # Keep history when a card is deleted
+    op.drop_constraint('card_activities_card_id_fkey', 'card_activities', type_='foreignkey')
+    op.alter_column('card_activities', 'card_id', nullable=True)
+    op.create_foreign_key(
+        'card_activities_card_id_fkey', 'card_activities', 'cards',
+        ['card_id'], ['id'], ondelete='SET NULL',
+    )
+
+    op.drop_index('ix_card_activities_card_id', table_name='card_activities')
+    op.create_index(
+        'ix_card_activities_card_created', 'card_activities',
+        ['card_id', sa.text('created_at DESC'), sa.text('id DESC')], unique=False,
+    )
+    op.create_index(
+        'ix_card_activities_workspace_created', 'card_activities',
+        ['workspace_id', sa.text('created_at DESC'), sa.text('id DESC')], unique=False,
+    )
+    op.create_index(op.f('ix_card_activities_board_id'), 'card_activities', ['board_id'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index(op.f('ix_card_activities_board_id'), table_name='card_activities')
+    op.drop_index('ix_card_activities_workspace_created', table_name='card_activities')
+    op.drop_index('ix_card_activities_card_created', table_name='card_activities')
+    op.create_index('ix_card_activities_card_id', 'card_activities', ['card_id'], unique=False)
+
+    op.execute("DELETE FROM card_activities WHERE card_id IS NULL")
+    op.drop_constraint('card_activities_card_id_fkey', 'card_activities', type_='foreignkey')
+    op.alter_column('card_activities', 'card_id', nullable=False)
+    op.create_foreign_key(
+        'card_activities_card_id_fkey', 'card_activities', 'cards',
+        ['card_id'], ['id'], ondelete='CASCADE',
+    )
+
+    op.drop_constraint('card_activities_workspace_id_fkey', 'card_activities', type_='foreignkey')
+    op.drop_constraint('card_activities_board_id_fkey', 'card_activities', type_='foreignkey')
+    op.drop_column('card_activities', 'workspace_id')
+    op.drop_column('card_activities', 'board_id')
@@ -0,0 +1,200 @@
+"""Partition card_activities and workspace_audit_logs by month and add workspace retention
+
+Revision ID: e3b8d1f6a274
+Revises: c7f2a9d4e815
+Create Date: 2026-10-19 14:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'e3b8d1f6a274'
+down_revision = 'c7f2a9d4e815'
+branch_labels = None
+depends_on = None
+
+# Months created ahead of the current one (PARTITION_PREMAKE_MONTHS at the time)
+PREMAKE_MONTHS = 3
+
+CARD_ACTIVITIES_COLUMNS = """
+    id UUID NOT NULL,
+    card_id UUID,
+    board_id UUID NOT NULL,
+    workspace_id UUID NOT NULL,
+    user_id UUID,
+    action VARCHAR(50) NOT NULL,
+    activity_metadata JSONB NOT NULL,
+    created_at TIMESTAMP WITH TIME ZONE DEFAULT now() NOT NULL,
+    CONSTRAINT card_activities_card_id_fkey FOREIGN KEY (card_id)
+        REFERENCES cards (id) ON DELETE SET NULL,
+    CONSTRAINT card_activities_board_id_fkey FOREIGN KEY (board_id)
+        REFERENCES boards (id) ON DELETE CASCADE,
+    CONSTRAINT card_activities_workspace_id_fkey FOREIGN KEY (workspace_id)
+        REFERENCES workspaces (id) ON DELETE CASCADE,
+    CONSTRAINT card_activities_user_id_fkey FOREIGN KEY (user_id)
+        REFERENCES users (id) ON DELETE SET NULL
+"""
+
+AUDIT_LOGS_COLUMNS = """
+    id UUID NOT NULL,
+    workspace_id UUID NOT NULL,
+    actor_id UUID NOT NULL,
+    action auditactionenum NOT NULL,
+    resource_type VARCHAR(50) NOT NULL,
+    resource_id UUID NOT NULL,
+    context_data JSONB,
+    created_at TIMESTAMP WITH TIME ZONE DEFAULT now() NOT NULL,
+    CONSTRAINT workspace_audit_logs_workspace_id_fkey FOREIGN KEY (workspace_id)
+        REFERENCES workspaces (id) ON DELETE CASCADE,
+    CONSTRAINT workspace_audit_logs_actor_id_fkey FOREIGN KEY (actor_id)
+        REFERENCES users (id)
+"""
+
+CARD_ACTIVITIES_INDEXES = [
+    "CREATE INDEX ix_card_activities_id ON card_activities (id)",
+    "CREATE INDEX ix_card_activities_user_id ON card_activities (user_id)",
+    "CREATE INDEX ix_card_activities_board_id ON card_activities (board_id)",
+    "CREATE INDEX ix_card_activities_card_created "
+    "ON card_activities (card_id, created_at DESC, id DESC)",
+    "CREATE INDEX ix_card_activities_workspace_created "
+    "ON card_activities (workspace_id, created_at DESC, id DESC)",
+]
+
+AUDIT_LOGS_INDEXES = [
+    "CREATE INDEX ix_workspace_audit_logs_actor_id ON workspace_audit_logs (actor_id)",
+    "CREATE INDEX ix_workspace_audit_logs_created_at ON workspace_audit_logs (created_at)",
+    "CREATE INDEX ix_workspace_audit_logs_action ON workspace_audit_logs (action)",
+]
+
+
+CARD_ACTIVITIES_COPY = (
+    "id, card_id, board_id, workspace_id, user_id, action, activity_metadata, created_at"
+)
+
+AUDIT_LOGS_COPY = (
+    "id, workspace_id, actor_id, action, resource_type, resource_id, context_data, created_at"
+)
+
+
+def _index_names(statements: list[str]) -> list[str]:
+    return [statement.split()[2] for statement in statements]
+
+
+def _create_monthly_partitions(table: str, source: str) -> None:
+    """Create a partition for every month from the oldest row in source until PREMAKE_MONTHS ahead."""
+    op.execute(
+        f"""
+        DO $$
+        DECLARE
+            bound date;
+        BEGIN
+            FOR bound IN
+                SELECT generate_series(
+                    date_trunc('month', COALESCE(
+                        (SELECT min(created_at) FROM {source}), now()
+                    ) AT TIME ZONE 'UTC'),
+                    date_trunc('month', now() AT TIME ZONE 'UTC')
+                        + interval '{PREMAKE_MONTHS} months',
+                    interval '1 month'
+                )::date
+            LOOP
+                EXECUTE format(
+                    'CREATE TABLE %I PARTITION OF {table} FOR VALUES FROM (%L) TO (%L)',
+                    '{table}_p' || to_char(bound, 'YYYYMM'),
+                    bound || ' 00:00:00+00',
+                    (bound + interval '1 month')::date || ' 00:00:00+00'
+                );
+            END LOOP;
+        END $$
+        """
+    )
+
+
+def _swap_table(
+    table: str,
+    columns: str,
+    copy: str,
+    indexes: list[str],
+    old_indexes: list[str],
+    partitioned: bool,
+) -> None:
+    """Rebuild table with the given layout, copying its rows across."""
+    old = f"{table}_old"
+    op.execute(f"ALTER TABLE {table} RENAME TO {old}")
+    op.execute(f"ALTER TABLE {old} RENAME CONSTRAINT {table}_pkey TO {old}_pkey")
+    for index in old_indexes:
+        op.execute(f"DROP INDEX {index}")
+
+    if partitioned:
+        op.execute(
+            f"CREATE TABLE {table} ({columns}, "
+            f"CONSTRAINT {table}_pkey PRIMARY KEY (id, created_at)) "
+            f"PARTITION BY RANGE (created_at)"
+        )
+        _create_monthly_partitions(table, old)
+        # Catches rows of months maintain_history_partitions hasn't created yet
+        op.execute(f"CREATE TABLE {table}_default PARTITION OF {table} DEFAULT")
+    else:
+        op.execute(
+            f"CREATE TABLE {table} ({columns}, CONSTRAINT {table}_pkey PRIMARY KEY (id))"
+        )
+
+    op.execute(f"INSERT INTO {table} ({copy}) SELECT {copy} FROM {old}")
+    op.execute(f"DROP TABLE {old}")
+    for statement in indexes:
+        op.execute(statement)
+
+
+def upgrade() -> None:
+    op.add_column('workspaces', sa.Column('retention_days', sa.Integer(), nullable=True))
+
+    _swap_table(
+        'card_activities',
+        CARD_ACTIVITIES_COLUMNS,
+        CARD_ACTIVITIES_COPY,
+        CARD_ACTIVITIES_INDEXES,
+        _index_names(CARD_ACTIVITIES_INDEXES),
+        partitioned=True,
+    )
+
+    # created_at joins the primary key, so it can no longer be NULL
+    op.execute("UPDATE workspace_audit_logs SET created_at = now() WHERE created_at IS NULL")
+    _swap_table(
+        'workspace_audit_logs',
+        AUDIT_LOGS_COLUMNS,
+        AUDIT_LOGS_COPY,
+        AUDIT_LOGS_INDEXES
+        + [
+            "CREATE INDEX ix_workspace_audit_logs_workspace_created "
+            "ON workspace_audit_logs (workspace_id, created_at DESC)"
+        ],
+        _index_names(AUDIT_LOGS_INDEXES) + ['ix_workspace_audit_logs_workspace_id'],
+        partitioned=True,
+    )
+
+
+def downgrade() -> None:
+    _swap_table(
+        'workspace_audit_logs',
+        AUDIT_LOGS_COLUMNS,
+        AUDIT_LOGS_COPY,
+        AUDIT_LOGS_INDEXES
+        + [
+            "CREATE INDEX ix_workspace_audit_logs_workspace_id "
+            "ON workspace_audit_logs (workspace_id)"
+        ],
+        _index_names(AUDIT_LOGS_INDEXES) + ['ix_workspace_audit_logs_workspace_created'],
+        partitioned=False,
+    )
+    _swap_table(
+        'card_activities',
+        CARD_ACTIVITIES_COLUMNS,
+        CARD_ACTIVITIES_COPY,
+        CARD_ACTIVITIES_INDEXES,
+        _index_names(CARD_ACTIVITIES_INDEXES),
+        partitioned=False,
+    )
+
+    op.drop_column('workspaces', 'retention_days')
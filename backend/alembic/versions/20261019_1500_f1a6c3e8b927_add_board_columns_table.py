@@ -0,0 +1,133 @@
+"""Add board_columns with card counts and WIP limits, referenced by cards
+
+Revision ID: f1a6c3e8b927
+Revises: e3b8d1f6a274
+Create Date: 2026-10-19 15:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision = 'f1a6c3e8b927'
+down_revision = 'e3b8d1f6a274'
+branch_labels = None
+depends_on = None
+
+UUID_PATTERN = '^[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}$'
+
+
+def upgrade() -> None:
+    op.create_table(
+        'board_columns',
+        sa.Column('board_id', postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column('id', postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column('name', sa.String(length=100), nullable=False),
+        sa.Column('position', sa.Integer(), nullable=False),
+        sa.Column('wip_limit', sa.Integer(), nullable=True),
+        sa.Column('card_count', sa.Integer(), server_default='0', nullable=False),
+        sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+        sa.ForeignKeyConstraint(['board_id'], ['boards.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('board_id', 'id'),
+    )
+
+    # Column ids become keys: give ids that aren't UUIDs, and repeats of an
+    # id within a board, fresh ones. No card can reference either.
+    op.execute(
+        f"""
+        WITH elements AS (
+            SELECT b.id AS board_id, e.ord, e.col,
+                   e.col->>'id' ~* '{UUID_PATTERN}' AS valid,
+                   row_number() OVER (
+                       PARTITION BY b.id, lower(e.col->>'id') ORDER BY e.ord
+                   ) AS seen
+            FROM boards AS b
+            CROSS JOIN LATERAL jsonb_array_elements(b.columns) WITH ORDINALITY AS e(col, ord)
+        ),
+        fixed AS (
+            SELECT board_id,
+                   jsonb_agg(
+                       col || jsonb_build_object(
+                           'id',
+                           CASE WHEN valid AND seen = 1 THEN lower(col->>'id')
+                                ELSE gen_random_uuid()::text END
+                       )
+                       ORDER BY ord
+                   ) AS columns
+            FROM elements
+            GROUP BY board_id
+            HAVING bool_or(NOT valid OR seen > 1)
+        )
+        UPDATE boards SET columns = fixed.columns
+        FROM fixed
+        WHERE boards.id = fixed.board_id
+        """
+    )
+    op.execute(
+        """
+        INSERT INTO board_columns (board_id, id, name, position)
+        SELECT b.id, (e.col->>'id')::uuid, left(coalesce(e.col->>'name', ''), 100), e.ord - 1
+        FROM boards AS b
+        CROSS JOIN LATERAL jsonb_array_elements(b.columns) WITH ORDINALITY AS e(col, ord)
+        """
+    )
+
+    # Cards left in columns an earlier update removed were invisible; append
+    # a "Recovered" column for each such id so they show up again
+    op.execute(
+        """
+        WITH orphans AS (
+            SELECT DISTINCT c.board_id, c.column_id
+            FROM cards AS c
+            WHERE NOT EXISTS (
+                SELECT 1 FROM board_columns AS bc
+                WHERE bc.board_id = c.board_id AND bc.id = c.column_id
+            )
+        ),
+        recovered AS (
+            INSERT INTO board_columns (board_id, id, name, position)
+            SELECT o.board_id, o.column_id, 'Recovered',
+                   jsonb_array_length(b.columns)
+                   + row_number() OVER (PARTITION BY o.board_id ORDER BY o.column_id) - 1
+            FROM orphans AS o
+            JOIN boards AS b ON b.id = o.board_id
+            RETURNING board_id, id, name, position
+        )
+        UPDATE boards SET columns = boards.columns || added.columns
+        FROM (
+            SELECT board_id,
+                   jsonb_agg(
+                       jsonb_build_object('id', id::text, 'name', name, 'position', position)
+                       ORDER BY position
+                   ) AS columns
+            FROM recovered
+            GROUP BY board_id
+        ) AS added
+        WHERE boards.id = added.board_id
+        """
+    )
+
+    op.execute(
+        """
+        UPDATE board_columns AS bc SET card_count = c.card_count
+        FROM (
+            SELECT board_id, column_id, count(*) AS card_count
+            FROM cards
+            GROUP BY board_id, column_id
+        ) AS c
+        WHERE bc.board_id = c.board_id AND bc.id = c.column_id
+        """
+    )
+
+    op.create_foreign_key(
+        'fk_cards_board_column', 'cards', 'board_columns',
+        ['board_id', 'column_id'], ['board_id', 'id'],
+    )
+
+
+def downgrade() -> None:
+    # Normalized ids and recovered columns stay in boards.columns
+    op.drop_constraint('fk_cards_board_column', 'cards', type_='foreignkey')
+    op.drop_table('board_columns')
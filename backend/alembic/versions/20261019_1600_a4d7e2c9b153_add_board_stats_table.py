@@ -0,0 +1,54 @@
+"""Add board_stats with maintained card, story point and overdue totals
+
+Revision ID: a4d7e2c9b153
+Revises: f1a6c3e8b927
+Create Date: 2026-10-19 16:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision = 'a4d7e2c9b153'
+down_revision = 'f1a6c3e8b927'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'board_stats',
+        sa.Column('board_id', postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column('card_count', sa.Integer(), server_default='0', nullable=False),
+        sa.Column('story_points', sa.Integer(), server_default='0', nullable=False),
+        sa.Column('overdue_count', sa.Integer(), server_default='0', nullable=False),
+        sa.Column('overdue_as_of', sa.Date(), server_default=sa.text('CURRENT_DATE'), nullable=False),
+        sa.Column('reconciled_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+        sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+        sa.ForeignKeyConstraint(['board_id'], ['boards.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('board_id'),
+    )
+    op.create_index(
+        'ix_cards_board_due_date', 'cards', ['board_id', 'due_date'],
+        postgresql_where=sa.text('due_date IS NOT NULL'),
+    )
+
+    op.execute(
+        """
+        INSERT INTO board_stats (board_id, card_count, story_points, overdue_count)
+        SELECT b.id,
+               count(c.id),
+               coalesce(sum(c.story_points), 0),
+               count(c.id) FILTER (WHERE c.due_date < CURRENT_DATE)
+        FROM boards AS b
+        LEFT JOIN cards AS c ON c.board_id = b.id
+        GROUP BY b.id
+        """
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_cards_board_due_date', table_name='cards')
+    op.drop_table('board_stats')
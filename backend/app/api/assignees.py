@@ -6,15 +6,49 @@ from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.api.dependencies import get_current_user
+from app.api.responses import bulk_relation_error
 from app.core.database import get_db
 from app.models.user import User
-from app.schemas.assignee import AssigneeRequest
+from app.schemas.assignee import AssigneeRequest, BulkCardAssigneesRequest
+from app.schemas.card import BulkRelationUpdateResponse
 from app.schemas.user import UserResponse
 from app.services.assignee_service import AssigneeService
 
 router = APIRouter(prefix="/api/cards", tags=["assignees"])
 
 
+# Must be registered before /{card_id}/assignees so "bulk" is not parsed as a card ID
+@router.post("/bulk/assignees", response_model=BulkRelationUpdateResponse)
+async def bulk_update_card_assignees(
+    data: BulkCardAssigneesRequest,
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db),
+) -> BulkRelationUpdateResponse:
+    """
+    Assign and/or unassign users on many cards at once.
+
+    Args:
+        data: Card IDs plus user IDs to add and remove
+        current_user: Current authenticated user
+        db: Database session
+
+    Returns:
+        Number of cards touched and assignments added/removed
+
+    Raises:
+        HTTPException: 404 if a card is not found, 403 if user is not a workspace
+                       member, 400 if cards span workspaces or an assignee is not
+                       a member, 422 if a user is both added and removed
+    """
+    service = AssigneeService(db)
+    try:
+        return await service.bulk_update_card_assignees(
+            data.card_ids, data.add, data.remove, current_user.id
+        )
+    except (LookupError, ValueError, PermissionError) as e:
+        raise bulk_relation_error(e) from e
+
+
 @router.post("/{card_id}/assignees", response_model=UserResponse)
 async def assign_user_to_card(
     card_id: UUID,
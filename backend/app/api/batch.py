@@ -0,0 +1,180 @@
+"""Batch API endpoint running several reads in one round-trip."""
+
+import asyncio
+from urllib.parse import unquote
+
+import orjson
+import structlog
+from fastapi import APIRouter, Depends, Request, Response
+from sqlalchemy.ext.asyncio import AsyncSession
+from starlette.types import Message, Scope
+
+from app.api.dependencies import get_current_user
+from app.api.responses import json_response
+from app.core.config import settings
+from app.core.database import get_db
+from app.models.user import User
+from app.schemas.batch import BatchRequest, BatchResponse, BatchSubRequest
+
+logger = structlog.get_logger(__name__)
+
+router = APIRouter(prefix="/api", tags=["batch"])
+
+# Request headers a sub-request doesn't inherit from the batch: its body is
+# empty, and its response is embedded rather than compressed
+_DROPPED_HEADERS = {b"content-length", b"content-type", b"accept-encoding", b"if-match"}
+
+# Response headers copied into each sub-response
+_KEPT_HEADERS = ("content-type", "etag")
+
+
+@router.post("/batch", response_model=BatchResponse)
+async def run_batch(
+    data: BatchRequest,
+    request: Request,
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db),
+) -> Response:
+    """
+    Run several GET requests against existing routes in one round-trip.
+
+    Each sub-request goes through the application like a request of its
+    own (middleware, validation, permission checks) and runs
+    concurrently with the others, up to BATCH_MAX_CONCURRENCY at a time.
+    The batch is authenticated once: sub-requests reuse its user instead
+    of verifying the token again. Each sub-request reads through its own
+    database session, since one session can't serve concurrent queries.
+
+    A failing sub-request only fails its own entry, which carries the
+    status and body the route answered with.
+
+    Args:
+        data: Sub-requests to run
+        request: Incoming batch request
+        current_user: Current authenticated user
+        db: Database session the batch was authenticated with
+
+    Returns:
+        Sub-responses in request order
+
+    Raises:
+        HTTPException: 401 if not authenticated, 422 if a sub-request isn't
+                      a GET under /api/
+    """
+    logger.info(
+        "batch.run.start",
+        request_count=len(data.requests),
+        user_id=str(current_user.id),
+    )
+    # Hand the authentication query's connection back before the
+    # sub-requests check out theirs
+    await db.commit()
+    semaphore = asyncio.Semaphore(settings.BATCH_MAX_CONCURRENCY)
+
+    async def run(sub_request: BatchSubRequest) -> bytes:
+        async with semaphore:
+            status_code, headers, body = await _dispatch(request, sub_request, current_user)
+        content_type = headers.get("content-type", "")
+        if not body:
+            encoded_body = b"null"
+        elif content_type.startswith("application/json"):
+            encoded_body = body
+        else:
+            encoded_body = orjson.dumps(body.decode(errors="replace"))
+        envelope = orjson.dumps(
+            {
+                "id": sub_request.id,
+                "status": status_code,
+                "headers": {name: headers[name] for name in _KEPT_HEADERS if name in headers},
+            }
+        )
+        # The sub-response body is already encoded JSON; splice it in as is
+        return envelope[:-1] + b',"body":' + encoded_body + b"}"
+
+    responses = await asyncio.gather(*(run(sub_request) for sub_request in data.requests))
+
+    logger.info("batch.run.success", request_count=len(responses))
+    return json_response(b'{"responses":[' + b",".join(responses) + b"]}")
+
+
+async def _dispatch(
+    request: Request, sub_request: BatchSubRequest, user: User
+) -> tuple[int, dict[str, str], bytes]:
+    """
+    Run one sub-request through the application and collect its response.
+
+    Args:
+        request: Batch request whose connection details are reused
+        sub_request: Sub-request to run
+        user: Principal the batch was authenticated as
+
+    Returns:
+        Status code, response headers (lowercased) and body
+    """
+    path, _, query = sub_request.path.partition("?")
+    if path.rstrip("/") == "/api/batch":
+        error = orjson.dumps({"detail": "Batches can't be nested"})
+        return 400, {"content-type": "application/json"}, error
+
+    scope: Scope = {
+        "type": "http",
+        "asgi": request.scope.get("asgi", {"version": "3.0"}),
+        "http_version": request.scope.get("http_version", "1.1"),
+        "method": sub_request.method,
+        "scheme": request.scope.get("scheme", "http"),
+        "server": request.scope.get("server"),
+        "client": request.scope.get("client"),
+        "root_path": request.scope.get("root_path", ""),
+        "path": unquote(path),
+        "raw_path": path.encode(),
+        "query_string": query.encode(),
+        "headers": [
+            (name, value)
+            for name, value in request.scope["headers"]
+            if name not in _DROPPED_HEADERS
+        ],
+        "state": {"batch_principal": user},
+    }
+
+    status_code = 500
+    headers: dict[str, str] = {}
+    chunks: list[bytes] = []
+    request_sent = False
+    response_complete = asyncio.Event()
+
+    async def receive() -> Message:
+        nonlocal request_sent
+        if not request_sent:
+            request_sent = True
+            return {"type": "http.request", "body": b"", "more_body": False}
+        # Nothing more to read: report a disconnect only once the response is done
+        await response_complete.wait()
+        return {"type": "http.disconnect"}
+
+    async def send(message: Message) -> None:
+        nonlocal status_code
+        if message["type"] == "http.response.start":
+            status_code = message["status"]
+            headers.update(
+                (name.decode("latin-1").lower(), value.decode("latin-1"))
+                for name, value in message.get("headers", [])
+            )
+        elif message["type"] == "http.response.body":
+            chunks.append(message.get("body", b""))
+            if not message.get("more_body", False):
+                response_complete.set()
+
+    try:
+        await request.app(scope, receive, send)
+    except Exception as e:
+        # The error middleware has already sent its 500 response
+        logger.error(
+            "batch.dispatch.failed",
+            path=path,
+            error=str(e),
+            error_type=type(e).__name__,
+        )
+        status_code = 500
+    finally:
+        response_complete.set()
+    return status_code, headers, b"".join(chunks)
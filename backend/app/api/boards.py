@@ -1,24 +1,41 @@
 """Board API endpoints for managing boards and columns."""
 
+from collections.abc import AsyncIterator
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, Query, status
+from fastapi import APIRouter, Depends, Query, Response, status
+from fastapi.responses import StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
+from starlette.concurrency import run_in_threadpool
 
-from app.api.dependencies import get_current_user
-from app.core.database import get_db
+from app.api.dependencies import get_current_user, get_if_match_version
+from app.api.responses import embed_json, json_response, model_response, version_etag
+from app.core.database import AsyncSessionLocal, get_db
+from app.models.board import Board
 from app.models.user import User
 from app.schemas.board import (
     BoardCreate,
     BoardDetailResponse,
     BoardResponse,
+    BoardStatsResponse,
     BoardUpdate,
 )
 from app.services.board_service import BoardService
+from app.services.card_export_service import CardExportService, ExportFormat
+from app.services.label_service import LabelService
+from app.tasks.purge_deleted import enqueue_purge, purge_board
 
 router = APIRouter(prefix="/api", tags=["boards"])
 
 
+def _board_response(board: Board, counts: dict[UUID, int]) -> BoardResponse:
+    """Build a board response carrying each column's live card count."""
+    board_response = BoardResponse.model_validate(board)
+    for column in board_response.columns:
+        column.card_count = counts.get(UUID(column.id), 0)
+    return board_response
+
+
 @router.post(
     "/workspaces/{workspace_id}/boards",
     response_model=BoardResponse,
@@ -62,7 +79,7 @@ async def list_workspace_boards(
     include_archived: bool = Query(default=False),
     current_user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
-) -> list[BoardResponse]:
+) -> Response:
     """
     List all boards in workspace.
 
@@ -84,20 +101,29 @@ async def list_workspace_boards(
         user_id=current_user.id,
         include_archived=include_archived,
     )
-    return [BoardResponse.model_validate(b) for b in boards]
+    counts = await service.get_column_card_counts([b.id for b in boards])
+    return model_response([_board_response(b, counts.get(b.id, {})) for b in boards])
 
 
 @router.get("/boards/{board_id}", response_model=BoardResponse)
 async def get_board(
     board_id: UUID,
+    response: Response,
+    include_labels: bool = Query(False, description="Embed the workspace's labels"),
     current_user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
-) -> BoardResponse:
+) -> BoardResponse | Response:
     """
-    Get board details with columns.
+    Get board details with columns and their card counts.
+
+    With include_labels, the workspace's cached label catalog is spliced
+    into the encoded board as "labels", so the board page needs no
+    separate labels request.
 
     Args:
         board_id: UUID of board
+        response: Outgoing response (carries the ETag)
+        include_labels: Add the workspace's labels to the response
         current_user: Current authenticated user
         db: Database session
 
@@ -110,13 +136,140 @@ async def get_board(
     """
     service = BoardService(db)
     board = await service.get_board_by_id(board_id=board_id, user_id=current_user.id)
-    return BoardResponse.model_validate(board)
+    counts = await service.get_column_card_counts([board.id])
+    board_response = _board_response(board, counts.get(board.id, {}))
+    etag = version_etag(board.version)
+    if include_labels:
+        labels = await LabelService(db).get_label_catalog(board.workspace_id)
+        body = model_response(board_response).body
+        return json_response(embed_json(body, labels=labels), headers={"ETag": etag})
+    response.headers["ETag"] = etag
+    return board_response
+
+
+@router.get("/boards/{board_id}/stats", response_model=BoardStatsResponse)
+async def get_board_stats(
+    board_id: UUID,
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db),
+) -> BoardStatsResponse:
+    """
+    Get a board's card, story point and overdue totals.
+
+    Args:
+        board_id: UUID of board
+        current_user: Current authenticated user
+        db: Database session
+
+    Returns:
+        Board totals and the card count of each column
+
+    Raises:
+        HTTPException: 401 if not authenticated, 403 if not workspace member,
+                      404 if board not found
+    """
+    service = BoardService(db)
+    stats = await service.get_board_stats(board_id=board_id, user_id=current_user.id)
+    return BoardStatsResponse(**stats)
+
+
+def _export_response(
+    board_id: UUID,
+    board_columns: list[dict],
+    export_format: ExportFormat,
+    filename: str,
+    sprint_id: UUID | None = None,
+) -> StreamingResponse:
+    """
+    Build a streaming export response backed by its own database session.
+
+    The request session is closed before a streamed body is sent, so the
+    server-side cursor runs on a session owned by the body iterator.
+    """
+
+    async def body() -> AsyncIterator[bytes]:
+        async with AsyncSessionLocal() as session:
+            service = CardExportService(session)
+            async for chunk in service.stream_export(
+                board_id, board_columns, export_format, sprint_id=sprint_id
+            ):
+                yield chunk
+
+    return StreamingResponse(
+        body(),
+        media_type=export_format.media_type,
+        headers={
+            "Content-Disposition": f'attachment; filename="{filename}.{export_format.value}"'
+        },
+    )
+
+
+@router.get("/boards/{board_id}/export", response_class=StreamingResponse)
+async def export_board(
+    board_id: UUID,
+    export_format: ExportFormat = Query(ExportFormat.CSV, alias="format"),
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db),
+) -> StreamingResponse:
+    """
+    Export every card on a board as CSV or NDJSON.
+
+    Rows include status (column name), sprint, assignees and labels and are
+    streamed from a server-side cursor, so large boards are never held in
+    memory.
+
+    Args:
+        board_id: UUID of board
+        export_format: "csv" (default) or "ndjson"
+        current_user: Current authenticated user
+        db: Database session
+
+    Returns:
+        Streaming attachment ordered by column, then position
+
+    Raises:
+        HTTPException: 401 if not authenticated, 403 if not workspace member,
+                      404 if board not found
+    """
+    board = await CardExportService(db).get_board(board_id, current_user.id)
+    return _export_response(board.id, board.columns, export_format, f"board-{board.id}")
+
+
+@router.get("/sprints/{sprint_id}/export", response_class=StreamingResponse)
+async def export_sprint(
+    sprint_id: UUID,
+    export_format: ExportFormat = Query(ExportFormat.CSV, alias="format"),
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db),
+) -> StreamingResponse:
+    """
+    Export a sprint plan (the sprint's cards) as CSV or NDJSON.
+
+    Args:
+        sprint_id: UUID of sprint
+        export_format: "csv" (default) or "ndjson"
+        current_user: Current authenticated user
+        db: Database session
+
+    Returns:
+        Streaming attachment with the same fields as the board export
+
+    Raises:
+        HTTPException: 401 if not authenticated, 403 if not workspace member,
+                      404 if sprint not found
+    """
+    sprint, board = await CardExportService(db).get_sprint(sprint_id, current_user.id)
+    return _export_response(
+        board.id, board.columns, export_format, f"sprint-{sprint.id}", sprint_id=sprint.id
+    )
 
 
 @router.patch("/boards/{board_id}", response_model=BoardResponse)
 async def update_board(
     board_id: UUID,
     data: BoardUpdate,
+    response: Response,
+    expected_version: int | None = Depends(get_if_match_version),
     current_user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
 ) -> BoardResponse:
@@ -126,6 +279,8 @@ async def update_board(
     Args:
         board_id: UUID of board to update
         data: Update data
+        response: Outgoing response (carries the new ETag)
+        expected_version: Version required by the If-Match header
         current_user: Current authenticated user
         db: Database session
 
@@ -135,7 +290,8 @@ async def update_board(
     Raises:
         HTTPException: 401 if not authenticated, 403 if not workspace member
                       (or not admin for archiving), 404 if board not found,
-                      400 if invalid column structure
+                      400 if invalid column structure, 409 if a removed
+                      column still has cards, 412 if If-Match is stale
     """
     service = BoardService(db)
     board = await service.update_board(
@@ -144,27 +300,38 @@ async def update_board(
         name=data.name,
         columns=[c.model_dump() for c in data.columns] if data.columns else None,
         archived=data.archived,
+        expected_version=expected_version,
     )
-    return BoardResponse.model_validate(board)
+    counts = await service.get_column_card_counts([board.id])
+    response.headers["ETag"] = version_etag(board.version)
+    return _board_response(board, counts.get(board.id, {}))
 
 
 @router.delete("/boards/{board_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_board(
     board_id: UUID,
+    expected_version: int | None = Depends(get_if_match_version),
     current_user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
 ) -> None:
     """
-    Delete board and all its cards (cascade).
+    Delete board.
+
+    The board disappears immediately; its cards are purged in the
+    background.
 
     Args:
         board_id: UUID of board to delete
+        expected_version: Version required by the If-Match header
         current_user: Current authenticated user
         db: Database session
 
     Raises:
         HTTPException: 401 if not authenticated, 403 if not workspace admin,
-                      404 if board not found
+                      404 if board not found, 412 if If-Match is stale
     """
     service = BoardService(db)
-    await service.delete_board(board_id=board_id, user_id=current_user.id)
+    await service.delete_board(
+        board_id=board_id, user_id=current_user.id, expected_version=expected_version
+    )
+    await run_in_threadpool(enqueue_purge, purge_board, board_id)
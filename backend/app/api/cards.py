@@ -2,25 +2,47 @@
 
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, Query, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
+from redis.asyncio import Redis
 from sqlalchemy.ext.asyncio import AsyncSession
+from starlette.concurrency import run_in_threadpool
 
-from app.api.dependencies import get_current_user
+from app.api.coalescing import coalesced_response
+from app.api.dependencies import get_current_user, get_if_match_version
+from app.api.responses import model_response, version_etag
+from app.core.cache import get_redis
 from app.core.database import get_db
+from app.core.single_flight import board_cards_flight, board_scope, workspace_scope
 from app.models.user import User
+from app.schemas.activity import ActivityPageResponse, ActivityResponse
 from app.schemas.card import (
+    BoardCardsWindowResponse,
+    BulkCardEditRequest,
+    BulkCardEditResponse,
     BulkCardMoveRequest,
     CardCreate,
     CardDetailResponse,
+    CardImportResponse,
+    CardImportStatusResponse,
+    CardLookupResponse,
     CardMoveRequest,
+    CardMultiGetResponse,
+    CardPageResponse,
     CardResponse,
     CardUpdate,
 )
+from app.services.activity_service import ActivityService
+from app.services.board_service import BoardService
+from app.services.card_import_service import CardImportService
 from app.services.card_movement_service import CardMovementService
 from app.services.card_service import CardService
+from app.tasks.import_cards import import_cards
 
 router = APIRouter(prefix="/api", tags=["cards"])
 
+# Most card ids one multi-get accepts (keeps the URL under common 8 KB limits)
+MAX_MULTI_GET_IDS = 200
+
 
 @router.post(
     "/boards/{board_id}/cards",
@@ -30,6 +52,7 @@ router = APIRouter(prefix="/api", tags=["cards"])
 async def create_card(
     board_id: UUID,
     data: CardCreate,
+    response: Response,
     current_user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
 ) -> CardResponse:
@@ -39,6 +62,7 @@ async def create_card(
     Args:
         board_id: UUID of board to create card in
         data: Card creation data (title, column_id)
+        response: Outgoing response (carries the ETag)
         current_user: Current authenticated user
         db: Database session
 
@@ -56,21 +80,125 @@ async def create_card(
         title=data.title,
         user_id=current_user.id,
     )
+    response.headers["ETag"] = version_etag(card.version)
     return CardResponse.model_validate(card)
 
 
+@router.post(
+    "/boards/{board_id}/cards/import",
+    response_model=CardImportResponse,
+    status_code=status.HTTP_202_ACCEPTED,
+)
+async def import_board_cards(
+    board_id: UUID,
+    request: Request,
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db),
+    redis: Redis = Depends(get_redis),
+) -> CardImportResponse:
+    """
+    Import cards from an NDJSON or CSV body.
+
+    The body is validated as it streams in and staged in Redis; a Celery task
+    then inserts every row in one transaction, appending to the end of each
+    column. Fields: title (required), description, column (id or name;
+    defaults to the first column), priority, story_points, due_date. CSV
+    bodies need a header row.
+
+    No websocket event announces the new cards: clients poll the status
+    endpoint and reload the board once the task succeeds.
+
+    Args:
+        board_id: UUID of board to import into
+        request: Incoming request (Content-Type application/x-ndjson or text/csv)
+        current_user: Current authenticated user
+        db: Database session
+        redis: Redis client for staging rows
+
+    Returns:
+        Task ID to poll for progress and the number of rows accepted
+
+    Raises:
+        HTTPException: 401 if not authenticated, 403 if not workspace member,
+                      404 if board not found, 415 if unsupported content type,
+                      400 if no rows, 422 with per-line errors if rows are invalid
+    """
+    service = CardImportService(db)
+    task_id, total_rows = await service.stage_import(
+        board_id=board_id,
+        user_id=current_user.id,
+        content_type=request.headers.get("content-type"),
+        stream=request.stream(),
+        redis=redis,
+    )
+    await run_in_threadpool(
+        import_cards.apply_async,
+        args=[str(board_id), str(current_user.id), total_rows],
+        task_id=task_id,
+    )
+    return CardImportResponse(task_id=task_id, total_rows=total_rows)
+
+
+@router.get("/boards/{board_id}/cards/import/{task_id}", response_model=CardImportStatusResponse)
+async def get_card_import_status(
+    board_id: UUID,
+    task_id: UUID,
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db),
+) -> CardImportStatusResponse:
+    """
+    Report progress of a card import.
+
+    Args:
+        board_id: UUID of board the import targets
+        task_id: Task ID returned by the import endpoint
+        current_user: Current authenticated user
+        db: Database session
+
+    Returns:
+        Celery state with processed/total row counts
+
+    Raises:
+        HTTPException: 401 if not authenticated, 403 if not workspace member,
+                      404 if board not found
+    """
+    await CardImportService(db).get_board(board_id, current_user.id)
+
+    def read_result() -> tuple[str, object]:
+        result = import_cards.AsyncResult(str(task_id))
+        return result.state, result.info
+
+    state, info = await run_in_threadpool(read_result)
+    response = CardImportStatusResponse(task_id=str(task_id), state=state)
+    if isinstance(info, dict):
+        response.processed = info.get("processed", 0)
+        response.total = info.get("total")
+    elif isinstance(info, Exception):
+        response.error = str(info)
+    return response
+
+
 @router.get("/boards/{board_id}/cards", response_model=list[CardResponse])
 async def list_board_cards(
     board_id: UUID,
+    request: Request,
     column_id: UUID | None = Query(default=None),
     current_user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
-) -> list[CardResponse]:
+) -> Response:
     """
     List all cards in board, optionally filtered by column.
 
+    The JSON document is assembled by Postgres (see
+    CardService.build_board_cards_json) and returned as-is; response_model
+    is kept for the OpenAPI schema only. Once the caller's membership is
+    checked, concurrent requests for the same board and column share one
+    query (see coalesced_response); card, assignee and label writes detach
+    it through invalidate_board_cards.
+
     Args:
         board_id: UUID of board
+        request: Incoming request
         column_id: Optional UUID to filter by column
         current_user: Current authenticated user
         db: Database session
@@ -78,20 +206,171 @@ async def list_board_cards(
     Returns:
         List of cards ordered by position ascending
 
+    Raises:
+        HTTPException: 401 if not authenticated, 403 if not workspace member,
+                      404 if board not found
+    """
+    board = await BoardService(db).get_board_by_id(board_id, current_user.id)
+
+    async def compute() -> Response:
+        payload = await CardService(db).build_board_cards_json(board_id, column_id)
+        return Response(content=payload, media_type="application/json")
+
+    return await coalesced_response(
+        request,
+        board_cards_flight,
+        auth_scope=workspace_scope(board.workspace_id),
+        compute=compute,
+        scopes=(board_scope(board_id), workspace_scope(board.workspace_id)),
+    )
+
+
+@router.get("/boards/{board_id}/cards/windowed", response_model=BoardCardsWindowResponse)
+async def list_board_cards_windowed(
+    board_id: UUID,
+    limit: int = Query(default=50, ge=1, le=200),
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db),
+) -> Response:
+    """
+    List the first page of cards for every column of a board.
+
+    Args:
+        board_id: UUID of board
+        limit: Maximum number of cards per column (1-200)
+        current_user: Current authenticated user
+        db: Database session
+
+    Returns:
+        One page per column with a cursor for loading more
+
     Raises:
         HTTPException: 401 if not authenticated, 403 if not workspace member,
                       404 if board not found
     """
     service = CardService(db)
-    cards = await service.get_board_cards(
-        board_id=board_id, user_id=current_user.id, column_id=column_id
+    pages = await service.get_board_cards_window(
+        board_id=board_id, user_id=current_user.id, limit=limit
+    )
+    return model_response(
+        BoardCardsWindowResponse(
+            board_id=board_id,
+            columns=[
+                CardPageResponse(
+                    column_id=page.column_id,
+                    cards=[CardResponse.model_validate(c) for c in page.cards],
+                    next_cursor=page.next_cursor,
+                )
+                for page in pages
+            ],
+        )
+    )
+
+
+@router.get("/boards/{board_id}/columns/{column_id}/cards", response_model=CardPageResponse)
+async def list_column_cards(
+    board_id: UUID,
+    column_id: UUID,
+    cursor: str | None = Query(default=None),
+    limit: int = Query(default=50, ge=1, le=200),
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db),
+) -> Response:
+    """
+    Load the next page of cards in a column ("load more").
+
+    Args:
+        board_id: UUID of board
+        column_id: UUID of column
+        cursor: Cursor returned by the previous page
+        limit: Maximum number of cards to return (1-200)
+        current_user: Current authenticated user
+        db: Database session
+
+    Returns:
+        Page of cards ordered by position with cursor for the next page
+
+    Raises:
+        HTTPException: 401 if not authenticated, 403 if not workspace member,
+                      404 if board or column not found, 400 if cursor is invalid
+    """
+    service = CardService(db)
+    page = await service.get_column_cards_page(
+        board_id=board_id,
+        column_id=column_id,
+        user_id=current_user.id,
+        limit=limit,
+        cursor=cursor,
+    )
+    return model_response(
+        CardPageResponse(
+            column_id=page.column_id,
+            cards=[CardResponse.model_validate(c) for c in page.cards],
+            next_cursor=page.next_cursor,
+        )
+    )
+
+
+@router.get("/cards", response_model=CardMultiGetResponse)
+async def get_cards(
+    ids: list[str] = Query(..., description="Card ids, comma-separated or repeated"),
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db),
+) -> Response:
+    """
+    Get many cards by id in one request.
+
+    Meant for clients resolving the card ids carried by WebSocket events.
+    Each id gets its own entry, in request order: the card, or the 403/404
+    GET /cards/{id} would have returned for it.
+
+    Args:
+        ids: Card UUIDs (up to MAX_MULTI_GET_IDS)
+        current_user: Current authenticated user
+        db: Database session
+
+    Returns:
+        One lookup result per distinct id
+
+    Raises:
+        HTTPException: 401 if not authenticated, 400 if an id is not a UUID
+                      or too many ids are given
+    """
+    try:
+        card_ids = [
+            UUID(part.strip()) for value in ids for part in value.split(",") if part.strip()
+        ]
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST, detail="Card ids must be UUIDs"
+        ) from e
+    if not card_ids or len(set(card_ids)) > MAX_MULTI_GET_IDS:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Provide between 1 and {MAX_MULTI_GET_IDS} card ids",
+        )
+
+    service = CardService(db)
+    lookups = await service.get_cards_by_ids(card_ids=card_ids, user_id=current_user.id)
+    return model_response(
+        CardMultiGetResponse(
+            cards=[
+                CardLookupResponse(
+                    id=lookup.id,
+                    status=lookup.status_code,
+                    card=CardResponse.model_validate(lookup.card) if lookup.card else None,
+                    detail=lookup.detail,
+                )
+                for lookup in lookups
+            ]
+        )
     )
-    return [CardResponse.model_validate(c) for c in cards]
 
 
 @router.get("/cards/{card_id}", response_model=CardDetailResponse)
 async def get_card(
     card_id: UUID,
+    response: Response,
     current_user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
 ) -> CardDetailResponse:
@@ -100,6 +379,7 @@ async def get_card(
 
     Args:
         card_id: UUID of card
+        response: Outgoing response (carries the ETag)
         current_user: Current authenticated user
         db: Database session
 
@@ -112,9 +392,47 @@ async def get_card(
     """
     service = CardService(db)
     card = await service.get_card_by_id(card_id=card_id, user_id=current_user.id)
+    response.headers["ETag"] = version_etag(card.version)
     return CardDetailResponse.model_validate(card)
 
 
+@router.get("/cards/{card_id}/activity", response_model=ActivityPageResponse)
+async def get_card_activity(
+    card_id: UUID,
+    cursor: str | None = Query(default=None),
+    limit: int = Query(default=50, ge=1, le=200),
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db),
+) -> Response:
+    """
+    Get a card's activity history, newest first.
+
+    Args:
+        card_id: UUID of card
+        cursor: Cursor returned by the previous page
+        limit: Maximum number of activities to return (1-200)
+        current_user: Current authenticated user
+        db: Database session
+
+    Returns:
+        Page of activities with cursor for the next page
+
+    Raises:
+        HTTPException: 401 if not authenticated, 403 if not workspace member,
+                      404 if card not found, 400 if cursor is invalid
+    """
+    service = ActivityService(db)
+    page = await service.get_card_activity(
+        card_id=card_id, user_id=current_user.id, limit=limit, cursor=cursor
+    )
+    return model_response(
+        ActivityPageResponse(
+            activities=[ActivityResponse.model_validate(a) for a in page.activities],
+            next_cursor=page.next_cursor,
+        )
+    )
+
+
 @router.patch("/cards/bulk-move", response_model=list[CardResponse])
 async def bulk_move_cards(
     data: BulkCardMoveRequest,
@@ -146,19 +464,55 @@ async def bulk_move_cards(
     return [CardResponse.model_validate(c) for c in cards]
 
 
+@router.patch("/cards/bulk", response_model=BulkCardEditResponse)
+async def bulk_edit_cards(
+    data: BulkCardEditRequest,
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db),
+) -> BulkCardEditResponse:
+    """
+    Apply the same edits to many cards at once.
+
+    Supports title prefix/suffix, description append, setting priority,
+    setting or adjusting story points and setting or offsetting due dates.
+
+    Args:
+        data: Card IDs and edits to apply
+        current_user: Current authenticated user
+        db: Database session
+
+    Returns:
+        Number and IDs of updated cards
+
+    Raises:
+        HTTPException: 401 if not authenticated, 403 if not workspace member,
+                      404 if any card not found, 422 if edits are invalid
+    """
+    service = CardService(db)
+    card_ids = await service.bulk_update_cards(data=data, user_id=current_user.id)
+    return BulkCardEditResponse(updated=len(card_ids), card_ids=card_ids)
+
+
 @router.patch("/cards/{card_id}", response_model=CardResponse)
 async def update_card(
     card_id: UUID,
     data: CardUpdate,
+    response: Response,
+    expected_version: int | None = Depends(get_if_match_version),
     current_user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
 ) -> CardResponse:
     """
     Update card properties.
 
+    Send the card's ETag as If-Match to have the update rejected if someone
+    else changed the card in the meantime.
+
     Args:
         card_id: UUID of card to update
         data: Update data (title, description, priority, due_date, story_points)
+        response: Outgoing response (carries the new ETag)
+        expected_version: Version required by the If-Match header
         current_user: Current authenticated user
         db: Database session
 
@@ -167,20 +521,26 @@ async def update_card(
 
     Raises:
         HTTPException: 401 if not authenticated, 403 if not workspace member,
-                      404 if card not found, 422 if validation fails
+                      404 if card not found, 412 if If-Match is stale,
+                      422 if validation fails
     """
     service = CardService(db)
     # Filter out None values (don't update fields not provided)
     updates = {k: v for k, v in data.model_dump().items() if v is not None}
     card = await service.update_card(
-        card_id=card_id, user_id=current_user.id, updates=updates
+        card_id=card_id,
+        user_id=current_user.id,
+        updates=updates,
+        expected_version=expected_version,
     )
+    response.headers["ETag"] = version_etag(card.version)
     return CardResponse.model_validate(card)
 
 
 @router.delete("/cards/{card_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_card(
     card_id: UUID,
+    expected_version: int | None = Depends(get_if_match_version),
     current_user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
 ) -> None:
@@ -189,21 +549,26 @@ async def delete_card(
 
     Args:
         card_id: UUID of card to delete
+        expected_version: Version required by the If-Match header
         current_user: Current authenticated user
         db: Database session
 
     Raises:
         HTTPException: 401 if not authenticated, 403 if not workspace member,
-                      404 if card not found
+                      404 if card not found, 412 if If-Match is stale
     """
     service = CardService(db)
-    await service.delete_card(card_id=card_id, user_id=current_user.id)
+    await service.delete_card(
+        card_id=card_id, user_id=current_user.id, expected_version=expected_version
+    )
 
 
 @router.patch("/cards/{card_id}/move", response_model=CardResponse)
 async def move_card(
     card_id: UUID,
     data: CardMoveRequest,
+    response: Response,
+    expected_version: int | None = Depends(get_if_match_version),
     current_user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
 ) -> CardResponse:
@@ -213,6 +578,8 @@ async def move_card(
     Args:
         card_id: UUID of card to move
         data: Move request data (column_id, position)
+        response: Outgoing response (carries the new ETag)
+        expected_version: Version required by the If-Match header
         current_user: Current authenticated user
         db: Database session
 
@@ -221,7 +588,8 @@ async def move_card(
 
     Raises:
         HTTPException: 401 if not authenticated, 403 if not workspace member,
-                      404 if card not found, 400 if board is archived or column invalid
+                      404 if card not found, 400 if board is archived or column invalid,
+                      412 if If-Match is stale
     """
     service = CardMovementService(db)
     card = await service.move_card(
@@ -229,5 +597,7 @@ async def move_card(
         target_column_id=data.column_id,
         target_position=data.position,
         moved_by=current_user.id,
+        expected_version=expected_version,
     )
+    response.headers["ETag"] = version_etag(card.version)
     return CardResponse.model_validate(card)
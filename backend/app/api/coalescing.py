@@ -0,0 +1,55 @@
+"""Opt-in request coalescing for idempotent GET routes."""
+
+from collections.abc import Awaitable, Callable, Iterable
+
+from fastapi import Request, Response
+
+from app.core.single_flight import SingleFlight
+
+
+async def coalesced_response(
+    request: Request,
+    flight: SingleFlight,
+    auth_scope: str,
+    compute: Callable[[], Awaitable[Response]],
+    scopes: Iterable[str] = (),
+) -> Response:
+    """
+    Serve a GET route's response, sharing it with identical concurrent requests.
+
+    Routes opt in by returning through this helper once the caller's
+    permissions are checked. Requests with the same route, path and query
+    parameters and authorization scope share one computation of the
+    response and its encoded body; each caller gets its own Response
+    carrying them, so middleware can still set headers per request.
+    Nothing is kept once the computation finishes, and writers detach
+    running computations with flight.invalidate().
+
+    Args:
+        request: Incoming request
+        flight: Group the route's computations run in
+        auth_scope: What the caller was authorized for (e.g. a workspace
+            membership); requests only share responses within it
+        compute: Coroutine function building the response (not streaming)
+        scopes: Scopes whose writes change the response (see SingleFlight)
+
+    Returns:
+        Response for this caller
+    """
+    route = request.scope.get("route")
+    key = (
+        request.method,
+        getattr(route, "path", request.url.path),
+        tuple(sorted(request.path_params.items())),
+        tuple(sorted(request.query_params.multi_items())),
+        auth_scope,
+    )
+
+    async def encode() -> tuple[int, list[tuple[bytes, bytes]], bytes]:
+        response = await compute()
+        return response.status_code, response.raw_headers, response.body
+
+    status_code, raw_headers, body = await flight.run(key, encode, scopes)
+    response = Response(content=body, status_code=status_code)
+    response.raw_headers = list(raw_headers)
+    return response
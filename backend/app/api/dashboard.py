@@ -0,0 +1,38 @@
+"""Dashboard API endpoint summarizing the user's workspaces."""
+
+from fastapi import APIRouter, Depends, Response
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.api.dependencies import get_current_user
+from app.api.responses import model_response
+from app.core.database import get_db
+from app.models.user import User
+from app.schemas.dashboard import DashboardResponse
+from app.services.dashboard_service import DashboardService
+
+router = APIRouter(prefix="/api", tags=["dashboard"])
+
+
+@router.get("/dashboard", response_model=DashboardResponse)
+async def get_dashboard(
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db),
+) -> Response:
+    """
+    Summarize every workspace of the current user in one request.
+
+    Each workspace carries its board and member counts, its active boards
+    with per-column card counts, and its last activity.
+
+    Args:
+        current_user: Current authenticated user
+        db: Database session
+
+    Returns:
+        Workspace summaries, most recently updated first
+
+    Raises:
+        HTTPException: 401 if not authenticated
+    """
+    workspaces = await DashboardService(db).get_dashboard(current_user.id)
+    return model_response(DashboardResponse(workspaces=workspaces))
@@ -2,7 +2,7 @@
 
 from uuid import UUID
 
-from fastapi import Depends, HTTPException, status
+from fastapi import Depends, Header, HTTPException, Request, status
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -15,6 +15,7 @@ security = HTTPBearer(auto_error=False)
 
 
 async def get_current_user(
+    request: Request,
     credentials: HTTPAuthorizationCredentials | None = Depends(security),
     db: AsyncSession = Depends(get_db),
 ) -> User:
@@ -22,9 +23,11 @@ async def get_current_user(
     Get current authenticated user from JWT token.
 
     This dependency extracts and validates the JWT token from the
-    Authorization header, then returns the associated user.
+    Authorization header, then returns the associated user. Sub-requests
+    of POST /api/batch reuse the user the batch was authenticated as.
 
     Args:
+        request: Incoming request
         credentials: HTTP Bearer credentials from Authorization header
         db: Database session
 
@@ -34,6 +37,10 @@ async def get_current_user(
     Raises:
         HTTPException: 401 if token is missing, invalid, expired, or user not found
     """
+    principal = getattr(request.state, "batch_principal", None)
+    if principal is not None:
+        return principal
+
     if not credentials:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -107,6 +114,37 @@ async def get_current_user_optional(
         return None
 
 
+async def get_if_match_version(
+    if_match: str | None = Header(default=None),
+) -> int | None:
+    """
+    Parse an If-Match header into the resource version it requires.
+
+    Versions are sent as ETags of the form "<version>". Weak tags
+    (W/"<version>") are accepted too, since the compression middleware
+    weakens ETags on compressed responses.
+
+    Args:
+        if_match: Raw If-Match header value
+
+    Returns:
+        Required version, or None when the header is absent or "*"
+
+    Raises:
+        HTTPException: 412 if the header is not a single version ETag
+    """
+    if if_match is None or if_match.strip() == "*":
+        return None
+
+    tag = if_match.strip().removeprefix("W/")
+    if len(tag) < 3 or not (tag[0] == tag[-1] == '"') or not tag[1:-1].isdigit():
+        raise HTTPException(
+            status_code=status.HTTP_412_PRECONDITION_FAILED,
+            detail="If-Match must be a single ETag returned by this API",
+        )
+    return int(tag[1:-1])
+
+
 async def check_workspace_admin(
     workspace_id: UUID,
     current_user: User = Depends(get_current_user),
@@ -4,8 +4,9 @@ from fastapi import APIRouter, Depends
 from sqlalchemy import text
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.core.cache import get_redis
+from app.core.cache import cache_stats, get_redis
 from app.core.database import get_db
+from app.core.single_flight import single_flight_stats
 
 router = APIRouter()
 
@@ -46,3 +47,25 @@ async def health_check(
 
     health_status["services"] = services
     return health_status
+
+
+@router.get("/health/cache")
+async def cache_health() -> dict[str, dict[str, int]]:
+    """
+    Hit/miss counters of this process's caches.
+
+    Returns:
+        dict: Counters per cache namespace
+    """
+    return cache_stats()
+
+
+@router.get("/health/single-flight")
+async def single_flight_health() -> dict[str, dict[str, int]]:
+    """
+    Coalescing counters of this process's single-flight groups.
+
+    Returns:
+        dict: Counters per group
+    """
+    return single_flight_stats()
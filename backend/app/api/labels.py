@@ -2,13 +2,21 @@
 
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Response, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.api.dependencies import get_current_user
+from app.api.responses import bulk_relation_error, json_response
 from app.core.database import get_db
 from app.models.user import User
-from app.schemas.label import LabelAssignRequest, LabelCreate, LabelResponse, LabelUpdate
+from app.schemas.card import BulkRelationUpdateResponse
+from app.schemas.label import (
+    BulkCardLabelsRequest,
+    LabelAssignRequest,
+    LabelCreate,
+    LabelResponse,
+    LabelUpdate,
+)
 from app.services.label_service import LabelService
 
 router = APIRouter(prefix="/api", tags=["labels"])
@@ -19,7 +27,7 @@ async def list_workspace_labels(
     workspace_id: UUID,
     current_user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
-) -> list[LabelResponse]:
+) -> Response:
     """
     List all labels for a workspace.
 
@@ -36,9 +44,10 @@ async def list_workspace_labels(
     """
     service = LabelService(db)
     try:
-        return await service.get_workspace_labels(workspace_id, current_user.id)
+        labels = await service.get_workspace_labels_json(workspace_id, current_user.id)
     except PermissionError as e:
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail=str(e))
+    return json_response(labels)
 
 
 @router.post(
@@ -138,6 +147,38 @@ async def delete_label(
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail=str(e))
 
 
+# Must be registered before /cards/{card_id}/labels so "bulk" is not parsed as a card ID
+@router.post("/cards/bulk/labels", response_model=BulkRelationUpdateResponse)
+async def bulk_update_card_labels(
+    data: BulkCardLabelsRequest,
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db),
+) -> BulkRelationUpdateResponse:
+    """
+    Add and/or remove labels on many cards at once.
+
+    Args:
+        data: Card IDs plus label IDs to add and remove
+        current_user: Current authenticated user
+        db: Database session
+
+    Returns:
+        Number of cards touched and links added/removed
+
+    Raises:
+        HTTPException: 404 if a card or label is not found, 403 if user is not a
+                       workspace member, 400 if cards span workspaces,
+                       422 if a label is both added and removed
+    """
+    service = LabelService(db)
+    try:
+        return await service.bulk_update_card_labels(
+            data.card_ids, data.add, data.remove, current_user.id
+        )
+    except (LookupError, ValueError, PermissionError) as e:
+        raise bulk_relation_error(e) from e
+
+
 @router.post("/cards/{card_id}/labels", response_model=LabelResponse)
 async def add_label_to_card(
     card_id: UUID,
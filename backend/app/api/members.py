@@ -4,17 +4,18 @@ from datetime import datetime
 from uuid import UUID
 
 import structlog
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Response, status
 from pydantic import BaseModel
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.api.dependencies import get_current_user
+from app.api.responses import model_response
 from app.core.database import get_db
 from app.models.user import User
 from app.models.workspace_audit_log import AuditActionEnum
 from app.models.workspace_member import RoleEnum
 from app.services.audit_service import AuditService
-from app.services.workspace_service import WorkspaceService
+from app.services.workspace_service import WorkspaceService, invalidate_membership
 
 logger = structlog.get_logger(__name__)
 
@@ -48,7 +49,7 @@ async def list_workspace_members(
     search: str | None = None,
     current_user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
-) -> list[MemberResponse]:
+) -> Response:
     """
     List workspace members with pagination and search.
 
@@ -117,7 +118,7 @@ async def list_workspace_members(
             )
         )
 
-    return members
+    return model_response(members)
 
 
 @router.patch("/api/workspaces/{workspace_id}/members/{user_id}")
@@ -211,6 +212,7 @@ async def update_member_role(
         .values(role=data.role)
     )
     await db.commit()
+    await invalidate_membership(workspace_id, user_id)
 
     # Audit log
     audit_service = AuditService(db)
@@ -365,6 +367,7 @@ async def remove_member(
         )
     )
     await db.commit()
+    await invalidate_membership(workspace_id, user_id)
 
     # Audit log
     audit_service = AuditService(db)
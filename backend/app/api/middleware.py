@@ -1,12 +1,25 @@
-"""API middleware for correlation tracking and request context."""
+"""API middleware for correlation tracking, request context and compression."""
 
 import time
 import uuid
+import zlib
 from collections.abc import Callable
 
 import structlog
 from fastapi import Request, Response
+from starlette.datastructures import Headers, MutableHeaders
 from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+try:
+    import brotli
+except ImportError:  # pragma: no cover - optional "compression" extra
+    brotli = None
+
+try:
+    import zstandard
+except ImportError:  # pragma: no cover - optional "compression" extra
+    zstandard = None
 
 logger = structlog.get_logger(__name__)
 
@@ -77,3 +90,242 @@ class CorrelationIDMiddleware(BaseHTTPMiddleware):
                 duration_ms=round(duration_ms, 2),
             )
             raise
+
+
+COMPRESSIBLE_CONTENT_TYPES = (
+    "application/json",
+    "application/x-ndjson",
+    "application/javascript",
+    "application/xml",
+    "image/svg+xml",
+    "text/",
+)
+
+
+class _GzipCompressor:
+    """Streaming gzip encoder (zlib with gzip framing)."""
+
+    def __init__(self, level: int) -> None:
+        self._compressor = zlib.compressobj(level, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+
+    def compress(self, data: bytes) -> bytes:
+        return self._compressor.compress(data)
+
+    def flush(self) -> bytes:
+        return self._compressor.flush(zlib.Z_SYNC_FLUSH)
+
+    def finish(self) -> bytes:
+        return self._compressor.flush(zlib.Z_FINISH)
+
+
+class _BrotliCompressor:
+    """Streaming brotli encoder."""
+
+    def __init__(self, quality: int) -> None:
+        self._compressor = brotli.Compressor(quality=quality, mode=brotli.MODE_TEXT)
+
+    def compress(self, data: bytes) -> bytes:
+        return self._compressor.process(data)
+
+    def flush(self) -> bytes:
+        return self._compressor.flush()
+
+    def finish(self) -> bytes:
+        return self._compressor.finish()
+
+
+class _ZstdCompressor:
+    """Streaming zstd encoder."""
+
+    def __init__(self, level: int) -> None:
+        self._compressor = zstandard.ZstdCompressor(level=level).compressobj()
+
+    def compress(self, data: bytes) -> bytes:
+        return self._compressor.compress(data)
+
+    def flush(self) -> bytes:
+        return self._compressor.flush(zstandard.COMPRESSOBJ_FLUSH_BLOCK)
+
+    def finish(self) -> bytes:
+        return self._compressor.flush(zstandard.COMPRESSOBJ_FLUSH_FINISH)
+
+
+_Compressor = _GzipCompressor | _BrotliCompressor | _ZstdCompressor
+
+
+class CompressionMiddleware:
+    """
+    Pure ASGI middleware negotiating zstd, brotli or gzip response compression.
+
+    This middleware:
+    - Picks the encoding from Accept-Encoding (q-values honoured), preferring
+      zstd, then br, then gzip; brotli/zstd are used only when installed
+    - Compresses only allowlisted content types at or above minimum_size
+    - Compresses body chunks as they are sent, flushing after each chunk of a
+      streaming response, so whole responses are never buffered
+    - Leaves responses alone that already carry Content-Encoding or
+      Cache-Control: no-transform
+    - Adds Vary: Accept-Encoding to every response it could have compressed,
+      compressed or not, so shared caches key them by Accept-Encoding
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        minimum_size: int = 1024,
+        gzip_level: int = 6,
+        brotli_quality: int = 4,
+        zstd_level: int = 3,
+    ) -> None:
+        """
+        Initialize compression middleware.
+
+        Args:
+            app: Wrapped ASGI application
+            minimum_size: Smallest body (bytes) worth compressing
+            gzip_level: zlib compression level (1-9)
+            brotli_quality: Brotli quality (0-11); low values suit dynamic content
+            zstd_level: Zstandard compression level
+        """
+        self.app = app
+        self.minimum_size = minimum_size
+        self._factories: dict[str, Callable[[], _Compressor]] = {}
+        if zstandard is not None:
+            self._factories["zstd"] = lambda: _ZstdCompressor(zstd_level)
+        if brotli is not None:
+            self._factories["br"] = lambda: _BrotliCompressor(brotli_quality)
+        self._factories["gzip"] = lambda: _GzipCompressor(gzip_level)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        encoding = self.select_encoding(Headers(scope=scope).get("accept-encoding", ""))
+        # Without an encoding the responder only adds Vary to eligible responses
+        factory = self._factories[encoding] if encoding is not None else None
+        responder = _CompressionResponder(send, encoding, factory, self.minimum_size)
+        await self.app(scope, receive, responder.send)
+
+    def select_encoding(self, accept_encoding: str) -> str | None:
+        """
+        Choose the best supported encoding for an Accept-Encoding header.
+
+        Args:
+            accept_encoding: Raw Accept-Encoding header value
+
+        Returns:
+            Encoding token, or None if the response should stay uncompressed
+        """
+        accepted: dict[str, float] = {}
+        for item in accept_encoding.split(","):
+            token, _, params = item.strip().partition(";")
+            token = token.strip().lower()
+            if not token:
+                continue
+            quality = 1.0
+            for param in params.split(";"):
+                name, _, value = param.strip().partition("=")
+                if name.strip().lower() == "q":
+                    try:
+                        quality = float(value)
+                    except ValueError:
+                        quality = 0.0
+            accepted[token] = quality
+
+        wildcard = accepted.get("*", 0.0)
+        best: str | None = None
+        best_quality = 0.0
+        # Server preference order breaks ties between equal q-values
+        for encoding in self._factories:
+            quality = accepted.get(encoding, wildcard)
+            if quality > best_quality:
+                best, best_quality = encoding, quality
+        return best
+
+
+class _CompressionResponder:
+    """Per-request send wrapper that compresses the response body on the fly."""
+
+    def __init__(
+        self,
+        send: Send,
+        encoding: str | None,
+        factory: Callable[[], _Compressor] | None,
+        minimum_size: int,
+    ) -> None:
+        self._send = send
+        self._encoding = encoding
+        self._factory = factory
+        self._minimum_size = minimum_size
+        self._start_message: Message | None = None
+        self._compressor: _Compressor | None = None
+        self._passthrough = False
+
+    async def send(self, message: Message) -> None:
+        if self._passthrough:
+            await self._send(message)
+            return
+
+        if message["type"] == "http.response.start":
+            self._start_message = message
+            headers = Headers(raw=message["headers"])
+            if not self._is_compressible(message["status"], headers):
+                await self._start_passthrough()
+                return
+            # Whether this response is compressed depends on Accept-Encoding
+            MutableHeaders(raw=message["headers"]).add_vary_header("Accept-Encoding")
+            if self._factory is None:
+                await self._start_passthrough()
+            return
+
+        if message["type"] != "http.response.body":
+            await self._send(message)
+            return
+
+        body = message.get("body", b"")
+        more_body = message.get("more_body", False)
+
+        if self._compressor is None:
+            if not more_body and len(body) < self._minimum_size:
+                await self._start_passthrough()
+                await self._send(message)
+                return
+
+            self._compressor = self._factory()
+            headers = MutableHeaders(raw=self._start_message["headers"])
+            headers["Content-Encoding"] = self._encoding
+            etag = headers.get("etag")
+            if etag and not etag.startswith("W/"):
+                # The encoded representation is no longer byte-identical
+                headers["ETag"] = f"W/{etag}"
+            if more_body:
+                del headers["Content-Length"]
+            else:
+                compressed = self._compressor.compress(body) + self._compressor.finish()
+                headers["Content-Length"] = str(len(compressed))
+                await self._send(self._start_message)
+                await self._send({"type": "http.response.body", "body": compressed})
+                return
+            await self._send(self._start_message)
+
+        if more_body:
+            chunk = self._compressor.compress(body) + self._compressor.flush()
+        else:
+            chunk = self._compressor.compress(body) + self._compressor.finish()
+        await self._send({"type": "http.response.body", "body": chunk, "more_body": more_body})
+
+    def _is_compressible(self, status_code: int, headers: Headers) -> bool:
+        if status_code < 200 or status_code in (204, 304):
+            return False
+        if "content-encoding" in headers:
+            return False
+        if "no-transform" in headers.get("cache-control", "").lower():
+            return False
+        content_type = headers.get("content-type", "").lower()
+        return content_type.startswith(COMPRESSIBLE_CONTENT_TYPES)
+
+    async def _start_passthrough(self) -> None:
+        self._passthrough = True
+        if self._start_message is not None:
+            await self._send(self._start_message)
@@ -0,0 +1,118 @@
+"""Response helpers for returning already-validated schema objects."""
+
+from collections.abc import Sequence
+from typing import Any
+from uuid import UUID
+
+import orjson
+from fastapi import HTTPException, Response, status
+from fastapi.responses import ORJSONResponse
+from pydantic import BaseModel
+
+
+def embed_json(document: bytes, **fields: bytes) -> bytes:
+    """
+    Add already-encoded fields to an encoded JSON object without re-encoding it.
+
+    Args:
+        document: Encoded JSON object
+        fields: Encoded JSON values, keyed by field name
+
+    Returns:
+        Encoded JSON object with the fields appended
+    """
+    members = b",".join(orjson.dumps(name) + b":" + value for name, value in fields.items())
+    if not members:
+        return document
+    separator = b"" if document.rstrip().endswith(b"{}") else b","
+    return document.rstrip()[:-1] + separator + members + b"}"
+
+
+def _encode_default(value: Any) -> Any:
+    """Encode values orjson rejects: UUID subclasses such as asyncpg's, read from the ORM."""
+    if isinstance(value, UUID):
+        return str(value)
+    raise TypeError
+
+
+class ORJSONModelResponse(ORJSONResponse):
+    """ORJSONResponse rendering UTC datetimes with a "Z" suffix, as Pydantic does."""
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(
+            content,
+            default=_encode_default,
+            option=orjson.OPT_NON_STR_KEYS | orjson.OPT_UTC_Z,
+        )
+
+
+def json_response(
+    body: bytes, status_code: int = status.HTTP_200_OK, headers: dict[str, str] | None = None
+) -> Response:
+    """
+    Send an already-encoded JSON body as is.
+
+    Args:
+        body: Encoded JSON
+        status_code: HTTP status code (default 200)
+        headers: Extra response headers
+
+    Returns:
+        Response carrying the body
+    """
+    return Response(
+        content=body, status_code=status_code, headers=headers, media_type="application/json"
+    )
+
+
+def version_etag(version: int) -> str:
+    """Format a resource version as the (strong) ETag clients echo in If-Match."""
+    return f'"{version}"'
+
+
+def model_response(
+    content: BaseModel | Sequence[BaseModel], status_code: int = status.HTTP_200_OK
+) -> ORJSONModelResponse:
+    """
+    Serialize response schema objects straight to an orjson-encoded response.
+
+    Returning a Response from a route makes FastAPI skip response_model
+    validation and jsonable_encoder, so handlers that already built the
+    declared schema objects avoid validating them a second time. Models are
+    dumped in python mode because orjson natively encodes UUID, datetime,
+    date and Enum values.
+
+    Args:
+        content: Schema instance or sequence of schema instances
+        status_code: HTTP status code (default 200)
+
+    Returns:
+        ORJSONModelResponse with the serialized content
+    """
+    if isinstance(content, BaseModel):
+        data = content.model_dump()
+    else:
+        data = [item.model_dump() for item in content]
+    return ORJSONModelResponse(content=data, status_code=status_code)
+
+
+def bulk_relation_error(error: LookupError | ValueError | PermissionError) -> HTTPException:
+    """
+    Map an error of a bulk label/assignee update to its HTTP status.
+
+    Both bulk endpoints answer the same way, by error type: 403 for a
+    PermissionError (the user isn't a workspace member), 404 for a
+    LookupError (a card or label doesn't exist) and 400 for any other
+    ValueError, such as cards spanning workspaces.
+
+    Args:
+        error: Error raised by LabelService or AssigneeService
+
+    Returns:
+        HTTPException to raise
+    """
+    if isinstance(error, PermissionError):
+        return HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail=str(error))
+    if isinstance(error, LookupError):
+        return HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(error))
+    return HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(error))
@@ -2,12 +2,15 @@
 
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
 from sqlalchemy.ext.asyncio import AsyncSession
+from starlette.concurrency import run_in_threadpool
 
 from app.api.dependencies import check_workspace_member, get_current_user
+from app.api.responses import model_response
 from app.core.database import get_db
 from app.models.user import User
+from app.schemas.activity import ActivityPageResponse, ActivityResponse
 from app.schemas.audit import AuditLogResponse
 from app.schemas.workspace import (
     WorkspaceCreate,
@@ -15,8 +18,11 @@ from app.schemas.workspace import (
     WorkspaceResponse,
     WorkspaceUpdate,
 )
+from app.services.activity_service import ActivityService
 from app.services.audit_service import AuditService
+from app.services.dashboard_service import DashboardService
 from app.services.workspace_service import WorkspaceService
+from app.tasks.purge_deleted import enqueue_purge, purge_workspace
 
 router = APIRouter(prefix="/api/workspaces", tags=["workspaces"])
 
@@ -79,6 +85,9 @@ async def get_workspace(
     """
     Get workspace details with boards and members.
 
+    Boards, with their per-column card counts, come from the cached
+    dashboard summary of the workspace.
+
     Args:
         workspace_id: UUID of workspace to retrieve
         current_user: Current authenticated user
@@ -99,10 +108,12 @@ async def get_workspace(
 
     # Get workspace members
     members = await service.get_workspace_members(workspace_id)
+    summaries = await DashboardService(db).get_workspace_summaries([workspace_id])
+    summary = summaries[str(workspace_id)]
 
-    # Convert workspace response to dict and populate members
+    # Convert workspace response to dict and populate boards and members
     response_data = WorkspaceResponse.model_validate(workspace).model_dump()
-    response_data["boards"] = []  # Will be populated in future stories
+    response_data["boards"] = summary["boards"] if summary else []
     response_data["members"] = [
         {
             "user_id": str(member.user_id),
@@ -151,7 +162,8 @@ async def delete_workspace(
     """
     Delete workspace and all boards/cards (admin only).
 
-    Cascade delete will remove all boards, cards, and memberships.
+    The workspace, its boards and memberships disappear immediately;
+    boards and cards are purged in the background.
 
     Args:
         workspace_id: UUID of workspace to delete
@@ -163,6 +175,7 @@ async def delete_workspace(
     """
     service = WorkspaceService(db)
     await service.delete_workspace(workspace_id, current_user.id)
+    await run_in_threadpool(enqueue_purge, purge_workspace, workspace_id)
 
 
 @router.get("/{workspace_id}/audit-logs", response_model=list[AuditLogResponse])
@@ -172,7 +185,7 @@ async def get_workspace_audit_logs(
     offset: int = 0,
     current_user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
-) -> list[AuditLogResponse]:
+) -> Response:
     """
     Get audit logs for workspace (admin only).
 
@@ -203,4 +216,41 @@ async def get_workspace_audit_logs(
     audit_service = AuditService(db)
     logs = await audit_service.get_workspace_audit_logs(workspace_id, limit, offset)
 
-    return [AuditLogResponse.model_validate(log) for log in logs]
+    return model_response([AuditLogResponse.model_validate(log) for log in logs])
+
+
+@router.get("/{workspace_id}/activity", response_model=ActivityPageResponse)
+async def get_workspace_activity(
+    workspace_id: UUID,
+    cursor: str | None = Query(default=None),
+    limit: int = Query(default=50, ge=1, le=200),
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db),
+) -> Response:
+    """
+    Get card activity across all boards of a workspace, newest first.
+
+    Args:
+        workspace_id: UUID of workspace
+        cursor: Cursor returned by the previous page
+        limit: Maximum number of activities to return (1-200)
+        current_user: Current authenticated user
+        db: Database session
+
+    Returns:
+        Page of activities with cursor for the next page
+
+    Raises:
+        HTTPException: 401 if not authenticated, 403 if not a member,
+                      404 if workspace not found, 400 if cursor is invalid
+    """
+    service = ActivityService(db)
+    page = await service.get_workspace_activity(
+        workspace_id=workspace_id, user_id=current_user.id, limit=limit, cursor=cursor
+    )
+    return model_response(
+        ActivityPageResponse(
+            activities=[ActivityResponse.model_validate(a) for a in page.activities],
+            next_cursor=page.next_cursor,
+        )
+    )
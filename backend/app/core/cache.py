@@ -1,9 +1,27 @@
-"""Redis cache configuration."""
+"""Redis cache configuration and a two-tier read-through cache."""
 
+import asyncio
+import functools
+import inspect
+import time
+from collections import OrderedDict
+from collections.abc import AsyncIterator, Awaitable, Callable
+from contextlib import asynccontextmanager
+from contextvars import ContextVar
+from dataclasses import asdict, dataclass
+from typing import Any, TypeVar
+
+import orjson
+import structlog
 from redis.asyncio import Redis
+from redis.exceptions import RedisError
 
 from app.core.config import settings
 
+logger = structlog.get_logger(__name__)
+
+T = TypeVar("T")
+
 # Create Redis client
 redis_client: Redis = Redis.from_url(
     settings.REDIS_URL,
@@ -12,6 +30,671 @@ redis_client: Redis = Redis.from_url(
 )
 
 
+# Client of the running Celery task, set by task_redis()
+_task_client: ContextVar[Redis | None] = ContextVar("task_redis_client", default=None)
+
+
 async def get_redis() -> Redis:
     """Dependency for getting Redis client."""
     return redis_client
+
+
+@asynccontextmanager
+async def task_redis() -> AsyncIterator[Redis]:
+    """
+    Provide a Redis client for one Celery task run.
+
+    redis_client's connections are bound to the event loop that opened
+    them, and every task run gets a fresh loop. Inside this context,
+    caches without their own client (and the invalidations they publish)
+    use a client created for the run, which is closed on exit.
+
+    Yields:
+        Redis client for the run
+    """
+    client = Redis.from_url(settings.REDIS_URL, encoding="utf-8", decode_responses=True)
+    token = _task_client.set(client)
+    try:
+        yield client
+    finally:
+        _task_client.reset(token)
+        await client.aclose()
+
+
+def _default_redis() -> Redis:
+    """Client of the running task, if any, otherwise the shared redis_client."""
+    return _task_client.get() or redis_client
+
+
+@dataclass
+class CacheStats:
+    """Hit/miss counters for one cache namespace."""
+
+    local_hits: int = 0
+    remote_hits: int = 0
+    misses: int = 0
+    coalesced: int = 0  # Misses that waited on another caller's load
+    errors: int = 0  # Redis failures (the cache degrades to local + compute)
+
+
+class LocalLRU:
+    """In-process LRU of encoded values, each with its own expiry."""
+
+    def __init__(self, maxsize: int):
+        """
+        Initialize LocalLRU.
+
+        Args:
+            maxsize: Maximum number of entries kept
+        """
+        self.maxsize = maxsize
+        self._entries: OrderedDict[str, tuple[float, bytes | str]] = OrderedDict()
+
+    def get(self, key: str) -> bytes | str | None:
+        """
+        Get a live entry, refreshing its recency.
+
+        Args:
+            key: Full cache key
+
+        Returns:
+            Encoded value, or None if absent or expired
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, raw = entry
+        if expires_at <= time.monotonic():
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return raw
+
+    def set(self, key: str, raw: bytes | str, ttl: float) -> None:
+        """
+        Store an entry, evicting the least recently used beyond maxsize.
+
+        Args:
+            key: Full cache key
+            raw: Encoded value
+            ttl: Seconds the entry stays valid
+        """
+        self._entries[key] = (time.monotonic() + ttl, raw)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def delete(self, key: str) -> None:
+        """Drop one entry if present."""
+        self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        """Drop every entry."""
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        """Number of entries held, including expired ones not yet evicted."""
+        return len(self._entries)
+
+
+# Channel carrying invalidations to every process's local tier
+INVALIDATION_CHANNEL = "cache:invalidations"
+
+# Every Cache by namespace, for metrics and the invalidation bus
+_caches: dict[str, "Cache"] = {}
+
+# Other in-process state the bus evicts (e.g. single-flight groups), by
+# namespace; each is called with the invalidated keys, or [] for all of them
+_listeners: dict[str, Callable[[list[str]], None]] = {}
+
+
+def on_invalidation(namespace: str, evict: Callable[[list[str]], None]) -> None:
+    """
+    Have the invalidation bus call evict for every invalidation of a namespace.
+
+    Args:
+        namespace: Namespace published with publish_invalidation
+        evict: Drops local state for the given keys ([] meaning all of it)
+    """
+    _listeners[namespace] = evict
+
+
+# Monotonic time before which publish_invalidation skips an unreachable Redis
+_publish_down_until = 0.0
+
+
+async def publish_invalidation(namespace: str, keys: list[str]) -> None:
+    """
+    Announce an invalidation of a listener namespace to every process.
+
+    Failures are logged, not raised: the write it follows has committed.
+    Redis is skipped for CACHE_REDIS_RETRY_SECONDS after a failure; the
+    bus of every other process drops all listener state when it loses
+    its connection.
+
+    Args:
+        namespace: Namespace registered with on_invalidation
+        keys: Invalidated keys ([] for the whole namespace)
+    """
+    global _publish_down_until
+    if _publish_down_until > time.monotonic():
+        return
+    message = {"namespace": namespace, "keys": keys, "epoch": None}
+    try:
+        await _default_redis().publish(INVALIDATION_CHANNEL, orjson.dumps(message))
+    except (RedisError, OSError) as e:
+        _publish_down_until = time.monotonic() + settings.CACHE_REDIS_RETRY_SECONDS
+        logger.warning(
+            "cache.bus.publish_failed",
+            namespace=namespace,
+            error=str(e),
+            error_type=type(e).__name__,
+        )
+
+
+class Cache:
+    """
+    Read-through cache with an in-process LRU in front of Redis.
+
+    Keys are namespaced and carry the namespace's version, stored in
+    Redis. invalidate_all() increments the version, so every key in the
+    namespace goes stale in O(1); orphaned Redis entries expire on their
+    TTL. Invalidations are published on INVALIDATION_CHANNEL, and the
+    InvalidationBus of every process evicts them from its local tier.
+    Each process also re-reads the version at most every local_ttl
+    seconds, which bounds staleness when the bus is down.
+
+    Values are stored encoded (JSON by default) in both tiers, so callers
+    always receive a fresh copy and never share mutable state. Concurrent
+    misses for the same key in one process are coalesced into a single
+    load. A load isn't stored if the namespace was invalidated while it
+    ran, so readers don't re-cache data a concurrent writer invalidated.
+    If Redis is unreachable the cache degrades to local-only and retries
+    Redis after CACHE_REDIS_RETRY_SECONDS.
+    """
+
+    def __init__(
+        self,
+        namespace: str,
+        ttl: int | None = None,
+        local_ttl: float | None = None,
+        local_maxsize: int | None = None,
+        encode: Callable[[Any], bytes | str] = orjson.dumps,
+        decode: Callable[[bytes | str], Any] = orjson.loads,
+        redis: Redis | None = None,
+    ):
+        """
+        Initialize Cache.
+
+        Args:
+            namespace: Prefix shared by all keys of this cache
+            ttl: Seconds entries live in Redis (defaults to CACHE_TTL_SECONDS)
+            local_ttl: Seconds entries, and the namespace version, live in
+                process (defaults to CACHE_LOCAL_TTL_SECONDS)
+            local_maxsize: Maximum in-process entries (defaults to CACHE_LOCAL_MAXSIZE)
+            encode: Serializer for cached values
+            decode: Deserializer for cached values
+            redis: Redis client (defaults to the running task's client, see
+                task_redis, or the shared redis_client)
+        """
+        self.namespace = namespace
+        self.ttl = ttl or settings.CACHE_TTL_SECONDS
+        self.local_ttl = min(
+            local_ttl if local_ttl is not None else settings.CACHE_LOCAL_TTL_SECONDS, self.ttl
+        )
+        self.local = LocalLRU(local_maxsize or settings.CACHE_LOCAL_MAXSIZE)
+        self.stats = CacheStats()
+        self._encode = encode
+        self._decode = decode
+        self._redis = redis
+        self._version = 0
+        self._version_expires_at = 0.0
+        self._epoch: int | None = None  # Last invalidation seen on the bus
+        self._local_invalidations = 0
+        self._redis_down_until = 0.0
+        self._inflight: dict[str, asyncio.Future] = {}
+        _caches[namespace] = self
+
+    @property
+    def redis(self) -> Redis:
+        """Redis client backing the shared tier."""
+        return self._redis or _default_redis()
+
+    @property
+    def version_key(self) -> str:
+        """Redis key holding the namespace version."""
+        return f"cache:{self.namespace}:version"
+
+    @property
+    def epoch_key(self) -> str:
+        """Redis key counting invalidations published for the namespace."""
+        return f"cache:{self.namespace}:epoch"
+
+    def key_for(self, key: str, version: int) -> str:
+        """
+        Build the full key of an entry.
+
+        Args:
+            key: Key within the namespace
+            version: Namespace version
+
+        Returns:
+            Namespaced, versioned key
+        """
+        return f"cache:{self.namespace}:v{version}:{key}"
+
+    async def get_or_set(self, key: str, load: Callable[[], Awaitable[T]]) -> T:
+        """
+        Return the cached value for key, loading and storing it on a miss.
+
+        Args:
+            key: Key within the namespace
+            load: Coroutine function computing the value (must be encodable)
+
+        Returns:
+            Decoded value
+        """
+        full_key = self.key_for(key, await self._current_version())
+
+        raw = self.local.get(full_key)
+        if raw is not None:
+            self.stats.local_hits += 1
+            return self._decode(raw)
+
+        raw = await self._remote(self.redis.get, full_key)
+        if raw is not None:
+            self.stats.remote_hits += 1
+            self.local.set(full_key, raw, self.local_ttl)
+            return self._decode(raw)
+
+        return self._decode(await self._load_once(full_key, load))
+
+    async def get_many(
+        self, keys: list[str], load_many: Callable[[list[str]], Awaitable[dict[str, Any]]]
+    ) -> dict[str, Any]:
+        """
+        Return cached values for several keys, loading all misses in one call.
+
+        Redis is read with a single MGET. Misses aren't coalesced with
+        concurrent callers; load_many is expected to be one batched query.
+
+        Args:
+            keys: Keys within the namespace
+            load_many: Coroutine function computing the values of the keys
+                it is given (keys it leaves out are cached as None)
+
+        Returns:
+            Decoded value per key
+        """
+        version = await self._current_version()
+        found: dict[str, bytes | str] = {}
+        remote_keys = []
+        for key in keys:
+            raw = self.local.get(self.key_for(key, version))
+            if raw is not None:
+                self.stats.local_hits += 1
+                found[key] = raw
+            else:
+                remote_keys.append(key)
+
+        if remote_keys:
+            full_keys = [self.key_for(key, version) for key in remote_keys]
+            raws = await self._remote(self.redis.mget, full_keys) or [None] * len(full_keys)
+            missing = []
+            for key, full_key, raw in zip(remote_keys, full_keys, raws, strict=True):
+                if raw is None:
+                    missing.append(key)
+                    continue
+                self.stats.remote_hits += 1
+                self.local.set(full_key, raw, self.local_ttl)
+                found[key] = raw
+
+            if missing:
+                self.stats.misses += len(missing)
+                mark = await self._invalidation_mark()
+                loaded = await load_many(missing)
+                encoded = {key: self._encode(loaded.get(key)) for key in missing}
+                if await self._invalidation_mark() == mark:
+                    for key, raw in encoded.items():
+                        await self._store(self.key_for(key, version), raw)
+                found.update(encoded)
+
+        return {key: self._decode(found[key]) for key in keys}
+
+    async def set(self, key: str, value: Any) -> None:
+        """
+        Store a value in both tiers.
+
+        Args:
+            key: Key within the namespace
+            value: Value to cache (must be encodable)
+        """
+        full_key = self.key_for(key, await self._current_version())
+        await self._store(full_key, self._encode(value))
+
+    async def invalidate(self, *keys: str) -> None:
+        """
+        Drop keys from Redis and from the local tier of every process.
+
+        Args:
+            keys: Keys within the namespace
+        """
+        if not keys:
+            return
+        # Bump the epoch first, so loads already running don't store what they read
+        epoch = await self._bump_epoch()
+        version = await self._current_version()
+        full_keys = [self.key_for(key, version) for key in keys]
+        for full_key in full_keys:
+            self.local.delete(full_key)
+        await self._remote(self.redis.delete, *full_keys)
+        await self._publish(list(keys), epoch)
+
+    async def invalidate_all(self) -> None:
+        """Make every key in the namespace stale by bumping its version."""
+        epoch = await self._bump_epoch()
+        self.local.clear()
+        version = await self._remote(self.redis.incr, self.version_key)
+        if version is None:
+            # Redis entries can't be invalidated; re-read the version next time
+            self._version_expires_at = 0.0
+            return
+        self._version = int(version)
+        self._version_expires_at = time.monotonic() + self.local_ttl
+        await self._publish([], epoch)
+
+    def clear_local(self) -> None:
+        """Drop this process's entries and cached version (e.g. on a remote invalidation)."""
+        self._local_invalidations += 1
+        self.local.clear()
+        self._version_expires_at = 0.0
+
+    def evict_local(self, keys: list[str], epoch: int) -> None:
+        """
+        Apply an invalidation received on the bus to the local tier.
+
+        Epochs count invalidations per namespace, so a gap means messages
+        were missed and the whole local tier is dropped.
+
+        Args:
+            keys: Keys within the namespace (empty for the whole namespace)
+            epoch: Epoch the publisher assigned to the invalidation
+        """
+        missed = self._epoch is not None and epoch > self._epoch + 1
+        self._epoch = epoch if self._epoch is None else max(self._epoch, epoch)
+        if missed or not keys:
+            self.clear_local()
+            return
+        self._local_invalidations += 1
+        for key in keys:
+            self.local.delete(self.key_for(key, self._version))
+
+    async def resync(self) -> None:
+        """Drop the local tier if invalidations were published that the bus didn't deliver."""
+        epoch = await self._remote(self.redis.get, self.epoch_key)
+        if epoch is None and not self._redis_available():
+            return
+        epoch = int(epoch) if epoch is not None else 0
+        if epoch != self._epoch:
+            if self._epoch is not None:
+                logger.info("cache.bus.resync", namespace=self.namespace, epoch=epoch)
+            self.clear_local()
+            self._epoch = epoch
+
+    async def _bump_epoch(self) -> int | None:
+        """Count an invalidation, in this process and in Redis."""
+        self._local_invalidations += 1
+        return await self._remote(self.redis.incr, self.epoch_key)
+
+    async def _invalidation_mark(self) -> tuple[int, Any]:
+        """Snapshot of the invalidations seen so far, locally and in Redis."""
+        return self._local_invalidations, await self._remote(self.redis.get, self.epoch_key)
+
+    async def _publish(self, keys: list[str], epoch: int | None) -> None:
+        """Announce an invalidation to every process (all keys if empty)."""
+        if epoch is None:
+            return
+        message = {"namespace": self.namespace, "keys": keys, "epoch": epoch}
+        await self._remote(self.redis.publish, INVALIDATION_CHANNEL, orjson.dumps(message))
+
+    async def _current_version(self) -> int:
+        """Namespace version, re-read from Redis once the local copy expires."""
+        if self._version_expires_at > time.monotonic():
+            return self._version
+        version = await self._remote(self.redis.get, self.version_key)
+        if version is not None:
+            self._version = int(version)
+        elif self._redis_available():
+            self._version = 0  # Never invalidated
+        # Otherwise Redis is down; keep the last version seen
+        self._version_expires_at = time.monotonic() + self.local_ttl
+        return self._version
+
+    async def _load_once(self, full_key: str, load: Callable[[], Awaitable[Any]]) -> bytes | str:
+        """
+        Load and store a missing entry, sharing one load among concurrent callers.
+
+        Args:
+            full_key: Namespaced, versioned key
+            load: Coroutine function computing the value
+
+        Returns:
+            Encoded value
+        """
+        pending = self._inflight.get(full_key)
+        if pending is not None:
+            self.stats.coalesced += 1
+            return await asyncio.shield(pending)
+
+        self.stats.misses += 1
+        future: asyncio.Future = asyncio.get_running_loop().create_future()
+        self._inflight[full_key] = future
+        try:
+            mark = await self._invalidation_mark()
+            raw = self._encode(await load())
+            # An invalidation during the load may have been for what it read
+            if await self._invalidation_mark() == mark:
+                await self._store(full_key, raw)
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as e:
+            future.set_exception(e)
+            future.exception()  # Waiters re-raise it; don't warn when there are none
+            raise
+        else:
+            future.set_result(raw)
+        finally:
+            del self._inflight[full_key]
+        return raw
+
+    async def _store(self, full_key: str, raw: bytes | str) -> None:
+        """Write an encoded value to both tiers."""
+        self.local.set(full_key, raw, self.local_ttl)
+        await self._remote(self.redis.set, full_key, raw, ex=self.ttl)
+
+    def _redis_available(self) -> bool:
+        return self._redis_down_until <= time.monotonic()
+
+    async def _remote(self, command: Callable[..., Awaitable[Any]], *args, **kwargs) -> Any:
+        """
+        Run a Redis command, treating failures as a miss.
+
+        Returns:
+            Command result, or None if Redis failed or is backing off
+        """
+        if not self._redis_available():
+            return None
+        try:
+            return await command(*args, **kwargs)
+        except (RedisError, OSError) as e:
+            self.stats.errors += 1
+            self._redis_down_until = time.monotonic() + settings.CACHE_REDIS_RETRY_SECONDS
+            logger.warning(
+                "cache.redis.failed",
+                namespace=self.namespace,
+                error=str(e),
+                error_type=type(e).__name__,
+            )
+            return None
+
+
+def clear_local_caches() -> None:
+    """Drop the local tier of every cache, and all state of other listeners, in this process."""
+    for cache in list(_caches.values()):
+        cache.clear_local()
+    for evict in list(_listeners.values()):
+        evict([])
+
+
+class InvalidationBus:
+    """
+    Redis pub/sub listener evicting local cache entries invalidated by any process.
+
+    Runs for the lifetime of a process with a long-lived event loop (the
+    API workers). Every CACHE_BUS_RESYNC_SECONDS, and on each reconnect,
+    it compares each namespace's invalidation epoch with Redis and drops
+    local tiers that missed messages.
+    """
+
+    def __init__(self, redis: Redis | None = None):
+        """
+        Initialize InvalidationBus.
+
+        Args:
+            redis: Redis client (defaults to the shared redis_client)
+        """
+        self._redis = redis
+        self._task: asyncio.Task | None = None
+
+    @property
+    def redis(self) -> Redis:
+        """Redis client carrying the channel."""
+        return self._redis or redis_client
+
+    def start(self) -> None:
+        """Start listening in the background."""
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Stop listening."""
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+    def handle(self, data: bytes | str) -> None:
+        """
+        Apply one invalidation message.
+
+        Args:
+            data: Message published by Cache or publish_invalidation
+        """
+        try:
+            message = orjson.loads(data)
+            namespace, keys, epoch = message["namespace"], message["keys"], message["epoch"]
+        except (orjson.JSONDecodeError, KeyError, TypeError):
+            logger.warning("cache.bus.invalid_message", data=str(data)[:200])
+            return
+        cache = _caches.get(namespace)
+        if cache is not None:
+            cache.evict_local(keys, epoch)
+        elif namespace in _listeners:
+            _listeners[namespace](keys)
+
+    async def resync(self) -> None:
+        """Resync every cache with the invalidation epochs in Redis."""
+        for cache in list(_caches.values()):
+            await cache.resync()
+
+    async def _run(self) -> None:
+        """Listen until cancelled, reconnecting after Redis failures."""
+        while True:
+            try:
+                await self._listen()
+            except (RedisError, OSError) as e:
+                logger.warning(
+                    "cache.bus.disconnected",
+                    error=str(e),
+                    error_type=type(e).__name__,
+                )
+                # Messages published while disconnected are lost
+                clear_local_caches()
+                await asyncio.sleep(settings.CACHE_REDIS_RETRY_SECONDS)
+
+    async def _listen(self) -> None:
+        """Subscribe, resync, then apply messages as they arrive."""
+        pubsub = self.redis.pubsub(ignore_subscribe_messages=True)
+        try:
+            await pubsub.subscribe(INVALIDATION_CHANNEL)
+            logger.info("cache.bus.subscribed", channel=INVALIDATION_CHANNEL)
+            await self.resync()
+            next_resync = time.monotonic() + settings.CACHE_BUS_RESYNC_SECONDS
+            while True:
+                message = await pubsub.get_message(timeout=max(next_resync - time.monotonic(), 0.0))
+                if message is not None:
+                    self.handle(message["data"])
+                if time.monotonic() >= next_resync:
+                    await self.resync()
+                    next_resync = time.monotonic() + settings.CACHE_BUS_RESYNC_SECONDS
+        finally:
+            await pubsub.aclose()
+
+
+invalidation_bus = InvalidationBus()
+
+
+def cached(cache: Cache, key: Callable[..., str] | None = None):
+    """
+    Cache an async function's result in a Cache.
+
+    The key defaults to the call's arguments joined with ":", skipping
+    self/cls, so it suits service methods taking IDs. The wrapper
+    exposes the cache as .cache for invalidation.
+
+    Args:
+        cache: Cache holding the results
+        key: Builds the key from the call's arguments (including self for methods)
+
+    Returns:
+        Decorator
+    """
+
+    def decorator(func: Callable[..., Awaitable[T]]) -> Callable[..., Awaitable[T]]:
+        signature = inspect.signature(func)
+
+        def default_key(*args, **kwargs) -> str:
+            bound = signature.bind(*args, **kwargs)
+            bound.apply_defaults()
+            return ":".join(
+                str(value) for name, value in bound.arguments.items() if name not in ("self", "cls")
+            )
+
+        build_key = key or default_key
+
+        @functools.wraps(func)
+        async def wrapper(*args, **kwargs) -> T:
+            return await cache.get_or_set(build_key(*args, **kwargs), lambda: func(*args, **kwargs))
+
+        wrapper.cache = cache  # type: ignore[attr-defined]
+        return wrapper
+
+    return decorator
+
+
+def cache_stats() -> dict[str, dict[str, int]]:
+    """
+    Hit/miss counters of every cache in this process.
+
+    Returns:
+        Counters keyed by namespace
+    """
+    return {
+        namespace: {**asdict(cache.stats), "local_entries": len(cache.local)}
+        for namespace, cache in sorted(_caches.items())
+    }
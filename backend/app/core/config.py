@@ -18,6 +18,13 @@ class Settings(BaseSettings):
     # Redis
     REDIS_URL: str = "redis://redis:6379/0"
 
+    # Two-tier cache (app.core.cache): in-process LRU in front of Redis
+    CACHE_TTL_SECONDS: int = 300
+    CACHE_LOCAL_TTL_SECONDS: float = 5.0  # Also bounds cross-process staleness
+    CACHE_LOCAL_MAXSIZE: int = 1024
+    CACHE_REDIS_RETRY_SECONDS: float = 5.0  # Back-off after a Redis failure
+    CACHE_BUS_RESYNC_SECONDS: float = 30.0  # Epoch check against missed invalidations
+
     # Security
     SECRET_KEY: str = "dev-secret-key-change-in-production"
     ALGORITHM: str = "HS256"
@@ -40,6 +47,29 @@ class Settings(BaseSettings):
     FROM_NAME: str = "Taskly"
     APP_URL: str = "http://localhost:3000"
 
+    # Response compression (gzip always; br/zstd with the "compression" extra)
+    COMPRESSION_MINIMUM_SIZE: int = 1024
+
+    # Request batching (sub-requests of one POST /api/batch run at once)
+    BATCH_MAX_CONCURRENCY: int = 4
+
+    # Bulk card import (rows are staged in Redis until the worker inserts them)
+    CARD_IMPORT_MAX_ROWS: int = 50_000
+    CARD_IMPORT_STAGING_TTL_SECONDS: int = 3600
+
+    # Periodic card position repair (columns drained from the dirty list per run)
+    POSITION_REPAIR_BATCH_SIZE: int = 500
+
+    # Board stats reconcile (boards recounted per run, oldest first)
+    BOARD_STATS_RECONCILE_BATCH_SIZE: int = 200
+
+    # Background purge of soft-deleted boards and workspaces (rows per DELETE)
+    PURGE_CHUNK_SIZE: int = 1000
+
+    # Monthly partitions of card_activities and workspace_audit_logs
+    PARTITION_PREMAKE_MONTHS: int = 3  # Months created ahead of the current one
+    HISTORY_RETENTION_DAYS: int = 365  # Default when a workspace sets no retention_days
+
     @property
     def CORS_ORIGINS(self) -> list[str]:
         """Parse CORS_ORIGINS from comma-separated string."""
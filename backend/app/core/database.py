@@ -30,7 +30,10 @@ AsyncSessionLocal = async_sessionmaker(
 class Base(DeclarativeBase):
     """Base class for all database models."""
 
-    pass
+    # Fetch server-generated values (created_at, updated_at, ...) through
+    # RETURNING on the INSERT/UPDATE itself, so a flush never needs a
+    # follow-up SELECT or refresh() to read them back
+    __mapper_args__ = {"eager_defaults": True}
 
 
 async def get_db() -> AsyncGenerator[AsyncSession, None]:
@@ -0,0 +1,197 @@
+"""Single-flight coalescing of identical concurrent computations."""
+
+import asyncio
+from collections.abc import Awaitable, Callable, Hashable, Iterable
+from dataclasses import asdict, dataclass
+from typing import Generic, TypeVar
+from uuid import UUID
+
+from app.core.cache import on_invalidation, publish_invalidation
+
+T = TypeVar("T")
+
+
+@dataclass
+class SingleFlightStats:
+    """Counters of one SingleFlight group."""
+
+    leads: int = 0  # Calls that ran the computation
+    coalesced: int = 0  # Calls that waited on another caller's computation
+    forgotten: int = 0  # In-flight computations detached by invalidations
+
+
+_groups: dict[str, "SingleFlight"] = {}
+
+
+class SingleFlight(Generic[T]):
+    """
+    Share one in-flight computation among concurrent identical calls.
+
+    Unlike Cache, nothing is kept once a computation finishes: a call
+    made after it completes runs a new one. Each computation is tagged
+    with the scopes (e.g. "board:<id>") whose writes change its result.
+    Writers call invalidate() after committing, which detaches matching
+    computations in every process (through the cache invalidation bus),
+    so calls arriving after a write start a fresh computation instead of
+    joining one that may have read the state before it.
+
+    Callers check their own permissions before joining, since the result
+    is shared by everyone whose call has the same key.
+    """
+
+    def __init__(self, name: str):
+        """
+        Initialize SingleFlight.
+
+        Args:
+            name: Name of the group, reported by single_flight_stats()
+        """
+        self.name = name
+        self.stats = SingleFlightStats()
+        self._inflight: dict[Hashable, tuple[frozenset[str], asyncio.Future]] = {}
+        _groups[name] = self
+        on_invalidation(self.namespace, self.evict_local)
+
+    @property
+    def namespace(self) -> str:
+        """Namespace of the group's invalidations on the bus."""
+        return f"flight:{self.name}"
+
+    async def run(
+        self, key: Hashable, compute: Callable[[], Awaitable[T]], scopes: Iterable[str] = ()
+    ) -> T:
+        """
+        Run compute, or wait for the identical computation already running.
+
+        If the caller leading the computation is cancelled (e.g. its client
+        disconnected), the callers waiting on it run it again themselves.
+
+        Args:
+            key: Identifies the computation
+            compute: Coroutine function computing the result
+            scopes: Scopes whose invalidation detaches the computation
+
+        Returns:
+            The computation's result, shared by every concurrent caller
+        """
+        while (entry := self._inflight.get(key)) is not None:
+            pending = entry[1]
+            self.stats.coalesced += 1
+            try:
+                return await asyncio.shield(pending)
+            except asyncio.CancelledError:
+                if not pending.cancelled() or asyncio.current_task().cancelling():
+                    raise
+                # The leader was cancelled, not this caller: try again
+
+        self.stats.leads += 1
+        future: asyncio.Future = asyncio.get_running_loop().create_future()
+        self._inflight[key] = (frozenset(scopes), future)
+        try:
+            result = await compute()
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as e:
+            future.set_exception(e)
+            future.exception()  # Waiters re-raise it; don't warn when there are none
+            raise
+        else:
+            future.set_result(result)
+        finally:
+            entry = self._inflight.get(key)
+            if entry is not None and entry[1] is future:
+                del self._inflight[key]
+        return result
+
+    async def invalidate(self, *scopes: str) -> None:
+        """
+        Detach computations of scopes in every process, after a write to them commits.
+
+        Args:
+            scopes: Scopes that were written to
+        """
+        if not scopes:
+            return
+        self.evict_local(list(scopes))
+        await publish_invalidation(self.namespace, list(scopes))
+
+    async def invalidate_all(self) -> None:
+        """Detach every computation in every process (for writes no scope covers)."""
+        self.evict_local([])
+        await publish_invalidation(self.namespace, [])
+
+    def evict_local(self, scopes: list[str]) -> None:
+        """
+        Detach this process's computations of scopes.
+
+        Callers already waiting still get those results; later calls start
+        a new computation.
+
+        Args:
+            scopes: Scopes that were written to ([] for every computation)
+        """
+        stale = [
+            key
+            for key, (tags, _) in self._inflight.items()
+            if not scopes or not tags.isdisjoint(scopes)
+        ]
+        for key in stale:
+            del self._inflight[key]
+        self.stats.forgotten += len(stale)
+
+
+def single_flight_stats() -> dict[str, dict[str, int]]:
+    """
+    Counters of every single-flight group in this process.
+
+    Returns:
+        Counters keyed by group name
+    """
+    return {
+        name: {**asdict(group.stats), "inflight": len(group._inflight)}
+        for name, group in sorted(_groups.items())
+    }
+
+
+# Responses of GET /api/boards/{id}/cards, tagged with their board and
+# workspace scopes
+board_cards_flight: SingleFlight[tuple] = SingleFlight("board_cards")
+
+
+def board_scope(board_id: UUID) -> str:
+    """Scope of everything read from one board."""
+    return f"board:{board_id}"
+
+
+def workspace_scope(workspace_id: UUID) -> str:
+    """Scope of everything read from one workspace's boards."""
+    return f"workspace:{workspace_id}"
+
+
+async def invalidate_board_cards(*board_ids: UUID) -> None:
+    """
+    Detach in-flight card lists of boards after their cards change.
+
+    Call after the change is committed, including from Celery tasks
+    (inside task_redis()).
+
+    Args:
+        board_ids: Boards whose cards, or the cards' assignees or labels, changed
+    """
+    await board_cards_flight.invalidate(*(board_scope(board_id) for board_id in board_ids))
+
+
+async def invalidate_workspace_board_cards(*workspace_ids: UUID) -> None:
+    """
+    Detach in-flight card lists of every board of workspaces.
+
+    For writes shared by a workspace's boards, such as label renames.
+    Call after the change is committed.
+
+    Args:
+        workspace_ids: Workspaces whose boards' card lists changed
+    """
+    await board_cards_flight.invalidate(
+        *(workspace_scope(workspace_id) for workspace_id in workspace_ids)
+    )
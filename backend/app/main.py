@@ -2,24 +2,28 @@
 
 import structlog
 from fastapi import FastAPI, Request, Response
+from fastapi.encoders import jsonable_encoder
 from fastapi.exceptions import RequestValidationError
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, ORJSONResponse
 from starlette.middleware.base import BaseHTTPMiddleware
 
 from app.api.assignees import router as assignees_router
 from app.api.auth import router as auth_router
+from app.api.batch import router as batch_router
 from app.api.boards import router as boards_router
 from app.api.cards import router as cards_router
+from app.api.dashboard import router as dashboard_router
 from app.api.health import router as health_router
 from app.api.invitations import router as invitations_router
 from app.api.labels import router as labels_router
 from app.api.members import router as members_router
-from app.api.middleware import CorrelationIDMiddleware
+from app.api.middleware import CompressionMiddleware, CorrelationIDMiddleware
 from app.api.users import router as users_router
 from app.api.webhooks import router as webhooks_router
 from app.api.websockets import router as websockets_router
 from app.api.workspaces import router as workspaces_router
+from app.core.cache import invalidation_bus
 from app.core.config import settings
 from app.core.logging import configure_logging
 
@@ -31,6 +35,7 @@ app = FastAPI(
     version="0.1.0",
     docs_url="/docs",
     redoc_url="/redoc",
+    default_response_class=ORJSONResponse,
 )
 
 
@@ -50,6 +55,13 @@ class NoCacheMiddleware(BaseHTTPMiddleware):
 async def startup_event() -> None:
     """Configure application on startup."""
     configure_logging()
+    invalidation_bus.start()
+
+
+@app.on_event("shutdown")
+async def shutdown_event() -> None:
+    """Release background resources on shutdown."""
+    await invalidation_bus.stop()
 
 
 @app.exception_handler(RequestValidationError)
@@ -61,9 +73,10 @@ async def validation_exception_handler(request: Request, exc: RequestValidationE
         errors=exc.errors(),
         body=await request.body(),
     )
+    # Errors raised by model validators carry the exception in their context
     return JSONResponse(
         status_code=422,
-        content={"detail": exc.errors()},
+        content={"detail": jsonable_encoder(exc.errors())},
     )
 
 
@@ -80,14 +93,18 @@ app.add_middleware(
 # Add correlation ID middleware (after CORS)
 app.add_middleware(CorrelationIDMiddleware)
 
-# Add no-cache middleware (last)
+# Add no-cache middleware
 app.add_middleware(NoCacheMiddleware)
 
+# Add response compression (outermost, so it sees final headers)
+app.add_middleware(CompressionMiddleware, minimum_size=settings.COMPRESSION_MINIMUM_SIZE)
+
 # Include routers
 app.include_router(health_router, prefix="/api", tags=["health"])
 app.include_router(auth_router, prefix="/auth", tags=["authentication"])
 app.include_router(users_router, prefix="/api", tags=["users"])
 app.include_router(workspaces_router)
+app.include_router(dashboard_router)
 app.include_router(boards_router)
 app.include_router(cards_router)
 app.include_router(labels_router)
@@ -96,6 +113,7 @@ app.include_router(invitations_router)
 app.include_router(members_router)
 app.include_router(webhooks_router)
 app.include_router(websockets_router, tags=["websockets"])
+app.include_router(batch_router)
 
 
 @app.get("/")
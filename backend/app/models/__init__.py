@@ -1,10 +1,13 @@
 """Models package - exports all database models for Alembic migrations."""
 
 from app.models.board import Board
+from app.models.board_column import BoardColumn
+from app.models.board_stats import BoardStats
 from app.models.card import Card, PriorityEnum
 from app.models.card_activity import CardActivity
 from app.models.card_assignee import CardAssignee
 from app.models.card_label import CardLabel
+from app.models.dirty_column import DirtyColumn
 from app.models.git_repository import GitRepository
 from app.models.pull_request import PRStatusEnum, PullRequest
 from app.models.refresh_token import RefreshToken
@@ -26,11 +29,14 @@ __all__ = [
     "WorkspaceAuditLog",
     "AuditActionEnum",
     "Board",
+    "BoardColumn",
+    "BoardStats",
     "Card",
     "CardActivity",
     "PriorityEnum",
     "CardAssignee",
     "CardLabel",
+    "DirtyColumn",
     "WorkspaceLabel",
     "Sprint",
     "SprintStatusEnum",
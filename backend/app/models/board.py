@@ -2,7 +2,7 @@
 
 import uuid
 
-from sqlalchemy import Boolean, Column, DateTime, ForeignKey, Index, String, func
+from sqlalchemy import Boolean, Column, DateTime, ForeignKey, Index, Integer, String, func, text
 from sqlalchemy.dialects.postgresql import JSONB, UUID
 from sqlalchemy.orm import relationship
 
@@ -26,6 +26,10 @@ class Board(Base):
         JSONB, nullable=False, default=list
     )  # [{"id": "uuid", "name": "str", "position": int}]
     archived = Column(Boolean, default=False, nullable=False)
+    # Set on delete; the row and its cards are purged later in the background
+    deleted_at = Column(DateTime(timezone=True), nullable=True)
+    # Optimistic concurrency token, exposed as the board's ETag
+    version = Column(Integer, nullable=False, server_default="1")
     created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
     updated_at = Column(
         DateTime(timezone=True),
@@ -39,7 +43,12 @@ class Board(Base):
     cards = relationship("Card", back_populates="board", cascade="all, delete-orphan")
 
     # Indexes
-    __table_args__ = (Index("ix_boards_columns_gin", "columns", postgresql_using="gin"),)
+    __table_args__ = (
+        Index("ix_boards_columns_gin", "columns", postgresql_using="gin"),
+        Index("ix_boards_deleted_at", "deleted_at", postgresql_where=text("deleted_at IS NOT NULL")),
+    )
+    # ORM flushes issue UPDATE/DELETE ... WHERE version = :v and bump it
+    __mapper_args__ = {**Base.__mapper_args__, "version_id_col": version}
 
     def __repr__(self) -> str:
         """String representation of Board."""
@@ -0,0 +1,101 @@
+"""BoardColumn model for the columns of a board."""
+
+from uuid import UUID as PyUUID
+
+from sqlalchemy import Column, DateTime, ForeignKey, Integer, String, delete, event, func
+from sqlalchemy.dialects.postgresql import UUID, insert
+from sqlalchemy.engine import Connection
+from sqlalchemy.orm import Mapper
+from sqlalchemy.orm.attributes import get_history
+
+from app.core.database import Base
+from app.models.board import Board
+
+
+class BoardColumn(Base):
+    """
+    Column of a board, with its live card count and optional WIP limit.
+
+    Board.columns stays the layout document clients read and write; every
+    flush that changes it upserts the matching rows here (see
+    sync_board_columns), so cards can reference their column by foreign
+    key and per-column lookups use the primary key.
+    """
+
+    __tablename__ = "board_columns"
+
+    board_id = Column(
+        UUID(as_uuid=True),
+        ForeignKey("boards.id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    id = Column(UUID(as_uuid=True), primary_key=True)
+    name = Column(String(100), nullable=False)
+    position = Column(Integer, nullable=False)
+    # Cards allowed in the column (None for no limit), enforced on create and move
+    wip_limit = Column(Integer, nullable=True)
+    # Maintained by every statement that adds or removes cards in the column
+    card_count = Column(Integer, nullable=False, server_default="0")
+    created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+
+    def __repr__(self) -> str:
+        """String representation of BoardColumn."""
+        return f"<BoardColumn(board_id={self.board_id}, id={self.id}, name={self.name})>"
+
+
+def sync_board_columns(
+    connection: Connection, board_id: PyUUID, columns: list[dict], prune: bool = True
+) -> None:
+    """
+    Mirror a board's column layout into board_columns.
+
+    Existing rows keep their card_count; only name, position and WIP limit
+    are rewritten. Rows for columns missing from the layout are deleted,
+    which the cards foreign key rejects while cards still reference them.
+
+    Args:
+        connection: Connection of the flush writing the board
+        board_id: UUID of board
+        columns: Board.columns layout
+        prune: Delete rows for columns no longer in the layout
+    """
+    rows = [
+        {
+            "board_id": board_id,
+            "id": PyUUID(str(col["id"])),
+            "name": col["name"],
+            "position": col.get("position", i),
+            "wip_limit": col.get("wip_limit"),
+        }
+        for i, col in enumerate(columns)
+    ]
+    if rows:
+        stmt = insert(BoardColumn).values(rows)
+        connection.execute(
+            stmt.on_conflict_do_update(
+                index_elements=[BoardColumn.board_id, BoardColumn.id],
+                set_={
+                    "name": stmt.excluded.name,
+                    "position": stmt.excluded.position,
+                    "wip_limit": stmt.excluded.wip_limit,
+                },
+            )
+        )
+    if prune:
+        connection.execute(
+            delete(BoardColumn).where(
+                BoardColumn.board_id == board_id,
+                BoardColumn.id.not_in([row["id"] for row in rows]),
+            )
+        )
+
+
+@event.listens_for(Board, "after_insert")
+def _board_inserted(mapper: Mapper, connection: Connection, board: Board) -> None:
+    sync_board_columns(connection, board.id, board.columns or [], prune=False)
+
+
+@event.listens_for(Board, "after_update")
+def _board_updated(mapper: Mapper, connection: Connection, board: Board) -> None:
+    if get_history(board, "columns").has_changes():
+        sync_board_columns(connection, board.id, board.columns or [])
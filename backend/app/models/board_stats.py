@@ -0,0 +1,51 @@
+"""BoardStats model for the materialized card totals of a board."""
+
+from sqlalchemy import Column, Date, DateTime, ForeignKey, Integer, event, func
+from sqlalchemy.dialects.postgresql import UUID, insert
+from sqlalchemy.engine import Connection
+from sqlalchemy.orm import Mapper
+
+from app.core.database import Base
+from app.models.board import Board
+
+
+class BoardStats(Base):
+    """
+    Card totals of a board, kept current by the statements that change cards.
+
+    Every create, edit and delete adds its delta in the same statement (see
+    BoardStatsRepository.apply_from), so reading the totals is a primary key
+    lookup. Per-column card counts live on board_columns.
+
+    A card is overdue when its due date is before overdue_as_of; the
+    reconcile task moves that date forward each day and recounts the rows
+    that drifted.
+    """
+
+    __tablename__ = "board_stats"
+
+    board_id = Column(
+        UUID(as_uuid=True),
+        ForeignKey("boards.id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    card_count = Column(Integer, nullable=False, server_default="0")
+    story_points = Column(Integer, nullable=False, server_default="0")
+    overdue_count = Column(Integer, nullable=False, server_default="0")
+    overdue_as_of = Column(Date, nullable=False, server_default=func.current_date())
+    reconciled_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+    updated_at = Column(
+        DateTime(timezone=True),
+        server_default=func.now(),
+        onupdate=func.now(),
+        nullable=False,
+    )
+
+    def __repr__(self) -> str:
+        """String representation of BoardStats."""
+        return f"<BoardStats(board_id={self.board_id}, card_count={self.card_count})>"
+
+
+@event.listens_for(Board, "after_insert")
+def _board_inserted(mapper: Mapper, connection: Connection, board: Board) -> None:
+    connection.execute(insert(BoardStats).values(board_id=board.id).on_conflict_do_nothing())
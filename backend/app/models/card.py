@@ -3,7 +3,19 @@
 import enum
 import uuid
 
-from sqlalchemy import Column, Date, DateTime, Enum, ForeignKey, Index, Integer, String, Text, func
+from sqlalchemy import (
+    Column,
+    Date,
+    DateTime,
+    Enum,
+    ForeignKey,
+    ForeignKeyConstraint,
+    Index,
+    Integer,
+    String,
+    Text,
+    func,
+)
 from sqlalchemy.dialects.postgresql import JSONB, UUID
 from sqlalchemy.orm import relationship
 
@@ -42,6 +54,8 @@ class Card(Base):
     story_points = Column(Integer, nullable=True)
     due_date = Column(Date, nullable=True)
     position = Column(Integer, nullable=False, default=0)
+    # Optimistic concurrency token, exposed as the card's ETag
+    version = Column(Integer, nullable=False, server_default="1")
     sprint_id = Column(
         UUID(as_uuid=True),
         ForeignKey("sprints.id", ondelete="SET NULL"),
@@ -77,18 +91,34 @@ class Card(Base):
         viewonly=True,
     )
     sprint = relationship("Sprint", back_populates="cards")
+    # History outlives the card: the FK sets card_id to NULL on delete
     activities = relationship(
         "CardActivity",
         back_populates="card",
-        cascade="all, delete-orphan",
         passive_deletes=True,
     )
 
     # Indexes
     __table_args__ = (
         Index("ix_cards_board_position", "board_id", "position"),
+        Index("ix_cards_board_column_position", "board_id", "column_id", "position", "id"),
         Index("ix_cards_card_metadata_gin", "card_metadata", postgresql_using="gin"),
+        # Overdue counts of a board, recomputed by the stats reconcile task
+        Index(
+            "ix_cards_board_due_date",
+            "board_id",
+            "due_date",
+            postgresql_where=due_date.isnot(None),
+        ),
+        # A column can't be removed from its board while cards are still in it
+        ForeignKeyConstraint(
+            ["board_id", "column_id"],
+            ["board_columns.board_id", "board_columns.id"],
+            name="fk_cards_board_column",
+        ),
     )
+    # ORM flushes issue UPDATE/DELETE ... WHERE version = :v and bump it
+    __mapper_args__ = {**Base.__mapper_args__, "version_id_col": version}
 
     def __repr__(self) -> str:
         """String representation of Card."""
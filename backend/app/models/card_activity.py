@@ -2,11 +2,12 @@
 
 import uuid
 
-from sqlalchemy import Column, DateTime, ForeignKey, String, func
+from sqlalchemy import Column, DateTime, ForeignKey, Index, String, event, func
 from sqlalchemy.dialects.postgresql import JSONB, UUID
 from sqlalchemy.orm import relationship
 
 from app.core.database import Base
+from app.utils.partitions import create_initial_partitions
 
 
 class CardActivity(Base):
@@ -15,12 +16,24 @@ class CardActivity(Base):
     __tablename__ = "card_activities"
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4, index=True)
+    # NULL once the card is deleted; its "deleted" entry keeps the id in metadata
     card_id = Column(
         UUID(as_uuid=True),
-        ForeignKey("cards.id", ondelete="CASCADE"),
+        ForeignKey("cards.id", ondelete="SET NULL"),
+        nullable=True,
+    )
+    board_id = Column(
+        UUID(as_uuid=True),
+        ForeignKey("boards.id", ondelete="CASCADE"),
         nullable=False,
         index=True,
     )
+    # Denormalized from the board so the workspace stream is one index range
+    workspace_id = Column(
+        UUID(as_uuid=True),
+        ForeignKey("workspaces.id", ondelete="CASCADE"),
+        nullable=False,
+    )
     user_id = Column(
         UUID(as_uuid=True),
         ForeignKey("users.id", ondelete="SET NULL"),
@@ -31,12 +44,37 @@ class CardActivity(Base):
     activity_metadata = Column(
         JSONB, default=dict, nullable=False
     )  # Additional activity data
-    created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+    # Partition key, so part of the table's primary key (the mapper still keys on id)
+    created_at = Column(
+        DateTime(timezone=True), server_default=func.now(), primary_key=True, nullable=False
+    )
 
     # Relationships
     card = relationship("Card", back_populates="activities")
     user = relationship("User", back_populates="card_activities")
 
+    # Indexes (newest-first keyset pagination on (created_at, id)), monthly partitions
+    __table_args__ = (
+        Index(
+            "ix_card_activities_card_created",
+            "card_id",
+            created_at.desc(),
+            id.desc(),
+        ),
+        Index(
+            "ix_card_activities_workspace_created",
+            "workspace_id",
+            created_at.desc(),
+            id.desc(),
+        ),
+        {"postgresql_partition_by": "RANGE (created_at)"},
+    )
+    __mapper_args__ = {**Base.__mapper_args__, "primary_key": [id]}
+
     def __repr__(self) -> str:
         """String representation of CardActivity."""
         return f"<CardActivity(id={self.id}, card_id={self.card_id}, action={self.action})>"
+
+
+# Monthly range partitions; see app.services.partition_service for upkeep
+event.listen(CardActivity.__table__, "after_create", create_initial_partitions)
@@ -0,0 +1,27 @@
+"""DirtyColumn model queuing board columns for position repair."""
+
+from sqlalchemy import Column, DateTime, ForeignKey, PrimaryKeyConstraint, func
+from sqlalchemy.dialects.postgresql import UUID
+
+from app.core.database import Base
+
+
+class DirtyColumn(Base):
+    """Board column whose card positions changed since it was last repaired."""
+
+    __tablename__ = "dirty_columns"
+
+    board_id = Column(
+        UUID(as_uuid=True),
+        ForeignKey("boards.id", ondelete="CASCADE"),
+        nullable=False,
+    )
+    column_id = Column(UUID(as_uuid=True), nullable=False)
+    marked_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False, index=True)
+
+    # Composite primary key
+    __table_args__ = (PrimaryKeyConstraint("board_id", "column_id"),)
+
+    def __repr__(self) -> str:
+        """String representation of DirtyColumn."""
+        return f"<DirtyColumn(board_id={self.board_id}, column_id={self.column_id})>"
@@ -2,7 +2,7 @@
 
 import uuid
 
-from sqlalchemy import Column, DateTime, ForeignKey, String, func
+from sqlalchemy import Column, DateTime, ForeignKey, Index, Integer, String, func, text
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 
@@ -22,6 +22,10 @@ class Workspace(Base):
         nullable=True,
         index=True,
     )
+    # Days of card activity and audit history kept (NULL: HISTORY_RETENTION_DAYS)
+    retention_days = Column(Integer, nullable=True)
+    # Set on delete; the row and its boards are purged later in the background
+    deleted_at = Column(DateTime(timezone=True), nullable=True)
     created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
     updated_at = Column(
         DateTime(timezone=True),
@@ -43,6 +47,13 @@ class Workspace(Base):
         "WorkspaceLabel", back_populates="workspace", cascade="all, delete-orphan"
     )
 
+    # Indexes
+    __table_args__ = (
+        Index(
+            "ix_workspaces_deleted_at", "deleted_at", postgresql_where=text("deleted_at IS NOT NULL")
+        ),
+    )
+
     def __repr__(self) -> str:
         """String representation of Workspace."""
         return f"<Workspace(id={self.id}, name={self.name})>"
@@ -3,11 +3,12 @@
 import enum
 import uuid
 
-from sqlalchemy import Column, DateTime, Enum, ForeignKey, Index, String, func
+from sqlalchemy import Column, DateTime, Enum, ForeignKey, Index, String, event, func
 from sqlalchemy.dialects.postgresql import JSONB, UUID
 from sqlalchemy.orm import relationship
 
 from app.core.database import Base
+from app.utils.partitions import create_initial_partitions
 
 
 class AuditActionEnum(str, enum.Enum):
@@ -38,7 +39,10 @@ class WorkspaceAuditLog(Base):
     resource_type = Column(String(50), nullable=False)  # "invitation", "member"
     resource_id = Column(UUID(as_uuid=True), nullable=False)
     context_data = Column(JSONB, nullable=True)  # Additional context (email, role, etc.)
-    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    # Partition key, so part of the table's primary key (the mapper still keys on id)
+    created_at = Column(
+        DateTime(timezone=True), server_default=func.now(), primary_key=True, nullable=False
+    )
 
     # Relationships
     workspace = relationship("Workspace")
@@ -46,12 +50,18 @@ class WorkspaceAuditLog(Base):
 
     # Indexes for performance
     __table_args__ = (
-        Index("ix_workspace_audit_logs_workspace_id", "workspace_id"),
+        Index("ix_workspace_audit_logs_workspace_created", "workspace_id", created_at.desc()),
         Index("ix_workspace_audit_logs_actor_id", "actor_id"),
         Index("ix_workspace_audit_logs_created_at", "created_at"),
         Index("ix_workspace_audit_logs_action", "action"),
+        {"postgresql_partition_by": "RANGE (created_at)"},
     )
+    __mapper_args__ = {**Base.__mapper_args__, "primary_key": [id]}
 
     def __repr__(self) -> str:
         """String representation of WorkspaceAuditLog."""
         return f"<WorkspaceAuditLog(workspace_id={self.workspace_id}, action={self.action}, actor_id={self.actor_id})>"
+
+
+# Monthly range partitions; see app.services.partition_service for upkeep
+event.listen(WorkspaceAuditLog.__table__, "after_create", create_initial_partitions)
@@ -0,0 +1,96 @@
+"""Card activity repository for database operations."""
+
+from datetime import datetime
+from typing import Any
+from uuid import UUID
+
+from sqlalchemy import CTE, ColumnElement, func, literal, null, select, tuple_
+from sqlalchemy.dialects.postgresql import JSONB, Insert, insert
+from sqlalchemy.dialects.postgresql import UUID as PG_UUID
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.board import Board
+from app.models.card_activity import CardActivity
+from app.repositories.base import BaseRepository
+
+
+class ActivityRepository(BaseRepository[CardActivity]):
+    """Repository for CardActivity model operations."""
+
+    def __init__(self, session: AsyncSession):
+        """Initialize ActivityRepository.
+
+        Args:
+            session: Async database session
+        """
+        super().__init__(CardActivity, session)
+
+    @staticmethod
+    def insert_from(
+        cards: CTE,
+        user_id: UUID,
+        action: str,
+        metadata: dict[str, Any] | ColumnElement,
+        keep_card_id: bool = True,
+    ) -> Insert:
+        """Build an INSERT recording one activity per row of a card CTE.
+
+        The CTE is the data-modifying statement that changed the cards
+        (it must return their id and board_id), so the activity rows are
+        written by the same statement as the change and cost no extra
+        round trip.
+
+        Args:
+            cards: CTE over the changed cards
+            user_id: UUID of acting user
+            action: Activity action name
+            metadata: JSON metadata, or a SQL expression over the CTE columns
+            keep_card_id: False for deleted cards, whose id is gone
+
+        Returns:
+            INSERT ... SELECT statement, usable as a statement or a CTE
+        """
+        if isinstance(metadata, dict):
+            metadata = literal(metadata, JSONB)
+        workspace_id = (
+            select(Board.workspace_id).where(Board.id == cards.c.board_id).scalar_subquery()
+        )
+        return insert(CardActivity).from_select(
+            ["id", "card_id", "board_id", "workspace_id", "user_id", "action", "activity_metadata"],
+            select(
+                func.gen_random_uuid(),
+                cards.c.id if keep_card_id else null(),
+                cards.c.board_id,
+                workspace_id,
+                literal(user_id, PG_UUID(as_uuid=True)),
+                literal(action),
+                metadata,
+            ),
+        )
+
+    async def get_page(
+        self,
+        *where: ColumnElement[bool],
+        limit: int,
+        before: tuple[datetime, UUID] | None = None,
+    ) -> list[CardActivity]:
+        """Get activities newest first, continuing below a keyset position.
+
+        Args:
+            where: Filters selecting the feed (card or workspace)
+            limit: Maximum number of activities to return
+            before: (created_at, id) of the last activity already seen
+
+        Returns:
+            List of CardActivity instances
+        """
+        query = (
+            select(CardActivity)
+            .where(*where)
+            .order_by(CardActivity.created_at.desc(), CardActivity.id.desc())
+            .limit(limit)
+        )
+        if before is not None:
+            query = query.where(tuple_(CardActivity.created_at, CardActivity.id) < before)
+        result = await self.session.execute(query)
+        return list(result.scalars().all())
@@ -3,11 +3,15 @@
 from typing import Sequence
 from uuid import UUID
 
-from sqlalchemy import delete, select
+from sqlalchemy import Row, delete, exists, func, select, true
+from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.models.board import Board
+from app.models.card import Card
 from app.models.card_assignee import CardAssignee
 from app.models.user import User
+from app.models.workspace_member import WorkspaceMember
 
 
 class AssigneeRepository:
@@ -17,12 +21,102 @@ class AssigneeRepository:
         """Initialize assignee repository."""
         self.session = session
 
-    async def assign_user_to_card(self, card_id: UUID, user_id: UUID) -> CardAssignee:
-        """Assign a user to a card."""
-        assignee = CardAssignee(card_id=card_id, user_id=user_id)
-        self.session.add(assignee)
-        await self.session.flush()
-        return assignee
+    async def assign_user_to_card(
+        self, card_id: UUID, user_id: UUID, actor_id: UUID
+    ) -> Row | None:
+        """
+        Assign a user to a card in a single statement.
+
+        Resolves the card's workspace, checks that actor_id and user_id are
+        both members of it, and inserts the card_assignees row with ON
+        CONFLICT DO NOTHING, all in one round-trip.
+
+        Returns:
+            Row with actor_is_member, the card's workspace_id, the assignee's
+            user columns (None when they are not a workspace member) and an
+            inserted flag, or None if the card does not exist
+        """
+        actor_is_member = exists().where(
+            WorkspaceMember.workspace_id == Board.workspace_id,
+            WorkspaceMember.user_id == actor_id,
+        )
+        target = (
+            select(
+                Card.id.label("card_id"),
+                Board.workspace_id,
+                actor_is_member.label("actor_is_member"),
+            )
+            .join(Board, Board.id == Card.board_id)
+            .where(Card.id == card_id, Board.deleted_at.is_(None))
+            .cte("target")
+        )
+        assignee = (
+            select(User.id, User.username, User.email, User.avatar_url, User.github_id)
+            .join(WorkspaceMember, WorkspaceMember.user_id == User.id)
+            .join(target, WorkspaceMember.workspace_id == target.c.workspace_id)
+            .where(User.id == user_id)
+            .cte("assignee")
+        )
+        inserted = (
+            insert(CardAssignee)
+            .from_select(
+                ["card_id", "user_id"],
+                select(target.c.card_id, assignee.c.id).where(target.c.actor_is_member),
+            )
+            .on_conflict_do_nothing(index_elements=["card_id", "user_id"])
+            .returning(CardAssignee.user_id)
+            .cte("inserted")
+        )
+        result = await self.session.execute(
+            select(
+                target.c.actor_is_member,
+                target.c.workspace_id,
+                assignee.c.id,
+                assignee.c.username,
+                assignee.c.email,
+                assignee.c.avatar_url,
+                assignee.c.github_id,
+                exists(select(inserted.c.user_id)).label("inserted"),
+            ).select_from(target.outerjoin(assignee, true()))
+        )
+        return result.one_or_none()
+
+    async def count_workspace_members(self, workspace_id: UUID, user_ids: list[UUID]) -> int:
+        """Count how many of the given users are members of a workspace."""
+        result = await self.session.execute(
+            select(func.count(WorkspaceMember.user_id)).where(
+                WorkspaceMember.workspace_id == workspace_id, WorkspaceMember.user_id.in_(user_ids)
+            )
+        )
+        return result.scalar() or 0
+
+    async def assign_users_to_cards(
+        self, card_ids: list[UUID], user_ids: list[UUID], workspace_id: UUID
+    ) -> int:
+        """Assign every workspace member in user_ids to every card; returns rows inserted."""
+        result = await self.session.execute(
+            insert(CardAssignee)
+            .from_select(
+                ["card_id", "user_id"],
+                select(Card.id, WorkspaceMember.user_id).where(
+                    Card.id.in_(card_ids),
+                    WorkspaceMember.workspace_id == workspace_id,
+                    WorkspaceMember.user_id.in_(user_ids),
+                ),
+            )
+            .on_conflict_do_nothing(index_elements=["card_id", "user_id"])
+            .returning(CardAssignee.card_id)
+        )
+        return len(result.all())
+
+    async def unassign_users_from_cards(self, card_ids: list[UUID], user_ids: list[UUID]) -> int:
+        """Unassign users from cards in one DELETE; returns rows deleted."""
+        result = await self.session.execute(
+            delete(CardAssignee).where(
+                CardAssignee.card_id.in_(card_ids), CardAssignee.user_id.in_(user_ids)
+            )
+        )
+        return result.rowcount
 
     async def unassign_user_from_card(self, card_id: UUID, user_id: UUID) -> bool:
         """Unassign a user from a card."""
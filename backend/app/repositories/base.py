@@ -1,9 +1,9 @@
 """Base repository with common CRUD operations."""
 
-from typing import Generic, Optional, TypeVar
+from typing import Any, Generic, Optional, TypeVar
 from uuid import UUID
 
-from sqlalchemy import select
+from sqlalchemy import inspect, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.database import Base
@@ -54,6 +54,9 @@ class BaseRepository(Generic[ModelType]):
     async def create(self, obj: ModelType) -> ModelType:
         """Create a new record.
 
+        Server defaults are read back by the INSERT's RETURNING clause
+        (models use eager_defaults), so this is a single round trip.
+
         Args:
             obj: Model instance to create
 
@@ -62,7 +65,6 @@ class BaseRepository(Generic[ModelType]):
         """
         self.session.add(obj)
         await self.session.flush()
-        await self.session.refresh(obj)
         return obj
 
     async def update(self, obj: ModelType) -> ModelType:
@@ -72,12 +74,42 @@ class BaseRepository(Generic[ModelType]):
             obj: Model instance with updated fields
 
         Returns:
-            Updated model instance
+            Updated model instance, including onupdate values from RETURNING
         """
         await self.session.flush()
-        await self.session.refresh(obj)
         return obj
 
+    async def update_by_id(self, id: UUID, values: dict[str, Any]) -> Optional[ModelType]:
+        """Update a record by ID without loading it first.
+
+        Issues one UPDATE ... RETURNING and maps the returned row, so the
+        result reflects every column as written, including server-side
+        onupdate values. Versioned models have their version bumped.
+
+        Args:
+            id: UUID of the record
+            values: Column values to set
+
+        Returns:
+            Updated model instance or None if not found
+        """
+        if not values:
+            return await self.get_by_id(id)
+        version_col = inspect(self.model).version_id_col
+        if version_col is not None:
+            values = {**values, version_col.key: version_col + 1}
+        result = await self.session.execute(
+            select(self.model)
+            .from_statement(
+                update(self.model)
+                .where(self.model.id == id)  # type: ignore[attr-defined]
+                .values(**values)
+                .returning(self.model)
+            )
+            .execution_options(populate_existing=True)
+        )
+        return result.scalar_one_or_none()
+
     async def delete(self, obj: ModelType) -> None:
         """Delete a record.
 
@@ -0,0 +1,115 @@
+"""Board column repository for column lookups and card counters."""
+
+from collections.abc import Iterable
+from uuid import UUID
+
+from sqlalchemy import case, func, or_, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.board_column import BoardColumn
+from app.models.card import Card
+
+
+class BoardColumnRepository:
+    """Repository for board columns and their card counters."""
+
+    def __init__(self, session: AsyncSession) -> None:
+        """Initialize board column repository."""
+        self.session = session
+
+    async def get_columns(
+        self, board_id: UUID, column_ids: Iterable[UUID]
+    ) -> dict[UUID, BoardColumn]:
+        """Get board columns by primary key, keyed by column id."""
+        result = await self.session.execute(
+            select(BoardColumn).where(
+                BoardColumn.board_id == board_id, BoardColumn.id.in_(set(column_ids))
+            )
+        )
+        return {column.id: column for column in result.scalars()}
+
+    async def get_card_counts(self, board_ids: Iterable[UUID]) -> dict[UUID, dict[UUID, int]]:
+        """Get the card count of every column of the given boards."""
+        result = await self.session.execute(
+            select(BoardColumn.board_id, BoardColumn.id, BoardColumn.card_count).where(
+                BoardColumn.board_id.in_(set(board_ids))
+            )
+        )
+        counts: dict[UUID, dict[UUID, int]] = {}
+        for board_id, column_id, card_count in result:
+            counts.setdefault(board_id, {})[column_id] = card_count
+        return counts
+
+    async def claim_slot(self, board_id: UUID, column_id: UUID) -> BoardColumn | None:
+        """
+        Count one more card in a column if it is below its WIP limit.
+
+        Returns:
+            The updated column, or None if it doesn't exist or is full
+        """
+        result = await self.session.execute(
+            update(BoardColumn)
+            .where(
+                BoardColumn.board_id == board_id,
+                BoardColumn.id == column_id,
+                or_(
+                    BoardColumn.wip_limit.is_(None),
+                    BoardColumn.card_count < BoardColumn.wip_limit,
+                ),
+            )
+            .values(card_count=BoardColumn.card_count + 1)
+            .returning(BoardColumn)
+            .execution_options(synchronize_session=False)
+        )
+        return result.scalar_one_or_none()
+
+    async def adjust_card_counts(self, board_id: UUID, deltas: dict[UUID, int]) -> None:
+        """Add per-column deltas to the card counters with a single UPDATE."""
+        deltas = {column_id: delta for column_id, delta in deltas.items() if delta}
+        if not deltas:
+            return
+        await self.session.execute(
+            update(BoardColumn)
+            .where(BoardColumn.board_id == board_id, BoardColumn.id.in_(deltas))
+            .values(card_count=BoardColumn.card_count + case(deltas, value=BoardColumn.id, else_=0))
+            .execution_options(synchronize_session=False)
+        )
+
+    async def recount(self, board_id: UUID, column_ids: Iterable[UUID]) -> None:
+        """Reset card counters to the number of cards actually in each column."""
+        await self.session.execute(
+            update(BoardColumn)
+            .where(BoardColumn.board_id == board_id, BoardColumn.id.in_(set(column_ids)))
+            .values(
+                card_count=select(func.count())
+                .where(Card.board_id == BoardColumn.board_id, Card.column_id == BoardColumn.id)
+                .scalar_subquery()
+            )
+            .execution_options(synchronize_session=False)
+        )
+
+    async def recount_boards(self, board_ids: Iterable[UUID]) -> list[UUID]:
+        """
+        Reset the card counters of every column of boards, writing only drifted ones.
+
+        The caller must hold the columns' locks (see lock_columns).
+
+        Returns:
+            UUIDs of boards with at least one counter that had drifted
+        """
+        board_ids = set(board_ids)
+        if not board_ids:
+            return []
+        actual = (
+            select(func.count())
+            .where(Card.board_id == BoardColumn.board_id, Card.column_id == BoardColumn.id)
+            .scalar_subquery()
+        )
+        result = await self.session.execute(
+            update(BoardColumn)
+            .where(BoardColumn.board_id.in_(board_ids), BoardColumn.card_count != actual)
+            .values(card_count=actual)
+            .returning(BoardColumn.board_id)
+            .execution_options(synchronize_session=False)
+        )
+        return list(dict.fromkeys(result.scalars()))
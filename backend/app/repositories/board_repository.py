@@ -29,7 +29,9 @@ class BoardRepository(BaseRepository[Board]):
         Returns:
             List of Board instances
         """
-        result = await self.session.execute(select(Board).where(Board.workspace_id == workspace_id))
+        result = await self.session.execute(
+            select(Board).where(Board.workspace_id == workspace_id, Board.deleted_at.is_(None))
+        )
         return list(result.scalars().all())
 
     async def get_active_by_workspace(self, workspace_id: UUID) -> list[Board]:
@@ -45,6 +47,7 @@ class BoardRepository(BaseRepository[Board]):
             select(Board).where(
                 Board.workspace_id == workspace_id,
                 Board.archived == False,  # noqa: E712
+                Board.deleted_at.is_(None),
             )
         )
         return list(result.scalars().all())
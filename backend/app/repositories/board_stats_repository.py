@@ -0,0 +1,212 @@
+"""Board stats repository for the materialized card totals of boards."""
+
+from collections.abc import Iterable
+from datetime import date
+from uuid import UUID
+
+from sqlalchemy import (
+    CTE,
+    ColumnElement,
+    Integer,
+    Update,
+    and_,
+    cast,
+    func,
+    literal,
+    select,
+    update,
+)
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import aliased
+
+from app.models.board_stats import BoardStats
+from app.models.card import Card
+
+
+class BoardStatsRepository:
+    """Repository for board stats rows and the deltas applied to them."""
+
+    def __init__(self, session: AsyncSession) -> None:
+        """Initialize board stats repository."""
+        self.session = session
+
+    @staticmethod
+    def apply_from(
+        cards: CTE,
+        card_delta: int = 0,
+        added: tuple[ColumnElement, ColumnElement] | None = None,
+        removed: tuple[ColumnElement, ColumnElement] | None = None,
+    ) -> Update:
+        """Build an UPDATE adding the totals of a card CTE to board_stats.
+
+        Like ActivityRepository.insert_from, the CTE is the data-modifying
+        statement that changed the cards (it must return their board_id), so
+        the totals move in the same statement as the cards.
+
+        Args:
+            cards: CTE over the changed cards
+            card_delta: Cards added (1) or removed (-1) per row
+            added: (story_points, due_date) expressions now counted per row
+            removed: (story_points, due_date) expressions no longer counted
+
+        Returns:
+            UPDATE ... FROM statement, usable as a statement or a CTE
+        """
+        current = aliased(BoardStats)
+
+        def totals(values: tuple[ColumnElement, ColumnElement]) -> tuple:
+            story_points, due_date = values
+            overdue = cast(due_date < current.overdue_as_of, Integer)
+            return func.coalesce(story_points, 0), func.coalesce(overdue, 0)
+
+        story_points, overdue = literal(0), literal(0)
+        if added is not None:
+            points, late = totals(added)
+            story_points, overdue = story_points + points, overdue + late
+        if removed is not None:
+            points, late = totals(removed)
+            story_points, overdue = story_points - points, overdue - late
+
+        deltas = (
+            select(
+                cards.c.board_id,
+                (func.count() * card_delta).label("card_count"),
+                func.sum(story_points).label("story_points"),
+                func.sum(overdue).label("overdue_count"),
+            )
+            .join(current, current.board_id == cards.c.board_id)
+            .group_by(cards.c.board_id)
+            .subquery("deltas")
+        )
+        return (
+            update(BoardStats)
+            .where(BoardStats.board_id == deltas.c.board_id)
+            .values(
+                card_count=BoardStats.card_count + deltas.c.card_count,
+                story_points=BoardStats.story_points + deltas.c.story_points,
+                overdue_count=BoardStats.overdue_count + deltas.c.overdue_count,
+                updated_at=func.now(),
+            )
+        )
+
+    async def get(self, board_id: UUID) -> BoardStats | None:
+        """Get the stats row of a board."""
+        return await self.session.get(BoardStats, board_id, populate_existing=True)
+
+    async def roll_overdue(self, today: date, limit: int) -> int:
+        """
+        Move overdue counts of stale boards forward to today.
+
+        Locks a batch of boards whose overdue_as_of is in the past, skipping
+        rows other transactions hold, and recounts their overdue cards from
+        the (board_id, due_date) index.
+
+        Returns:
+            Number of boards updated
+        """
+        locked = aliased(BoardStats)
+        stale = (
+            select(locked.board_id)
+            .where(locked.overdue_as_of < today)
+            .order_by(locked.overdue_as_of)
+            .limit(limit)
+            .with_for_update(skip_locked=True)
+            .scalar_subquery()
+        )
+        result = await self.session.execute(
+            update(BoardStats)
+            .where(BoardStats.board_id.in_(stale))
+            .values(
+                overdue_as_of=today,
+                overdue_count=self._overdue_count(today),
+                updated_at=func.now(),
+            )
+            .returning(BoardStats.board_id)
+            .execution_options(synchronize_session=False)
+        )
+        return len(result.all())
+
+    async def lock_least_recently_reconciled(self, limit: int) -> list[UUID]:
+        """Lock the stats rows reconciled longest ago, skipping locked rows."""
+        result = await self.session.execute(
+            select(BoardStats.board_id)
+            .order_by(BoardStats.reconciled_at)
+            .limit(limit)
+            .with_for_update(skip_locked=True)
+        )
+        return list(result.scalars())
+
+    async def reconcile(self, board_ids: Iterable[UUID]) -> list[UUID]:
+        """
+        Recount the totals of locked boards from their cards.
+
+        The caller must hold the stats rows' locks (see
+        lock_least_recently_reconciled), since writers adding deltas in the
+        meantime would otherwise be overwritten.
+
+        Returns:
+            UUIDs of boards whose stored totals had drifted
+        """
+        board_ids = set(board_ids)
+        if not board_ids:
+            return []
+        actual = (
+            select(
+                Card.board_id,
+                func.count().label("card_count"),
+                func.coalesce(func.sum(Card.story_points), 0).label("story_points"),
+            )
+            .where(Card.board_id.in_(board_ids))
+            .group_by(Card.board_id)
+            .subquery("actual")
+        )
+        previous = aliased(BoardStats)
+        card_count = func.coalesce(actual.c.card_count, 0)
+        story_points = func.coalesce(actual.c.story_points, 0)
+        overdue_count = self._overdue_count(BoardStats.overdue_as_of)
+        recount = (
+            select(
+                previous.board_id,
+                previous.card_count,
+                previous.story_points,
+                previous.overdue_count,
+                card_count.label("actual_cards"),
+                story_points.label("actual_points"),
+            )
+            .outerjoin(actual, actual.c.board_id == previous.board_id)
+            .where(previous.board_id.in_(board_ids))
+            .subquery("recount")
+        )
+        result = await self.session.execute(
+            update(BoardStats)
+            .where(BoardStats.board_id == recount.c.board_id)
+            .values(
+                card_count=recount.c.actual_cards,
+                story_points=recount.c.actual_points,
+                overdue_count=overdue_count,
+                reconciled_at=func.now(),
+            )
+            .returning(
+                BoardStats.board_id,
+                and_(
+                    recount.c.card_count == recount.c.actual_cards,
+                    recount.c.story_points == recount.c.actual_points,
+                    recount.c.overdue_count == BoardStats.overdue_count,
+                ).label("in_sync"),
+            )
+            .execution_options(synchronize_session=False)
+        )
+        return [board_id for board_id, in_sync in result if not in_sync]
+
+    @staticmethod
+    def _overdue_count(as_of: date | ColumnElement) -> ColumnElement:
+        """Count a stats row's board's cards due before a date."""
+        return (
+            select(func.count())
+            .where(
+                Card.board_id == BoardStats.board_id,
+                Card.due_date.is_not(None),
+                Card.due_date < as_of,
+            )
+            .scalar_subquery()
+        )
@@ -1,15 +1,28 @@
 """Card repository for database operations."""
 
+from dataclasses import dataclass, field
 from uuid import UUID
 
-from sqlalchemy import select
+from sqlalchemy import exists, select
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
+from app.models.board import Board
 from app.models.card import Card
+from app.models.workspace_member import WorkspaceMember
 from app.repositories.base import BaseRepository
 
 
+@dataclass
+class CardScope:
+    """Boards and workspaces spanned by a set of cards."""
+
+    card_ids: set[UUID] = field(default_factory=set)
+    workspace_ids: set[UUID] = field(default_factory=set)
+    cards_by_board: dict[UUID, list[UUID]] = field(default_factory=dict)
+    is_member: bool = True
+
+
 class CardRepository(BaseRepository[Card]):
     """Repository for Card model operations."""
 
@@ -31,7 +44,7 @@ class CardRepository(BaseRepository[Card]):
             List of Card instances ordered by position
         """
         result = await self.session.execute(
-            select(Card).where(Card.board_id == board_id).order_by(Card.column_id, Card.position)
+            select(Card).where(Card.board_id == board_id).order_by(Card.column_id, Card.position, Card.id)
         )
         return list(result.scalars().all())
 
@@ -48,7 +61,7 @@ class CardRepository(BaseRepository[Card]):
         result = await self.session.execute(
             select(Card)
             .where(Card.board_id == board_id, Card.column_id == column_id)
-            .order_by(Card.position)
+            .order_by(Card.position, Card.id)
         )
         return list(result.scalars().all())
 
@@ -77,3 +90,31 @@ class CardRepository(BaseRepository[Card]):
             select(Card).where(Card.id == card_id).options(selectinload(Card.board))
         )
         return result.scalar_one_or_none()
+
+    async def get_scope(self, card_ids: list[UUID], user_id: UUID) -> CardScope:
+        """Resolve boards, workspaces and membership for many cards in one query.
+
+        Args:
+            card_ids: Card UUIDs
+            user_id: User whose workspace membership is checked
+
+        Returns:
+            CardScope of the cards that exist; is_member is True only if the
+            user belongs to every workspace involved
+        """
+        is_member = exists().where(
+            WorkspaceMember.workspace_id == Board.workspace_id,
+            WorkspaceMember.user_id == user_id,
+        )
+        result = await self.session.execute(
+            select(Card.id, Card.board_id, Board.workspace_id, is_member.label("is_member"))
+            .join(Board, Board.id == Card.board_id)
+            .where(Card.id.in_(card_ids), Board.deleted_at.is_(None))
+        )
+        scope = CardScope()
+        for row in result:
+            scope.card_ids.add(row.id)
+            scope.workspace_ids.add(row.workspace_id)
+            scope.cards_by_board.setdefault(row.board_id, []).append(row.id)
+            scope.is_member = scope.is_member and row.is_member
+        return scope
@@ -3,11 +3,16 @@
 from typing import Sequence
 from uuid import UUID
 
-from sqlalchemy import delete, func, select
+from sqlalchemy import Row, delete, exists, func, literal, select, update
+from sqlalchemy.dialects.postgresql import UUID as PG_UUID
+from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.models.board import Board
+from app.models.card import Card
 from app.models.card_label import CardLabel
 from app.models.workspace_label import WorkspaceLabel
+from app.models.workspace_member import WorkspaceMember
 
 
 class LabelRepository:
@@ -20,11 +25,10 @@ class LabelRepository:
     async def create_label(
         self, workspace_id: UUID, name: str, color: str
     ) -> WorkspaceLabel:
-        """Create a new workspace label."""
+        """Create a new workspace label with a single INSERT ... RETURNING."""
         label = WorkspaceLabel(workspace_id=workspace_id, name=name, color=color)
         self.session.add(label)
         await self.session.flush()
-        await self.session.refresh(label)
         return label
 
     async def get_label_by_id(self, label_id: UUID) -> WorkspaceLabel | None:
@@ -34,6 +38,12 @@ class LabelRepository:
         )
         return result.scalar_one_or_none()
 
+    async def get_label_workspace_id(self, label_id: UUID) -> UUID | None:
+        """Get the workspace a label belongs to."""
+        return await self.session.scalar(
+            select(WorkspaceLabel.workspace_id).where(WorkspaceLabel.id == label_id)
+        )
+
     async def get_workspace_labels(self, workspace_id: UUID) -> Sequence[WorkspaceLabel]:
         """Get all labels for a workspace."""
         result = await self.session.execute(
@@ -46,29 +56,31 @@ class LabelRepository:
     async def update_label(
         self, label_id: UUID, name: str | None = None, color: str | None = None
     ) -> WorkspaceLabel | None:
-        """Update label name and/or color."""
-        label = await self.get_label_by_id(label_id)
-        if not label:
-            return None
+        """Update label name and/or color with a single UPDATE ... RETURNING."""
+        values = {
+            key: value for key, value in (("name", name), ("color", color)) if value is not None
+        }
+        if not values:
+            return await self.get_label_by_id(label_id)
 
-        if name is not None:
-            label.name = name
-        if color is not None:
-            label.color = color
-
-        await self.session.flush()
-        await self.session.refresh(label)
-        return label
+        result = await self.session.execute(
+            select(WorkspaceLabel)
+            .from_statement(
+                update(WorkspaceLabel)
+                .where(WorkspaceLabel.id == label_id)
+                .values(**values)
+                .returning(WorkspaceLabel)
+            )
+            .execution_options(populate_existing=True)
+        )
+        return result.scalar_one_or_none()
 
     async def delete_label(self, label_id: UUID) -> bool:
-        """Delete a label and all its card associations."""
-        label = await self.get_label_by_id(label_id)
-        if not label:
-            return False
-
-        await self.session.delete(label)
-        await self.session.flush()
-        return True
+        """Delete a label; its card associations go with it (ON DELETE CASCADE)."""
+        result = await self.session.execute(
+            delete(WorkspaceLabel).where(WorkspaceLabel.id == label_id)
+        )
+        return result.rowcount > 0
 
     async def count_cards_with_label(self, label_id: UUID) -> int:
         """Count how many cards use this label."""
@@ -77,33 +89,105 @@ class LabelRepository:
         )
         return result.scalar() or 0
 
-    async def add_label_to_card(self, card_id: UUID, label_id: UUID) -> CardLabel:
-        """Add a label to a card."""
-        # Check if already exists
+    async def add_label_to_card(
+        self, card_id: UUID, label_id: UUID, user_id: UUID
+    ) -> Row | None:
+        """
+        Attach a label to a card in a single statement.
+
+        Looks up the label, checks that user_id is a member of the label's
+        workspace and that the card lives in that workspace, and inserts the
+        card_labels row with ON CONFLICT DO NOTHING, all in one round-trip.
+
+        Returns:
+            Row with the label columns plus is_member, card_in_workspace and
+            inserted flags and the card's board_id (None unless the card is
+            in the label's workspace), or None if the label does not exist
+        """
+        is_member = exists().where(
+            WorkspaceMember.workspace_id == WorkspaceLabel.workspace_id,
+            WorkspaceMember.user_id == user_id,
+        )
+        card_board_id = (
+            select(Card.board_id)
+            .join(Board, Board.id == Card.board_id)
+            .where(Card.id == card_id, Board.deleted_at.is_(None))
+            .where(Board.workspace_id == WorkspaceLabel.workspace_id)
+            .scalar_subquery()
+        )
+        target = (
+            select(
+                WorkspaceLabel.id,
+                WorkspaceLabel.workspace_id,
+                WorkspaceLabel.name,
+                WorkspaceLabel.color,
+                WorkspaceLabel.created_at,
+                is_member.label("is_member"),
+                card_board_id.label("board_id"),
+            )
+            .where(WorkspaceLabel.id == label_id)
+            .cte("target")
+        )
+        card_in_workspace = target.c.board_id.is_not(None)
+        inserted = (
+            insert(CardLabel)
+            .from_select(
+                ["card_id", "label_id"],
+                select(literal(card_id, PG_UUID(as_uuid=True)), target.c.id).where(
+                    target.c.is_member, card_in_workspace
+                ),
+            )
+            .on_conflict_do_nothing(index_elements=["card_id", "label_id"])
+            .returning(CardLabel.label_id)
+            .cte("inserted")
+        )
         result = await self.session.execute(
-            select(CardLabel).where(
-                CardLabel.card_id == card_id,
-                CardLabel.label_id == label_id
+            select(
+                target,
+                card_in_workspace.label("card_in_workspace"),
+                exists(select(inserted.c.label_id)).label("inserted"),
             )
         )
-        existing = result.scalar_one_or_none()
-        if existing:
-            raise ValueError("Label already added to this card")
+        return result.one_or_none()
 
-        card_label = CardLabel(card_id=card_id, label_id=label_id)
-        self.session.add(card_label)
-        await self.session.flush()
-        return card_label
+    async def add_labels_to_cards(self, card_ids: list[UUID], label_ids: list[UUID]) -> int:
+        """Attach every label to every card, skipping existing links; returns rows inserted."""
+        result = await self.session.execute(
+            insert(CardLabel)
+            .from_select(
+                ["card_id", "label_id"],
+                select(Card.id, WorkspaceLabel.id).where(
+                    Card.id.in_(card_ids), WorkspaceLabel.id.in_(label_ids)
+                ),
+            )
+            .on_conflict_do_nothing(index_elements=["card_id", "label_id"])
+            .returning(CardLabel.card_id)
+        )
+        return len(result.all())
 
-    async def remove_label_from_card(self, card_id: UUID, label_id: UUID) -> bool:
-        """Remove a label from a card."""
+    async def remove_labels_from_cards(self, card_ids: list[UUID], label_ids: list[UUID]) -> int:
+        """Detach labels from cards in one DELETE; returns rows deleted."""
         result = await self.session.execute(
             delete(CardLabel).where(
-                CardLabel.card_id == card_id, CardLabel.label_id == label_id
+                CardLabel.card_id.in_(card_ids), CardLabel.label_id.in_(label_ids)
             )
         )
+        return result.rowcount
+
+    async def remove_label_from_card(self, card_id: UUID, label_id: UUID) -> UUID | None:
+        """
+        Remove a label from a card.
+
+        Returns:
+            The card's board_id, or None if the card didn't have the label
+        """
+        result = await self.session.execute(
+            delete(CardLabel)
+            .where(CardLabel.card_id == card_id, CardLabel.label_id == label_id)
+            .returning(select(Card.board_id).where(Card.id == CardLabel.card_id).scalar_subquery())
+        )
         await self.session.flush()
-        return result.rowcount > 0
+        return result.scalar_one_or_none()
 
     async def get_card_labels(self, card_id: UUID) -> Sequence[WorkspaceLabel]:
         """Get all labels for a card."""
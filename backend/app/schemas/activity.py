@@ -0,0 +1,31 @@
+"""Pydantic schemas for card activity feeds."""
+
+from datetime import datetime
+from typing import Any
+from uuid import UUID
+
+from pydantic import BaseModel, Field
+
+
+class ActivityResponse(BaseModel):
+    """Schema for a single card activity entry."""
+
+    id: UUID
+    card_id: UUID | None = Field(None, description="Null once the card has been deleted")
+    board_id: UUID
+    workspace_id: UUID
+    user_id: UUID | None
+    action: str
+    metadata: dict[str, Any] = Field(..., validation_alias="activity_metadata")
+    created_at: datetime
+
+    model_config = {"from_attributes": True}
+
+
+class ActivityPageResponse(BaseModel):
+    """Keyset-paginated page of activities, newest first."""
+
+    activities: list[ActivityResponse]
+    next_cursor: str | None = Field(
+        None, description="Cursor for the next page (null when the feed is exhausted)"
+    )
@@ -2,10 +2,27 @@
 
 from uuid import UUID
 
-from pydantic import BaseModel
+from pydantic import BaseModel, Field, model_validator
 
 
 class AssigneeRequest(BaseModel):
     """Schema for assigning user to card."""
 
     user_id: UUID
+
+
+class BulkCardAssigneesRequest(BaseModel):
+    """Schema for adding/removing assignees on many cards at once."""
+
+    card_ids: list[UUID] = Field(..., min_length=1, max_length=500, description="Target cards")
+    add: list[UUID] = Field(default_factory=list, max_length=50, description="Users to assign")
+    remove: list[UUID] = Field(default_factory=list, max_length=50, description="Users to unassign")
+
+    @model_validator(mode="after")
+    def validate_sets(self) -> "BulkCardAssigneesRequest":
+        """Require at least one change and disjoint add/remove sets."""
+        if not self.add and not self.remove:
+            raise ValueError("At least one user to add or remove must be provided")
+        if set(self.add) & set(self.remove):
+            raise ValueError("A user cannot be both added and removed")
+        return self
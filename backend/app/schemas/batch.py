@@ -0,0 +1,39 @@
+"""Batch Pydantic schemas for running several API reads in one request."""
+
+from typing import Any, Literal, Optional
+
+from pydantic import BaseModel, Field
+
+
+class BatchSubRequest(BaseModel):
+    """One read against an existing API route."""
+
+    id: Optional[str] = Field(None, max_length=100, description="Label echoed in the response")
+    method: Literal["GET"] = Field("GET", description="Only reads can be batched")
+    path: str = Field(
+        ...,
+        pattern=r"^/api/",
+        max_length=2048,
+        description="Path and query string, e.g. /api/boards/{id}/cards?column_id=...",
+    )
+
+
+class BatchRequest(BaseModel):
+    """Sub-requests to run together."""
+
+    requests: list[BatchSubRequest] = Field(..., min_length=1, max_length=20)
+
+
+class BatchSubResponse(BaseModel):
+    """Outcome of one sub-request, as the route itself would have answered."""
+
+    id: Optional[str] = None
+    status: int
+    headers: dict[str, str] = Field(..., description="Content-Type and ETag, when sent")
+    body: Any = Field(None, description="Decoded JSON, or the text of other responses")
+
+
+class BatchResponse(BaseModel):
+    """Sub-responses in request order."""
+
+    responses: list[BatchSubResponse]
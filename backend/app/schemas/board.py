@@ -1,6 +1,6 @@
 """Board Pydantic schemas for request/response validation."""
 
-from datetime import datetime
+from datetime import date, datetime
 from typing import Optional
 from uuid import UUID
 
@@ -13,6 +13,15 @@ class ColumnSchema(BaseModel):
     id: str  # UUID as string
     name: str
     position: int
+    wip_limit: Optional[int] = Field(
+        None, ge=1, description="Most cards the column may hold (none if unset)"
+    )
+
+
+class ColumnResponse(ColumnSchema):
+    """Column within a board response, with its live card count."""
+
+    card_count: int = 0
 
 
 class BoardCreate(BaseModel):
@@ -38,8 +47,9 @@ class BoardResponse(BaseModel):
     id: UUID
     workspace_id: UUID
     name: str
-    columns: list[ColumnSchema]
+    columns: list[ColumnResponse]
     archived: bool
+    version: int = Field(..., description="Concurrency token; also sent as the ETag")
     created_at: datetime
     updated_at: datetime
 
@@ -52,3 +62,14 @@ class BoardDetailResponse(BoardResponse):
 
     card_count: int
     member_avatars: list[str]  # Up to 5 avatar URLs
+
+
+class BoardStatsResponse(BaseModel):
+    """Maintained card totals of a board."""
+
+    board_id: UUID
+    card_count: int
+    story_points: int
+    overdue_count: int = Field(..., description="Cards due before overdue_as_of")
+    overdue_as_of: Optional[date]
+    column_card_counts: dict[UUID, int] = Field(..., description="Card count per column id")
@@ -4,7 +4,7 @@ from datetime import date, datetime
 from typing import Optional
 from uuid import UUID
 
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, Field, field_validator, model_validator
 
 from app.models.card import PriorityEnum
 from app.schemas.label import LabelResponse
@@ -65,6 +65,7 @@ class CardResponse(BaseModel):
     due_date: Optional[date] = None
     story_points: Optional[int] = None
     position: int
+    version: int = Field(..., description="Concurrency token; also sent as the ETag")
     created_by: Optional[UUID] = None
     created_at: datetime
     updated_at: datetime
@@ -85,6 +86,38 @@ class CardDetailResponse(CardResponse):
         from_attributes = True
 
 
+class CardLookupResponse(BaseModel):
+    """One id of a multi-card lookup: the card, or why it can't be returned."""
+
+    id: UUID
+    status: int = Field(..., description="200, or the 403/404 GET /cards/{id} would return")
+    card: Optional[CardResponse] = None
+    detail: Optional[str] = None
+
+
+class CardMultiGetResponse(BaseModel):
+    """Cards looked up by id, in request order."""
+
+    cards: list[CardLookupResponse]
+
+
+class CardPageResponse(BaseModel):
+    """Keyset-paginated page of cards within a single column."""
+
+    column_id: UUID
+    cards: list[CardResponse]
+    next_cursor: Optional[str] = Field(
+        None, description="Cursor for the next page (null when column is exhausted)"
+    )
+
+
+class BoardCardsWindowResponse(BaseModel):
+    """First page of cards for every column of a board."""
+
+    board_id: UUID
+    columns: list[CardPageResponse]
+
+
 class CardMoveRequest(BaseModel):
     """Schema for moving a card to a new column/position."""
 
@@ -122,3 +155,93 @@ class BulkCardMoveRequest(BaseModel):
         if v < 0:
             raise ValueError("Position must be non-negative")
         return v
+
+
+class BulkCardEditRequest(BaseModel):
+    """Schema for editing many cards with one set-based update."""
+
+    card_ids: list[UUID] = Field(..., min_length=1, max_length=500, description="Target cards")
+    title_prefix: Optional[str] = Field(None, min_length=1, max_length=100)
+    title_suffix: Optional[str] = Field(None, min_length=1, max_length=100)
+    description_append: Optional[str] = Field(None, min_length=1)
+    priority: Optional[PriorityEnum] = None
+    story_points: Optional[int] = Field(None, ge=0, le=99, description="Set story points")
+    story_points_delta: Optional[int] = Field(
+        None, ge=-99, le=99, description="Adjust story points by N (clamped to 0-99)"
+    )
+    due_date: Optional[date] = Field(None, description="Set due date")
+    due_date_offset_days: Optional[int] = Field(
+        None, ge=-3650, le=3650, description="Shift existing due dates by N days"
+    )
+
+    @model_validator(mode="after")
+    def validate_operations(self) -> "BulkCardEditRequest":
+        """Require at least one edit and no conflicting set/adjust pairs."""
+        if not self.model_dump(exclude={"card_ids"}, exclude_none=True):
+            raise ValueError("At least one edit must be provided")
+        if self.story_points is not None and self.story_points_delta is not None:
+            raise ValueError("Provide either story_points or story_points_delta, not both")
+        if self.due_date is not None and self.due_date_offset_days is not None:
+            raise ValueError("Provide either due_date or due_date_offset_days, not both")
+        return self
+
+
+class BulkCardEditResponse(BaseModel):
+    """Result of a bulk card edit."""
+
+    updated: int
+    card_ids: list[UUID]
+
+
+class BulkRelationUpdateResponse(BaseModel):
+    """Result of a bulk label/assignee update."""
+
+    card_count: int
+    added: int = Field(..., description="Rows inserted (existing links are skipped)")
+    removed: int = Field(..., description="Rows deleted")
+
+
+class CardImportRow(BaseModel):
+    """One card in a bulk import file (an NDJSON object or a CSV row)."""
+
+    title: str = Field(..., min_length=1, max_length=255)
+    description: Optional[str] = None
+    column: Optional[str] = Field(
+        None, description="Column id or name (defaults to the board's first column)"
+    )
+    priority: PriorityEnum = PriorityEnum.NONE
+    story_points: Optional[int] = Field(None, ge=0, le=99, description="Story points (0-99)")
+    due_date: Optional[date] = None
+
+    @model_validator(mode="before")
+    @classmethod
+    def normalize_fields(cls, data: object) -> object:
+        """Treat blank values as missing and accept priorities in any case."""
+        if not isinstance(data, dict):
+            return data
+        normalized = {}
+        for key, value in data.items():
+            if isinstance(value, str):
+                value = value.strip() or None
+            if value is not None:
+                normalized[key] = value
+        if isinstance(normalized.get("priority"), str):
+            normalized["priority"] = normalized["priority"].lower()
+        return normalized
+
+
+class CardImportResponse(BaseModel):
+    """Accepted bulk import, tracked by its Celery task ID."""
+
+    task_id: str
+    total_rows: int
+
+
+class CardImportStatusResponse(BaseModel):
+    """Progress of a bulk card import."""
+
+    task_id: str
+    state: str = Field(..., description="Celery state: PENDING, STARTED, PROGRESS, SUCCESS, FAILURE")
+    processed: int = 0
+    total: Optional[int] = None
+    error: Optional[str] = None
@@ -0,0 +1,45 @@
+"""Dashboard Pydantic schemas for workspace summaries."""
+
+from datetime import datetime
+from uuid import UUID
+
+from pydantic import BaseModel, Field
+
+from app.models.workspace_member import RoleEnum
+
+
+class DashboardColumn(BaseModel):
+    """Column of a board with its card count."""
+
+    id: UUID
+    name: str
+    card_count: int
+
+
+class DashboardBoard(BaseModel):
+    """Active board of a workspace with per-column card counts."""
+
+    id: UUID
+    name: str
+    card_count: int
+    columns: list[DashboardColumn]
+
+
+class DashboardWorkspace(BaseModel):
+    """Summary of one workspace the user belongs to."""
+
+    id: UUID
+    name: str
+    role: RoleEnum
+    board_count: int = Field(..., description="Active (non-archived) boards")
+    member_count: int
+    last_activity_at: datetime | None = Field(
+        None, description="Most recent card activity (null if none)"
+    )
+    boards: list[DashboardBoard]
+
+
+class DashboardResponse(BaseModel):
+    """Every workspace of the user, most recently updated first."""
+
+    workspaces: list[DashboardWorkspace]
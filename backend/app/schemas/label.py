@@ -3,7 +3,7 @@
 from datetime import datetime
 from uuid import UUID
 
-from pydantic import BaseModel, ConfigDict, Field
+from pydantic import BaseModel, ConfigDict, Field, model_validator
 
 
 class LabelBase(BaseModel):
@@ -42,3 +42,20 @@ class LabelAssignRequest(BaseModel):
     """Schema for assigning label to card."""
 
     label_id: UUID
+
+
+class BulkCardLabelsRequest(BaseModel):
+    """Schema for adding/removing labels on many cards at once."""
+
+    card_ids: list[UUID] = Field(..., min_length=1, max_length=500, description="Target cards")
+    add: list[UUID] = Field(default_factory=list, max_length=50, description="Labels to add")
+    remove: list[UUID] = Field(default_factory=list, max_length=50, description="Labels to remove")
+
+    @model_validator(mode="after")
+    def validate_sets(self) -> "BulkCardLabelsRequest":
+        """Require at least one change and disjoint add/remove sets."""
+        if not self.add and not self.remove:
+            raise ValueError("At least one label to add or remove must be provided")
+        if set(self.add) & set(self.remove):
+            raise ValueError("A label cannot be both added and removed")
+        return self
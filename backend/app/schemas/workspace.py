@@ -25,6 +25,12 @@ class WorkspaceUpdate(BaseModel):
     """Schema for updating workspace."""
 
     name: str | None = Field(None, min_length=1, max_length=100)
+    retention_days: int | None = Field(
+        None,
+        ge=30,
+        le=3650,
+        description="Days of activity and audit history to keep (null for the default)",
+    )
 
     @field_validator("name")
     @classmethod
@@ -41,6 +47,7 @@ class WorkspaceResponse(BaseModel):
     id: UUID
     name: str
     created_by: UUID | None
+    retention_days: int | None = None
     created_at: datetime
     updated_at: datetime
 
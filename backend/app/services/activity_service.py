@@ -0,0 +1,190 @@
+"""Activity service for reading card and workspace activity feeds."""
+
+import uuid
+from dataclasses import dataclass
+from datetime import datetime
+from uuid import UUID
+
+from fastapi import HTTPException, status
+from sqlalchemy import and_, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.board import Board
+from app.models.card import Card
+from app.models.card_activity import CardActivity
+from app.models.workspace import Workspace
+from app.models.workspace_member import WorkspaceMember
+from app.repositories.activity_repository import ActivityRepository
+from app.services.partition_service import retention_cutoff
+from app.utils.pagination import decode_cursor, encode_cursor
+
+
+@dataclass
+class ActivityPage:
+    """One keyset-paginated window of an activity feed."""
+
+    activities: list[CardActivity]
+    next_cursor: str | None = None
+
+
+class ActivityService:
+    """Service for paging through recorded card activity."""
+
+    def __init__(self, db: AsyncSession):
+        """
+        Initialize ActivityService.
+
+        Args:
+            db: Async database session
+        """
+        self.db = db
+        self.activities = ActivityRepository(db)
+
+    async def get_card_activity(
+        self, card_id: UUID, user_id: UUID, limit: int, cursor: str | None = None
+    ) -> ActivityPage:
+        """
+        Fetch a page of a card's history, newest first.
+
+        Only entries within the workspace's retention are read, which
+        prunes older monthly partitions from the plan; walking newest
+        first, a page is normally served from the latest partitions alone.
+
+        Args:
+            card_id: UUID of card
+            user_id: UUID of requesting user
+            limit: Maximum number of activities to return
+            cursor: Opaque cursor from a previous page (None for first page)
+
+        Returns:
+            Page of activities with cursor for the next page
+
+        Raises:
+            HTTPException: If card not found, user not workspace member, or
+                cursor is invalid
+        """
+        result = await self.db.execute(
+            select(Board.workspace_id, Workspace.retention_days)
+            .join(Card, Card.board_id == Board.id)
+            .join(Workspace, Workspace.id == Board.workspace_id)
+            .where(Card.id == card_id, Board.deleted_at.is_(None))
+        )
+        row = result.one_or_none()
+        if row is None:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND, detail="Card not found"
+            )
+        workspace_id, retention_days = row
+        await self._check_membership(workspace_id, user_id)
+
+        return await self._get_page(
+            CardActivity.card_id == card_id,
+            CardActivity.created_at >= retention_cutoff(retention_days),
+            limit=limit,
+            cursor=cursor,
+        )
+
+    async def get_workspace_activity(
+        self, workspace_id: UUID, user_id: UUID, limit: int, cursor: str | None = None
+    ) -> ActivityPage:
+        """
+        Fetch a page of activity across every board in a workspace, newest first.
+
+        Args:
+            workspace_id: UUID of workspace
+            user_id: UUID of requesting user
+            limit: Maximum number of activities to return
+            cursor: Opaque cursor from a previous page (None for first page)
+
+        Returns:
+            Page of activities with cursor for the next page
+
+        Raises:
+            HTTPException: If workspace not found, user not a member, or
+                cursor is invalid
+        """
+        result = await self.db.execute(
+            select(Workspace.id, Workspace.retention_days).where(
+                Workspace.id == workspace_id, Workspace.deleted_at.is_(None)
+            )
+        )
+        workspace = result.one_or_none()
+        if workspace is None:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND, detail="Workspace not found"
+            )
+        await self._check_membership(workspace_id, user_id)
+
+        # Boards awaiting purge keep their rows until then; hide them meanwhile
+        live_boards = select(Board.id).where(
+            Board.workspace_id == workspace_id, Board.deleted_at.is_(None)
+        )
+        return await self._get_page(
+            CardActivity.workspace_id == workspace_id,
+            CardActivity.created_at >= retention_cutoff(workspace.retention_days),
+            CardActivity.board_id.in_(live_boards),
+            limit=limit,
+            cursor=cursor,
+        )
+
+    async def _get_page(self, *where, limit: int, cursor: str | None) -> ActivityPage:
+        """
+        Read one page of activities using a (created_at, id) keyset cursor.
+
+        Args:
+            where: Filters selecting the feed
+            limit: Maximum number of activities to return
+            cursor: Opaque cursor from a previous page
+
+        Returns:
+            ActivityPage with next_cursor set when more activities exist
+
+        Raises:
+            HTTPException: 400 if cursor is invalid
+        """
+        before = None
+        if cursor:
+            created_at, activity_id = decode_cursor(cursor, 2)
+            try:
+                before = (datetime.fromisoformat(created_at), uuid.UUID(str(activity_id)))
+            except (TypeError, ValueError) as e:
+                raise HTTPException(
+                    status_code=status.HTTP_400_BAD_REQUEST,
+                    detail="Invalid pagination cursor",
+                ) from e
+
+        activities = await self.activities.get_page(*where, limit=limit + 1, before=before)
+        if len(activities) <= limit:
+            return ActivityPage(activities=activities)
+
+        page = activities[:limit]
+        last = page[-1]
+        return ActivityPage(
+            activities=page,
+            next_cursor=encode_cursor(last.created_at.isoformat(), str(last.id)),
+        )
+
+    async def _check_membership(self, workspace_id: UUID, user_id: UUID) -> None:
+        """
+        Verify user is a member of the workspace.
+
+        Args:
+            workspace_id: UUID of workspace
+            user_id: UUID of user
+
+        Raises:
+            HTTPException: 403 if user is not a workspace member
+        """
+        result = await self.db.execute(
+            select(WorkspaceMember.user_id).where(
+                and_(
+                    WorkspaceMember.workspace_id == workspace_id,
+                    WorkspaceMember.user_id == user_id,
+                )
+            )
+        )
+        if result.scalar_one_or_none() is None:
+            raise HTTPException(
+                status_code=status.HTTP_403_FORBIDDEN,
+                detail="You are not a member of this workspace",
+            )
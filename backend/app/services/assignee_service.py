@@ -1,13 +1,20 @@
 """Assignee service for business logic."""
 
+from datetime import datetime
 from uuid import UUID
 
+import structlog
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.single_flight import invalidate_board_cards, invalidate_workspace_board_cards
 from app.repositories.assignee_repository import AssigneeRepository
 from app.repositories.card_repository import CardRepository
+from app.schemas.card import BulkRelationUpdateResponse
 from app.schemas.user import UserResponse
 from app.services.workspace_service import WorkspaceService
+from app.websockets.manager import manager
+
+logger = structlog.get_logger(__name__)
 
 
 class AssigneeService:
@@ -23,41 +30,20 @@ class AssigneeService:
     async def assign_user_to_card(
         self, card_id: UUID, user_id: UUID, current_user_id: UUID
     ) -> UserResponse:
-        """Assign a user to a card."""
-        # Get card to verify workspace membership
-        card = await self.card_repo.get_with_board(card_id)
-        if not card:
+        """Assign a user to a card (lookups, permission checks and insert in one statement)."""
+        row = await self.assignee_repo.assign_user_to_card(card_id, user_id, current_user_id)
+        if row is None:
             raise ValueError("Card not found")
-
-        # Verify current user is workspace member
-        is_member = await self.workspace_service.check_workspace_member(
-            card.board.workspace_id, current_user_id
-        )
-        if not is_member:
+        if not row.actor_is_member:
             raise PermissionError("User is not a member of this workspace")
-
-        # Verify assignee is workspace member
-        is_assignee_member = await self.workspace_service.check_workspace_member(
-            card.board.workspace_id, user_id
-        )
-        if not is_assignee_member:
+        if row.id is None:
             raise ValueError("Assignee is not a member of this workspace")
-
-        # Check if already assigned
-        is_assigned = await self.assignee_repo.is_user_assigned(card_id, user_id)
-        if is_assigned:
+        if not row.inserted:
             raise ValueError("User is already assigned to this card")
 
-        # Assign user
-        await self.assignee_repo.assign_user_to_card(card_id, user_id)
-
-        # Return user info
-        assignees = await self.assignee_repo.get_card_assignees(card_id)
-        assigned_user = next((u for u in assignees if u.id == user_id), None)
-        if not assigned_user:
-            raise ValueError("Failed to assign user")
-
-        return UserResponse.model_validate(assigned_user)
+        await self.session.commit()
+        await invalidate_workspace_board_cards(row.workspace_id)
+        return UserResponse.model_validate(row)
 
     async def unassign_user_from_card(
         self, card_id: UUID, user_id: UUID, current_user_id: UUID
@@ -76,4 +62,63 @@ class AssigneeService:
             raise PermissionError("User is not a member of this workspace")
 
         # Unassign user
-        return await self.assignee_repo.unassign_user_from_card(card_id, user_id)
+        removed = await self.assignee_repo.unassign_user_from_card(card_id, user_id)
+        if removed:
+            await self.session.commit()
+            await invalidate_board_cards(card.board_id)
+        return removed
+
+    async def bulk_update_card_assignees(
+        self, card_ids: list[UUID], add: list[UUID], remove: list[UUID], current_user_id: UUID
+    ) -> BulkRelationUpdateResponse:
+        """Assign and unassign users on many cards with one INSERT and one DELETE."""
+        scope = await self.card_repo.get_scope(card_ids, current_user_id)
+        # Membership first, so non-members can't probe other workspaces' cards
+        if not scope.is_member:
+            raise PermissionError("User is not a member of this workspace")
+        if len(scope.card_ids) != len(set(card_ids)):
+            raise LookupError("Card not found")
+        if len(scope.workspace_ids) != 1:
+            raise ValueError("Cards must belong to the same workspace")
+
+        workspace_id = next(iter(scope.workspace_ids))
+        if add and await self.assignee_repo.count_workspace_members(workspace_id, add) != len(
+            set(add)
+        ):
+            raise ValueError("Assignee is not a member of this workspace")
+
+        target_ids = list(scope.card_ids)
+        added = (
+            await self.assignee_repo.assign_users_to_cards(target_ids, add, workspace_id)
+            if add
+            else 0
+        )
+        removed = (
+            await self.assignee_repo.unassign_users_from_cards(target_ids, remove) if remove else 0
+        )
+        await self.session.commit()
+        await invalidate_board_cards(*scope.cards_by_board)
+
+        logger.info(
+            "assignee.bulk_update.success",
+            card_count=len(target_ids),
+            added=added,
+            removed=removed,
+            user_id=str(current_user_id),
+        )
+
+        for board_id, board_card_ids in scope.cards_by_board.items():
+            await manager.broadcast_to_board(
+                board_id=str(board_id),
+                message={
+                    "event_type": "card_assignees_bulk_updated",
+                    "board_id": str(board_id),
+                    "card_ids": [str(cid) for cid in board_card_ids],
+                    "added_user_ids": [str(uid) for uid in add],
+                    "removed_user_ids": [str(uid) for uid in remove],
+                    "updated_by": str(current_user_id),
+                    "timestamp": datetime.utcnow().isoformat(),
+                },
+            )
+
+        return BulkRelationUpdateResponse(card_count=len(target_ids), added=added, removed=removed)
@@ -6,7 +6,9 @@ import structlog
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.models.workspace import Workspace
 from app.models.workspace_audit_log import AuditActionEnum, WorkspaceAuditLog
+from app.services.partition_service import retention_cutoff
 
 logger = structlog.get_logger(__name__)
 
@@ -57,7 +59,6 @@ class AuditService:
 
         self.db.add(log_entry)
         await self.db.commit()
-        await self.db.refresh(log_entry)
 
         logger.info(
             "audit.log.created",
@@ -85,11 +86,17 @@ class AuditService:
             offset: Number of logs to skip
 
         Returns:
-            List of audit log entries
+            List of audit log entries within the workspace's retention
         """
+        retention_days = await self.db.scalar(
+            select(Workspace.retention_days).where(Workspace.id == workspace_id)
+        )
         result = await self.db.execute(
             select(WorkspaceAuditLog)
-            .where(WorkspaceAuditLog.workspace_id == workspace_id)
+            .where(
+                WorkspaceAuditLog.workspace_id == workspace_id,
+                WorkspaceAuditLog.created_at >= retention_cutoff(retention_days),
+            )
             .order_by(WorkspaceAuditLog.created_at.desc())
             .limit(limit)
             .offset(offset)
@@ -16,6 +16,7 @@ from app.core.security import (
     hash_token,
     verify_token,
 )
+from app.core.single_flight import board_cards_flight
 from app.models.refresh_token import RefreshToken
 from app.models.user import User
 
@@ -115,12 +116,15 @@ class AuthService:
         # Encrypt GitHub access token before storing
         encrypted_token = encrypt_github_token(access_token)
 
+        profile_changed = False
         if user:
             # Update existing user
+            profile = (user.username, user.email, user.avatar_url)
             user.username = github_user.get("login", user.username)
             user.email = github_user.get("email") or user.email
             user.avatar_url = github_user.get("avatar_url")
             user.github_access_token = encrypted_token
+            profile_changed = profile != (user.username, user.email, user.avatar_url)
         else:
             # Create new user
             email = github_user.get("email")
@@ -138,7 +142,9 @@ class AuthService:
             self.db.add(user)
 
         await self.db.commit()
-        await self.db.refresh(user)
+        if profile_changed:
+            # Card lists embed assignees' profiles, on any board
+            await board_cards_flight.invalidate_all()
         return user
 
     async def generate_jwt_tokens(
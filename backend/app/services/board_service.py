@@ -7,25 +7,47 @@ import structlog
 from fastapi import HTTPException, status
 from sqlalchemy import and_, func, select
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm.exc import StaleDataError
 
+from app.core.single_flight import invalidate_board_cards
 from app.models.board import Board
+from app.models.card import Card
 from app.models.workspace_member import RoleEnum, WorkspaceMember
+from app.repositories.board_column_repository import BoardColumnRepository
+from app.repositories.board_stats_repository import BoardStatsRepository
+from app.services.dashboard_service import invalidate_dashboard
+from app.utils.concurrency import check_version, version_conflict
 from app.websockets.manager import manager
 
 logger = structlog.get_logger(__name__)
 
-# Board templates with pre-populated columns
+# Board templates with pre-populated column names
 BOARD_TEMPLATES = {
     "blank": [],
-    "kanban": [
-        {"id": str(uuid4()), "name": "To Do", "position": 0},
-        {"id": str(uuid4()), "name": "In Progress", "position": 1},
-        {"id": str(uuid4()), "name": "In Review", "position": 2},
-        {"id": str(uuid4()), "name": "Done", "position": 3},
-    ],
+    "kanban": ["To Do", "In Progress", "In Review", "Done"],
 }
 
 
+def template_columns(template: str) -> list[dict]:
+    """
+    Build a fresh column layout from a board template.
+
+    Column ids are generated per board: board_columns is keyed by
+    (board_id, id), but ids also appear in URLs and cached layouts, so
+    boards never share them.
+
+    Args:
+        template: Key of BOARD_TEMPLATES
+
+    Returns:
+        Board.columns layout
+    """
+    return [
+        {"id": str(uuid4()), "name": name, "position": i}
+        for i, name in enumerate(BOARD_TEMPLATES[template])
+    ]
+
+
 class BoardService:
     """Service for handling board operations."""
 
@@ -74,7 +96,7 @@ class BoardService:
                 detail=f"Invalid template: must be 'blank' or 'kanban'",
             )
 
-        columns = BOARD_TEMPLATES[template].copy()
+        columns = template_columns(template)
 
         try:
             board = Board(
@@ -82,7 +104,7 @@ class BoardService:
             )
             self.db.add(board)
             await self.db.commit()
-            await self.db.refresh(board)
+            await invalidate_dashboard(workspace_id)
 
             logger.info(
                 "board.create.success",
@@ -134,7 +156,9 @@ class BoardService:
         # Verify user is workspace member
         await self._check_workspace_member(workspace_id, user_id)
 
-        query = select(Board).where(Board.workspace_id == workspace_id)
+        query = select(Board).where(
+            Board.workspace_id == workspace_id, Board.deleted_at.is_(None)
+        )
 
         if not include_archived:
             query = query.where(Board.archived == False)  # noqa: E712
@@ -158,7 +182,9 @@ class BoardService:
         Raises:
             HTTPException: If board not found or user not workspace member
         """
-        result = await self.db.execute(select(Board).where(Board.id == board_id))
+        result = await self.db.execute(
+            select(Board).where(Board.id == board_id, Board.deleted_at.is_(None))
+        )
         board = result.scalar_one_or_none()
 
         if not board:
@@ -178,24 +204,32 @@ class BoardService:
         name: str | None = None,
         columns: list[dict] | None = None,
         archived: bool | None = None,
+        expected_version: int | None = None,
     ) -> Board:
         """
         Update board properties.
 
+        Board.version is the mapper's version_id_col, so the flush issues
+        UPDATE ... WHERE version = :v and a concurrent change surfaces as 412.
+
         Args:
             board_id: UUID of board to update
             user_id: UUID of user updating board
             name: Optional new board name
             columns: Optional new columns configuration
             archived: Optional archived status (admin only)
+            expected_version: Version from the client's If-Match header
 
         Returns:
             Updated board
 
         Raises:
-            HTTPException: If board not found, user not member, or validation fails
+            HTTPException: If board not found, user not member, validation
+                fails, a removed column still has cards (409), or the board
+                was modified concurrently (412)
         """
         board = await self.get_board_by_id(board_id, user_id)
+        check_version("Board", board.version, expected_version)
 
         # Check admin permission for archiving
         if archived is not None:
@@ -218,14 +252,31 @@ class BoardService:
 
                 if columns is not None:
                     # Validate columns structure
+                    column_ids = set()
                     for i, col in enumerate(columns):
                         if "id" not in col or "name" not in col:
                             raise HTTPException(
                                 status_code=status.HTTP_400_BAD_REQUEST,
                                 detail="Invalid column structure: must have 'id' and 'name' fields",
                             )
+                        try:
+                            column_id = UUID(str(col["id"]))
+                        except ValueError as e:
+                            raise HTTPException(
+                                status_code=status.HTTP_400_BAD_REQUEST,
+                                detail="Invalid column structure: 'id' must be a UUID",
+                            ) from e
+                        if column_id in column_ids:
+                            raise HTTPException(
+                                status_code=status.HTTP_400_BAD_REQUEST,
+                                detail="Invalid column structure: duplicate column id",
+                            )
+                        column_ids.add(column_id)
+                        col["id"] = str(column_id)
                         col["position"] = i  # Ensure sequential positions
 
+                    await self._check_removed_columns_empty(board, column_ids)
+                    # The flush mirrors the layout into board_columns
                     board.columns = columns
                     action = "column_updated"
 
@@ -234,7 +285,10 @@ class BoardService:
                     action = "board_archived" if archived else "board_unarchived"
 
                 await self.db.flush()
-                await self.db.refresh(board)
+
+            if action:
+                await self.db.commit()
+                await invalidate_dashboard(board.workspace_id)
 
             logger.info(
                 "board.update.success",
@@ -265,6 +319,9 @@ class BoardService:
 
         except HTTPException:
             raise
+        except StaleDataError as e:
+            await self.db.rollback()
+            raise version_conflict("Board") from e
         except Exception as e:
             logger.error(
                 "board.update.failed",
@@ -276,18 +333,27 @@ class BoardService:
             await self.db.rollback()
             raise
 
-    async def delete_board(self, board_id: UUID, user_id: UUID) -> None:
+    async def delete_board(
+        self, board_id: UUID, user_id: UUID, expected_version: int | None = None
+    ) -> None:
         """
-        Delete board (cascades to all cards).
+        Soft-delete board.
+
+        The board is hidden from listings and lookups as soon as this
+        commits; its cards are purged afterwards in bounded chunks by the
+        purge_board task (see PurgeService).
 
         Args:
             board_id: UUID of board to delete
             user_id: UUID of user deleting board
+            expected_version: Version from the client's If-Match header
 
         Raises:
-            HTTPException: If board not found, user not admin, or deletion fails
+            HTTPException: If board not found, user not admin, deletion fails,
+                or the board was modified concurrently (412)
         """
         board = await self.get_board_by_id(board_id, user_id)
+        check_version("Board", board.version, expected_version)
 
         # Only admins can delete boards
         await self._check_workspace_admin(board.workspace_id, user_id)
@@ -301,8 +367,11 @@ class BoardService:
 
         try:
             workspace_id = board.workspace_id
-            await self.db.delete(board)
+            # Versioned flush: a concurrent edit still surfaces as 412
+            board.deleted_at = func.now()
             await self.db.commit()
+            await invalidate_dashboard(workspace_id)
+            await invalidate_board_cards(board_id)
 
             logger.info(
                 "board.delete.success",
@@ -321,6 +390,9 @@ class BoardService:
                 },
             )
 
+        except StaleDataError as e:
+            await self.db.rollback()
+            raise version_conflict("Board") from e
         except Exception as e:
             logger.error(
                 "board.delete.failed",
@@ -332,6 +404,82 @@ class BoardService:
             await self.db.rollback()
             raise
 
+    async def get_column_card_counts(
+        self, board_ids: list[UUID]
+    ) -> dict[UUID, dict[UUID, int]]:
+        """
+        Get the live card count of every column of the given boards.
+
+        Counts are read from the board_columns counters, one indexed query
+        for any number of boards.
+
+        Args:
+            board_ids: UUIDs of boards
+
+        Returns:
+            Card count per column id, keyed by board id
+        """
+        return await BoardColumnRepository(self.db).get_card_counts(board_ids)
+
+    async def get_board_stats(self, board_id: UUID, user_id: UUID) -> dict:
+        """
+        Get a board's card totals and per-column card counts.
+
+        Both are maintained incrementally by the statements that change
+        cards, so this reads one board_stats row and the board's
+        board_columns rows whatever the number of cards.
+
+        Args:
+            board_id: UUID of board
+            user_id: UUID of requesting user
+
+        Returns:
+            dict with the board_stats totals and column_card_counts
+
+        Raises:
+            HTTPException: If board not found or user not workspace member
+        """
+        board = await self.get_board_by_id(board_id, user_id)
+        stats = await BoardStatsRepository(self.db).get(board.id)
+        counts = await BoardColumnRepository(self.db).get_card_counts([board.id])
+        return {
+            "board_id": board.id,
+            "card_count": stats.card_count if stats else 0,
+            "story_points": stats.story_points if stats else 0,
+            "overdue_count": stats.overdue_count if stats else 0,
+            "overdue_as_of": stats.overdue_as_of if stats else None,
+            "column_card_counts": counts.get(board.id, {}),
+        }
+
+    async def _check_removed_columns_empty(self, board: Board, column_ids: set[UUID]) -> None:
+        """
+        Verify no cards remain in the columns an update removes.
+
+        Cards reference their column by foreign key, so a non-empty column
+        has to be emptied (or its cards moved) before it can go.
+
+        Args:
+            board: Board being updated
+            column_ids: Column ids in the new layout
+
+        Raises:
+            HTTPException: 409 if a removed column still has cards
+        """
+        names = {UUID(str(col["id"])): col["name"] for col in board.columns}
+        removed = names.keys() - column_ids
+        if not removed:
+            return
+        occupied = await self.db.scalar(
+            select(Card.column_id)
+            .where(Card.board_id == board.id, Card.column_id.in_(removed))
+            .limit(1)
+        )
+        if occupied is not None:
+            raise HTTPException(
+                status_code=status.HTTP_409_CONFLICT,
+                detail=f"Column '{names[occupied]}' still has cards; move or delete them first",
+            )
+
     async def _check_workspace_member(self, workspace_id: UUID, user_id: UUID) -> None:
         """
         Verify user is member of workspace.
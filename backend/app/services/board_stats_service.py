@@ -0,0 +1,104 @@
+"""Board stats service for correcting the maintained card totals of boards."""
+
+from datetime import date, datetime
+from uuid import UUID
+
+import structlog
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.repositories.board_column_repository import BoardColumnRepository
+from app.repositories.board_stats_repository import BoardStatsRepository
+from app.utils.locks import try_lock_columns
+
+logger = structlog.get_logger(__name__)
+
+
+class BoardStatsService:
+    """Service for rolling overdue counts forward and reconciling board stats."""
+
+    def __init__(self, db: AsyncSession):
+        """
+        Initialize BoardStatsService.
+
+        Args:
+            db: Async database session
+        """
+        self.db = db
+
+    async def reconcile(
+        self, today: date | None = None, limit: int | None = None
+    ) -> dict[str, int]:
+        """
+        Bring a batch of board stats rows up to date.
+
+        First, boards whose overdue counts are from an earlier day get them
+        recounted as of today. Then the boards reconciled longest ago are
+        locked and have every total recounted from their cards, along with
+        the card counters of their columns, correcting drift from writes
+        that bypassed the services. Each step is its own short transaction,
+        and rows or columns locked by writers are skipped until a later run.
+
+        Args:
+            today: Date overdue counts are taken as of (defaults to today, UTC)
+            limit: Maximum number of boards per step (defaults to
+                BOARD_STATS_RECONCILE_BATCH_SIZE)
+
+        Returns:
+            dict with boards_rolled, boards_checked and boards_drifted
+        """
+        today = today or datetime.utcnow().date()
+        limit = limit or settings.BOARD_STATS_RECONCILE_BATCH_SIZE
+        repository = BoardStatsRepository(self.db)
+
+        try:
+            rolled = await repository.roll_overdue(today, limit)
+            await self.db.commit()
+
+            board_ids = await repository.lock_least_recently_reconciled(limit)
+            drifted = await repository.reconcile(board_ids)
+            drifted += await self._recount_column_counts(board_ids)
+            await self.db.commit()
+        except Exception as e:
+            logger.error(
+                "board.stats_reconcile.failed",
+                error=str(e),
+                error_type=type(e).__name__,
+            )
+            await self.db.rollback()
+            raise
+
+        if drifted:
+            logger.warning(
+                "board.stats_reconcile.drift",
+                board_ids=sorted({str(board_id) for board_id in drifted}),
+            )
+
+        return {
+            "boards_rolled": rolled,
+            "boards_checked": len(board_ids),
+            "boards_drifted": len(set(drifted)),
+        }
+
+    async def _recount_column_counts(self, board_ids: list[UUID]) -> list[UUID]:
+        """
+        Recount the column card counters of locked boards.
+
+        Writers lock columns before updating board_stats, so the columns
+        are only tried here: boards with a column a writer holds are left
+        for a later run rather than waited on.
+
+        Args:
+            board_ids: Boards whose stats rows this transaction holds
+
+        Returns:
+            UUIDs of boards with a column counter that had drifted
+        """
+        columns = BoardColumnRepository(self.db)
+        layouts = await columns.get_card_counts(board_ids)
+        idle = [
+            board_id
+            for board_id, counts in layouts.items()
+            if await try_lock_columns(self.db, board_id, counts)
+        ]
+        return await columns.recount_boards(idle)
@@ -0,0 +1,288 @@
+"""Card export service for streaming board and sprint exports."""
+
+import csv
+import enum
+import io
+from collections.abc import AsyncIterator
+from datetime import date, datetime
+from uuid import UUID
+
+import orjson
+import structlog
+from fastapi import HTTPException, status
+from sqlalchemy import and_, func, literal, literal_column, select
+from sqlalchemy.dialects.postgresql import ARRAY, aggregate_order_by
+from sqlalchemy.dialects.postgresql import UUID as PG_UUID
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.board import Board
+from app.models.card import Card
+from app.models.card_assignee import CardAssignee
+from app.models.card_label import CardLabel
+from app.models.sprint import Sprint
+from app.models.user import User
+from app.models.workspace_label import WorkspaceLabel
+from app.models.workspace_member import WorkspaceMember
+
+logger = structlog.get_logger(__name__)
+
+# Rows fetched per server-side cursor round trip and per emitted body chunk
+EXPORT_CHUNK_SIZE = 500
+NDJSON_OPTIONS = orjson.OPT_APPEND_NEWLINE | orjson.OPT_UTC_Z
+
+EXPORT_FIELDS = (
+    "id",
+    "title",
+    "description",
+    "status",
+    "position",
+    "priority",
+    "story_points",
+    "due_date",
+    "sprint",
+    "assignees",
+    "labels",
+    "created_at",
+    "updated_at",
+)
+
+
+class ExportFormat(str, enum.Enum):
+    """Supported export formats."""
+
+    CSV = "csv"
+    NDJSON = "ndjson"
+
+    @property
+    def media_type(self) -> str:
+        """Content-Type of the exported body."""
+        return "text/csv; charset=utf-8" if self is ExportFormat.CSV else "application/x-ndjson"
+
+
+class CardExportService:
+    """Service for exporting board cards without loading them into memory."""
+
+    def __init__(self, db: AsyncSession):
+        """
+        Initialize CardExportService.
+
+        Args:
+            db: Async database session
+        """
+        self.db = db
+
+    async def get_board(self, board_id: UUID, user_id: UUID) -> Board:
+        """
+        Get board and verify user is workspace member.
+
+        Args:
+            board_id: UUID of board
+            user_id: UUID of user
+
+        Returns:
+            Board instance
+
+        Raises:
+            HTTPException: If board not found or user not workspace member
+        """
+        result = await self.db.execute(
+            select(Board).where(Board.id == board_id, Board.deleted_at.is_(None))
+        )
+        board = result.scalar_one_or_none()
+
+        if not board:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND, detail="Board not found"
+            )
+
+        # Verify user is workspace member
+        member_result = await self.db.execute(
+            select(WorkspaceMember).where(
+                and_(
+                    WorkspaceMember.workspace_id == board.workspace_id,
+                    WorkspaceMember.user_id == user_id,
+                )
+            )
+        )
+
+        if not member_result.scalar_one_or_none():
+            raise HTTPException(
+                status_code=status.HTTP_403_FORBIDDEN,
+                detail="You are not a member of this workspace",
+            )
+
+        return board
+
+    async def get_sprint(self, sprint_id: UUID, user_id: UUID) -> tuple[Sprint, Board]:
+        """
+        Get sprint and its board, verifying user is workspace member.
+
+        Args:
+            sprint_id: UUID of sprint
+            user_id: UUID of user
+
+        Returns:
+            Tuple of (sprint, board)
+
+        Raises:
+            HTTPException: If sprint not found or user not workspace member
+        """
+        sprint = await self.db.get(Sprint, sprint_id)
+        if not sprint:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND, detail="Sprint not found"
+            )
+        board = await self.get_board(sprint.board_id, user_id)
+        return sprint, board
+
+    async def stream_export(
+        self,
+        board_id: UUID,
+        board_columns: list[dict],
+        export_format: ExportFormat,
+        sprint_id: UUID | None = None,
+    ) -> AsyncIterator[bytes]:
+        """
+        Stream a board's (or one sprint's) cards as CSV or NDJSON.
+
+        Cards are read through a server-side cursor in EXPORT_CHUNK_SIZE
+        batches with assignees, labels and sprint name aggregated per row in
+        SQL, and each batch is encoded and yielded before the next is
+        fetched, so memory use does not grow with board size. Cards are
+        ordered by board column, then position.
+
+        Args:
+            board_id: UUID of board
+            board_columns: Board.columns, used for status names and ordering
+            export_format: CSV or NDJSON
+            sprint_id: Only export cards in this sprint
+
+        Yields:
+            Encoded body chunks
+        """
+        columns = sorted(board_columns or [], key=lambda col: col.get("position", 0))
+        status_names = {col["id"]: col.get("name") for col in columns}
+        column_order = [UUID(col["id"]) for col in columns]
+
+        logger.info(
+            "card.export.start",
+            board_id=str(board_id),
+            sprint_id=str(sprint_id) if sprint_id else None,
+            format=export_format.value,
+        )
+
+        query = self._export_query(board_id, column_order, sprint_id)
+        result = await self.db.stream(query.execution_options(yield_per=EXPORT_CHUNK_SIZE))
+
+        exported = 0
+        if export_format is ExportFormat.CSV:
+            buffer = io.StringIO()
+            writer = csv.writer(buffer)
+            writer.writerow(EXPORT_FIELDS)
+            async for partition in result.partitions():
+                for row in partition:
+                    record = _export_record(row, status_names)
+                    record["assignees"] = "; ".join(record["assignees"])
+                    record["labels"] = "; ".join(record["labels"])
+                    writer.writerow(_csv_value(record[field]) for field in EXPORT_FIELDS)
+                exported += len(partition)
+                yield buffer.getvalue().encode()
+                buffer.seek(0)
+                buffer.truncate()
+            if not exported:
+                yield buffer.getvalue().encode()
+        else:
+            async for partition in result.partitions():
+                yield b"".join(
+                    orjson.dumps(_export_record(row, status_names), option=NDJSON_OPTIONS)
+                    for row in partition
+                )
+                exported += len(partition)
+
+        logger.info("card.export.complete", board_id=str(board_id), exported=exported)
+
+    @staticmethod
+    def _export_query(board_id: UUID, column_order: list[UUID], sprint_id: UUID | None):
+        """Build the export SELECT with per-card assignee and label aggregates."""
+        assignees = (
+            select(
+                func.coalesce(
+                    func.array_agg(aggregate_order_by(User.username, CardAssignee.assigned_at)),
+                    literal_column("'{}'"),
+                )
+            )
+            .select_from(CardAssignee)
+            .join(User, User.id == CardAssignee.user_id)
+            .where(CardAssignee.card_id == Card.id)
+            .scalar_subquery()
+        )
+        labels = (
+            select(
+                func.coalesce(
+                    func.array_agg(aggregate_order_by(WorkspaceLabel.name, WorkspaceLabel.name)),
+                    literal_column("'{}'"),
+                )
+            )
+            .select_from(CardLabel)
+            .join(WorkspaceLabel, WorkspaceLabel.id == CardLabel.label_id)
+            .where(CardLabel.card_id == Card.id)
+            .scalar_subquery()
+        )
+
+        query = (
+            select(
+                Card.id,
+                Card.title,
+                Card.description,
+                Card.column_id,
+                Card.position,
+                Card.priority,
+                Card.story_points,
+                Card.due_date,
+                Sprint.name.label("sprint"),
+                assignees.label("assignees"),
+                labels.label("labels"),
+                Card.created_at,
+                Card.updated_at,
+            )
+            .outerjoin(Sprint, Sprint.id == Card.sprint_id)
+            .where(Card.board_id == board_id)
+            .order_by(
+                func.array_position(
+                    literal(column_order, ARRAY(PG_UUID(as_uuid=True))), Card.column_id
+                ),
+                Card.position,
+                Card.id,
+            )
+        )
+        if sprint_id is not None:
+            query = query.where(Card.sprint_id == sprint_id)
+        return query
+
+
+def _export_record(row, status_names: dict[str, str]) -> dict:
+    """Map an export row to its output fields."""
+    return {
+        "id": str(row.id),
+        "title": row.title,
+        "description": row.description,
+        "status": status_names.get(str(row.column_id)),
+        "position": row.position,
+        "priority": row.priority.value,
+        "story_points": row.story_points,
+        "due_date": row.due_date,
+        "sprint": row.sprint,
+        "assignees": row.assignees,
+        "labels": row.labels,
+        "created_at": row.created_at,
+        "updated_at": row.updated_at,
+    }
+
+
+def _csv_value(value: object) -> object:
+    """Render dates as ISO 8601 and missing values as empty cells."""
+    if value is None:
+        return ""
+    if isinstance(value, date | datetime):
+        return value.isoformat()
+    return value
@@ -0,0 +1,514 @@
+"""Card import service for streaming NDJSON/CSV ingestion."""
+
+import csv
+import enum
+import uuid
+from collections.abc import AsyncIterator, Awaitable, Callable
+from datetime import date
+from uuid import UUID
+
+import orjson
+import structlog
+from fastapi import HTTPException, status
+from pydantic import ValidationError
+from redis.asyncio import Redis
+from sqlalchemy import and_, func, insert, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.core.single_flight import invalidate_board_cards
+from app.models.board import Board
+from app.models.card import Card, PriorityEnum
+from app.models.workspace_member import WorkspaceMember
+from app.repositories.board_column_repository import BoardColumnRepository
+from app.repositories.board_stats_repository import BoardStatsRepository
+from app.schemas.card import CardImportRow
+from app.services.dashboard_service import invalidate_dashboard
+from app.services.position_repair_service import mark_columns_dirty
+from app.utils.locks import lock_columns
+
+logger = structlog.get_logger(__name__)
+
+# Rows per staged chunk and per multi-row INSERT (10 bind params per row keeps
+# a batch well under Postgres' 32767 parameter limit)
+IMPORT_BATCH_SIZE = 1000
+# Validation stops after this many bad rows
+MAX_REPORTED_ERRORS = 50
+
+
+class ImportFormat(str, enum.Enum):
+    """Supported import file formats."""
+
+    NDJSON = "ndjson"
+    CSV = "csv"
+
+
+IMPORT_CONTENT_TYPES = {
+    "application/x-ndjson": ImportFormat.NDJSON,
+    "application/ndjson": ImportFormat.NDJSON,
+    "application/jsonl": ImportFormat.NDJSON,
+    "text/csv": ImportFormat.CSV,
+}
+
+
+def import_staging_key(task_id: str) -> str:
+    """Redis list holding the validated rows of an import until the worker runs."""
+    return f"card_import:{task_id}"
+
+
+class CardImportService:
+    """Service for importing large numbers of cards into a board."""
+
+    def __init__(self, db: AsyncSession):
+        """
+        Initialize CardImportService.
+
+        Args:
+            db: Async database session
+        """
+        self.db = db
+
+    async def stage_import(
+        self,
+        board_id: UUID,
+        user_id: UUID,
+        content_type: str | None,
+        stream: AsyncIterator[bytes],
+        redis: Redis,
+    ) -> tuple[str, int]:
+        """
+        Validate an uploaded import file and stage its rows for the worker.
+
+        The body is parsed as it arrives; every IMPORT_BATCH_SIZE valid rows
+        are pushed to a Redis list so memory stays bounded regardless of file
+        size. Nothing is staged for later pickup if any row is invalid.
+
+        Args:
+            board_id: UUID of target board
+            user_id: UUID of importing user
+            content_type: Request Content-Type (selects NDJSON or CSV parsing)
+            stream: Request body chunks
+            redis: Redis client used for staging
+
+        Returns:
+            Tuple of (task_id, total_rows); the task ID keys the staged rows
+
+        Raises:
+            HTTPException: 404/403 for board access, 415 for unsupported
+                content types, 400 for empty files, 422 for invalid rows
+        """
+        media_type = (content_type or "").split(";")[0].strip().lower()
+        import_format = IMPORT_CONTENT_TYPES.get(media_type)
+        if import_format is None:
+            raise HTTPException(
+                status_code=status.HTTP_415_UNSUPPORTED_MEDIA_TYPE,
+                detail=f"Unsupported import type; use one of {', '.join(IMPORT_CONTENT_TYPES)}",
+            )
+
+        board = await self.get_board(board_id, user_id)
+        columns = board.columns
+        # End the read transaction so the connection is not held while the
+        # (possibly slow) upload is consumed
+        await self.db.commit()
+
+        task_id = str(uuid.uuid4())
+        key = import_staging_key(task_id)
+
+        async def stage(batch: list[dict]) -> None:
+            await redis.rpush(key, orjson.dumps(batch))
+            await redis.expire(key, settings.CARD_IMPORT_STAGING_TTL_SECONDS)
+
+        logger.info(
+            "card.import.stage.start",
+            board_id=str(board_id),
+            format=import_format.value,
+            user_id=str(user_id),
+        )
+
+        try:
+            total, errors = await self.validate_stream(columns, import_format, stream, stage)
+        except BaseException:
+            await redis.delete(key)
+            raise
+
+        if errors:
+            await redis.delete(key)
+            raise HTTPException(
+                status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+                detail={"message": "Import contains invalid rows", "errors": errors},
+            )
+        if total == 0:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST, detail="Import contains no cards"
+            )
+
+        logger.info("card.import.stage.success", task_id=task_id, total_rows=total)
+        return task_id, total
+
+    async def validate_stream(
+        self,
+        board_columns: list[dict],
+        import_format: ImportFormat,
+        stream: AsyncIterator[bytes],
+        on_batch: Callable[[list[dict]], Awaitable[None]],
+    ) -> tuple[int, list[dict]]:
+        """
+        Parse and validate an import body incrementally.
+
+        Columns are resolved against the board's columns once up front; each row's
+        column may be given by id or (case-insensitive) name and defaults to
+        the board's first column. Valid rows are handed to on_batch in chunks
+        of IMPORT_BATCH_SIZE until the first error is seen.
+
+        Args:
+            board_columns: Target board's columns (Board.columns)
+            import_format: NDJSON or CSV
+            stream: Body chunks
+            on_batch: Called with each chunk of validated rows
+
+        Returns:
+            Tuple of (valid_row_count, errors); errors are {"line", "error"}
+            dicts, at most MAX_REPORTED_ERRORS of them
+        """
+        columns = sorted(board_columns or [], key=lambda col: col.get("position", 0))
+        if not columns:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST, detail="Board has no columns"
+            )
+        column_lookup: dict[str, str] = {}
+        for col in columns:
+            column_lookup[str(col["id"])] = str(col["id"])
+            column_lookup.setdefault(str(col.get("name", "")).strip().casefold(), str(col["id"]))
+        default_column = str(columns[0]["id"])
+
+        records = (
+            _iter_ndjson_records(stream)
+            if import_format is ImportFormat.NDJSON
+            else _iter_csv_records(stream)
+        )
+
+        total = 0
+        batch: list[dict] = []
+        errors: list[dict] = []
+
+        async for line, record in records:
+            if isinstance(record, str):
+                errors.append({"line": line, "error": record})
+            elif total >= settings.CARD_IMPORT_MAX_ROWS:
+                errors.append(
+                    {
+                        "line": line,
+                        "error": f"Import exceeds {settings.CARD_IMPORT_MAX_ROWS} rows",
+                    }
+                )
+                break
+            else:
+                try:
+                    row = CardImportRow.model_validate(record)
+                except ValidationError as exc:
+                    errors.append({"line": line, "error": _format_validation_error(exc)})
+                else:
+                    column_id = (
+                        column_lookup.get(row.column.casefold()) if row.column else default_column
+                    )
+                    if column_id is None:
+                        errors.append(
+                            {"line": line, "error": f"Unknown column: {row.column}"}
+                        )
+                    else:
+                        total += 1
+                        batch.append(_staged_row(row, column_id))
+
+            if len(errors) >= MAX_REPORTED_ERRORS:
+                break
+            if errors:
+                batch.clear()
+            elif len(batch) >= IMPORT_BATCH_SIZE:
+                await on_batch(batch)
+                batch = []
+
+        if batch and not errors:
+            await on_batch(batch)
+        return total, errors
+
+    async def import_staged(
+        self,
+        board_id: UUID,
+        user_id: UUID,
+        task_id: str,
+        redis: Redis,
+        on_progress: Callable[[int], None] | None = None,
+    ) -> int:
+        """
+        Insert the rows staged by stage_import in a single transaction.
+
+        The board row and every column are locked so concurrent imports and
+        moves cannot hand out the same positions. Positions continue after
+        each column's current maximum and are assigned in memory, so no
+        existing card is shifted. This runs in the Celery worker, which
+        holds no websocket connections, so nothing is broadcast: clients
+        poll the import status endpoint.
+
+        Args:
+            board_id: UUID of target board
+            user_id: UUID of importing user
+            task_id: Import task ID returned by stage_import
+            redis: Redis client holding the staged rows
+            on_progress: Called with the running count after each batch
+
+        Returns:
+            Number of cards imported
+
+        Raises:
+            HTTPException: If board was deleted since the import was staged
+        """
+        key = import_staging_key(task_id)
+        logger.info("card.import.start", task_id=task_id, board_id=str(board_id))
+
+        try:
+            board = await self.db.scalar(
+                select(Board)
+                .where(Board.id == board_id, Board.deleted_at.is_(None))
+                .with_for_update()
+            )
+            if board is None:
+                raise HTTPException(
+                    status_code=status.HTTP_404_NOT_FOUND, detail="Board not found"
+                )
+
+            column_ids = [UUID(col["id"]) for col in board.columns]
+            await lock_columns(self.db, board_id, column_ids)
+            await mark_columns_dirty(self.db, board_id, column_ids)
+            positions = await self._next_positions(board_id)
+            imported = 0
+            while (payload := await redis.lpop(key)) is not None:
+                rows = orjson.loads(payload)
+                await self.insert_rows(board_id, user_id, rows, positions)
+                imported += len(rows)
+                if on_progress:
+                    on_progress(imported)
+
+            await self.db.commit()
+            await invalidate_dashboard(board.workspace_id)
+            await invalidate_board_cards(board_id)
+        except Exception as e:
+            logger.error(
+                "card.import.failed",
+                task_id=task_id,
+                error=str(e),
+                error_type=type(e).__name__,
+            )
+            await self.db.rollback()
+            raise
+        finally:
+            await redis.delete(key)
+
+        logger.info("card.import.success", task_id=task_id, imported=imported)
+        return imported
+
+    async def insert_rows(
+        self,
+        board_id: UUID,
+        user_id: UUID,
+        rows: list[dict],
+        positions: dict[str, int],
+    ) -> None:
+        """
+        Insert one batch of staged rows with a single multi-row INSERT.
+
+        The INSERT feeds the board stats update as a CTE, and column card
+        counters are advanced by the batch in one UPDATE. WIP limits are not
+        applied to imports.
+
+        Args:
+            board_id: UUID of target board
+            user_id: UUID of importing user
+            rows: Staged rows (output of validate_stream)
+            positions: Next free position per column id, advanced in place
+        """
+        values = []
+        added: dict[UUID, int] = {}
+        for row in rows:
+            column_id = row["column_id"]
+            position = positions.get(column_id, 0)
+            positions[column_id] = position + 1
+            column_uuid = uuid.UUID(column_id)
+            added[column_uuid] = added.get(column_uuid, 0) + 1
+            values.append(
+                {
+                    "id": uuid.uuid4(),
+                    "board_id": board_id,
+                    "column_id": column_uuid,
+                    "title": row["title"],
+                    "description": row["description"],
+                    "card_metadata": {},
+                    "priority": PriorityEnum(row["priority"]),
+                    "story_points": row["story_points"],
+                    "due_date": date.fromisoformat(row["due_date"]) if row["due_date"] else None,
+                    "position": position,
+                    "created_by": user_id,
+                }
+            )
+        inserted = (
+            insert(Card)
+            .values(values)
+            .returning(Card.board_id, Card.story_points, Card.due_date)
+            .cte("inserted")
+        )
+        await self.db.execute(
+            BoardStatsRepository.apply_from(
+                inserted,
+                card_delta=1,
+                added=(inserted.c.story_points, inserted.c.due_date),
+            )
+        )
+        await BoardColumnRepository(self.db).adjust_card_counts(board_id, added)
+
+    async def get_board(
+        self, board_id: UUID, user_id: UUID
+    ) -> Board:
+        """
+        Get board and verify user is workspace member.
+
+        Args:
+            board_id: UUID of board
+            user_id: UUID of user
+
+        Returns:
+            Board instance
+
+        Raises:
+            HTTPException: If board not found or user not workspace member
+        """
+        result = await self.db.execute(
+            select(Board).where(Board.id == board_id, Board.deleted_at.is_(None))
+        )
+        board = result.scalar_one_or_none()
+
+        if not board:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND, detail="Board not found"
+            )
+
+        # Verify user is workspace member
+        member_result = await self.db.execute(
+            select(WorkspaceMember).where(
+                and_(
+                    WorkspaceMember.workspace_id == board.workspace_id,
+                    WorkspaceMember.user_id == user_id,
+                )
+            )
+        )
+
+        if not member_result.scalar_one_or_none():
+            raise HTTPException(
+                status_code=status.HTTP_403_FORBIDDEN,
+                detail="You are not a member of this workspace",
+            )
+
+        return board
+
+    async def _next_positions(self, board_id: UUID) -> dict[str, int]:
+        """Return the next free position for every non-empty column of a board."""
+        result = await self.db.execute(
+            select(Card.column_id, func.max(Card.position) + 1)
+            .where(Card.board_id == board_id)
+            .group_by(Card.column_id)
+        )
+        return {str(column_id): next_position for column_id, next_position in result.all()}
+
+
+def _staged_row(row: CardImportRow, column_id: str) -> dict:
+    """JSON-serializable form of a validated row, as stored in Redis."""
+    return {
+        "column_id": column_id,
+        "title": row.title,
+        "description": row.description,
+        "priority": row.priority.value,
+        "story_points": row.story_points,
+        "due_date": row.due_date.isoformat() if row.due_date else None,
+    }
+
+
+def _format_validation_error(exc: ValidationError) -> str:
+    """Flatten a row's validation errors into one message."""
+    return "; ".join(
+        f"{'.'.join(str(part) for part in err['loc']) or 'row'}: {err['msg']}"
+        for err in exc.errors()
+    )
+
+
+async def _iter_lines(stream: AsyncIterator[bytes]) -> AsyncIterator[tuple[int, str]]:
+    """Split a byte stream into numbered text lines without buffering the body."""
+    buffer = b""
+    line_number = 0
+    async for chunk in stream:
+        buffer += chunk
+        *lines, buffer = buffer.split(b"\n")
+        for raw in lines:
+            line_number += 1
+            yield line_number, _decode_line(raw, line_number)
+    if buffer:
+        yield line_number + 1, _decode_line(buffer, line_number + 1)
+
+
+def _decode_line(raw: bytes, line_number: int) -> str:
+    """Decode one line, dropping a leading BOM and trailing CR."""
+    text = raw.decode("utf-8", errors="replace").rstrip("\r")
+    return text.lstrip("\ufeff") if line_number == 1 else text
+
+
+async def _iter_ndjson_records(
+    stream: AsyncIterator[bytes],
+) -> AsyncIterator[tuple[int, dict | str]]:
+    """Yield (line, object) per NDJSON line, or (line, error message)."""
+    async for line_number, text in _iter_lines(stream):
+        if not text.strip():
+            continue
+        try:
+            record = orjson.loads(text)
+        except orjson.JSONDecodeError:
+            yield line_number, "Invalid JSON"
+            continue
+        if not isinstance(record, dict):
+            yield line_number, "Expected a JSON object"
+        else:
+            yield line_number, record
+
+
+async def _iter_csv_records(
+    stream: AsyncIterator[bytes],
+) -> AsyncIterator[tuple[int, dict | str]]:
+    """
+    Yield (line, row dict) per CSV record, or (line, error message).
+
+    The first record is the header row. Quoted fields may span lines: lines
+    are accumulated until the record's quote count is balanced.
+    """
+    header: list[str] | None = None
+    pending: list[str] = []
+    start_line = 0
+
+    async for line_number, text in _iter_lines(stream):
+        if not pending:
+            if not text.strip():
+                continue
+            start_line = line_number
+        pending.append(text)
+        record = "\n".join(pending)
+        if record.count('"') % 2:
+            continue
+        pending = []
+
+        fields = next(csv.reader([record]))
+        if header is None:
+            header = [name.strip().lower() for name in fields]
+            continue
+        if len(fields) > len(header):
+            yield start_line, f"Expected {len(header)} fields, got {len(fields)}"
+            continue
+        # Short rows leave their trailing columns unset
+        yield start_line, dict(zip(header[: len(fields)], fields, strict=True))
+
+    if pending:
+        yield start_line, "Unterminated quoted field"
@@ -5,14 +5,21 @@ from uuid import UUID
 
 import structlog
 from fastapi import HTTPException, status
-from sqlalchemy import and_, select, update
+from sqlalchemy import and_, func, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
+from app.core.single_flight import invalidate_board_cards
 from app.models.board import Board
 from app.models.card import Card
 from app.models.card_activity import CardActivity
 from app.models.workspace_member import WorkspaceMember
+from app.repositories.board_column_repository import BoardColumnRepository
+from app.services.card_service import wip_limit_reached
+from app.services.dashboard_service import invalidate_dashboard
+from app.services.position_repair_service import mark_columns_dirty
+from app.utils.concurrency import check_version, version_conflict
+from app.utils.locks import lock_columns
 from app.websockets.manager import manager
 
 logger = structlog.get_logger(__name__)
@@ -36,21 +43,34 @@ class CardMovementService:
         target_column_id: UUID,
         target_position: int,
         moved_by: UUID,
+        expected_version: int | None = None,
     ) -> Card:
         """
         Move card to new column/position with atomic position recalculation.
 
+        The source and target columns are locked first (advisory locks in
+        canonical order), so moves within a column are serialized while
+        moves in other columns run in parallel. The card is then claimed with
+        a conditional version bump (UPDATE ... WHERE version = :v RETURNING
+        column_id, position), which yields its current slot, so neighbour
+        shifts are computed from fresh data and a stale If-Match is rejected.
+        Both columns are read by primary key under the lock, so the target's
+        WIP limit is checked against its size at the time of the move.
+
         Args:
             card_id: UUID of card to move
             target_column_id: Target column UUID
-            target_position: Target position in column (0-indexed)
+            target_position: Target position in column (0-indexed, clamped to the end)
             moved_by: UUID of user moving card
+            expected_version: Version from the client's If-Match header
 
         Returns:
             Updated card
 
         Raises:
-            HTTPException: If card not found, user not authorized, or board archived
+            HTTPException: If card not found, user not authorized, board
+                archived or target column missing (400), target column at
+                its WIP limit (409), or expected_version is stale (412)
         """
         logger.info(
             "card.move.start",
@@ -60,18 +80,14 @@ class CardMovementService:
             moved_by=str(moved_by),
         )
 
-        # Get card with eagerly loaded relationships
-        result = await self.db.execute(
-            select(Card)
-            .where(Card.id == card_id)
-            .options(selectinload(Card.assignees), selectinload(Card.labels))
-        )
+        result = await self.db.execute(select(Card).where(Card.id == card_id))
         card = result.scalar_one_or_none()
 
         if not card:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND, detail="Card not found"
             )
+        check_version("Card", card.version, expected_version)
 
         # Get board and verify permissions
         board = await self._get_board_with_permission(card.board_id, moved_by)
@@ -83,31 +99,72 @@ class CardMovementService:
                 detail="Cannot move cards in archived boards",
             )
 
-        # Verify target column exists in board
-        column_exists = any(
-            col.get("id") == str(target_column_id) for col in board.columns
-        )
-        if not column_exists:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="Target column does not exist in board",
-            )
-
         try:
             async with self.db.begin_nested():
-                old_column_id = card.column_id
-                old_position = card.position
                 board_id = card.board_id
-
-                # Get column name for activity logging
-                old_column_name = next(
-                    (col["name"] for col in board.columns if col.get("id") == str(old_column_id)),
-                    "Unknown"
+                loaded_column_id = card.column_id
+
+                # Serialize with other position changes in both columns
+                await lock_columns(self.db, board_id, {loaded_column_id, target_column_id})
+
+                # Claim the card: bumps its version and returns its current slot
+                claim_conditions = [Card.id == card_id]
+                if expected_version is not None:
+                    claim_conditions.append(Card.version == expected_version)
+                claimed = (
+                    await self.db.execute(
+                        update(Card)
+                        .where(*claim_conditions)
+                        .values(version=Card.version + 1)
+                        .returning(Card.column_id, Card.position)
+                    )
+                ).one_or_none()
+                if claimed is None:
+                    raise version_conflict("Card")
+                old_column_id, old_position = claimed
+                if old_column_id != loaded_column_id:
+                    # Moved elsewhere before our lock was granted; its column is unlocked
+                    raise version_conflict("Card")
+
+                board_columns = BoardColumnRepository(self.db)
+                columns = await board_columns.get_columns(
+                    board_id, {old_column_id, target_column_id}
                 )
-                new_column_name = next(
-                    (col["name"] for col in board.columns if col.get("id") == str(target_column_id)),
-                    "Unknown"
+                target_column = columns.get(target_column_id)
+                if target_column is None:
+                    raise HTTPException(
+                        status_code=status.HTTP_400_BAD_REQUEST,
+                        detail="Target column does not exist in board",
+                    )
+
+                await mark_columns_dirty(self.db, board_id, {old_column_id, target_column_id})
+
+                # Clamp to the end of the target column so positions stay dense
+                column_size = await self.db.scalar(
+                    select(func.count())
+                    .select_from(Card)
+                    .where(
+                        Card.board_id == board_id,
+                        Card.column_id == target_column_id,
+                        Card.id != card_id,
+                    )
                 )
+                target_position = min(target_position, column_size)
+
+                if old_column_id != target_column_id:
+                    # Reordering never changes a column's size; only arrivals count
+                    if (
+                        target_column.wip_limit is not None
+                        and column_size >= target_column.wip_limit
+                    ):
+                        raise wip_limit_reached(target_column)
+                    await board_columns.adjust_card_counts(
+                        board_id, {old_column_id: -1, target_column_id: 1}
+                    )
+
+                # Get column names for activity logging
+                old_column_name = columns[old_column_id].name
+                new_column_name = target_column.name
 
                 if old_column_id == target_column_id:
                     # Same column: reorder
@@ -121,14 +178,25 @@ class CardMovementService:
                         board_id, target_column_id, target_position
                     )
 
-                # Update card
-                card.column_id = target_column_id
-                card.position = target_position
-                await self.db.flush()
+                # Update card, reloading it with relationships for the response
+                result = await self.db.execute(
+                    select(Card)
+                    .from_statement(
+                        update(Card)
+                        .where(Card.id == card_id)
+                        .values(column_id=target_column_id, position=target_position)
+                        .returning(Card)
+                    )
+                    .options(selectinload(Card.assignees), selectinload(Card.labels))
+                    .execution_options(populate_existing=True)
+                )
+                card = result.scalar_one()
 
                 # Log activity
                 activity = CardActivity(
                     card_id=card_id,
+                    board_id=board.id,
+                    workspace_id=board.workspace_id,
                     user_id=moved_by,
                     action="moved",
                     activity_metadata={
@@ -143,9 +211,11 @@ class CardMovementService:
                 self.db.add(activity)
 
                 await self.db.flush()
-                await self.db.refresh(card)
 
             await self.db.commit()
+            await invalidate_board_cards(board_id)
+            if old_column_id != target_column_id:
+                await invalidate_dashboard(board.workspace_id)
 
             logger.info(
                 "card.move.success",
@@ -169,6 +239,7 @@ class CardMovementService:
                     "new_column_name": new_column_name,
                     "old_position": old_position,
                     "new_position": target_position,
+                    "version": card.version,
                     "moved_by": str(moved_by),
                     "timestamp": datetime.utcnow().isoformat(),
                 },
@@ -368,7 +439,9 @@ class CardMovementService:
         Raises:
             HTTPException: If board not found or user not workspace member
         """
-        result = await self.db.execute(select(Board).where(Board.id == board_id))
+        result = await self.db.execute(
+            select(Board).where(Board.id == board_id, Board.deleted_at.is_(None))
+        )
         board = result.scalar_one_or_none()
 
         if not board:
@@ -1,23 +1,117 @@
 """Card service for managing cards and their metadata."""
 
 import uuid
+from dataclasses import dataclass
 from datetime import datetime
 from uuid import UUID
 
 import structlog
 from fastapi import HTTPException, status
-from sqlalchemy import and_, select, update
+from fastapi.encoders import jsonable_encoder
+from sqlalchemy import (
+    ColumnElement,
+    String,
+    Text,
+    and_,
+    case,
+    cast,
+    delete,
+    func,
+    literal,
+    literal_column,
+    select,
+    true,
+    tuple_,
+    update,
+)
+from sqlalchemy.dialects.postgresql import UUID as PG_UUID
+from sqlalchemy.dialects.postgresql import aggregate_order_by, array, insert
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import aliased, selectinload
+from sqlalchemy.orm.attributes import set_committed_value
 
+from app.core.single_flight import invalidate_board_cards
 from app.models.board import Board
-from app.models.card import Card
+from app.models.board_column import BoardColumn
+from app.models.card import Card, PriorityEnum
+from app.models.card_activity import CardActivity
+from app.models.card_assignee import CardAssignee
+from app.models.card_label import CardLabel
+from app.models.user import User
+from app.models.workspace_label import WorkspaceLabel
 from app.models.workspace_member import WorkspaceMember
+from app.repositories.activity_repository import ActivityRepository
+from app.repositories.board_column_repository import BoardColumnRepository
+from app.repositories.board_stats_repository import BoardStatsRepository
+from app.repositories.card_repository import CardRepository
+from app.schemas.card import BulkCardEditRequest
+from app.services.dashboard_service import invalidate_dashboard
+from app.services.position_repair_service import mark_columns_dirty
+from app.utils.concurrency import check_version, version_conflict
+from app.utils.locks import lock_columns
+from app.utils.pagination import decode_cursor, encode_cursor
 from app.websockets.manager import manager
 
 logger = structlog.get_logger(__name__)
 
 
+def _json_timestamp(column: ColumnElement[datetime]) -> ColumnElement[str]:
+    """
+    Render a timestamptz the way orjson/Pydantic encode datetimes.
+
+    json_build_object would follow the session TimeZone
+    ("...+00:00"); the API sends UTC with a "Z" suffix, with microseconds
+    only when they are non-zero.
+
+    Args:
+        column: timestamptz column
+
+    Returns:
+        Text expression of the ISO 8601 timestamp
+    """
+    utc = func.timezone("UTC", column)
+    fraction = case(
+        (func.date_trunc("second", utc) == utc, literal("")),
+        else_=func.to_char(utc, ".US"),
+    )
+    return func.concat(func.to_char(utc, 'YYYY-MM-DD"T"HH24:MI:SS'), fraction, literal("Z"))
+
+
+def wip_limit_reached(column: BoardColumn) -> HTTPException:
+    """
+    Build the 409 raised when a card would exceed a column's WIP limit.
+
+    Args:
+        column: The full column
+
+    Returns:
+        HTTPException with status 409
+    """
+    return HTTPException(
+        status_code=status.HTTP_409_CONFLICT,
+        detail=f"Column '{column.name}' is at its WIP limit of {column.wip_limit} cards",
+    )
+
+
+@dataclass
+class CardPage:
+    """One keyset-paginated window of cards within a column."""
+
+    column_id: UUID
+    cards: list[Card]
+    next_cursor: str | None = None
+
+
+@dataclass
+class CardLookup:
+    """Outcome of one id of a multi-card lookup."""
+
+    id: UUID
+    card: Card | None = None
+    status_code: int = status.HTTP_200_OK
+    detail: str | None = None
+
+
 class CardService:
     """Service for handling card operations."""
 
@@ -46,7 +140,8 @@ class CardService:
             Created card
 
         Raises:
-            HTTPException: If user not workspace member or column invalid
+            HTTPException: If user not workspace member, column invalid (400)
+                or column at its WIP limit (409)
         """
         logger.info(
             "card.create.start",
@@ -59,20 +154,21 @@ class CardService:
         # Get board and verify permissions
         board = await self._get_board_with_permission(board_id, user_id)
 
-        # Verify column exists in board
-        column_exists = any(
-            col.get("id") == str(column_id) for col in board.columns
-        )
-        if not column_exists:
+        try:
+            col_uuid = column_id if isinstance(column_id, UUID) else uuid.UUID(str(column_id))
+        except ValueError as e:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail="Column does not exist in board",
-            )
+            ) from e
 
         try:
             async with self.db.begin_nested():
-                # Parse column_id to UUID if it's a string
-                col_uuid = column_id if isinstance(column_id, UUID) else uuid.UUID(str(column_id))
+                await lock_columns(self.db, board_id, [col_uuid])
+                # Counting the card in its column checks the column exists and
+                # has room under its WIP limit in the same statement
+                await self._claim_column_slot(board_id, col_uuid)
+                await mark_columns_dirty(self.db, board_id, [col_uuid])
 
                 # Increment positions of existing cards in column
                 await self.db.execute(
@@ -86,19 +182,41 @@ class CardService:
                     .values(position=Card.position + 1)
                 )
 
-                # Create new card at position 0
-                card = Card(
-                    board_id=board_id,
-                    column_id=col_uuid,
-                    title=title.strip(),
-                    position=0,
-                    created_by=user_id,
+                # Insert the card at position 0, record its "created" activity
+                # and count it in the board's stats in the same statement.
+                # Python-side column defaults don't apply inside a CTE, so
+                # they're passed explicitly.
+                new_card = (
+                    insert(Card)
+                    .values(
+                        id=uuid.uuid4(),
+                        board_id=board_id,
+                        column_id=col_uuid,
+                        title=title.strip(),
+                        position=0,
+                        priority=PriorityEnum.NONE,
+                        card_metadata={},
+                        created_by=user_id,
+                    )
+                    .returning(*Card.__table__.c)
+                    .cte("new_card")
+                )
+                record_activity = ActivityRepository.insert_from(
+                    new_card, user_id, "created", {"title": title.strip()}
+                ).cte("activity")
+                record_stats = BoardStatsRepository.apply_from(new_card, card_delta=1).cte("stats")
+                created = aliased(Card, new_card)
+                result = await self.db.execute(
+                    select(created).add_cte(record_activity).add_cte(record_stats)
                 )
-                self.db.add(card)
-                await self.db.flush()
-                await self.db.refresh(card, ["assignees", "labels"])
+                card = result.scalar_one()
+                # A new card has no assignees or labels; no need to query them
+                set_committed_value(card, "assignees", [])
+                set_committed_value(card, "labels", [])
 
             await self.db.commit()
+            await invalidate_dashboard(board.workspace_id)
+            await invalidate_board_cards(board_id)
 
             logger.info(
                 "card.create.success",
@@ -163,11 +281,271 @@ class CardService:
         if column_id:
             col_uuid = column_id if isinstance(column_id, UUID) else uuid.UUID(str(column_id))
             query = query.where(Card.column_id == col_uuid)
-        query = query.order_by(Card.position.asc())
+        query = query.order_by(Card.position.asc(), Card.id.asc())
 
         result = await self.db.execute(query)
         return list(result.scalars().all())
 
+    async def get_board_cards_json(
+        self, board_id: UUID, user_id: UUID, column_id: UUID | str | None = None
+    ) -> str:
+        """
+        Fetch board cards as a JSON array built entirely by Postgres.
+
+        Produces the same document as serializing get_board_cards() through
+        CardResponse, but skips ORM hydration and Pydantic validation: cards,
+        assignees and labels are aggregated with json_build_object/json_agg
+        and returned as a single text value ready to send to the client.
+
+        Args:
+            board_id: UUID of board
+            user_id: UUID of requesting user
+            column_id: Optional UUID or string to filter by column
+
+        Returns:
+            JSON array text of cards ordered by position ascending
+        """
+        # Verify permissions
+        await self._get_board_with_permission(board_id, user_id)
+
+        col_uuid = None
+        if column_id:
+            col_uuid = column_id if isinstance(column_id, UUID) else uuid.UUID(str(column_id))
+        return await self.build_board_cards_json(board_id, col_uuid)
+
+    async def build_board_cards_json(self, board_id: UUID, column_id: UUID | None = None) -> str:
+        """
+        Build the JSON array of a board's cards, without a permission check.
+
+        Every member of the workspace gets the same document, so a route
+        that checked the caller's permissions can share it among concurrent
+        requests (see list_board_cards).
+
+        Args:
+            board_id: UUID of board
+            column_id: Optional UUID to filter by column
+
+        Returns:
+            JSON array text of cards ordered by position ascending
+        """
+        empty_array = literal_column("'[]'::json")
+
+        assignees = (
+            select(
+                func.coalesce(
+                    func.json_agg(
+                        aggregate_order_by(
+                            func.json_build_object(
+                                "id", User.id,
+                                "username", User.username,
+                                "email", User.email,
+                                "avatar_url", User.avatar_url,
+                                "github_id", User.github_id,
+                            ),
+                            CardAssignee.assigned_at,
+                        )
+                    ),
+                    empty_array,
+                )
+            )
+            .select_from(CardAssignee)
+            .join(User, User.id == CardAssignee.user_id)
+            .where(CardAssignee.card_id == Card.id)
+            .correlate(Card)
+            .scalar_subquery()
+        )
+        labels = (
+            select(
+                func.coalesce(
+                    func.json_agg(
+                        aggregate_order_by(
+                            func.json_build_object(
+                                "name", WorkspaceLabel.name,
+                                "color", WorkspaceLabel.color,
+                                "id", WorkspaceLabel.id,
+                                "workspace_id", WorkspaceLabel.workspace_id,
+                                "created_at", _json_timestamp(WorkspaceLabel.created_at),
+                            ),
+                            CardLabel.assigned_at,
+                        )
+                    ),
+                    empty_array,
+                )
+            )
+            .select_from(CardLabel)
+            .join(WorkspaceLabel, WorkspaceLabel.id == CardLabel.label_id)
+            .where(CardLabel.card_id == Card.id)
+            .correlate(Card)
+            .scalar_subquery()
+        )
+        card_json = func.json_build_object(
+            "id", Card.id,
+            "board_id", Card.board_id,
+            "column_id", Card.column_id,
+            "title", Card.title,
+            "description", Card.description,
+            # Enum is stored by member name; the API exposes the lowercase value
+            "priority", func.lower(cast(Card.priority, String)),
+            "due_date", Card.due_date,
+            "story_points", Card.story_points,
+            "position", Card.position,
+            "version", Card.version,
+            "created_by", Card.created_by,
+            "created_at", _json_timestamp(Card.created_at),
+            "updated_at", _json_timestamp(Card.updated_at),
+            "assignees", assignees,
+            "labels", labels,
+        )
+
+        query = select(
+            cast(
+                func.coalesce(
+                    func.json_agg(aggregate_order_by(card_json, Card.position.asc(), Card.id.asc())),
+                    empty_array,
+                ),
+                Text,
+            )
+        ).where(Card.board_id == board_id)
+        if column_id:
+            query = query.where(Card.column_id == column_id)
+
+        result = await self.db.execute(query)
+        return result.scalar_one()
+
+    async def get_board_cards_window(
+        self, board_id: UUID, user_id: UUID, limit: int
+    ) -> list[CardPage]:
+        """
+        Fetch the first `limit` cards of every board column in a single query.
+
+        Each column is read through its own LATERAL index range scan, so the
+        cost grows with columns * limit rather than with total board size.
+
+        Args:
+            board_id: UUID of board
+            user_id: UUID of requesting user
+            limit: Maximum number of cards per column
+
+        Returns:
+            One page per board column, in board column order
+        """
+        board = await self._get_board_with_permission(board_id, user_id)
+
+        column_ids = [uuid.UUID(str(col["id"])) for col in board.columns]
+        if not column_ids:
+            return []
+
+        columns = (
+            func.unnest(array(column_ids, type_=PG_UUID(as_uuid=True)))
+            .table_valued("id")
+            .render_derived(name="board_column")
+        )
+        window = (
+            select(Card)
+            .where(Card.board_id == board_id, Card.column_id == columns.c.id)
+            .order_by(Card.position.asc(), Card.id.asc())
+            .limit(limit + 1)
+            .lateral("column_window")
+        )
+        windowed_card = aliased(Card, window)
+
+        result = await self.db.execute(
+            select(windowed_card)
+            .select_from(columns)
+            .join(window, true())
+            .options(
+                selectinload(windowed_card.assignees),
+                selectinload(windowed_card.labels),
+            )
+            .order_by(windowed_card.position.asc(), windowed_card.id.asc())
+        )
+
+        cards_by_column: dict[UUID, list[Card]] = {col_id: [] for col_id in column_ids}
+        for card in result.scalars().all():
+            cards_by_column[card.column_id].append(card)
+
+        return [
+            self._build_page(col_id, cards_by_column[col_id], limit) for col_id in column_ids
+        ]
+
+    async def get_column_cards_page(
+        self,
+        board_id: UUID,
+        column_id: UUID,
+        user_id: UUID,
+        limit: int,
+        cursor: str | None = None,
+    ) -> CardPage:
+        """
+        Fetch the next page of cards in a column using a keyset cursor.
+
+        Args:
+            board_id: UUID of board
+            column_id: UUID of column
+            user_id: UUID of requesting user
+            limit: Maximum number of cards to return
+            cursor: Opaque cursor from a previous page (None for first page)
+
+        Returns:
+            Page of cards ordered by position with cursor for the next page
+
+        Raises:
+            HTTPException: If column doesn't exist or cursor is invalid
+        """
+        await self._get_board_with_permission(board_id, user_id)
+
+        columns = await BoardColumnRepository(self.db).get_columns(board_id, [column_id])
+        if column_id not in columns:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Column does not exist in board",
+            )
+
+        query = (
+            select(Card)
+            .where(Card.board_id == board_id, Card.column_id == column_id)
+            .options(selectinload(Card.assignees), selectinload(Card.labels))
+            .order_by(Card.position.asc(), Card.id.asc())
+            .limit(limit + 1)
+        )
+        if cursor:
+            after_position, after_id = decode_cursor(cursor, 2)
+            try:
+                after_key = (int(after_position), uuid.UUID(str(after_id)))
+            except (TypeError, ValueError) as e:
+                raise HTTPException(
+                    status_code=status.HTTP_400_BAD_REQUEST,
+                    detail="Invalid pagination cursor",
+                ) from e
+            query = query.where(tuple_(Card.position, Card.id) > after_key)
+
+        result = await self.db.execute(query)
+        return self._build_page(column_id, list(result.scalars().all()), limit)
+
+    @staticmethod
+    def _build_page(column_id: UUID, cards: list[Card], limit: int) -> CardPage:
+        """
+        Trim an over-fetched (limit + 1) result into a page with a next cursor.
+
+        Args:
+            column_id: UUID of column the cards belong to
+            cards: Cards ordered by (position, id), at most limit + 1 long
+            limit: Requested page size
+
+        Returns:
+            CardPage with next_cursor set when more cards exist
+        """
+        if len(cards) <= limit:
+            return CardPage(column_id=column_id, cards=cards)
+
+        page = cards[:limit]
+        last = page[-1]
+        return CardPage(
+            column_id=column_id,
+            cards=page,
+            next_cursor=encode_cursor(last.position, str(last.id)),
+        )
+
     async def get_card_by_id(self, card_id: UUID, user_id: UUID) -> Card:
         """
         Get card by ID with permission check.
@@ -195,38 +573,109 @@ class CardService:
 
         return card
 
+    async def get_cards_by_ids(self, card_ids: list[UUID], user_id: UUID) -> list[CardLookup]:
+        """
+        Get many cards by ID with one permission check per board.
+
+        The cards, their boards and the user's membership of each board's
+        workspace come from a single query (plus one each for assignees and
+        labels), however many cards are requested. An id that can't be
+        returned gets the status GET /cards/{id} would have answered with
+        instead of failing the whole lookup.
+
+        Args:
+            card_ids: UUIDs of cards (duplicates are looked up once)
+            user_id: UUID of requesting user
+
+        Returns:
+            One lookup per distinct id, in request order
+        """
+        card_ids = list(dict.fromkeys(card_ids))
+        result = await self.db.execute(
+            select(Card, Board.deleted_at.is_(None), WorkspaceMember.user_id.is_not(None))
+            .join(Board, Board.id == Card.board_id)
+            .outerjoin(
+                WorkspaceMember,
+                and_(
+                    WorkspaceMember.workspace_id == Board.workspace_id,
+                    WorkspaceMember.user_id == user_id,
+                ),
+            )
+            .where(Card.id.in_(card_ids))
+            .options(selectinload(Card.assignees), selectinload(Card.labels))
+        )
+        found = {card.id: (card, board_live, is_member) for card, board_live, is_member in result}
+
+        lookups = []
+        for card_id in card_ids:
+            card, board_live, is_member = found.get(card_id, (None, False, False))
+            if card is None:
+                lookups.append(CardLookup(card_id, None, status.HTTP_404_NOT_FOUND, "Card not found"))
+            elif not board_live:
+                lookups.append(
+                    CardLookup(card_id, None, status.HTTP_404_NOT_FOUND, "Board not found")
+                )
+            elif not is_member:
+                lookups.append(
+                    CardLookup(
+                        card_id,
+                        None,
+                        status.HTTP_403_FORBIDDEN,
+                        "You are not a member of this workspace",
+                    )
+                )
+            else:
+                lookups.append(CardLookup(card_id, card))
+
+        logger.info(
+            "card.multi_get.success",
+            requested=len(card_ids),
+            found=sum(lookup.card is not None for lookup in lookups),
+            user_id=str(user_id),
+        )
+        return lookups
+
     async def update_card(
-        self, card_id: UUID, user_id: UUID, updates: dict
+        self,
+        card_id: UUID,
+        user_id: UUID,
+        updates: dict,
+        expected_version: int | None = None,
     ) -> Card:
         """
         Update card fields.
 
+        The change is applied with a single UPDATE ... RETURNING that bumps
+        the card's version, filtered on workspace membership and, when
+        given, on the version the client last saw, so a concurrent edit is
+        detected instead of silently overwritten.
+
         Args:
             card_id: UUID of card to update
             user_id: UUID of user updating card
             updates: Dictionary of fields to update
+            expected_version: Version from the client's If-Match header
 
         Returns:
             Updated card
 
         Raises:
-            HTTPException: If card not found or user not workspace member
+            HTTPException: If card not found, user not workspace member, or
+                expected_version is stale (412)
         """
-        # Get card with eagerly loaded relationships
-        result = await self.db.execute(
-            select(Card)
-            .where(Card.id == card_id)
-            .options(selectinload(Card.assignees), selectinload(Card.labels))
-        )
-        card = result.scalar_one_or_none()
-
-        if not card:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND, detail="Card not found"
-            )
-
-        # Verify user has access via board's workspace
-        await self._get_board_with_permission(card.board_id, user_id)
+        # Filter allowed fields
+        allowed_fields = {
+            "title",
+            "description",
+            "priority",
+            "due_date",
+            "story_points",
+        }
+        filtered_updates = {
+            k: v for k, v in updates.items() if k in allowed_fields
+        }
+        if filtered_updates.get("title"):
+            filtered_updates["title"] = filtered_updates["title"].strip()
 
         logger.info(
             "card.update.start",
@@ -235,33 +684,82 @@ class CardService:
             user_id=str(user_id),
         )
 
+        if not filtered_updates:
+            card = await self.get_card_by_id(card_id, user_id)
+            check_version("Card", card.version, expected_version)
+            await self.db.refresh(card, ["assignees", "labels"])
+            return card
+
+        conditions = [
+            Card.id == card_id,
+            Card.board_id.in_(
+                select(Board.id)
+                .join(WorkspaceMember, WorkspaceMember.workspace_id == Board.workspace_id)
+                .where(WorkspaceMember.user_id == user_id, Board.deleted_at.is_(None))
+            ),
+        ]
+        if expected_version is not None:
+            conditions.append(Card.version == expected_version)
+
         try:
-            # Filter allowed fields
-            allowed_fields = {
-                "title",
-                "description",
-                "priority",
-                "due_date",
-                "story_points",
-            }
-            filtered_updates = {
-                k: v for k, v in updates.items() if k in allowed_fields
-            }
-
-            # Apply updates
-            for key, value in filtered_updates.items():
-                if key == "title" and value:
-                    value = value.strip()
-                setattr(card, key, value)
+            changed = (
+                update(Card)
+                .where(*conditions)
+                .values(**filtered_updates, version=Card.version + 1, updated_at=func.now())
+            )
+            tracks_stats = not filtered_updates.keys().isdisjoint({"story_points", "due_date"})
+            if tracks_stats:
+                # Joining the locked row gives RETURNING the values the edit
+                # replaces, which the board stats delta takes back out
+                before = (
+                    select(Card.id, Card.story_points, Card.due_date)
+                    .where(Card.id == card_id)
+                    .with_for_update()
+                    .subquery("before")
+                )
+                changed = changed.where(Card.id == before.c.id).returning(
+                    *Card.__table__.c,
+                    before.c.story_points.label("old_story_points"),
+                    before.c.due_date.label("old_due_date"),
+                )
+            else:
+                changed = changed.returning(*Card.__table__.c)
+            changed = changed.cte("updated")
+            record_activity = ActivityRepository.insert_from(
+                changed,
+                user_id,
+                "updated",
+                {"changes": jsonable_encoder(filtered_updates)},
+            ).cte("activity")
+            updated = aliased(Card, changed)
+            query = select(updated).add_cte(record_activity)
+            if tracks_stats:
+                query = query.add_cte(
+                    BoardStatsRepository.apply_from(
+                        changed,
+                        added=(changed.c.story_points, changed.c.due_date),
+                        removed=(changed.c.old_story_points, changed.c.old_due_date),
+                    ).cte("stats")
+                )
+            result = await self.db.execute(
+                query.options(selectinload(updated.assignees), selectinload(updated.labels))
+                .execution_options(populate_existing=True)
+            )
+            card = result.scalar_one_or_none()
+
+            if card is None:
+                # Raises 404/403 if that is why nothing matched, else the version was stale
+                await self.get_card_by_id(card_id, user_id)
+                raise version_conflict("Card")
 
             await self.db.commit()
-            # Refresh to get updated timestamps, relationships already loaded
-            await self.db.refresh(card)
+            await invalidate_board_cards(card.board_id)
 
             logger.info(
                 "card.update.success",
                 card_id=str(card_id),
                 updated_fields=list(filtered_updates.keys()),
+                version=card.version,
             )
 
             # Broadcast card update
@@ -273,6 +771,7 @@ class CardService:
                     "board_id": str(card.board_id),
                     "column_id": str(card.column_id),
                     "updates": filtered_updates,
+                    "version": card.version,
                     "user_id": str(user_id),
                     "timestamp": datetime.utcnow().isoformat(),
                 },
@@ -280,6 +779,8 @@ class CardService:
 
             return card
 
+        except HTTPException:
+            raise
         except Exception as e:
             logger.error(
                 "card.update.failed",
@@ -290,18 +791,170 @@ class CardService:
             await self.db.rollback()
             raise
 
-    async def delete_card(self, card_id: UUID, user_id: UUID) -> None:
+    async def bulk_update_cards(self, data: BulkCardEditRequest, user_id: UUID) -> list[UUID]:
+        """
+        Apply the same edits to many cards in a single statement.
+
+        The UPDATE runs as a data-modifying CTE feeding an INSERT into
+        card_activities, so all cards are edited and their activity rows
+        recorded in one round-trip. Edits are SQL expressions evaluated per
+        row (e.g. story points adjusted relative to each card's value).
+        Story point and due date edits also move the board stats totals in
+        the same statement.
+
+        Args:
+            data: Target card IDs and edits to apply
+            user_id: UUID of user performing the edit
+
+        Returns:
+            UUIDs of updated cards
+
+        Raises:
+            HTTPException: 404 if any card not found, 403 if user is not a
+                          member of every workspace involved
+        """
+        card_ids = list(dict.fromkeys(data.card_ids))
+        scope = await CardRepository(self.db).get_scope(card_ids, user_id)
+        if len(scope.card_ids) != len(card_ids):
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND, detail="Card not found"
+            )
+        if not scope.is_member:
+            raise HTTPException(
+                status_code=status.HTTP_403_FORBIDDEN,
+                detail="You are not a member of this workspace",
+            )
+
+        changes = data.model_dump(mode="json", exclude={"card_ids"}, exclude_none=True)
+        logger.info(
+            "card.bulk_update.start",
+            card_count=len(card_ids),
+            changes=changes,
+            user_id=str(user_id),
+        )
+
+        values = self._bulk_edit_values(data)
+        updated = (
+            update(Card)
+            .where(Card.id.in_(card_ids))
+            .values(**values, version=Card.version + 1, updated_at=func.now())
+        )
+        tracks_stats = not values.keys().isdisjoint({"story_points", "due_date"})
+        if tracks_stats:
+            # Joining the locked rows gives RETURNING the values the edit
+            # replaces, which the board stats delta takes back out
+            before = (
+                select(Card.id, Card.story_points, Card.due_date)
+                .where(Card.id.in_(card_ids))
+                .with_for_update()
+                .subquery("before")
+            )
+            updated = updated.where(Card.id == before.c.id).returning(
+                Card.id,
+                Card.board_id,
+                Card.story_points,
+                Card.due_date,
+                before.c.story_points.label("old_story_points"),
+                before.c.due_date.label("old_due_date"),
+            )
+        else:
+            updated = updated.returning(Card.id, Card.board_id)
+        updated = updated.cte("updated")
+        record_activity = ActivityRepository.insert_from(
+            updated, user_id, "updated", {"bulk": True, "changes": changes}
+        ).returning(CardActivity.card_id)
+        if tracks_stats:
+            record_activity = record_activity.add_cte(
+                BoardStatsRepository.apply_from(
+                    updated,
+                    added=(updated.c.story_points, updated.c.due_date),
+                    removed=(updated.c.old_story_points, updated.c.old_due_date),
+                ).cte("stats")
+            )
+
+        try:
+            result = await self.db.execute(record_activity)
+            updated_ids = [row.card_id for row in result]
+            await self.db.commit()
+            await invalidate_board_cards(*scope.cards_by_board)
+        except Exception as e:
+            logger.error(
+                "card.bulk_update.failed",
+                error=str(e),
+                error_type=type(e).__name__,
+                card_count=len(card_ids),
+            )
+            await self.db.rollback()
+            raise
+
+        logger.info("card.bulk_update.success", card_count=len(updated_ids))
+
+        timestamp = datetime.utcnow().isoformat()
+        for board_id, board_card_ids in scope.cards_by_board.items():
+            await manager.broadcast_to_board(
+                board_id=str(board_id),
+                message={
+                    "event_type": "cards_bulk_updated",
+                    "board_id": str(board_id),
+                    "card_ids": [str(cid) for cid in board_card_ids],
+                    "updates": changes,
+                    "user_id": str(user_id),
+                    "timestamp": timestamp,
+                },
+            )
+
+        return updated_ids
+
+    @staticmethod
+    def _bulk_edit_values(data: BulkCardEditRequest) -> dict:
+        """Translate bulk edit operations into per-row SQL expressions."""
+        values: dict = {}
+        if data.title_prefix or data.title_suffix:
+            title = Card.title
+            if data.title_prefix:
+                title = literal(data.title_prefix) + title
+            if data.title_suffix:
+                title = title + literal(data.title_suffix)
+            values["title"] = func.left(title, 255)
+        if data.description_append:
+            # concat_ws skips NULL, so empty descriptions take the text as-is
+            values["description"] = func.concat_ws(
+                "\n\n", func.nullif(Card.description, ""), data.description_append
+            )
+        if data.priority is not None:
+            values["priority"] = data.priority
+        if data.story_points is not None:
+            values["story_points"] = data.story_points
+        elif data.story_points_delta is not None:
+            values["story_points"] = func.least(
+                func.greatest(func.coalesce(Card.story_points, 0) + data.story_points_delta, 0),
+                99,
+            )
+        if data.due_date is not None:
+            values["due_date"] = data.due_date
+        elif data.due_date_offset_days is not None:
+            values["due_date"] = Card.due_date + data.due_date_offset_days
+        return values
+
+    async def delete_card(
+        self, card_id: UUID, user_id: UUID, expected_version: int | None = None
+    ) -> None:
         """
         Delete card and reorder remaining cards in column.
 
         Args:
             card_id: UUID of card to delete
             user_id: UUID of user deleting card
+            expected_version: Version from the client's If-Match header
 
         Raises:
-            HTTPException: If card not found or user not workspace member
+            HTTPException: If card not found, user not workspace member, or
+                expected_version is stale (412)
         """
         card = await self.get_card_by_id(card_id, user_id)
+        check_version("Card", card.version, expected_version)
+        # Loaded by the permission check; served from the identity map
+        board = await self.db.get(Board, card.board_id)
 
         logger.info(
             "card.delete.start",
@@ -312,12 +965,54 @@ class CardService:
 
         try:
             async with self.db.begin_nested():
-                board_id = card.board_id
-                column_id = card.column_id
-                position = card.position
-
-                # Delete card
-                await self.db.delete(card)
+                await lock_columns(self.db, card.board_id, [card.column_id])
+                conditions = [Card.id == card_id]
+                if expected_version is not None:
+                    conditions.append(Card.version == expected_version)
+
+                # RETURNING gives the slot the card held at delete time, so the
+                # shift below never works from a stale position
+                removed = (
+                    delete(Card)
+                    .where(*conditions)
+                    .returning(
+                        Card.id,
+                        Card.board_id,
+                        Card.column_id,
+                        Card.position,
+                        Card.title,
+                        Card.story_points,
+                        Card.due_date,
+                    )
+                    .cte("removed")
+                )
+                record_stats = BoardStatsRepository.apply_from(
+                    removed,
+                    card_delta=-1,
+                    removed=(removed.c.story_points, removed.c.due_date),
+                ).cte("stats")
+                # The card row is gone, so the entry keeps its id in metadata
+                record_activity = ActivityRepository.insert_from(
+                    removed,
+                    user_id,
+                    "deleted",
+                    func.jsonb_build_object("card_id", removed.c.id, "title", removed.c.title),
+                    keep_card_id=False,
+                ).cte("activity")
+                deleted = (
+                    await self.db.execute(
+                        select(removed.c.board_id, removed.c.column_id, removed.c.position)
+                        .add_cte(record_activity)
+                        .add_cte(record_stats)
+                    )
+                ).one_or_none()
+                if deleted is None or deleted.column_id != card.column_id:
+                    raise version_conflict("Card")
+                board_id, column_id, position = deleted
+                await mark_columns_dirty(self.db, board_id, [column_id])
+                await BoardColumnRepository(self.db).adjust_card_counts(
+                    board_id, {column_id: -1}
+                )
 
                 # Reorder remaining cards (decrement positions > deleted position)
                 await self.db.execute(
@@ -333,6 +1028,8 @@ class CardService:
                 )
 
             await self.db.commit()
+            await invalidate_dashboard(board.workspace_id)
+            await invalidate_board_cards(board_id)
 
             logger.info(
                 "card.delete.success",
@@ -363,6 +1060,29 @@ class CardService:
             await self.db.rollback()
             raise
 
+    async def _claim_column_slot(self, board_id: UUID, column_id: UUID) -> None:
+        """
+        Count a new card in its column, enforcing the column's WIP limit.
+
+        Args:
+            board_id: UUID of board
+            column_id: UUID of column receiving the card
+
+        Raises:
+            HTTPException: 400 if the column doesn't exist in the board,
+                409 if it is at its WIP limit
+        """
+        columns = BoardColumnRepository(self.db)
+        if await columns.claim_slot(board_id, column_id) is not None:
+            return
+        column = (await columns.get_columns(board_id, [column_id])).get(column_id)
+        if column is None:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Column does not exist in board",
+            )
+        raise wip_limit_reached(column)
+
     async def _get_board_with_permission(
         self, board_id: UUID, user_id: UUID
     ) -> Board:
@@ -379,7 +1099,9 @@ class CardService:
         Raises:
             HTTPException: If board not found or user not workspace member
         """
-        result = await self.db.execute(select(Board).where(Board.id == board_id))
+        result = await self.db.execute(
+            select(Board).where(Board.id == board_id, Board.deleted_at.is_(None))
+        )
         board = result.scalar_one_or_none()
 
         if not board:
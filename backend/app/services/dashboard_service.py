@@ -0,0 +1,191 @@
+"""Dashboard service aggregating workspace, board and column counts."""
+
+from typing import Any
+from uuid import UUID
+
+import structlog
+from sqlalchemy import and_, func, select
+from sqlalchemy.dialects.postgresql import aggregate_order_by
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.cache import Cache
+from app.models.board import Board
+from app.models.board_column import BoardColumn
+from app.models.card_activity import CardActivity
+from app.models.workspace import Workspace
+from app.models.workspace_member import WorkspaceMember
+
+logger = structlog.get_logger(__name__)
+
+# Boards, column card counts and member count of a workspace, keyed by workspace id
+dashboard_cache = Cache("dashboard")
+
+
+async def invalidate_dashboard(*workspace_ids: UUID) -> None:
+    """
+    Evict workspace summaries after their boards, cards or members change.
+
+    Call after the change is committed.
+
+    Args:
+        workspace_ids: Workspaces whose summaries are stale
+    """
+    await dashboard_cache.invalidate(*(str(workspace_id) for workspace_id in workspace_ids))
+
+
+class DashboardService:
+    """Service for the per-user dashboard of workspace summaries."""
+
+    def __init__(self, db: AsyncSession):
+        """
+        Initialize DashboardService.
+
+        Args:
+            db: Async database session
+        """
+        self.db = db
+
+    async def get_dashboard(self, user_id: UUID) -> list[dict[str, Any]]:
+        """
+        Summarize every workspace the user belongs to.
+
+        The user's memberships and each workspace's last activity are read
+        live in one query (the latter from the workspace/created_at index).
+        Board and member counts come from dashboard_cache, with all misses
+        computed together by one GROUP BY query.
+
+        Args:
+            user_id: UUID of requesting user
+
+        Returns:
+            Workspace summaries ordered by most recently updated workspace
+        """
+        last_activity = (
+            select(func.max(CardActivity.created_at))
+            .where(CardActivity.workspace_id == Workspace.id)
+            .scalar_subquery()
+        )
+        result = await self.db.execute(
+            select(Workspace.id, WorkspaceMember.role, last_activity)
+            .join(WorkspaceMember, WorkspaceMember.workspace_id == Workspace.id)
+            .where(WorkspaceMember.user_id == user_id, Workspace.deleted_at.is_(None))
+            .order_by(Workspace.updated_at.desc())
+        )
+        memberships = result.all()
+
+        summaries = await self.get_workspace_summaries(
+            [workspace_id for workspace_id, _, _ in memberships]
+        )
+        return [
+            {
+                **summaries[str(workspace_id)],
+                "role": role,
+                "last_activity_at": last_activity_at,
+            }
+            for workspace_id, role, last_activity_at in memberships
+            if summaries[str(workspace_id)] is not None
+        ]
+
+    async def get_workspace_summaries(
+        self, workspace_ids: list[UUID]
+    ) -> dict[str, dict[str, Any] | None]:
+        """
+        Get cached board and member counts of workspaces.
+
+        Args:
+            workspace_ids: UUIDs of workspaces (membership already checked)
+
+        Returns:
+            Summary per workspace id (None for missing or deleted workspaces)
+        """
+        return await dashboard_cache.get_many(
+            [str(workspace_id) for workspace_id in workspace_ids], self._load_summaries
+        )
+
+    async def _load_summaries(self, workspace_ids: list[str]) -> dict[str, dict[str, Any]]:
+        """
+        Compute workspace summaries with a single grouped query.
+
+        One row per (workspace, board) carries the board's columns with
+        their maintained card counters, aggregated in column order, and the
+        workspace's member count.
+
+        Args:
+            workspace_ids: Workspace ids (as strings) to summarize
+
+        Returns:
+            JSON-ready summary per workspace id
+        """
+        member_count = (
+            select(func.count())
+            .where(WorkspaceMember.workspace_id == Workspace.id)
+            .scalar_subquery()
+        )
+        columns = func.coalesce(
+            func.jsonb_agg(
+                aggregate_order_by(
+                    func.jsonb_build_object(
+                        "id",
+                        BoardColumn.id,
+                        "name",
+                        BoardColumn.name,
+                        "card_count",
+                        BoardColumn.card_count,
+                    ),
+                    BoardColumn.position,
+                )
+            ).filter(BoardColumn.id.is_not(None)),
+            func.jsonb_build_array(),
+        )
+        result = await self.db.execute(
+            select(
+                Workspace.id,
+                Workspace.name,
+                member_count,
+                Board.id.label("board_id"),
+                Board.name.label("board_name"),
+                columns,
+            )
+            .outerjoin(
+                Board,
+                and_(
+                    Board.workspace_id == Workspace.id,
+                    Board.deleted_at.is_(None),
+                    Board.archived.is_(False),
+                ),
+            )
+            .outerjoin(BoardColumn, BoardColumn.board_id == Board.id)
+            .where(
+                Workspace.id.in_([UUID(workspace_id) for workspace_id in workspace_ids]),
+                Workspace.deleted_at.is_(None),
+            )
+            .group_by(Workspace.id, Board.id)
+            .order_by(Workspace.id, Board.updated_at.desc())
+        )
+
+        summaries: dict[str, dict[str, Any]] = {}
+        for workspace_id, name, members, board_id, board_name, board_columns in result:
+            summary = summaries.setdefault(
+                str(workspace_id),
+                {
+                    "id": str(workspace_id),
+                    "name": name,
+                    "member_count": members,
+                    "board_count": 0,
+                    "boards": [],
+                },
+            )
+            if board_id is None:
+                continue
+            summary["board_count"] += 1
+            summary["boards"].append(
+                {
+                    "id": str(board_id),
+                    "name": board_name,
+                    "card_count": sum(column["card_count"] for column in board_columns),
+                    "columns": board_columns,
+                }
+            )
+
+        logger.info("dashboard.load.success", workspaces=len(summaries))
+        return summaries
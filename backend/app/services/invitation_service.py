@@ -13,6 +13,7 @@ from app.models.workspace_audit_log import AuditActionEnum
 from app.models.workspace_invitation import DeliveryStatusEnum, WorkspaceInvitation
 from app.models.workspace_member import RoleEnum, WorkspaceMember
 from app.services.audit_service import AuditService
+from app.services.workspace_service import invalidate_membership
 
 logger = structlog.get_logger(__name__)
 
@@ -124,10 +125,6 @@ class InvitationService:
 
         await self.db.commit()
 
-        # Refresh all invitations to get generated fields
-        for invitation in invitations:
-            await self.db.refresh(invitation)
-
         # Audit log for each invitation
         audit_service = AuditService(self.db)
         for invitation in invitations:
@@ -289,7 +286,7 @@ class InvitationService:
         attributes.set_attribute(invitation, "accepted_at", datetime.utcnow())
 
         await self.db.commit()
-        await self.db.refresh(member)
+        await invalidate_membership(member.workspace_id, user_id)
 
         # Audit log
         audit_service = AuditService(self.db)
@@ -405,7 +402,6 @@ class InvitationService:
         attributes.set_attribute(invitation, "delivery_status", DeliveryStatusEnum.PENDING)
 
         await self.db.commit()
-        await self.db.refresh(invitation)
 
         # Audit log
         audit_service = AuditService(self.db)
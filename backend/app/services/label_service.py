@@ -1,12 +1,37 @@
 """Label service for business logic."""
 
+from datetime import datetime
 from uuid import UUID
 
+import orjson
+import structlog
+from pydantic import TypeAdapter
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.cache import Cache
+from app.core.single_flight import invalidate_board_cards, invalidate_workspace_board_cards
+from app.repositories.card_repository import CardRepository
 from app.repositories.label_repository import LabelRepository
+from app.schemas.card import BulkRelationUpdateResponse
 from app.schemas.label import LabelCreate, LabelResponse, LabelUpdate
 from app.services.workspace_service import WorkspaceService
+from app.websockets.manager import manager
+
+logger = structlog.get_logger(__name__)
+
+
+def _as_bytes(raw: bytes | str) -> bytes:
+    """Cached catalogs come back as str from Redis, which decodes responses."""
+    return raw.encode() if isinstance(raw, str) else raw
+
+
+# Encoded list[LabelResponse] of each workspace, keyed by workspace ID
+label_catalog_cache = Cache("labels", encode=bytes, decode=_as_bytes)
+
+# Workspace of each label (None once deleted), keyed by label ID
+label_workspace_cache = Cache("label-workspaces")
+
+_label_list = TypeAdapter(list[LabelResponse])
 
 
 class LabelService:
@@ -15,6 +40,7 @@ class LabelService:
     def __init__(self, session: AsyncSession) -> None:
         """Initialize label service."""
         self.label_repo = LabelRepository(session)
+        self.card_repo = CardRepository(session)
         self.workspace_service = WorkspaceService(session)
         self.session = session
 
@@ -30,32 +56,68 @@ class LabelService:
         label = await self.label_repo.create_label(
             workspace_id=workspace_id, name=label_data.name, color=label_data.color
         )
-        return LabelResponse.model_validate(label)
+        response = LabelResponse.model_validate(label)
+        await self.session.commit()
+        await label_catalog_cache.invalidate(str(workspace_id))
+        await label_workspace_cache.set(str(label.id), str(workspace_id))
+        return response
 
-    async def get_workspace_labels(self, workspace_id: UUID, user_id: UUID) -> list[LabelResponse]:
-        """Get all labels for a workspace."""
+    async def get_label_catalog(self, workspace_id: UUID) -> bytes:
+        """
+        Get a workspace's labels as an encoded list[LabelResponse], without a permission check.
+
+        The catalog is cached and invalidated by every label write, so board
+        and label responses can embed it as is.
+        """
+
+        async def load() -> bytes:
+            labels = await self.label_repo.get_workspace_labels(workspace_id)
+            return _label_list.dump_json([LabelResponse.model_validate(label) for label in labels])
+
+        return await label_catalog_cache.get_or_set(str(workspace_id), load)
+
+    async def get_workspace_labels_json(self, workspace_id: UUID, user_id: UUID) -> bytes:
+        """Get all labels for a workspace, encoded as a list[LabelResponse]."""
         # Verify user is workspace member
         is_member = await self.workspace_service.check_workspace_member(workspace_id, user_id)
         if not is_member:
             raise PermissionError("User is not a member of this workspace")
 
-        labels = await self.label_repo.get_workspace_labels(workspace_id)
-        return [LabelResponse.model_validate(label) for label in labels]
+        return await self.get_label_catalog(workspace_id)
 
-    async def update_label(
-        self, label_id: UUID, label_data: LabelUpdate, user_id: UUID
-    ) -> LabelResponse:
-        """Update a label's name and/or color."""
-        label = await self.label_repo.get_label_by_id(label_id)
-        if not label:
+    async def get_workspace_labels(self, workspace_id: UUID, user_id: UUID) -> list[LabelResponse]:
+        """Get all labels for a workspace."""
+        return _label_list.validate_json(
+            await self.get_workspace_labels_json(workspace_id, user_id)
+        )
+
+    async def get_label_workspace(self, label_id: UUID) -> UUID | None:
+        """Get the workspace a label belongs to, or None if it doesn't exist."""
+
+        async def load() -> str | None:
+            workspace_id = await self.label_repo.get_label_workspace_id(label_id)
+            return str(workspace_id) if workspace_id is not None else None
+
+        workspace_id = await label_workspace_cache.get_or_set(str(label_id), load)
+        return UUID(workspace_id) if workspace_id is not None else None
+
+    async def _check_label_access(self, label_id: UUID, user_id: UUID) -> UUID:
+        """Resolve a label's workspace from cache and check the user belongs to it."""
+        workspace_id = await self.get_label_workspace(label_id)
+        if workspace_id is None:
             raise ValueError("Label not found")
 
         # Verify user is workspace member
-        is_member = await self.workspace_service.check_workspace_member(
-            label.workspace_id, user_id
-        )
+        is_member = await self.workspace_service.check_workspace_member(workspace_id, user_id)
         if not is_member:
             raise PermissionError("User is not a member of this workspace")
+        return workspace_id
+
+    async def update_label(
+        self, label_id: UUID, label_data: LabelUpdate, user_id: UUID
+    ) -> LabelResponse:
+        """Update a label's name and/or color."""
+        workspace_id = await self._check_label_access(label_id, user_id)
 
         updated_label = await self.label_repo.update_label(
             label_id=label_id, name=label_data.name, color=label_data.color
@@ -63,20 +125,15 @@ class LabelService:
         if not updated_label:
             raise ValueError("Label not found")
 
-        return LabelResponse.model_validate(updated_label)
+        response = LabelResponse.model_validate(updated_label)
+        await self.session.commit()
+        await label_catalog_cache.invalidate(str(workspace_id))
+        await invalidate_workspace_board_cards(workspace_id)
+        return response
 
     async def delete_label(self, label_id: UUID, user_id: UUID) -> dict[str, int]:
         """Delete a label and return count of affected cards."""
-        label = await self.label_repo.get_label_by_id(label_id)
-        if not label:
-            raise ValueError("Label not found")
-
-        # Verify user is workspace member
-        is_member = await self.workspace_service.check_workspace_member(
-            label.workspace_id, user_id
-        )
-        if not is_member:
-            raise PermissionError("User is not a member of this workspace")
+        workspace_id = await self._check_label_access(label_id, user_id)
 
         # Count affected cards
         card_count = await self.label_repo.count_cards_with_label(label_id)
@@ -84,45 +141,87 @@ class LabelService:
         # Delete label (cascade will remove card_labels entries)
         await self.label_repo.delete_label(label_id)
         await self.session.commit()
+        await label_catalog_cache.invalidate(str(workspace_id))
+        await label_workspace_cache.invalidate(str(label_id))
+        await invalidate_workspace_board_cards(workspace_id)
 
         return {"cards_affected": card_count}
 
     async def add_label_to_card(
         self, card_id: UUID, label_id: UUID, user_id: UUID
     ) -> LabelResponse:
-        """Add a label to a card."""
-        label = await self.label_repo.get_label_by_id(label_id)
-        if not label:
+        """Add a label to a card (lookup, permission check and insert in one statement)."""
+        row = await self.label_repo.add_label_to_card(card_id, label_id, user_id)
+        if row is None:
             raise ValueError("Label not found")
-
-        # Verify user is workspace member
-        is_member = await self.workspace_service.check_workspace_member(
-            label.workspace_id, user_id
-        )
-        if not is_member:
+        if not row.is_member:
             raise PermissionError("User is not a member of this workspace")
+        if not row.card_in_workspace:
+            raise ValueError("Card not found")
+        if not row.inserted:
+            raise ValueError("Label already added to this card")
 
-        try:
-            await self.label_repo.add_label_to_card(card_id, label_id)
-        except ValueError as e:
-            # Re-raise as ValueError so API layer can convert to 409
-            raise ValueError(str(e))
-
-        return LabelResponse.model_validate(label)
+        await self.session.commit()
+        await invalidate_board_cards(row.board_id)
+        return LabelResponse.model_validate(row)
 
     async def remove_label_from_card(
         self, card_id: UUID, label_id: UUID, user_id: UUID
     ) -> bool:
         """Remove a label from a card."""
-        label = await self.label_repo.get_label_by_id(label_id)
-        if not label:
-            raise ValueError("Label not found")
-
-        # Verify user is workspace member
-        is_member = await self.workspace_service.check_workspace_member(
-            label.workspace_id, user_id
-        )
-        if not is_member:
+        await self._check_label_access(label_id, user_id)
+        board_id = await self.label_repo.remove_label_from_card(card_id, label_id)
+        if board_id is None:
+            return False
+        await self.session.commit()
+        await invalidate_board_cards(board_id)
+        return True
+
+    async def bulk_update_card_labels(
+        self, card_ids: list[UUID], add: list[UUID], remove: list[UUID], user_id: UUID
+    ) -> BulkRelationUpdateResponse:
+        """Add and remove labels on many cards with one INSERT and one DELETE."""
+        scope = await self.card_repo.get_scope(card_ids, user_id)
+        # Membership first, so non-members can't probe other workspaces' cards
+        if not scope.is_member:
             raise PermissionError("User is not a member of this workspace")
+        if len(scope.card_ids) != len(set(card_ids)):
+            raise LookupError("Card not found")
+        if len(scope.workspace_ids) != 1:
+            raise ValueError("Cards must belong to the same workspace")
+
+        workspace_id = next(iter(scope.workspace_ids))
+        catalog = orjson.loads(await self.get_label_catalog(workspace_id))
+        known_ids = {label["id"] for label in catalog}
+        if not {str(label_id) for label_id in (*add, *remove)} <= known_ids:
+            raise LookupError("Label not found")
+
+        target_ids = list(scope.card_ids)
+        added = await self.label_repo.add_labels_to_cards(target_ids, add) if add else 0
+        removed = await self.label_repo.remove_labels_from_cards(target_ids, remove) if remove else 0
+        await self.session.commit()
+        await invalidate_board_cards(*scope.cards_by_board)
+
+        logger.info(
+            "label.bulk_update.success",
+            card_count=len(target_ids),
+            added=added,
+            removed=removed,
+            user_id=str(user_id),
+        )
 
-        return await self.label_repo.remove_label_from_card(card_id, label_id)
+        for board_id, board_card_ids in scope.cards_by_board.items():
+            await manager.broadcast_to_board(
+                board_id=str(board_id),
+                message={
+                    "event_type": "card_labels_bulk_updated",
+                    "board_id": str(board_id),
+                    "card_ids": [str(cid) for cid in board_card_ids],
+                    "added_label_ids": [str(lid) for lid in add],
+                    "removed_label_ids": [str(lid) for lid in remove],
+                    "updated_by": str(user_id),
+                    "timestamp": datetime.utcnow().isoformat(),
+                },
+            )
+
+        return BulkRelationUpdateResponse(card_count=len(target_ids), added=added, removed=removed)
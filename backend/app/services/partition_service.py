@@ -0,0 +1,213 @@
+"""Partition service for monthly history partitions and their retention."""
+
+from datetime import UTC, date, datetime, timedelta
+
+import structlog
+from sqlalchemy import func, select, text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.models.card_activity import CardActivity
+from app.models.workspace import Workspace
+from app.models.workspace_audit_log import WorkspaceAuditLog
+from app.services.purge_service import delete_in_chunks
+from app.utils.partitions import (
+    MONTHLY_PARTITIONED_TABLES,
+    add_months,
+    create_partition_sql,
+    default_partition_name,
+    partition_bounds,
+    partition_month,
+    partition_name,
+    upcoming_months,
+)
+
+logger = structlog.get_logger(__name__)
+
+
+def retention_cutoff(retention_days: int | None) -> datetime:
+    """
+    Oldest created_at still within a workspace's history retention.
+
+    Reads filter on it, so expired rows disappear before the nightly
+    cleanup removes them and older partitions are pruned from the plan.
+
+    Args:
+        retention_days: Workspace retention (None for HISTORY_RETENTION_DAYS)
+
+    Returns:
+        Cutoff timestamp (UTC)
+    """
+    days = retention_days or settings.HISTORY_RETENTION_DAYS
+    return datetime.now(UTC) - timedelta(days=days)
+
+
+class PartitionService:
+    """Service for creating and retiring monthly history partitions."""
+
+    def __init__(self, db: AsyncSession):
+        """
+        Initialize PartitionService.
+
+        Args:
+            db: Async database session
+        """
+        self.db = db
+
+    async def list_partitions(self, table: str) -> dict[str, date]:
+        """
+        List the monthly partitions attached to a table.
+
+        Args:
+            table: Partitioned parent table
+
+        Returns:
+            Month (first day) of each partition, keyed by partition name
+        """
+        result = await self.db.execute(
+            text(
+                "SELECT c.relname FROM pg_inherits i "
+                "JOIN pg_class c ON c.oid = i.inhrelid "
+                "WHERE i.inhparent = CAST(:table AS regclass)"
+            ),
+            {"table": table},
+        )
+        partitions = {}
+        for (name,) in result:
+            month = partition_month(table, name)
+            if month is not None:
+                partitions[name] = month
+        return partitions
+
+    async def create_partition(self, table: str, month: date) -> None:
+        """
+        Create one month's partition of a table if it doesn't exist.
+
+        Rows of the month already in the default partition are moved into
+        the new one. The default partition is detached meanwhile, which
+        locks the parent table until the transaction ends.
+
+        Args:
+            table: Partitioned parent table
+            month: First day of the month
+        """
+        default = default_partition_name(table)
+        lower, upper = partition_bounds(month)
+        in_month = f"created_at >= {lower} AND created_at < {upper}"
+        stray = await self.db.scalar(
+            text(f"SELECT EXISTS (SELECT 1 FROM {default} WHERE {in_month})")
+        )
+        if not stray:
+            await self.db.execute(text(create_partition_sql(table, month)))
+            return
+
+        await self.db.execute(text(f"ALTER TABLE {table} DETACH PARTITION {default}"))
+        await self.db.execute(text(create_partition_sql(table, month)))
+        result = await self.db.execute(
+            text(f"INSERT INTO {table} SELECT * FROM {default} WHERE {in_month}")
+        )
+        await self.db.execute(text(f"DELETE FROM {default} WHERE {in_month}"))
+        await self.db.execute(text(f"ALTER TABLE {table} ATTACH PARTITION {default} DEFAULT"))
+        logger.info(
+            "partition.split.success",
+            table=table,
+            partition=partition_name(table, month),
+            rows=result.rowcount,
+        )
+
+    async def default_partition_months(self, table: str) -> list[date]:
+        """
+        List the months of the rows sitting in a table's default partition.
+
+        Args:
+            table: Partitioned parent table
+
+        Returns:
+            First days of the months, oldest first
+        """
+        result = await self.db.execute(
+            text(
+                "SELECT DISTINCT date_trunc('month', created_at AT TIME ZONE 'UTC')::date "
+                f"FROM {default_partition_name(table)} ORDER BY 1"
+            )
+        )
+        return list(result.scalars())
+
+    async def ensure_partitions(self, today: date | None = None) -> list[str]:
+        """
+        Create the current month's partition and PARTITION_PREMAKE_MONTHS ahead.
+
+        Runs well before each month starts, so inserts rarely reach the
+        default partition. Rows that did (because maintenance fell behind)
+        are moved into partitions of their months, which retention can
+        then drop.
+
+        Args:
+            today: Reference date (defaults to the current UTC date)
+
+        Returns:
+            Names of the partitions created
+        """
+        created = []
+        for table in MONTHLY_PARTITIONED_TABLES:
+            existing = set((await self.list_partitions(table)).values())
+            months = set(upcoming_months(today)) | set(await self.default_partition_months(table))
+            for month in sorted(months - existing):
+                await self.create_partition(table, month)
+                created.append(partition_name(table, month))
+        await self.db.commit()
+
+        if created:
+            logger.info("partition.create.success", partitions=created)
+        return created
+
+    async def apply_retention(self) -> dict[str, int]:
+        """
+        Remove history older than each workspace's retention.
+
+        A partition is dropped once every workspace's retention has passed
+        its end: it is detached first, so the parent is locked only briefly
+        and the DROP touches nothing else. Workspaces keeping less than the
+        longest retention have their own expired rows deleted in chunks
+        from the partitions that remain.
+
+        Returns:
+            dict with partitions_dropped and rows_deleted
+        """
+        longest = await self.db.scalar(
+            select(func.max(Workspace.retention_days)).where(Workspace.deleted_at.is_(None))
+        )
+        longest = max(longest or 0, settings.HISTORY_RETENTION_DAYS)
+        drop_before = retention_cutoff(longest).date()
+
+        stats = {"partitions_dropped": 0, "rows_deleted": 0}
+        for table in MONTHLY_PARTITIONED_TABLES:
+            for name, month in sorted((await self.list_partitions(table)).items()):
+                if add_months(month, 1) > drop_before:
+                    continue
+                await self.db.execute(text(f"ALTER TABLE {table} DETACH PARTITION {name}"))
+                await self.db.execute(text(f"DROP TABLE {name}"))
+                await self.db.commit()
+                stats["partitions_dropped"] += 1
+                logger.info("partition.drop.success", table=table, partition=name)
+
+        result = await self.db.execute(
+            select(Workspace.id, Workspace.retention_days).where(
+                Workspace.deleted_at.is_(None),
+                func.coalesce(Workspace.retention_days, settings.HISTORY_RETENTION_DAYS) < longest,
+            )
+        )
+        workspaces = result.all()
+        await self.db.commit()
+        for workspace_id, retention_days in workspaces:
+            cutoff = retention_cutoff(retention_days)
+            for model in (CardActivity, WorkspaceAuditLog):
+                stats["rows_deleted"] += await delete_in_chunks(
+                    self.db,
+                    model,
+                    select(model.id).where(
+                        model.workspace_id == workspace_id, model.created_at < cutoff
+                    ),
+                )
+
+        return stats
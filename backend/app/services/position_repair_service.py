@@ -0,0 +1,176 @@
+"""Position repair service for keeping card positions dense per column."""
+
+from collections.abc import Iterable
+from datetime import datetime
+from uuid import UUID
+
+import structlog
+from sqlalchemy import delete, func, select, update
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.core.single_flight import invalidate_board_cards
+from app.models.card import Card
+from app.models.dirty_column import DirtyColumn
+from app.repositories.board_column_repository import BoardColumnRepository
+from app.utils.locks import lock_columns
+from app.websockets.manager import manager
+
+logger = structlog.get_logger(__name__)
+
+
+async def mark_columns_dirty(
+    db: AsyncSession, board_id: UUID, column_ids: Iterable[UUID]
+) -> None:
+    """
+    Queue board columns for the next position repair run.
+
+    Called inside the transaction that shifts positions, after the columns
+    are locked, so the mark commits or rolls back with the change itself.
+    A column already queued keeps its original mark.
+
+    Args:
+        db: Async database session
+        board_id: UUID of board
+        column_ids: Columns whose positions changed
+    """
+    values = [
+        {"board_id": board_id, "column_id": UUID(str(column_id))}
+        for column_id in set(column_ids)
+    ]
+    if values:
+        await db.execute(insert(DirtyColumn).values(values).on_conflict_do_nothing())
+
+
+class PositionRepairService:
+    """Service for renumbering card positions in recently changed columns."""
+
+    def __init__(self, db: AsyncSession):
+        """
+        Initialize PositionRepairService.
+
+        Args:
+            db: Async database session
+        """
+        self.db = db
+
+    async def repair_dirty_columns(self, limit: int | None = None) -> dict[str, int]:
+        """
+        Repair the oldest queued columns.
+
+        Only columns on the dirty list are scanned, so the cost of a run
+        depends on recent write volume rather than on the size of the
+        cards table. Each board is repaired in its own short transaction.
+
+        Args:
+            limit: Maximum number of columns to drain (defaults to
+                POSITION_REPAIR_BATCH_SIZE)
+
+        Returns:
+            dict with columns_checked, columns_repaired and cards_renumbered
+        """
+        limit = limit or settings.POSITION_REPAIR_BATCH_SIZE
+        result = await self.db.execute(
+            select(DirtyColumn.board_id, DirtyColumn.column_id)
+            .order_by(DirtyColumn.marked_at)
+            .limit(limit)
+        )
+        columns_by_board: dict[UUID, list[UUID]] = {}
+        for board_id, column_id in result:
+            columns_by_board.setdefault(board_id, []).append(column_id)
+        await self.db.commit()
+
+        stats = {"columns_checked": 0, "columns_repaired": 0, "cards_renumbered": 0}
+        for board_id, column_ids in columns_by_board.items():
+            renumbered = await self.repair_columns(board_id, column_ids)
+            stats["columns_checked"] += len(column_ids)
+            stats["columns_repaired"] += len(renumbered)
+            stats["cards_renumbered"] += sum(renumbered.values())
+
+        return stats
+
+    async def repair_columns(self, board_id: UUID, column_ids: list[UUID]) -> dict[UUID, int]:
+        """
+        Close gaps and break duplicate positions in board columns.
+
+        The columns are locked like any other position change, taken off
+        the dirty list, and renumbered with a single UPDATE ... FROM over a
+        row_number() window ordered by (position, id), the order reads
+        already use. Only cards whose position differs from their rank are
+        written, so a consistent column costs one read and no writes. The
+        columns' card counters are recounted in the same transaction, which
+        corrects any drift from writes that bypassed the services.
+
+        Args:
+            board_id: UUID of board
+            column_ids: Columns to repair
+
+        Returns:
+            Number of cards renumbered per repaired column
+        """
+        try:
+            await lock_columns(self.db, board_id, column_ids)
+            await self.db.execute(
+                delete(DirtyColumn).where(
+                    DirtyColumn.board_id == board_id,
+                    DirtyColumn.column_id.in_(column_ids),
+                )
+            )
+
+            ranked = (
+                select(
+                    Card.id,
+                    Card.position,
+                    (
+                        func.row_number().over(
+                            partition_by=Card.column_id,
+                            order_by=(Card.position, Card.id),
+                        )
+                        - 1
+                    ).label("expected"),
+                )
+                .where(Card.board_id == board_id, Card.column_id.in_(column_ids))
+                .subquery()
+            )
+            result = await self.db.execute(
+                update(Card)
+                .where(Card.id == ranked.c.id, ranked.c.position != ranked.c.expected)
+                .values(position=ranked.c.expected)
+                .returning(Card.column_id)
+                .execution_options(synchronize_session=False)
+            )
+            renumbered: dict[UUID, int] = {}
+            for (column_id,) in result:
+                renumbered[column_id] = renumbered.get(column_id, 0) + 1
+            await BoardColumnRepository(self.db).recount(board_id, column_ids)
+
+            await self.db.commit()
+        except Exception as e:
+            logger.error(
+                "card.position_repair.failed",
+                board_id=str(board_id),
+                error=str(e),
+                error_type=type(e).__name__,
+            )
+            await self.db.rollback()
+            raise
+
+        if renumbered:
+            await invalidate_board_cards(board_id)
+            logger.warning(
+                "card.position_repair.repaired",
+                board_id=str(board_id),
+                columns={str(column_id): count for column_id, count in renumbered.items()},
+            )
+            await manager.broadcast_to_board(
+                board_id=str(board_id),
+                message={
+                    "event_type": "cards_reordered",
+                    "board_id": str(board_id),
+                    "column_ids": [str(column_id) for column_id in renumbered],
+                    "timestamp": datetime.utcnow().isoformat(),
+                },
+            )
+
+        return renumbered
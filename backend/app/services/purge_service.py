@@ -0,0 +1,186 @@
+"""Purge service for removing soft-deleted boards and workspaces."""
+
+from uuid import UUID
+
+import structlog
+from sqlalchemy import delete, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.core.single_flight import invalidate_board_cards
+from app.models.board import Board
+from app.models.card import Card
+from app.models.card_activity import CardActivity
+from app.models.workspace import Workspace
+from app.models.workspace_audit_log import WorkspaceAuditLog
+
+logger = structlog.get_logger(__name__)
+
+
+async def delete_in_chunks(db: AsyncSession, model: type, ids_query) -> int:
+    """
+    Delete the rows selected by ids_query, one committed chunk at a time.
+
+    Args:
+        db: Async database session
+        model: Mapped class whose rows are deleted
+        ids_query: SELECT of the primary keys to delete
+
+    Returns:
+        Number of rows deleted
+    """
+    chunk_size = settings.PURGE_CHUNK_SIZE
+    total = 0
+    while True:
+        try:
+            result = await db.execute(
+                delete(model)
+                .where(model.id.in_(ids_query.limit(chunk_size).scalar_subquery()))
+                .execution_options(synchronize_session=False)
+            )
+            await db.commit()
+        except Exception as e:
+            logger.error(
+                "purge.chunk.failed",
+                table=model.__tablename__,
+                error=str(e),
+                error_type=type(e).__name__,
+            )
+            await db.rollback()
+            raise
+        total += result.rowcount
+        if result.rowcount < chunk_size:
+            return total
+
+
+class PurgeService:
+    """Service for deleting soft-deleted data in short, bounded transactions."""
+
+    def __init__(self, db: AsyncSession):
+        """
+        Initialize PurgeService.
+
+        Args:
+            db: Async database session
+        """
+        self.db = db
+
+    async def purge_board(self, board_id: UUID) -> int:
+        """
+        Delete a soft-deleted board and everything under it.
+
+        Card activities, then cards (whose assignee and label rows go with
+        them through FK cascades) are deleted PURGE_CHUNK_SIZE rows at a
+        time, each chunk in its own transaction, so no statement holds
+        locks on, or writes WAL for, the whole board at once. The board
+        row itself is deleted last with a plain DELETE, bypassing the ORM
+        cascade that would load every card.
+
+        Args:
+            board_id: UUID of board
+
+        Returns:
+            Number of cards deleted (0 if the board is not soft-deleted)
+        """
+        deleted_at = await self.db.scalar(select(Board.deleted_at).where(Board.id == board_id))
+        await self.db.commit()
+        if deleted_at is None:
+            logger.warning("board.purge.skipped", board_id=str(board_id))
+            return 0
+
+        logger.info("board.purge.start", board_id=str(board_id))
+
+        await delete_in_chunks(
+            self.db, CardActivity, select(CardActivity.id).where(CardActivity.board_id == board_id)
+        )
+        cards_deleted = await delete_in_chunks(
+            self.db, Card, select(Card.id).where(Card.board_id == board_id)
+        )
+
+        await self.db.execute(
+            delete(Board)
+            .where(Board.id == board_id, Board.deleted_at.is_not(None))
+            .execution_options(synchronize_session=False)
+        )
+        await self.db.commit()
+        await invalidate_board_cards(board_id)
+
+        logger.info("board.purge.complete", board_id=str(board_id), cards_deleted=cards_deleted)
+        return cards_deleted
+
+    async def purge_workspace(self, workspace_id: UUID) -> int:
+        """
+        Delete a soft-deleted workspace, its boards and its audit log.
+
+        Args:
+            workspace_id: UUID of workspace
+
+        Returns:
+            Number of cards deleted (0 if the workspace is not soft-deleted)
+        """
+        deleted_at = await self.db.scalar(
+            select(Workspace.deleted_at).where(Workspace.id == workspace_id)
+        )
+        board_ids = (
+            await self.db.scalars(select(Board.id).where(Board.workspace_id == workspace_id))
+        ).all()
+        await self.db.commit()
+        if deleted_at is None:
+            logger.warning("workspace.purge.skipped", workspace_id=str(workspace_id))
+            return 0
+
+        logger.info("workspace.purge.start", workspace_id=str(workspace_id), boards=len(board_ids))
+
+        cards_deleted = 0
+        for board_id in board_ids:
+            cards_deleted += await self.purge_board(board_id)
+        await delete_in_chunks(
+            self.db,
+            WorkspaceAuditLog,
+            select(WorkspaceAuditLog.id).where(WorkspaceAuditLog.workspace_id == workspace_id),
+        )
+
+        # Remaining children (labels, members, invitations) are small
+        await self.db.execute(
+            delete(Workspace)
+            .where(Workspace.id == workspace_id, Workspace.deleted_at.is_not(None))
+            .execution_options(synchronize_session=False)
+        )
+        await self.db.commit()
+
+        logger.info(
+            "workspace.purge.complete",
+            workspace_id=str(workspace_id),
+            cards_deleted=cards_deleted,
+        )
+        return cards_deleted
+
+    async def purge_pending(self) -> dict[str, int]:
+        """
+        Purge every soft-deleted workspace and board still present.
+
+        Catches up on purges whose task was never enqueued or did not
+        finish; purging is idempotent, so overlapping a running task is
+        harmless.
+
+        Returns:
+            dict with workspaces_purged and boards_purged
+        """
+        workspace_ids = (
+            await self.db.scalars(select(Workspace.id).where(Workspace.deleted_at.is_not(None)))
+        ).all()
+        board_ids = (
+            await self.db.scalars(
+                select(Board.id)
+                .join(Workspace, Workspace.id == Board.workspace_id)
+                .where(Board.deleted_at.is_not(None), Workspace.deleted_at.is_(None))
+            )
+        ).all()
+        await self.db.commit()
+
+        for workspace_id in workspace_ids:
+            await self.purge_workspace(workspace_id)
+        for board_id in board_ids:
+            await self.purge_board(board_id)
+
+        return {"workspaces_purged": len(workspace_ids), "boards_purged": len(board_ids)}
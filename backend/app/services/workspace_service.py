@@ -4,15 +4,46 @@ from uuid import UUID
 
 import structlog
 from fastapi import HTTPException, status
-from sqlalchemy import select
+from sqlalchemy import delete, func, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.cache import Cache
+from app.core.single_flight import invalidate_workspace_board_cards
+from app.models.board import Board
 from app.models.workspace import Workspace
+from app.models.workspace_invitation import WorkspaceInvitation
 from app.models.workspace_member import RoleEnum, WorkspaceMember
+from app.repositories.workspace_repository import WorkspaceRepository
+from app.services.dashboard_service import invalidate_dashboard
 from app.websockets.manager import manager
 
 logger = structlog.get_logger(__name__)
 
+# Role of a user in a workspace (None for non-members), keyed by membership_key()
+membership_cache = Cache("membership")
+
+
+def membership_key(workspace_id: UUID, user_id: UUID) -> str:
+    """Key of a user's role in membership_cache."""
+    return f"{workspace_id}:{user_id}"
+
+
+async def invalidate_membership(workspace_id: UUID, *user_ids: UUID) -> None:
+    """
+    Evict cached roles after memberships change, in every process.
+
+    The workspace's dashboard summary, which counts its members, is
+    evicted too. Call after the change is committed.
+
+    Args:
+        workspace_id: Workspace whose members changed
+        user_ids: Users whose role was granted, changed or revoked
+    """
+    await membership_cache.invalidate(
+        *(membership_key(workspace_id, user_id) for user_id in user_ids)
+    )
+    await invalidate_dashboard(workspace_id)
+
 
 class WorkspaceService:
     """Service for handling workspace operations."""
@@ -59,7 +90,6 @@ class WorkspaceService:
                 )
                 self.db.add(membership)
                 await self.db.flush()
-                await self.db.refresh(workspace)
 
             logger.info(
                 "workspace.create.success",
@@ -92,7 +122,7 @@ class WorkspaceService:
         result = await self.db.execute(
             select(Workspace)
             .join(WorkspaceMember)
-            .where(WorkspaceMember.user_id == user_id)
+            .where(WorkspaceMember.user_id == user_id, Workspace.deleted_at.is_(None))
             .order_by(Workspace.updated_at.desc())
         )
         return list(result.scalars().all())
@@ -107,7 +137,9 @@ class WorkspaceService:
         Returns:
             Workspace if found, None otherwise
         """
-        result = await self.db.execute(select(Workspace).where(Workspace.id == workspace_id))
+        result = await self.db.execute(
+            select(Workspace).where(Workspace.id == workspace_id, Workspace.deleted_at.is_(None))
+        )
         return result.scalar_one_or_none()
 
     async def update_workspace(
@@ -138,8 +170,11 @@ class WorkspaceService:
             # Check admin permission
             await self._check_admin(workspace_id, user_id)
 
-            result = await self.db.execute(select(Workspace).where(Workspace.id == workspace_id))
-            workspace = result.scalar_one_or_none()
+            # Apply updates in a single UPDATE ... RETURNING
+            workspace = await WorkspaceRepository(self.db).update_by_id(
+                workspace_id,
+                {key: value for key, value in updates.items() if hasattr(Workspace, key)},
+            )
 
             if not workspace:
                 logger.warning(
@@ -148,13 +183,8 @@ class WorkspaceService:
                 )
                 raise HTTPException(status_code=404, detail="Workspace not found")
 
-            # Apply updates
-            for key, value in updates.items():
-                if hasattr(workspace, key):
-                    setattr(workspace, key, value)
-
             await self.db.commit()
-            await self.db.refresh(workspace)
+            await invalidate_dashboard(workspace_id)
 
             # Broadcast WebSocket event to workspace members
             await manager.broadcast_to_workspace(
@@ -192,9 +222,13 @@ class WorkspaceService:
 
     async def delete_workspace(self, workspace_id: UUID, user_id: UUID) -> None:
         """
-        Delete workspace and all related data (admin only).
+        Soft-delete workspace and its boards (admin only).
 
-        Cascade delete will remove all boards, cards, and memberships.
+        The workspace and its boards are marked deleted and memberships and
+        pending invitations are removed, so the workspace disappears from
+        every listing and permission check at once. Boards, cards and audit
+        logs are purged afterwards in bounded chunks by the purge_workspace
+        task (see PurgeService).
 
         Args:
             workspace_id: UUID of workspace to delete
@@ -213,7 +247,11 @@ class WorkspaceService:
             # Check admin permission
             await self._check_admin(workspace_id, user_id)
 
-            result = await self.db.execute(select(Workspace).where(Workspace.id == workspace_id))
+            result = await self.db.execute(
+                select(Workspace).where(
+                    Workspace.id == workspace_id, Workspace.deleted_at.is_(None)
+                )
+            )
             workspace = result.scalar_one_or_none()
 
             if not workspace:
@@ -237,8 +275,25 @@ class WorkspaceService:
                 },
             )
 
-            await self.db.delete(workspace)
+            workspace.deleted_at = func.now()
+            await self.db.execute(
+                update(Board)
+                .where(Board.workspace_id == workspace_id, Board.deleted_at.is_(None))
+                .values(deleted_at=func.now(), version=Board.version + 1)
+                .execution_options(synchronize_session=False)
+            )
+            removed = await self.db.scalars(
+                delete(WorkspaceMember)
+                .where(WorkspaceMember.workspace_id == workspace_id)
+                .returning(WorkspaceMember.user_id)
+            )
+            member_ids = removed.all()
+            await self.db.execute(
+                delete(WorkspaceInvitation).where(WorkspaceInvitation.workspace_id == workspace_id)
+            )
             await self.db.commit()
+            await invalidate_membership(workspace_id, *member_ids)
+            await invalidate_workspace_board_cards(workspace_id)
 
             logger.info(
                 "workspace.delete.success",
@@ -270,37 +325,44 @@ class WorkspaceService:
         Returns:
             True if user is a member, False otherwise
         """
-        result = await self.db.execute(
-            select(WorkspaceMember).where(
-                WorkspaceMember.workspace_id == workspace_id,
-                WorkspaceMember.user_id == user_id,
-            )
-        )
-        return result.scalar_one_or_none() is not None
+        return await self.get_member_role(workspace_id, user_id) is not None
 
-    async def _check_admin(self, workspace_id: UUID, user_id: UUID) -> None:
+    async def get_member_role(self, workspace_id: UUID, user_id: UUID) -> RoleEnum | None:
         """
-        Check if user is admin of workspace.
+        Get a user's role in a workspace, served from membership_cache.
 
         Args:
             workspace_id: UUID of workspace to check
             user_id: UUID of user to check
 
-        Raises:
-            HTTPException: If user is not an admin (403 Forbidden)
+        Returns:
+            Role, or None if the user is not a member
         """
-        from sqlalchemy import and_
 
-        result = await self.db.execute(
-            select(WorkspaceMember).where(
-                and_(
+        async def load() -> str | None:
+            role = await self.db.scalar(
+                select(WorkspaceMember.role).where(
                     WorkspaceMember.workspace_id == workspace_id,
                     WorkspaceMember.user_id == user_id,
-                    WorkspaceMember.role == RoleEnum.ADMIN,
                 )
             )
-        )
-        if not result.scalar_one_or_none():
+            return role.value if role is not None else None
+
+        role = await membership_cache.get_or_set(membership_key(workspace_id, user_id), load)
+        return RoleEnum(role) if role is not None else None
+
+    async def _check_admin(self, workspace_id: UUID, user_id: UUID) -> None:
+        """
+        Check if user is admin of workspace.
+
+        Args:
+            workspace_id: UUID of workspace to check
+            user_id: UUID of user to check
+
+        Raises:
+            HTTPException: If user is not an admin (403 Forbidden)
+        """
+        if await self.get_member_role(workspace_id, user_id) != RoleEnum.ADMIN:
             logger.warning(
                 "workspace.permission_denied",
                 workspace_id=str(workspace_id),
@@ -1,7 +1,9 @@
 """Celery application configuration."""
 
 from celery import Celery
+from celery.signals import task_prerun
 
+from app.core.cache import clear_local_caches
 from app.core.config import settings
 
 # Create Celery app
@@ -9,7 +11,15 @@ celery_app = Celery(
     "taskly",
     broker=settings.REDIS_URL,
     backend=settings.REDIS_URL,
-    include=["app.tasks.send_invitation_email", "app.tasks.cleanup_invitations"],
+    include=[
+        "app.tasks.send_invitation_email",
+        "app.tasks.cleanup_invitations",
+        "app.tasks.import_cards",
+        "app.tasks.repair_positions",
+        "app.tasks.purge_deleted",
+        "app.tasks.maintain_partitions",
+        "app.tasks.reconcile_board_stats",
+    ],
 )
 
 # Configure Celery
@@ -25,3 +35,43 @@ celery_app.conf.update(
     worker_prefetch_multiplier=1,
     worker_max_tasks_per_child=1000,
 )
+
+# Beat schedule for periodic tasks (run by the celery-beat service)
+celery_app.conf.beat_schedule = {
+    "cleanup-expired-invitations": {
+        "task": "app.tasks.cleanup_invitations.cleanup_expired_invitations",
+        "schedule": 86400.0,  # Run daily (86400 seconds = 24 hours)
+        "options": {"expires": 3600},  # Task expires after 1 hour if not executed
+    },
+    "repair-card-positions": {
+        "task": "app.tasks.repair_positions.repair_card_positions",
+        "schedule": 300.0,  # Run every 5 minutes
+        "options": {"expires": 300},  # Skip a run the next one supersedes
+    },
+    "purge-deleted-resources": {
+        "task": "app.tasks.purge_deleted.purge_deleted_resources",
+        "schedule": 3600.0,  # Run hourly
+        "options": {"expires": 3600},
+    },
+    "reconcile-board-stats": {
+        "task": "app.tasks.reconcile_board_stats.reconcile_board_stats",
+        "schedule": 600.0,  # Run every 10 minutes
+        "options": {"expires": 600},  # Skip a run the next one supersedes
+    },
+    "maintain-history-partitions": {
+        "task": "app.tasks.maintain_partitions.maintain_history_partitions",
+        "schedule": 86400.0,  # Run daily; partitions are made months ahead
+        "options": {"expires": 3600},
+    },
+}
+
+
+@task_prerun.connect
+def reset_local_caches(**kwargs) -> None:
+    """
+    Start every task with an empty local cache tier.
+
+    Tasks run on short-lived event loops, so workers can't keep an
+    InvalidationBus listening; their cache reads go through Redis instead.
+    """
+    clear_local_caches()
@@ -0,0 +1,65 @@
+"""Celery task for inserting a staged bulk card import."""
+
+import asyncio
+from uuid import UUID
+
+import structlog
+from celery import Task
+
+from app.core.cache import task_redis
+from app.core.database import AsyncSessionLocal
+from app.services.card_import_service import CardImportService
+from app.tasks.celery_app import celery_app
+
+logger = structlog.get_logger(__name__)
+
+
+@celery_app.task(bind=True)
+def import_cards(self: Task, board_id: str, user_id: str, total_rows: int) -> dict[str, int]:
+    """
+    Insert the cards staged in Redis for this task's import.
+
+    The task ID doubles as the staging key, so the API enqueues it with
+    task_id set to the ID returned by CardImportService.stage_import.
+    Progress is published as a PROGRESS state with processed/total meta.
+
+    Args:
+        board_id: UUID of target board
+        user_id: UUID of importing user
+        total_rows: Number of staged rows
+
+    Returns:
+        dict with processed and total
+    """
+    # Create fresh event loop for Celery worker
+    loop = asyncio.new_event_loop()
+    asyncio.set_event_loop(loop)
+    try:
+        return loop.run_until_complete(_import_cards(self, board_id, user_id, total_rows))
+    finally:
+        loop.close()
+
+
+async def _import_cards(
+    task: Task, board_id: str, user_id: str, total_rows: int
+) -> dict[str, int]:
+    """
+    Internal async function to insert staged cards.
+
+    Returns:
+        dict with processed and total
+    """
+    task_id = task.request.id
+
+    def report_progress(processed: int) -> None:
+        task.update_state(state="PROGRESS", meta={"processed": processed, "total": total_rows})
+
+    # A client per run, for staging and cache invalidation alike: connection
+    # pools are bound to the event loop
+    async with task_redis() as redis, AsyncSessionLocal() as db:
+        imported = await CardImportService(db).import_staged(
+            UUID(board_id), UUID(user_id), task_id, redis, on_progress=report_progress
+        )
+
+    logger.info("card.import.task.complete", task_id=task_id, imported=imported)
+    return {"processed": imported, "total": total_rows}
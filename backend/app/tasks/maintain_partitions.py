@@ -0,0 +1,50 @@
+"""Celery periodic task for maintaining monthly history partitions."""
+
+import asyncio
+
+import structlog
+
+from app.core.database import AsyncSessionLocal
+from app.services.partition_service import PartitionService
+from app.tasks.celery_app import celery_app
+
+logger = structlog.get_logger(__name__)
+
+
+@celery_app.task
+def maintain_history_partitions() -> dict[str, int]:
+    """
+    Create upcoming monthly partitions and apply history retention.
+
+    This task runs daily via Celery Beat. Partitions for card_activities
+    and workspace_audit_logs are created PARTITION_PREMAKE_MONTHS ahead,
+    and months past every workspace's retention are detached and dropped.
+
+    Returns:
+        dict with partitions_created, partitions_dropped and rows_deleted
+    """
+    # Create fresh event loop for Celery worker
+    loop = asyncio.new_event_loop()
+    asyncio.set_event_loop(loop)
+    try:
+        return loop.run_until_complete(_maintain_history_partitions())
+    finally:
+        loop.close()
+
+
+async def _maintain_history_partitions() -> dict[str, int]:
+    """
+    Internal async function to create and retire partitions.
+
+    Returns:
+        dict with partitions_created, partitions_dropped and rows_deleted
+    """
+    logger.info("partition.maintenance.start")
+
+    async with AsyncSessionLocal() as db:
+        service = PartitionService(db)
+        created = await service.ensure_partitions()
+        stats = {"partitions_created": len(created), **await service.apply_retention()}
+
+    logger.info("partition.maintenance.complete", **stats)
+    return stats
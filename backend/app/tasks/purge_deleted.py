@@ -0,0 +1,141 @@
+"""Celery tasks for purging soft-deleted boards and workspaces."""
+
+import asyncio
+from uuid import UUID
+
+import structlog
+from celery import Task
+
+from app.core.cache import task_redis
+from app.core.database import AsyncSessionLocal
+from app.services.purge_service import PurgeService
+from app.tasks.celery_app import celery_app
+
+logger = structlog.get_logger(__name__)
+
+
+@celery_app.task(ignore_result=True)
+def purge_board(board_id: str) -> dict[str, int]:
+    """
+    Delete a soft-deleted board and its cards in bounded chunks.
+
+    Enqueued by the board DELETE endpoint right after the soft delete
+    commits.
+
+    Args:
+        board_id: UUID of board
+
+    Returns:
+        dict with cards_deleted
+    """
+    # Create fresh event loop for Celery worker
+    loop = asyncio.new_event_loop()
+    asyncio.set_event_loop(loop)
+    try:
+        return loop.run_until_complete(_purge_board(board_id))
+    finally:
+        loop.close()
+
+
+@celery_app.task(ignore_result=True)
+def purge_workspace(workspace_id: str) -> dict[str, int]:
+    """
+    Delete a soft-deleted workspace, its boards and cards in bounded chunks.
+
+    Enqueued by the workspace DELETE endpoint right after the soft delete
+    commits.
+
+    Args:
+        workspace_id: UUID of workspace
+
+    Returns:
+        dict with cards_deleted
+    """
+    # Create fresh event loop for Celery worker
+    loop = asyncio.new_event_loop()
+    asyncio.set_event_loop(loop)
+    try:
+        return loop.run_until_complete(_purge_workspace(workspace_id))
+    finally:
+        loop.close()
+
+
+@celery_app.task(ignore_result=True)
+def purge_deleted_resources() -> dict[str, int]:
+    """
+    Purge any soft-deleted boards and workspaces left behind.
+
+    This task runs hourly via Celery Beat as a safety net for purge tasks
+    that were lost or failed.
+
+    Returns:
+        dict with workspaces_purged and boards_purged
+    """
+    # Create fresh event loop for Celery worker
+    loop = asyncio.new_event_loop()
+    asyncio.set_event_loop(loop)
+    try:
+        return loop.run_until_complete(_purge_deleted_resources())
+    finally:
+        loop.close()
+
+
+def enqueue_purge(task: Task, resource_id: UUID) -> None:
+    """
+    Enqueue a purge task without blocking on an unavailable broker.
+
+    The soft delete has already committed, so a failed enqueue is only
+    logged: purge_deleted_resources picks the resource up on its next run.
+
+    Args:
+        task: purge_board or purge_workspace
+        resource_id: UUID of the soft-deleted board or workspace
+    """
+    try:
+        task.apply_async(args=[str(resource_id)], retry=False)
+    except Exception as e:
+        logger.warning(
+            "purge.enqueue.failed",
+            task=task.name,
+            resource_id=str(resource_id),
+            error=str(e),
+            error_type=type(e).__name__,
+        )
+
+
+async def _purge_board(board_id: str) -> dict[str, int]:
+    """
+    Internal async function to purge one board.
+
+    Returns:
+        dict with cards_deleted
+    """
+    async with task_redis(), AsyncSessionLocal() as db:
+        cards_deleted = await PurgeService(db).purge_board(UUID(board_id))
+    return {"cards_deleted": cards_deleted}
+
+
+async def _purge_workspace(workspace_id: str) -> dict[str, int]:
+    """
+    Internal async function to purge one workspace.
+
+    Returns:
+        dict with cards_deleted
+    """
+    async with task_redis(), AsyncSessionLocal() as db:
+        cards_deleted = await PurgeService(db).purge_workspace(UUID(workspace_id))
+    return {"cards_deleted": cards_deleted}
+
+
+async def _purge_deleted_resources() -> dict[str, int]:
+    """
+    Internal async function to purge everything still soft-deleted.
+
+    Returns:
+        dict with workspaces_purged and boards_purged
+    """
+    async with task_redis(), AsyncSessionLocal() as db:
+        result = await PurgeService(db).purge_pending()
+
+    logger.info("purge.sweep.complete", **result)
+    return result
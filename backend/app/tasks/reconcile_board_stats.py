@@ -0,0 +1,49 @@
+"""Celery periodic task for reconciling the maintained board stats."""
+
+import asyncio
+
+import structlog
+
+from app.core.database import AsyncSessionLocal
+from app.services.board_stats_service import BoardStatsService
+from app.tasks.celery_app import celery_app
+
+logger = structlog.get_logger(__name__)
+
+
+@celery_app.task
+def reconcile_board_stats() -> dict[str, int]:
+    """
+    Roll overdue counts forward and recount a batch of board stats.
+
+    This task runs every few minutes via Celery Beat, so every board's
+    overdue count moves to the new day shortly after midnight UTC and each
+    board (and its column counters) is recounted regularly in round-robin
+    order.
+
+    Returns:
+        dict with boards_rolled, boards_checked and boards_drifted
+    """
+    # Create fresh event loop for Celery worker
+    loop = asyncio.new_event_loop()
+    asyncio.set_event_loop(loop)
+    try:
+        return loop.run_until_complete(_reconcile_board_stats())
+    finally:
+        loop.close()
+
+
+async def _reconcile_board_stats() -> dict[str, int]:
+    """
+    Internal async function to reconcile board stats.
+
+    Returns:
+        dict with boards_rolled, boards_checked and boards_drifted
+    """
+    logger.info("board.stats_reconcile.start")
+
+    async with AsyncSessionLocal() as db:
+        stats = await BoardStatsService(db).reconcile()
+
+    logger.info("board.stats_reconcile.complete", **stats)
+    return stats
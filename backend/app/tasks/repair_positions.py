@@ -0,0 +1,50 @@
+"""Celery periodic task for repairing card positions in changed columns."""
+
+import asyncio
+
+import structlog
+
+from app.core.cache import task_redis
+from app.core.database import AsyncSessionLocal
+from app.services.position_repair_service import PositionRepairService
+from app.tasks.celery_app import celery_app
+
+logger = structlog.get_logger(__name__)
+
+
+@celery_app.task
+def repair_card_positions() -> dict[str, int]:
+    """
+    Renumber card positions in columns changed since the last run.
+
+    This task runs every few minutes via Celery Beat. It drains a batch of
+    the dirty-column list and closes any gaps or duplicate positions left
+    by failed or partial moves.
+
+    Returns:
+        dict with columns_checked, columns_repaired and cards_renumbered
+    """
+    # Create fresh event loop for Celery worker
+    loop = asyncio.new_event_loop()
+    asyncio.set_event_loop(loop)
+    try:
+        return loop.run_until_complete(_repair_card_positions())
+    finally:
+        loop.close()
+
+
+async def _repair_card_positions() -> dict[str, int]:
+    """
+    Internal async function to repair dirty columns.
+
+    Returns:
+        dict with columns_checked, columns_repaired and cards_renumbered
+    """
+    logger.info("card.position_repair.start")
+
+    # Repairs invalidate board card lists through this run's Redis client
+    async with task_redis(), AsyncSessionLocal() as db:
+        stats = await PositionRepairService(db).repair_dirty_columns()
+
+    logger.info("card.position_repair.complete", **stats)
+    return stats
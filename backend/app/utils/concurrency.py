@@ -0,0 +1,35 @@
+"""Optimistic concurrency helpers for versioned resources."""
+
+from fastapi import HTTPException, status
+
+
+def version_conflict(resource: str) -> HTTPException:
+    """
+    Build the 412 raised when a write's expected version is stale.
+
+    Args:
+        resource: Human-readable resource name ("Card", "Board")
+
+    Returns:
+        HTTPException with status 412
+    """
+    return HTTPException(
+        status_code=status.HTTP_412_PRECONDITION_FAILED,
+        detail=f"{resource} was modified by another request; reload and retry",
+    )
+
+
+def check_version(resource: str, current: int, expected: int | None) -> None:
+    """
+    Verify a client's expected version (from If-Match) is still current.
+
+    Args:
+        resource: Human-readable resource name
+        current: Version currently stored
+        expected: Version the client last saw, or None for unconditional writes
+
+    Raises:
+        HTTPException: 412 if expected is given and differs from current
+    """
+    if expected is not None and current != expected:
+        raise version_conflict(resource)
@@ -0,0 +1,169 @@
+"""Helpers for tables range-partitioned by month on created_at."""
+
+from datetime import UTC, date, datetime
+
+from app.core.config import settings
+
+# Parent tables whose partitions are created ahead and dropped on retention
+MONTHLY_PARTITIONED_TABLES = ("card_activities", "workspace_audit_logs")
+
+
+def month_start(value: date) -> date:
+    """
+    Return the first day of the month containing value.
+
+    Args:
+        value: Any date (or datetime)
+
+    Returns:
+        Date of the first day of that month
+    """
+    return date(value.year, value.month, 1)
+
+
+def add_months(month: date, count: int) -> date:
+    """
+    Shift the first day of a month by a number of months.
+
+    Args:
+        month: First day of a month
+        count: Months to move (may be negative)
+
+    Returns:
+        First day of the resulting month
+    """
+    index = month.year * 12 + month.month - 1 + count
+    return date(index // 12, index % 12 + 1, 1)
+
+
+def partition_name(table: str, month: date) -> str:
+    """
+    Name of the partition holding one month of a table, e.g. card_activities_p202610.
+
+    Args:
+        table: Partitioned parent table
+        month: First day of the month
+
+    Returns:
+        Partition table name
+    """
+    return f"{table}_p{month:%Y%m}"
+
+
+def partition_month(table: str, name: str) -> date | None:
+    """
+    Parse the month back out of a partition name.
+
+    Args:
+        table: Partitioned parent table
+        name: Partition table name
+
+    Returns:
+        First day of the month, or None if name doesn't follow partition_name
+    """
+    suffix = name.removeprefix(f"{table}_p")
+    if suffix == name or len(suffix) != 6 or not suffix.isdigit():
+        return None
+    return date(int(suffix[:4]), int(suffix[4:]), 1)
+
+
+def default_partition_name(table: str) -> str:
+    """
+    Name of the partition catching rows no monthly partition covers.
+
+    Args:
+        table: Partitioned parent table
+
+    Returns:
+        Partition table name, e.g. card_activities_default
+    """
+    return f"{table}_default"
+
+
+def partition_bounds(month: date) -> tuple[str, str]:
+    """
+    Range of created_at one month's partition holds, as SQL literals.
+
+    Bounds are midnight UTC, matching how created_at is compared.
+
+    Args:
+        month: First day of the month
+
+    Returns:
+        Inclusive lower and exclusive upper bound
+    """
+    return (
+        f"'{month.isoformat()} 00:00:00+00'",
+        f"'{add_months(month, 1).isoformat()} 00:00:00+00'",
+    )
+
+
+def create_partition_sql(table: str, month: date) -> str:
+    """
+    Build the DDL creating one month's partition if it doesn't exist.
+
+    The default partition must hold no rows of the month (see
+    PartitionService.ensure_partitions).
+
+    Args:
+        table: Partitioned parent table
+        month: First day of the month
+
+    Returns:
+        CREATE TABLE ... PARTITION OF statement
+    """
+    lower, upper = partition_bounds(month)
+    return (
+        f"CREATE TABLE IF NOT EXISTS {partition_name(table, month)} "
+        f"PARTITION OF {table} FOR VALUES FROM ({lower}) TO ({upper})"
+    )
+
+
+def create_default_partition_sql(table: str) -> str:
+    """
+    Build the DDL creating a table's default partition if it doesn't exist.
+
+    It keeps inserts working when maintenance falls behind and a month
+    has no partition yet.
+
+    Args:
+        table: Partitioned parent table
+
+    Returns:
+        CREATE TABLE ... PARTITION OF ... DEFAULT statement
+    """
+    return (
+        f"CREATE TABLE IF NOT EXISTS {default_partition_name(table)} "
+        f"PARTITION OF {table} DEFAULT"
+    )
+
+
+def upcoming_months(today: date | None = None) -> list[date]:
+    """
+    Months that must have a partition: the current one and PARTITION_PREMAKE_MONTHS ahead.
+
+    Args:
+        today: Reference date (defaults to the current UTC date)
+
+    Returns:
+        First days of the months, oldest first
+    """
+    current = month_start(today or datetime.now(UTC).date())
+    return [add_months(current, i) for i in range(settings.PARTITION_PREMAKE_MONTHS + 1)]
+
+
+def create_initial_partitions(target, connection, **kw) -> None:
+    """
+    after_create hook giving a freshly created parent table its partitions.
+
+    These are the upcoming months' and the default partition. Migrations
+    create partitions themselves; this covers metadata.create_all.
+
+    Args:
+        target: Table that was just created
+        connection: Connection the CREATE TABLE ran on
+        kw: Remaining DDL event arguments
+    """
+    for month in upcoming_months():
+        connection.exec_driver_sql(create_partition_sql(target.name, month))
+    connection.exec_driver_sql(create_default_partition_sql(target.name))
@@ -0,0 +1,151 @@
+"""Benchmark board card listing: ORM + Pydantic vs Postgres-built JSON.
+
+Seeds a throwaway board with N cards (each with assignees and labels) inside a
+transaction that is rolled back afterwards, then times both serialization
+paths used by GET /api/boards/{board_id}/cards.
+
+Usage:
+    DATABASE_URL=postgresql+asyncpg://... python -m scripts.benchmark_card_listing --cards 5000
+"""
+
+import argparse
+import asyncio
+import json
+import statistics
+import time
+import uuid
+
+from sqlalchemy import insert
+
+from app.core.database import AsyncSessionLocal
+from app.models.board import Board
+from app.models.card import Card, PriorityEnum
+from app.models.card_assignee import CardAssignee
+from app.models.card_label import CardLabel
+from app.models.user import User
+from app.models.workspace import Workspace
+from app.models.workspace_label import WorkspaceLabel
+from app.models.workspace_member import RoleEnum, WorkspaceMember
+from app.schemas.card import CardResponse
+from app.services.card_service import CardService
+
+
+async def _seed(session, card_count: int) -> tuple[uuid.UUID, uuid.UUID]:
+    """Create a user, workspace, board and cards; return (board_id, user_id)."""
+    suffix = uuid.uuid4().hex[:8]
+    github_base = 1_000_000_000 + int(suffix[:5], 16) * 10
+    users = [
+        User(
+            github_id=github_base + i,
+            username=f"bench-{suffix}-{i}",
+            email=f"bench-{suffix}-{i}@example.com",
+            github_access_token="bench",
+        )
+        for i in range(5)
+    ]
+    session.add_all(users)
+    await session.flush()
+
+    workspace = Workspace(name=f"Benchmark {suffix}", created_by=users[0].id)
+    session.add(workspace)
+    await session.flush()
+    session.add_all(
+        WorkspaceMember(user_id=u.id, workspace_id=workspace.id, role=RoleEnum.ADMIN)
+        for u in users
+    )
+
+    columns = [{"id": str(uuid.uuid4()), "name": f"Column {i}", "position": i} for i in range(4)]
+    board = Board(workspace_id=workspace.id, name="Benchmark", columns=columns)
+    session.add(board)
+    labels = [
+        WorkspaceLabel(workspace_id=workspace.id, name=f"label-{i}", color="#3366FF")
+        for i in range(8)
+    ]
+    session.add_all(labels)
+    await session.flush()
+
+    priorities = list(PriorityEnum)
+    card_rows = [
+        {
+            "id": uuid.uuid4(),
+            "board_id": board.id,
+            "column_id": uuid.UUID(columns[i % len(columns)]["id"]),
+            "title": f"Benchmark card {i}",
+            "description": "Lorem ipsum dolor sit amet " * 4,
+            "priority": priorities[i % len(priorities)],
+            "story_points": i % 13,
+            "position": i // len(columns),
+            "created_by": users[0].id,
+        }
+        for i in range(card_count)
+    ]
+    await session.execute(insert(Card), card_rows)
+    await session.execute(
+        insert(CardAssignee),
+        [
+            {"card_id": row["id"], "user_id": users[(i + k) % len(users)].id}
+            for i, row in enumerate(card_rows)
+            for k in range(2)
+        ],
+    )
+    await session.execute(
+        insert(CardLabel),
+        [
+            {"card_id": row["id"], "label_id": labels[(i + k) % len(labels)].id}
+            for i, row in enumerate(card_rows)
+            for k in range(2)
+        ],
+    )
+    await session.flush()
+    return board.id, users[0].id
+
+
+def _report(name: str, wall: list[float], cpu: list[float], size: int) -> None:
+    """Print median wall and app-process CPU time for a benchmark path."""
+    print(
+        f"{name:<18} wall p50 {statistics.median(wall) * 1000:8.1f} ms   "
+        f"app cpu p50 {statistics.median(cpu) * 1000:8.1f} ms   "
+        f"payload {size / 1024:8.1f} KiB"
+    )
+
+
+async def run(card_count: int, iterations: int) -> None:
+    """Seed data, time both listing paths, then roll everything back."""
+    async with AsyncSessionLocal() as session:
+        board_id, user_id = await _seed(session, card_count)
+        service = CardService(session)
+        print(f"Board with {card_count} cards, {iterations} iterations per path\n")
+
+        for name in ("orm+pydantic", "postgres json"):
+            wall: list[float] = []
+            cpu: list[float] = []
+            size = 0
+            for _ in range(iterations):
+                session.expunge_all()
+                wall_start, cpu_start = time.perf_counter(), time.process_time()
+                if name == "orm+pydantic":
+                    cards = await service.get_board_cards(board_id, user_id)
+                    body = json.dumps(
+                        [CardResponse.model_validate(c).model_dump(mode="json") for c in cards]
+                    )
+                else:
+                    body = await service.get_board_cards_json(board_id, user_id)
+                wall.append(time.perf_counter() - wall_start)
+                cpu.append(time.process_time() - cpu_start)
+                size = len(body)
+            _report(name, wall, cpu, size)
+
+        await session.rollback()
+
+
+def main() -> None:
+    """Main entry point for the benchmark script."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--cards", type=int, default=5000, help="Number of cards to seed")
+    parser.add_argument("--iterations", type=int, default=10, help="Runs per path")
+    args = parser.parse_args()
+    asyncio.run(run(args.cards, args.iterations))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,107 @@
+"""Benchmark listing response serialization through the ASGI stack.
+
+Mounts two routes returning the same list of CardResponse objects: one
+returns the models and lets FastAPI re-validate them against response_model
+and encode with the stdlib JSON encoder, the other returns
+app.api.responses.model_response (orjson, no second validation). Requests are
+driven in-process with httpx so only application time is measured.
+
+Usage:
+    python -m scripts.benchmark_response_serialization --items 500 --requests 200
+"""
+
+import argparse
+import asyncio
+import time
+import uuid
+from datetime import UTC, datetime
+
+import httpx
+from fastapi import FastAPI, Response
+
+from app.api.responses import model_response
+from app.schemas.card import CardResponse
+from app.schemas.label import LabelResponse
+from app.schemas.user import UserResponse
+
+
+def _build_cards(count: int) -> list[CardResponse]:
+    """Build realistic CardResponse objects with nested assignees and labels."""
+    now = datetime.now(UTC)
+    workspace_id = uuid.uuid4()
+    user = UserResponse(
+        id=uuid.uuid4(), username="alice", email="alice@example.com", github_id=1
+    )
+    label = LabelResponse(
+        id=uuid.uuid4(), workspace_id=workspace_id, name="bug", color="#FF0000", created_at=now
+    )
+    board_id, column_id = uuid.uuid4(), uuid.uuid4()
+    return [
+        CardResponse(
+            id=uuid.uuid4(),
+            board_id=board_id,
+            column_id=column_id,
+            title=f"Card {i}",
+            description="Lorem ipsum dolor sit amet " * 4,
+            priority="medium",
+            story_points=3,
+            position=i,
+            version=1,
+            created_by=user.id,
+            created_at=now,
+            updated_at=now,
+            assignees=[user, user],
+            labels=[label, label],
+        )
+        for i in range(count)
+    ]
+
+
+def _build_app(cards: list[CardResponse]) -> FastAPI:
+    """Build a throwaway app exposing both serialization paths."""
+    app = FastAPI()
+
+    @app.get("/validated", response_model=list[CardResponse])
+    async def validated() -> list[CardResponse]:
+        return cards
+
+    @app.get("/fast", response_model=list[CardResponse])
+    async def fast() -> Response:
+        return model_response(cards)
+
+    return app
+
+
+async def run(items: int, requests: int) -> None:
+    """Time both routes and print throughput."""
+    app = _build_app(_build_cards(items))
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        print(f"{items} cards per response, {requests} requests per route\n")
+        results = {}
+        for path in ("/validated", "/fast"):
+            await client.get(path)  # warm up
+            start = time.perf_counter()
+            for _ in range(requests):
+                response = await client.get(path)
+                response.raise_for_status()
+            elapsed = time.perf_counter() - start
+            results[path] = requests / elapsed
+            print(
+                f"{path:<11} {results[path]:8.1f} req/s   "
+                f"{elapsed / requests * 1000:7.2f} ms/req   {len(response.content) / 1024:7.1f} KiB"
+            )
+        print(f"\nspeedup: {results['/fast'] / results['/validated']:.2f}x")
+
+
+def main() -> None:
+    """Main entry point for the benchmark script."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--items", type=int, default=500, help="Cards per response")
+    parser.add_argument("--requests", type=int, default=200, help="Requests per route")
+    args = parser.parse_args()
+    asyncio.run(run(args.items, args.requests))
+
+
+if __name__ == "__main__":
+    main()
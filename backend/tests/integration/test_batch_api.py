@@ -0,0 +1,143 @@
+"""Integration tests for the batch API endpoint."""
+
+import uuid
+from collections.abc import AsyncGenerator
+from unittest.mock import patch
+
+import pytest
+from httpx import AsyncClient
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.database import get_db
+from app.main import app
+from app.models.board import Board
+from app.models.card import Card
+from app.models.user import User
+from app.models.workspace import Workspace
+from app.models.workspace_member import RoleEnum, WorkspaceMember
+from app.services.auth_service import AuthService
+
+
+@pytest.fixture
+async def batch_client(
+    client: AsyncClient, db_session: AsyncSession
+) -> AsyncGenerator[AsyncClient, None]:
+    """Client whose requests each get their own session, as in production.
+
+    Sub-requests run concurrently, so they can't share the test session.
+    """
+
+    async def session_per_request() -> AsyncGenerator[AsyncSession, None]:
+        async with AsyncSession(db_session.bind, expire_on_commit=False) as session:
+            yield session
+            await session.commit()
+
+    app.dependency_overrides[get_db] = session_per_request
+    yield client
+
+
+@pytest.fixture
+async def test_user(db_session: AsyncSession) -> User:
+    """Create a test user."""
+    user = User(github_id=222222, username="batcher", email="batcher@example.com")
+    db_session.add(user)
+    await db_session.commit()
+    return user
+
+
+@pytest.fixture
+async def test_token(test_user: User, db_session: AsyncSession) -> str:
+    """Generate JWT access token for test user."""
+    tokens = await AuthService(db_session).generate_jwt_tokens(test_user)
+    return tokens["access_token"]
+
+
+@pytest.fixture
+async def test_board(db_session: AsyncSession, test_user: User) -> Board:
+    """Board with one card in a workspace the user belongs to."""
+    workspace = Workspace(name="Batch Workspace", created_by=test_user.id)
+    db_session.add(workspace)
+    await db_session.flush()
+    db_session.add(
+        WorkspaceMember(user_id=test_user.id, workspace_id=workspace.id, role=RoleEnum.MEMBER)
+    )
+    column_id = str(uuid.uuid4())
+    board = Board(
+        workspace_id=workspace.id,
+        name="Batch Board",
+        columns=[{"id": column_id, "name": "To Do", "position": 0}],
+    )
+    db_session.add(board)
+    await db_session.flush()
+    db_session.add(
+        Card(board_id=board.id, column_id=uuid.UUID(column_id), title="Only card", position=0)
+    )
+    await db_session.commit()
+    return board
+
+
+@pytest.mark.asyncio
+async def test_batch_runs_sub_requests_with_one_authentication(
+    batch_client: AsyncClient, test_board: Board, test_token: str
+):
+    """Test sub-responses come back in order, each with its own status."""
+    verify = AuthService.verify_access_token
+    calls = []
+
+    async def counting_verify(self, token):
+        calls.append(token)
+        return await verify(self, token)
+
+    with patch.object(AuthService, "verify_access_token", counting_verify):
+        response = await batch_client.post(
+            "/api/batch",
+            json={
+                "requests": [
+                    {"id": "board", "path": f"/api/boards/{test_board.id}"},
+                    {"id": "cards", "path": f"/api/boards/{test_board.id}/cards"},
+                    {"id": "missing", "path": f"/api/cards/{uuid.uuid4()}"},
+                    {"id": "nested", "path": "/api/batch"},
+                ]
+            },
+            headers={"Authorization": f"Bearer {test_token}", "Accept-Encoding": "gzip"},
+        )
+
+    assert response.status_code == 200
+    results = response.json()["responses"]
+    assert [(r["id"], r["status"]) for r in results] == [
+        ("board", 200),
+        ("cards", 200),
+        ("missing", 404),
+        ("nested", 400),
+    ]
+    assert results[0]["body"]["name"] == "Batch Board"
+    assert results[0]["headers"]["etag"] == '"1"'
+    assert [card["title"] for card in results[1]["body"]] == ["Only card"]
+    assert results[2]["body"] == {"detail": "Card not found"}
+    # Only the batch itself verified the token
+    assert len(calls) == 1
+
+
+@pytest.mark.asyncio
+async def test_batch_rejects_writes_and_requires_auth(
+    batch_client: AsyncClient, test_board: Board, test_token: str
+):
+    """Test only GETs under /api/ can be batched, by authenticated users."""
+    headers = {"Authorization": f"Bearer {test_token}"}
+
+    response = await batch_client.post(
+        "/api/batch",
+        json={"requests": [{"method": "DELETE", "path": f"/api/boards/{test_board.id}"}]},
+        headers=headers,
+    )
+    assert response.status_code == 422
+
+    response = await batch_client.post(
+        "/api/batch", json={"requests": [{"path": "/auth/me"}]}, headers=headers
+    )
+    assert response.status_code == 422
+
+    response = await batch_client.post(
+        "/api/batch", json={"requests": [{"path": f"/api/boards/{test_board.id}"}]}
+    )
+    assert response.status_code == 401
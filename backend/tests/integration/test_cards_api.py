@@ -1,12 +1,14 @@
 """Integration tests for cards API endpoints."""
 
+import uuid
 from datetime import date
+
 import pytest
 from httpx import AsyncClient
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models.board import Board
-from app.models.card import PriorityEnum
+from app.models.card import Card, PriorityEnum
 from app.models.user import User
 from app.models.workspace import Workspace
 from app.models.workspace_member import RoleEnum, WorkspaceMember
@@ -69,9 +71,9 @@ async def test_board(
         workspace_id=test_workspace.id,
         name="Test Board",
         columns=[
-            {"id": "col-1", "name": "To Do", "position": 0},
-            {"id": "col-2", "name": "In Progress", "position": 1},
-            {"id": "col-3", "name": "Done", "position": 2},
+            {"id": str(uuid.uuid4()), "name": "To Do", "position": 0},
+            {"id": str(uuid.uuid4()), "name": "In Progress", "position": 1},
+            {"id": str(uuid.uuid4()), "name": "Done", "position": 2},
         ],
     )
     db_session.add(board)
@@ -397,3 +399,120 @@ async def test_unauthorized_access(
     response = await client.get(f"/api/boards/{test_board.id}/cards")
 
     assert response.status_code == 401
+
+
+@pytest.mark.asyncio
+async def test_get_cards_by_ids(
+    client: AsyncClient,
+    test_board: Board,
+    test_token: str,
+):
+    """Test the multi-get returns cards and per-id errors in request order."""
+    headers = {"Authorization": f"Bearer {test_token}"}
+    card_ids = []
+    for title in ("First", "Second"):
+        response = await client.post(
+            f"/api/boards/{test_board.id}/cards",
+            json={
+                "title": title,
+                "column_id": test_board.columns[0]["id"],
+                "board_id": str(test_board.id),
+            },
+            headers=headers,
+        )
+        card_ids.append(response.json()["id"])
+    missing = str(uuid.uuid4())
+
+    response = await client.get(
+        f"/api/cards?ids={card_ids[1]},{missing}&ids={card_ids[0]}", headers=headers
+    )
+
+    assert response.status_code == 200
+    results = response.json()["cards"]
+    assert [(r["id"], r["status"]) for r in results] == [
+        (card_ids[1], 200),
+        (missing, 404),
+        (card_ids[0], 200),
+    ]
+    assert results[0]["card"]["title"] == "Second"
+    assert results[1]["card"] is None
+
+    response = await client.get("/api/cards?ids=not-a-uuid", headers=headers)
+    assert response.status_code == 400
+
+
+@pytest.mark.asyncio
+async def test_bulk_label_and_assignee_errors_share_statuses(
+    client: AsyncClient,
+    db_session: AsyncSession,
+    test_board: Board,
+    test_user: User,
+    test_token: str,
+):
+    """Test both bulk relation endpoints answer the same errors the same way."""
+    headers = {"Authorization": f"Bearer {test_token}"}
+    response = await client.post(
+        f"/api/boards/{test_board.id}/cards",
+        json={
+            "title": "Card",
+            "column_id": test_board.columns[0]["id"],
+            "board_id": str(test_board.id),
+        },
+        headers=headers,
+    )
+    card_id = response.json()["id"]
+
+    other_workspace = Workspace(name="Other Workspace", created_by=test_user.id)
+    db_session.add(other_workspace)
+    await db_session.flush()
+    db_session.add(
+        WorkspaceMember(
+            user_id=test_user.id, workspace_id=other_workspace.id, role=RoleEnum.MEMBER
+        )
+    )
+    column_id = uuid.uuid4()
+    other_board = Board(
+        workspace_id=other_workspace.id,
+        name="Other Board",
+        columns=[{"id": str(column_id), "name": "To Do", "position": 0}],
+    )
+    db_session.add(other_board)
+    await db_session.flush()
+    other_card = Card(board_id=other_board.id, column_id=column_id, title="Elsewhere", position=0)
+    db_session.add(other_card)
+
+    # A workspace test_user doesn't belong to
+    foreign_workspace = Workspace(name="Foreign Workspace", created_by=test_user.id)
+    db_session.add(foreign_workspace)
+    await db_session.flush()
+    foreign_column_id = uuid.uuid4()
+    foreign_board = Board(
+        workspace_id=foreign_workspace.id,
+        name="Foreign Board",
+        columns=[{"id": str(foreign_column_id), "name": "To Do", "position": 0}],
+    )
+    db_session.add(foreign_board)
+    await db_session.flush()
+    foreign_card = Card(
+        board_id=foreign_board.id, column_id=foreign_column_id, title="Foreign", position=0
+    )
+    db_session.add(foreign_card)
+    await db_session.commit()
+
+    related_id = str(uuid.uuid4())
+    cases = [
+        ([str(uuid.uuid4())], [related_id], [], 404),
+        ([card_id, str(other_card.id)], [], [related_id], 400),
+        ([card_id], [related_id], [related_id], 422),
+        # Membership is checked before existence and workspace span
+        ([str(foreign_card.id), str(uuid.uuid4())], [related_id], [], 403),
+        ([card_id, str(foreign_card.id)], [], [related_id], 403),
+    ]
+    for path in ("/api/cards/bulk/labels", "/api/cards/bulk/assignees"):
+        for card_ids, add, remove, expected in cases:
+            response = await client.post(
+                path,
+                json={"card_ids": card_ids, "add": add, "remove": remove},
+                headers=headers,
+            )
+            assert response.status_code == expected, (path, card_ids, response.text)
@@ -10,6 +10,8 @@ Coverage:
 - Cascade delete (boards, memberships)
 """
 
+from unittest.mock import patch
+
 import pytest
 from httpx import AsyncClient
 from sqlalchemy import select
@@ -20,6 +22,7 @@ from app.models.user import User
 from app.models.workspace import Workspace
 from app.models.workspace_member import RoleEnum, WorkspaceMember
 from app.services.auth_service import AuthService
+from app.services.purge_service import PurgeService
 
 
 # ============================================================================
@@ -439,10 +442,9 @@ async def test_delete_workspace_cascades_to_boards_and_memberships(
     Given: Workspace with 2 boards and 3 members
     When: DELETE /api/workspaces/{id} by admin user
     Then:
-        - Returns 204 No Content
-        - Workspace deleted from database
-        - All boards deleted (cascade)
-        - All memberships deleted (cascade)
+        - Returns 204 No Content and enqueues the background purge
+        - Memberships are removed immediately
+        - Once purged: workspace and all boards deleted
 
     Validates: AC11 (cascade delete)
     """
@@ -460,12 +462,17 @@ async def test_delete_workspace_cascades_to_boards_and_memberships(
     assert len(members_before.scalars().all()) == 3
 
     # When: Admin deletes workspace
-    response = await client.delete(
-        f"/api/workspaces/{workspace_id}",
-        headers={"Authorization": f"Bearer {admin_token}"},
-    )
+    with patch("app.api.workspaces.purge_workspace") as mock_purge:
+        response = await client.delete(
+            f"/api/workspaces/{workspace_id}",
+            headers={"Authorization": f"Bearer {admin_token}"},
+        )
 
     assert response.status_code == 204
+    mock_purge.apply_async.assert_called_once_with(args=[str(workspace_id)], retry=False)
+
+    # And: The worker purges it
+    await PurgeService(db_session).purge_workspace(workspace_id)
 
     # Then: Workspace deleted
     workspace_result = await db_session.execute(
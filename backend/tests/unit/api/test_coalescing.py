@@ -0,0 +1,58 @@
+"""Unit tests for route-level request coalescing."""
+
+import asyncio
+import uuid
+
+import pytest
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse, Response
+from httpx import ASGITransport, AsyncClient
+
+from app.api.coalescing import coalesced_response
+from app.core.single_flight import SingleFlight
+
+
+def _build_app(flight: SingleFlight, release: asyncio.Event, calls: list[str]) -> FastAPI:
+    app = FastAPI()
+
+    @app.get("/boards/{board_id}/cards")
+    async def cards(request: Request, board_id: str, user: str) -> Response:
+        async def compute() -> Response:
+            calls.append(board_id)
+            await release.wait()
+            return JSONResponse({"board": board_id, "calls": len(calls)})
+
+        # The query's user stands in for the caller's authorization scope
+        return await coalesced_response(
+            request, flight, auth_scope=user, compute=compute, scopes=(f"board:{board_id}",)
+        )
+
+    return app
+
+
+@pytest.mark.asyncio
+async def test_identical_requests_share_one_response_within_auth_scope():
+    """Test requests share a response only when route, params and auth scope match."""
+    flight = SingleFlight(f"test-{uuid.uuid4().hex[:8]}")
+    release = asyncio.Event()
+    calls: list[str] = []
+    app = _build_app(flight, release, calls)
+
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+        urls = [
+            "/boards/1/cards?user=a",
+            "/boards/1/cards?user=a",
+            "/boards/1/cards?user=b",
+            "/boards/2/cards?user=a",
+        ]
+        requests = [asyncio.create_task(client.get(url)) for url in urls]
+        while flight.stats.leads + flight.stats.coalesced < len(urls):
+            await asyncio.sleep(0.01)
+        release.set()
+        responses = await asyncio.gather(*requests)
+
+    assert sorted(calls) == ["1", "1", "2"]
+    assert all(response.status_code == 200 for response in responses)
+    assert responses[0].content == responses[1].content
+    assert responses[0].headers["content-type"] == "application/json"
+    assert (flight.stats.leads, flight.stats.coalesced) == (3, 1)
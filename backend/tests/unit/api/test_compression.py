@@ -0,0 +1,165 @@
+"""Unit tests for response compression middleware."""
+
+import asyncio
+import gzip
+import json
+
+import brotli
+import pytest
+import zstandard
+from fastapi import FastAPI
+from fastapi.responses import JSONResponse, PlainTextResponse, Response, StreamingResponse
+from fastapi.testclient import TestClient
+
+from app.api.middleware import CompressionMiddleware
+
+PAYLOAD = [{"id": f"00000000-0000-0000-0000-{i:012d}", "priority": "medium"} for i in range(200)]
+
+
+def _build_app() -> FastAPI:
+    app = FastAPI()
+
+    @app.get("/large")
+    async def large() -> JSONResponse:
+        return JSONResponse(PAYLOAD, headers={"ETag": '"abc"'})
+
+    @app.get("/small")
+    async def small() -> JSONResponse:
+        return JSONResponse({"ok": True})
+
+    @app.get("/binary")
+    async def binary() -> Response:
+        return Response(b"\x89PNG" * 1000, media_type="image/png")
+
+    @app.get("/encoded")
+    async def encoded() -> Response:
+        return Response(
+            gzip.compress(b"x" * 5000),
+            media_type="text/plain",
+            headers={"Content-Encoding": "gzip"},
+        )
+
+    @app.get("/stream")
+    async def stream() -> StreamingResponse:
+        async def rows():
+            for item in PAYLOAD:
+                yield json.dumps(item) + "\n"
+
+        return StreamingResponse(rows(), media_type="application/x-ndjson")
+
+    @app.get("/no-transform")
+    async def no_transform() -> PlainTextResponse:
+        return PlainTextResponse("y" * 5000, headers={"Cache-Control": "no-transform"})
+
+    app.add_middleware(CompressionMiddleware, minimum_size=500)
+    return app
+
+
+client = TestClient(_build_app())
+
+
+def _get_raw(path: str, accept_encoding: str) -> tuple[dict, bytes]:
+    with client.stream("GET", path, headers={"Accept-Encoding": accept_encoding}) as response:
+        return dict(response.headers), b"".join(response.iter_raw())
+
+
+@pytest.mark.parametrize(
+    ("accept_encoding", "encoding", "decompress"),
+    [
+        ("gzip", "gzip", gzip.decompress),
+        ("gzip, br", "br", brotli.decompress),
+        ("gzip, br, zstd", "zstd", lambda data: zstandard.ZstdDecompressor().decompressobj().decompress(data)),
+        ("zstd;q=0, br;q=0.5, gzip", "gzip", gzip.decompress),
+        ("*", "zstd", lambda data: zstandard.ZstdDecompressor().decompressobj().decompress(data)),
+    ],
+)
+def test_negotiates_encoding(accept_encoding, encoding, decompress):
+    """Test Accept-Encoding negotiation and round-trip of the compressed body."""
+    headers, raw = _get_raw("/large", accept_encoding)
+
+    assert headers["content-encoding"] == encoding
+    assert "Accept-Encoding" in headers["vary"]
+    assert int(headers["content-length"]) == len(raw)
+    assert json.loads(decompress(raw)) == PAYLOAD
+    assert len(raw) < len(json.dumps(PAYLOAD)) / 3
+
+
+def test_weakens_strong_etag_when_compressing():
+    """Test strong ETags are weakened since the encoded bytes differ."""
+    headers, _ = _get_raw("/large", "gzip")
+    assert headers["etag"] == 'W/"abc"'
+
+
+@pytest.mark.parametrize(
+    ("path", "accept_encoding", "varies"),
+    [
+        ("/large", "identity", True),
+        ("/large", "gzip;q=0", True),
+        ("/large", "", True),
+        ("/small", "gzip", True),
+        ("/binary", "gzip", False),
+        ("/no-transform", "gzip", False),
+    ],
+)
+def test_skips_compression(path, accept_encoding, varies):
+    """Test responses that should not be compressed pass through unchanged.
+
+    Those that would be compressed for another Accept-Encoding still say so
+    in Vary, so shared caches don't serve them to clients asking otherwise.
+    """
+    headers, _ = _get_raw(path, accept_encoding)
+    assert "content-encoding" not in headers
+    assert ("Accept-Encoding" in headers.get("vary", "")) is varies
+
+
+def test_does_not_double_encode():
+    """Test responses that already carry Content-Encoding are left alone."""
+    headers, raw = _get_raw("/encoded", "br")
+    assert headers["content-encoding"] == "gzip"
+    assert gzip.decompress(raw) == b"x" * 5000
+
+
+def test_streaming_response_is_compressed_per_chunk():
+    """Test streaming bodies are compressed incrementally, not buffered."""
+    app = _build_app()
+    messages = []
+    requests = [{"type": "http.request", "body": b"", "more_body": False}]
+
+    async def receive():
+        if requests:
+            return requests.pop()
+        # Block like a connected client until the response completes
+        await asyncio.Event().wait()
+
+    async def send(message):
+        messages.append(message)
+
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "GET",
+        "scheme": "http",
+        "path": "/stream",
+        "raw_path": b"/stream",
+        "query_string": b"",
+        "root_path": "",
+        "headers": [(b"accept-encoding", b"gzip")],
+        "client": ("testclient", 123),
+        "server": ("testserver", 80),
+    }
+
+    asyncio.run(app(scope, receive, send))
+
+    start = messages[0]
+    headers = {k.decode(): v.decode() for k, v in start["headers"]}
+    bodies = [m for m in messages if m["type"] == "http.response.body"]
+
+    assert headers["content-encoding"] == "gzip"
+    assert "content-length" not in headers
+    # One compressed chunk per yielded row, plus the closing message
+    assert len(bodies) >= len(PAYLOAD)
+    assert all(m["body"] for m in bodies[:-1])
+    raw = b"".join(m["body"] for m in bodies)
+    rows = [json.loads(line) for line in gzip.decompress(raw).splitlines()]
+    assert rows == PAYLOAD
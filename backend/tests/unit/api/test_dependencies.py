@@ -0,0 +1,32 @@
+"""Unit tests for API dependencies."""
+
+import pytest
+from fastapi import HTTPException
+
+from app.api.dependencies import get_if_match_version
+from app.api.responses import version_etag
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    ("header", "expected"),
+    [
+        (None, None),
+        ("*", None),
+        ('"3"', 3),
+        ('W/"12"', 12),
+        (version_etag(7), 7),
+    ],
+)
+async def test_if_match_version_parses_version_etags(header, expected):
+    """Test If-Match values map to the version they require."""
+    assert await get_if_match_version(header) == expected
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("header", ['"abc"', "3", '"1", "2"', '""'])
+async def test_if_match_version_rejects_foreign_etags(header):
+    """Test ETags this API never issued can never match."""
+    with pytest.raises(HTTPException) as exc_info:
+        await get_if_match_version(header)
+    assert exc_info.value.status_code == 412
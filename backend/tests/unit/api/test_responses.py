@@ -0,0 +1,101 @@
+"""Unit tests for orjson response helpers."""
+
+import json
+import uuid
+from datetime import UTC, datetime
+
+from fastapi import FastAPI, Response
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import ORJSONResponse
+from fastapi.testclient import TestClient
+
+from app.api.responses import embed_json, model_response
+from app.main import app
+from app.models.workspace_member import RoleEnum
+from app.schemas.label import LabelResponse
+
+
+def _label() -> LabelResponse:
+    return LabelResponse(
+        id=uuid.uuid4(),
+        workspace_id=uuid.uuid4(),
+        name="bug",
+        color="#FF0000",
+        created_at=datetime(2026, 1, 15, 12, 30, tzinfo=UTC),
+    )
+
+
+def test_model_response_matches_pydantic_json():
+    """Test orjson output matches what FastAPI's default encoding produced."""
+    labels = [_label(), _label()]
+
+    response = model_response(labels)
+
+    assert isinstance(response, ORJSONResponse)
+    assert response.status_code == 200
+    assert json.loads(response.body) == jsonable_encoder(labels)
+
+
+def test_model_response_single_model_and_enum():
+    """Test single models are serialized as objects and enums by value."""
+    from app.api.members import MemberResponse
+
+    member = MemberResponse(
+        user_id=uuid.uuid4(),
+        username="alice",
+        email="alice@example.com",
+        avatar_url=None,
+        role=RoleEnum.ADMIN,
+        joined_at=datetime(2026, 1, 15, tzinfo=UTC),
+    )
+
+    response = model_response(member, status_code=201)
+
+    assert response.status_code == 201
+    assert json.loads(response.body) == jsonable_encoder(member)
+    assert json.loads(response.body)["role"] == "admin"
+
+
+def test_model_response_encodes_uuid_subclasses():
+    """Test UUIDs as asyncpg returns them (a uuid.UUID subclass) encode as strings."""
+    from asyncpg.pgproto.pgproto import UUID as PgUUID
+
+    label = _label()
+    label.id = PgUUID(str(label.id))
+
+    response = model_response([label])
+
+    assert json.loads(response.body)[0]["id"] == str(label.id)
+
+
+def test_model_response_skips_response_model_validation():
+    """Test route returning model_response bypasses response_model filtering."""
+    test_app = FastAPI()
+    label = _label()
+
+    @test_app.get("/labels", response_model=list[LabelResponse])
+    async def list_labels() -> Response:
+        return model_response([label])
+
+    response = TestClient(test_app).get("/labels")
+
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/json"
+    assert response.json() == jsonable_encoder([label])
+
+
+def test_app_default_response_class_is_orjson():
+    """Test the application encodes responses with orjson by default."""
+    assert app.router.default_response_class is ORJSONResponse
+
+
+def test_embed_json_appends_encoded_fields():
+    """Test pre-encoded values are spliced into an encoded object unchanged."""
+    label = _label()
+    labels = model_response([label]).body
+    board = model_response(label).body
+
+    embedded = json.loads(embed_json(board, labels=labels, empty=b"[]"))
+
+    assert embedded == {**json.loads(board), "labels": json.loads(labels), "empty": []}
+    assert json.loads(embed_json(b"{}", labels=labels)) == {"labels": json.loads(labels)}
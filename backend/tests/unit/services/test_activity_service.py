@@ -0,0 +1,157 @@
+"""Unit tests for ActivityService."""
+
+import uuid
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from fastapi import HTTPException
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.board import Board
+from app.models.user import User
+from app.models.workspace import Workspace
+from app.models.workspace_member import RoleEnum, WorkspaceMember
+from app.services.activity_service import ActivityService
+from app.services.board_service import BoardService
+from app.services.card_service import CardService
+
+
+@pytest.fixture
+async def test_user(db_session: AsyncSession) -> User:
+    """Workspace member making the changes."""
+    user = User(github_id=12345, username="testuser", email="test@example.com")
+    db_session.add(user)
+    await db_session.flush()
+    return user
+
+
+@pytest.fixture
+async def test_workspace(db_session: AsyncSession, test_user: User) -> Workspace:
+    """Workspace the user administers."""
+    workspace = Workspace(name="Test Workspace", created_by=test_user.id)
+    db_session.add(workspace)
+    await db_session.flush()
+    db_session.add(
+        WorkspaceMember(user_id=test_user.id, workspace_id=workspace.id, role=RoleEnum.ADMIN)
+    )
+    await db_session.flush()
+    return workspace
+
+
+async def _add_board(db_session: AsyncSession, workspace: Workspace) -> Board:
+    board = Board(
+        workspace_id=workspace.id,
+        name="Board",
+        columns=[{"id": str(uuid.uuid4()), "name": "To Do", "position": 0}],
+    )
+    db_session.add(board)
+    await db_session.flush()
+    return board
+
+
+@pytest.fixture(autouse=True)
+def mock_broadcast():
+    """Silence card websocket broadcasts."""
+    with patch(
+        "app.services.card_service.manager.broadcast_to_board", new_callable=AsyncMock
+    ) as mock:
+        yield mock
+
+
+@pytest.mark.asyncio
+async def test_card_writes_record_activity_in_the_same_statement(
+    db_session: AsyncSession, test_workspace: Workspace, test_user: User
+):
+    """Test create, update and delete each log an activity without a separate INSERT."""
+    board = await _add_board(db_session, test_workspace)
+    service = CardService(db_session)
+    card = await service.create_card(board.id, board.columns[0]["id"], "Card", test_user.id)
+    card_id = card.id
+
+    statements = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    engine = db_session.bind.sync_engine
+    event.listen(engine, "before_cursor_execute", record)
+    try:
+        await service.update_card(card_id, test_user.id, {"title": "Renamed", "story_points": 3})
+        await service.delete_card(card_id, test_user.id)
+    finally:
+        event.remove(engine, "before_cursor_execute", record)
+
+    assert not [s for s in statements if s.startswith("INSERT INTO card_activities")]
+
+    page = await ActivityService(db_session).get_workspace_activity(
+        test_workspace.id, test_user.id, limit=10
+    )
+    assert {a.action for a in page.activities} == {"created", "updated", "deleted"}
+    by_action = {a.action: a for a in page.activities}
+    assert by_action["updated"].activity_metadata == {
+        "changes": {"title": "Renamed", "story_points": 3}
+    }
+    # The card is gone; its history stays in the workspace stream
+    assert all(a.card_id is None for a in page.activities)
+    assert by_action["deleted"].activity_metadata == {"card_id": str(card_id), "title": "Renamed"}
+    assert {a.board_id for a in page.activities} == {board.id}
+
+
+@pytest.mark.asyncio
+async def test_card_activity_pages_newest_first(
+    db_session: AsyncSession, test_workspace: Workspace, test_user: User
+):
+    """Test keyset pages cover every entry once, even with tied timestamps."""
+    board = await _add_board(db_session, test_workspace)
+    service = CardService(db_session)
+    card = await service.create_card(board.id, board.columns[0]["id"], "Card", test_user.id)
+    for points in range(4):
+        await service.update_card(card.id, test_user.id, {"story_points": points})
+
+    activity = ActivityService(db_session)
+    seen, cursor = [], None
+    while True:
+        page = await activity.get_card_activity(card.id, test_user.id, limit=2, cursor=cursor)
+        seen.extend(page.activities)
+        cursor = page.next_cursor
+        if cursor is None:
+            break
+
+    assert len(seen) == 5
+    assert len({a.id for a in seen}) == 5
+    keys = [(a.created_at, a.id) for a in seen]
+    assert keys == sorted(keys, reverse=True)
+    assert seen[-1].action == "created"
+
+    with pytest.raises(HTTPException) as exc_info:
+        await activity.get_card_activity(card.id, test_user.id, limit=2, cursor="bogus")
+    assert exc_info.value.status_code == 400
+
+
+@pytest.mark.asyncio
+async def test_workspace_activity_hides_deleted_boards_and_checks_membership(
+    db_session: AsyncSession, test_workspace: Workspace, test_user: User
+):
+    """Test the workspace stream skips soft-deleted boards and rejects non-members."""
+    kept = await _add_board(db_session, test_workspace)
+    dropped = await _add_board(db_session, test_workspace)
+    service = CardService(db_session)
+    await service.create_card(kept.id, kept.columns[0]["id"], "Kept", test_user.id)
+    await service.create_card(dropped.id, dropped.columns[0]["id"], "Dropped", test_user.id)
+    await BoardService(db_session).delete_board(dropped.id, test_user.id)
+
+    page = await ActivityService(db_session).get_workspace_activity(
+        test_workspace.id, test_user.id, limit=10
+    )
+    assert [a.activity_metadata["title"] for a in page.activities] == ["Kept"]
+    assert page.next_cursor is None
+
+    outsider = User(github_id=67890, username="outsider", email="outsider@example.com")
+    db_session.add(outsider)
+    await db_session.flush()
+    with pytest.raises(HTTPException) as exc_info:
+        await ActivityService(db_session).get_workspace_activity(
+            test_workspace.id, outsider.id, limit=10
+        )
+    assert exc_info.value.status_code == 403
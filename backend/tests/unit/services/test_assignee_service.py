@@ -1,7 +1,10 @@
 """Unit tests for AssigneeService."""
 
 import uuid
+from unittest.mock import AsyncMock, patch
+
 import pytest
+from sqlalchemy import event
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models.board import Board
@@ -324,3 +327,108 @@ async def test_is_user_assigned(
         user_id=assignee_user.id,
     )
     assert is_assigned is True
+
+
+@pytest.mark.asyncio
+async def test_assign_user_to_card_is_single_statement(
+    assignee_service: AssigneeService,
+    test_card: Card,
+    test_user: User,
+    assignee_user: User,
+    db_session: AsyncSession,
+):
+    """Test assigning a user costs one round-trip, including duplicates."""
+    statements = []
+
+    def count(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    engine = db_session.bind.sync_engine
+    event.listen(engine, "before_cursor_execute", count)
+    try:
+        result = await assignee_service.assign_user_to_card(
+            card_id=test_card.id,
+            user_id=assignee_user.id,
+            current_user_id=test_user.id,
+        )
+        assert result.email == assignee_user.email
+        assert len(statements) == 1
+        assert "ON CONFLICT" in statements[0]
+
+        with pytest.raises(ValueError, match="already assigned"):
+            await assignee_service.assign_user_to_card(
+                card_id=test_card.id,
+                user_id=assignee_user.id,
+                current_user_id=test_user.id,
+            )
+        assert len(statements) == 2
+    finally:
+        event.remove(engine, "before_cursor_execute", count)
+
+
+@pytest.mark.asyncio
+async def test_assign_user_to_missing_card_raises_error(
+    assignee_service: AssigneeService,
+    test_user: User,
+    assignee_user: User,
+):
+    """Test assigning to a nonexistent card raises ValueError."""
+    with pytest.raises(ValueError, match="Card not found"):
+        await assignee_service.assign_user_to_card(
+            card_id=uuid.uuid4(),
+            user_id=assignee_user.id,
+            current_user_id=test_user.id,
+        )
+
+
+@pytest.mark.asyncio
+async def test_bulk_update_card_assignees(
+    assignee_service: AssigneeService,
+    test_board: Board,
+    test_card: Card,
+    test_user: User,
+    assignee_user: User,
+    db_session: AsyncSession,
+):
+    """Test assigning and unassigning users across cards in bulk."""
+    second_card = Card(
+        board_id=test_board.id,
+        column_id=test_card.column_id,
+        title="Second Card",
+        position=1,
+    )
+    db_session.add(second_card)
+    await db_session.flush()
+    await assignee_service.assign_user_to_card(test_card.id, test_user.id, test_user.id)
+
+    card_ids = [test_card.id, second_card.id]
+    with patch(
+        "app.services.assignee_service.manager.broadcast_to_board", new_callable=AsyncMock
+    ) as broadcast:
+        result = await assignee_service.bulk_update_card_assignees(
+            card_ids, add=[assignee_user.id], remove=[test_user.id], current_user_id=test_user.id
+        )
+
+    assert (result.card_count, result.added, result.removed) == (2, 2, 1)
+    broadcast.assert_awaited_once()
+    assert broadcast.await_args.kwargs["message"]["event_type"] == "card_assignees_bulk_updated"
+
+    from app.repositories.assignee_repository import AssigneeRepository
+
+    repo = AssigneeRepository(db_session)
+    for card_id in card_ids:
+        assert [u.id for u in await repo.get_card_assignees(card_id)] == [assignee_user.id]
+
+
+@pytest.mark.asyncio
+async def test_bulk_update_card_assignees_rejects_non_member_assignee(
+    assignee_service: AssigneeService,
+    test_card: Card,
+    test_user: User,
+    other_user: User,
+):
+    """Test bulk assignment rejects users outside the workspace."""
+    with pytest.raises(ValueError, match="not a member"):
+        await assignee_service.bulk_update_card_assignees(
+            [test_card.id], add=[other_user.id], remove=[], current_user_id=test_user.id
+        )
@@ -1,14 +1,19 @@
 """Unit tests for BoardService."""
 
+import uuid
+
 import pytest
 from fastapi import HTTPException
+from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models.board import Board
+from app.models.board_column import BoardColumn
+from app.models.card import Card
 from app.models.user import User
 from app.models.workspace import Workspace
 from app.models.workspace_member import RoleEnum, WorkspaceMember
-from app.services.board_service import BoardService, BOARD_TEMPLATES
+from app.services.board_service import BoardService, template_columns
 
 
 @pytest.fixture
@@ -73,7 +78,7 @@ async def test_board(
     board = Board(
         workspace_id=test_workspace.id,
         name="Test Board",
-        columns=BOARD_TEMPLATES["kanban"].copy(),
+        columns=template_columns("kanban"),
     )
     db_session.add(board)
     await db_session.flush()
@@ -278,8 +283,8 @@ async def test_update_board_columns(
 ):
     """Test updating board columns."""
     new_columns = [
-        {"id": "col1", "name": "Backlog", "position": 0},
-        {"id": "col2", "name": "Active", "position": 1},
+        {"id": str(uuid.uuid4()), "name": "Backlog", "position": 0},
+        {"id": str(uuid.uuid4()), "name": "Active", "position": 1},
     ]
 
     updated = await board_service.update_board(
@@ -351,18 +356,22 @@ async def test_delete_board(
     test_admin: User,
     db_session: AsyncSession,
 ):
-    """Test deleting board."""
+    """Test deleting board soft-deletes it and hides it at once."""
     await board_service.delete_board(
         board_id=test_board.id,
         user_id=test_admin.id,
     )
 
-    # Verify board deleted
+    # Verify board marked deleted; the row is purged later in the background
     from sqlalchemy import select
 
-    result = await db_session.execute(select(Board).where(Board.id == test_board.id))
-    deleted_board = result.scalar_one_or_none()
-    assert deleted_board is None
+    result = await db_session.execute(select(Board.deleted_at).where(Board.id == test_board.id))
+    assert result.scalar_one() is not None
+
+    with pytest.raises(HTTPException) as exc_info:
+        await board_service.get_board_by_id(test_board.id, test_admin.id)
+    assert exc_info.value.status_code == 404
+    assert await board_service.get_workspace_boards(test_board.workspace_id, test_admin.id) == []
 
 
 @pytest.mark.asyncio
@@ -390,3 +399,81 @@ async def test_delete_board_requires_admin(
         )
 
     assert exc_info.value.status_code == 403
+
+
+@pytest.mark.asyncio
+async def test_update_board_honours_expected_version(
+    board_service: BoardService,
+    test_board: Board,
+    test_admin: User,
+):
+    """Test board updates bump the version and a stale If-Match fails with 412."""
+    assert test_board.version == 1
+
+    updated = await board_service.update_board(
+        board_id=test_board.id, user_id=test_admin.id, name="Renamed", expected_version=1
+    )
+    assert updated.version == 2
+
+    with pytest.raises(HTTPException) as exc_info:
+        await board_service.update_board(
+            board_id=test_board.id, user_id=test_admin.id, name="Stale", expected_version=1
+        )
+    assert exc_info.value.status_code == 412
+
+    with pytest.raises(HTTPException) as exc_info:
+        await board_service.delete_board(
+            board_id=test_board.id, user_id=test_admin.id, expected_version=1
+        )
+    assert exc_info.value.status_code == 412
+
+
+@pytest.mark.asyncio
+async def test_board_columns_mirror_layout_and_keep_cards_attached(
+    board_service: BoardService,
+    test_board: Board,
+    test_admin: User,
+    db_session: AsyncSession,
+):
+    """Test column updates sync board_columns and can't orphan cards."""
+    todo, doing = test_board.columns[0], test_board.columns[1]
+    db_session.add(
+        Card(board_id=test_board.id, column_id=uuid.UUID(todo["id"]), title="Card", position=0)
+    )
+    await db_session.flush()
+
+    # Given: A layout that drops the column holding the card
+    with pytest.raises(HTTPException) as exc_info:
+        await board_service.update_board(
+            board_id=test_board.id, user_id=test_admin.id, columns=[dict(doing)]
+        )
+    assert exc_info.value.status_code == 409
+    assert "To Do" in exc_info.value.detail
+
+    # Then: Renames, WIP limits and removals of empty columns go through
+    await board_service.update_board(
+        board_id=test_board.id,
+        user_id=test_admin.id,
+        columns=[{**todo, "name": "Backlog", "wip_limit": 5}, dict(doing)],
+    )
+    result = await db_session.execute(
+        select(BoardColumn.name, BoardColumn.position, BoardColumn.wip_limit)
+        .where(BoardColumn.board_id == test_board.id)
+        .order_by(BoardColumn.position)
+    )
+    assert result.all() == [("Backlog", 0, 5), ("In Progress", 1, None)]
+
+    with pytest.raises(HTTPException) as exc_info:
+        await board_service.update_board(
+            board_id=test_board.id,
+            user_id=test_admin.id,
+            columns=[{"id": "not-a-uuid", "name": "Bad"}],
+        )
+    assert exc_info.value.status_code == 400
+
+
+def test_template_columns_get_fresh_ids():
+    """Test each board built from a template gets its own column ids."""
+    first, second = template_columns("kanban"), template_columns("kanban")
+    assert [col["name"] for col in first] == ["To Do", "In Progress", "In Review", "Done"]
+    assert not {col["id"] for col in first} & {col["id"] for col in second}
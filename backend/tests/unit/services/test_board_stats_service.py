@@ -0,0 +1,161 @@
+"""Unit tests for the maintained board stats and BoardStatsService."""
+
+import uuid
+from datetime import date, timedelta
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from sqlalchemy import update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.board import Board
+from app.models.board_column import BoardColumn
+from app.models.board_stats import BoardStats
+from app.models.card import Card
+from app.models.user import User
+from app.models.workspace import Workspace
+from app.models.workspace_member import RoleEnum, WorkspaceMember
+from app.repositories.board_column_repository import BoardColumnRepository
+from app.schemas.card import BulkCardEditRequest
+from app.services.board_service import BoardService
+from app.services.board_stats_service import BoardStatsService
+from app.services.card_service import CardService
+
+
+@pytest.fixture
+async def test_user(db_session: AsyncSession) -> User:
+    """Test user owning the cards."""
+    user = User(github_id=12345, username="testuser", email="test@example.com")
+    db_session.add(user)
+    await db_session.flush()
+    return user
+
+
+@pytest.fixture
+async def test_board(db_session: AsyncSession, test_user: User) -> Board:
+    """Board with two columns in a workspace the user belongs to."""
+    workspace = Workspace(name="Test Workspace", created_by=test_user.id)
+    db_session.add(workspace)
+    await db_session.flush()
+    db_session.add(
+        WorkspaceMember(user_id=test_user.id, workspace_id=workspace.id, role=RoleEnum.MEMBER)
+    )
+    board = Board(
+        workspace_id=workspace.id,
+        name="Test Board",
+        columns=[
+            {"id": str(uuid.uuid4()), "name": "To Do", "position": 0},
+            {"id": str(uuid.uuid4()), "name": "Done", "position": 1},
+        ],
+    )
+    db_session.add(board)
+    await db_session.flush()
+    return board
+
+
+def _column(board: Board, index: int) -> uuid.UUID:
+    return uuid.UUID(board.columns[index]["id"])
+
+
+async def _totals(db_session: AsyncSession, board: Board, user: User) -> tuple[int, int, int]:
+    stats = await BoardService(db_session).get_board_stats(board.id, user.id)
+    return stats["card_count"], stats["story_points"], stats["overdue_count"]
+
+
+@pytest.mark.asyncio
+async def test_card_writes_keep_board_stats_current(
+    db_session: AsyncSession, test_board: Board, test_user: User
+):
+    """Test create, edit, bulk edit and delete each move the board totals."""
+    card_service = CardService(db_session)
+    yesterday = date.today() - timedelta(days=1)
+    assert await _totals(db_session, test_board, test_user) == (0, 0, 0)
+
+    with patch("app.services.card_service.manager.broadcast_to_board", new_callable=AsyncMock):
+        first = await card_service.create_card(
+            test_board.id, _column(test_board, 0), "First", test_user.id
+        )
+        second = await card_service.create_card(
+            test_board.id, _column(test_board, 1), "Second", test_user.id
+        )
+        assert await _totals(db_session, test_board, test_user) == (2, 0, 0)
+
+        await card_service.update_card(
+            first.id, test_user.id, {"story_points": 5, "due_date": yesterday}
+        )
+        await card_service.update_card(second.id, test_user.id, {"story_points": 3})
+        assert await _totals(db_session, test_board, test_user) == (2, 8, 1)
+
+        # Replacing a value takes the old one back out; other fields don't count
+        await card_service.update_card(first.id, test_user.id, {"story_points": 2})
+        await card_service.update_card(first.id, test_user.id, {"title": "Renamed"})
+        assert await _totals(db_session, test_board, test_user) == (2, 5, 1)
+
+        await card_service.bulk_update_cards(
+            BulkCardEditRequest(
+                card_ids=[first.id, second.id], story_points_delta=1, due_date_offset_days=7
+            ),
+            test_user.id,
+        )
+        # Only the first card had a due date; a week later it is no longer overdue
+        assert await _totals(db_session, test_board, test_user) == (2, 7, 0)
+
+        await card_service.delete_card(first.id, test_user.id)
+        assert await _totals(db_session, test_board, test_user) == (1, 4, 0)
+
+    stats = await BoardService(db_session).get_board_stats(test_board.id, test_user.id)
+    assert stats["column_card_counts"] == {_column(test_board, 0): 0, _column(test_board, 1): 1}
+
+
+@pytest.mark.asyncio
+async def test_reconcile_rolls_overdue_forward_and_fixes_drift(
+    db_session: AsyncSession, test_board: Board, test_user: User
+):
+    """Test the reconcile job recounts overdue cards for a new day and drifted totals."""
+    today = date.today()
+    db_session.add_all(
+        [
+            # Written directly, bypassing the stats deltas
+            Card(
+                board_id=test_board.id,
+                column_id=_column(test_board, 0),
+                title=f"Card {i}",
+                position=i,
+                story_points=2,
+                due_date=today - timedelta(days=i),
+            )
+            for i in range(3)
+        ]
+    )
+    await db_session.execute(
+        update(BoardStats)
+        .where(BoardStats.board_id == test_board.id)
+        .values(overdue_as_of=today - timedelta(days=3))
+    )
+    await db_session.commit()
+
+    result = await BoardStatsService(db_session).reconcile(today=today)
+
+    assert result == {"boards_rolled": 1, "boards_checked": 1, "boards_drifted": 1}
+    assert await _totals(db_session, test_board, test_user) == (3, 6, 2)
+    stats = await BoardService(db_session).get_board_stats(test_board.id, test_user.id)
+    assert stats["overdue_as_of"] == today
+
+    column_counts = BoardColumnRepository(db_session)
+    counts = await column_counts.get_card_counts([test_board.id])
+    assert counts[test_board.id] == {_column(test_board, 0): 3, _column(test_board, 1): 0}
+
+    # A second run finds nothing to roll or correct
+    result = await BoardStatsService(db_session).reconcile(today=today)
+    assert result == {"boards_rolled": 0, "boards_checked": 1, "boards_drifted": 0}
+
+    # Column counters drifting on their own are corrected too
+    await db_session.execute(
+        update(BoardColumn)
+        .where(BoardColumn.board_id == test_board.id)
+        .values(card_count=BoardColumn.card_count + 1)
+    )
+    await db_session.commit()
+    result = await BoardStatsService(db_session).reconcile(today=today)
+    assert result == {"boards_rolled": 0, "boards_checked": 1, "boards_drifted": 1}
+    assert await column_counts.get_card_counts([test_board.id]) == counts
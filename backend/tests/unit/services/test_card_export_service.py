@@ -0,0 +1,216 @@
+"""Unit tests for CardExportService."""
+
+import csv
+import io
+import json
+import uuid
+from datetime import date, timedelta
+from unittest.mock import patch
+
+import pytest
+from fastapi import HTTPException
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.board import Board
+from app.models.card import Card, PriorityEnum
+from app.models.card_assignee import CardAssignee
+from app.models.card_label import CardLabel
+from app.models.sprint import Sprint
+from app.models.user import User
+from app.models.workspace import Workspace
+from app.models.workspace_label import WorkspaceLabel
+from app.models.workspace_member import RoleEnum, WorkspaceMember
+from app.services import card_export_service
+from app.services.card_export_service import CardExportService, ExportFormat
+
+
+@pytest.fixture
+async def test_user(db_session: AsyncSession) -> User:
+    """Exporting user."""
+    user = User(github_id=12345, username="alice", email="alice@example.com")
+    db_session.add(user)
+    await db_session.flush()
+    return user
+
+
+@pytest.fixture
+async def test_board(db_session: AsyncSession, test_user: User) -> Board:
+    """Board with two columns in a workspace the user belongs to."""
+    workspace = Workspace(name="Test Workspace", created_by=test_user.id)
+    db_session.add(workspace)
+    await db_session.flush()
+    db_session.add(
+        WorkspaceMember(user_id=test_user.id, workspace_id=workspace.id, role=RoleEnum.MEMBER)
+    )
+    board = Board(
+        workspace_id=workspace.id,
+        name="Test Board",
+        columns=[
+            {"id": str(uuid.uuid4()), "name": "Done", "position": 1},
+            {"id": str(uuid.uuid4()), "name": "To Do", "position": 0},
+        ],
+    )
+    db_session.add(board)
+    await db_session.flush()
+    return board
+
+
+@pytest.fixture
+async def test_sprint(db_session: AsyncSession, test_board: Board) -> Sprint:
+    """Sprint on the test board."""
+    sprint = Sprint(
+        board_id=test_board.id,
+        name="Sprint 1",
+        start_date=date(2026, 3, 2),
+        end_date=date(2026, 3, 16),
+    )
+    db_session.add(sprint)
+    await db_session.flush()
+    return sprint
+
+
+@pytest.fixture
+async def seeded_cards(
+    db_session: AsyncSession, test_board: Board, test_user: User, test_sprint: Sprint
+) -> list[Card]:
+    """Cards across both columns; the first two are in the sprint and decorated."""
+    bob = User(github_id=67890, username="bob", email="bob@example.com")
+    db_session.add(bob)
+    labels = [
+        WorkspaceLabel(workspace_id=test_board.workspace_id, name=name, color="#FF0000")
+        for name in ("frontend", "bug")
+    ]
+    db_session.add_all(labels)
+
+    todo, done = (
+        uuid.UUID(next(col["id"] for col in test_board.columns if col["name"] == name))
+        for name in ("To Do", "Done")
+    )
+    cards = [
+        Card(
+            board_id=test_board.id,
+            column_id=done if i % 2 else todo,
+            title=f"Card {i}",
+            description="Line one\nline, two" if i == 0 else None,
+            priority=PriorityEnum.HIGH if i == 0 else PriorityEnum.NONE,
+            story_points=i,
+            due_date=date(2026, 3, 10) if i == 0 else None,
+            position=i // 2,
+            sprint_id=test_sprint.id if i < 2 else None,
+            created_by=test_user.id,
+        )
+        for i in range(5)
+    ]
+    db_session.add_all(cards)
+    await db_session.flush()
+
+    db_session.add_all(
+        [
+            CardAssignee(card_id=cards[0].id, user_id=bob.id),
+            CardLabel(card_id=cards[0].id, label_id=labels[0].id),
+            CardLabel(card_id=cards[0].id, label_id=labels[1].id),
+        ]
+    )
+    await db_session.flush()
+    # Assigned later, so alice follows bob
+    db_session.add(
+        CardAssignee(
+            card_id=cards[0].id,
+            user_id=test_user.id,
+            assigned_at=cards[0].created_at + timedelta(seconds=1),
+        )
+    )
+    await db_session.commit()
+    return cards
+
+
+async def _export(
+    db_session: AsyncSession,
+    board: Board,
+    export_format: ExportFormat,
+    sprint_id: uuid.UUID | None = None,
+) -> list[bytes]:
+    service = CardExportService(db_session)
+    return [
+        chunk
+        async for chunk in service.stream_export(
+            board.id, board.columns, export_format, sprint_id=sprint_id
+        )
+    ]
+
+
+@pytest.mark.asyncio
+async def test_csv_export_rows(
+    db_session: AsyncSession, test_board: Board, seeded_cards: list[Card]
+):
+    """Test CSV export includes status, sprint, assignees and labels in board order."""
+    chunks = await _export(db_session, test_board, ExportFormat.CSV)
+    rows = list(csv.DictReader(io.StringIO(b"".join(chunks).decode())))
+
+    assert [row["title"] for row in rows] == ["Card 0", "Card 2", "Card 4", "Card 1", "Card 3"]
+    assert [row["status"] for row in rows] == ["To Do"] * 3 + ["Done"] * 2
+    first = rows[0]
+    assert first["id"] == str(seeded_cards[0].id)
+    assert first["description"] == "Line one\nline, two"
+    assert first["priority"] == "high"
+    assert first["due_date"] == "2026-03-10"
+    assert first["sprint"] == "Sprint 1"
+    assert first["assignees"] == "bob; alice"
+    assert first["labels"] == "bug; frontend"
+    assert rows[1]["sprint"] == ""
+    assert rows[1]["assignees"] == ""
+
+
+@pytest.mark.asyncio
+async def test_ndjson_sprint_export(
+    db_session: AsyncSession,
+    test_board: Board,
+    test_sprint: Sprint,
+    seeded_cards: list[Card],
+):
+    """Test NDJSON export filtered to one sprint keeps list-valued fields."""
+    chunks = await _export(db_session, test_board, ExportFormat.NDJSON, sprint_id=test_sprint.id)
+    records = [json.loads(line) for line in b"".join(chunks).splitlines()]
+
+    assert [record["title"] for record in records] == ["Card 0", "Card 1"]
+    assert records[0]["assignees"] == ["bob", "alice"]
+    assert records[0]["labels"] == ["bug", "frontend"]
+    assert records[1]["assignees"] == []
+    assert records[0]["created_at"].endswith("Z")
+
+
+@pytest.mark.asyncio
+async def test_export_streams_in_chunks(
+    db_session: AsyncSession, test_board: Board, seeded_cards: list[Card]
+):
+    """Test rows are fetched and emitted one cursor batch at a time."""
+    with patch.object(card_export_service, "EXPORT_CHUNK_SIZE", 2):
+        ndjson_chunks = await _export(db_session, test_board, ExportFormat.NDJSON)
+        csv_chunks = await _export(db_session, test_board, ExportFormat.CSV)
+
+    assert [chunk.count(b"\n") for chunk in ndjson_chunks] == [2, 2, 1]
+    assert len(csv_chunks) == 3
+    assert csv_chunks[0].startswith(b"id,title,")
+
+
+@pytest.mark.asyncio
+async def test_csv_export_of_empty_board_has_header(db_session: AsyncSession, test_board: Board):
+    """Test an empty board still exports the CSV header."""
+    chunks = await _export(db_session, test_board, ExportFormat.CSV)
+    assert b"".join(chunks).decode().strip() == ",".join(card_export_service.EXPORT_FIELDS)
+
+
+@pytest.mark.asyncio
+async def test_get_sprint_requires_membership(db_session: AsyncSession, test_sprint: Sprint):
+    """Test sprint export access is checked against the sprint's workspace."""
+    outsider = User(github_id=99999, username="mallory", email="mallory@example.com")
+    db_session.add(outsider)
+    await db_session.flush()
+
+    with pytest.raises(HTTPException) as exc_info:
+        await CardExportService(db_session).get_sprint(test_sprint.id, outsider.id)
+    assert exc_info.value.status_code == 403
+
+    with pytest.raises(HTTPException) as exc_info:
+        await CardExportService(db_session).get_sprint(uuid.uuid4(), outsider.id)
+    assert exc_info.value.status_code == 404
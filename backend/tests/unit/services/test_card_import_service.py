@@ -0,0 +1,263 @@
+"""Unit tests for CardImportService."""
+
+import uuid
+from datetime import date
+from unittest.mock import patch
+
+import pytest
+from fastapi import HTTPException
+from sqlalchemy import event, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.board import Board
+from app.models.card import Card, PriorityEnum
+from app.models.user import User
+from app.models.workspace import Workspace
+from app.models.workspace_member import RoleEnum, WorkspaceMember
+from app.services import card_import_service
+from app.services.card_import_service import CardImportService, ImportFormat
+
+
+class _ListRedis:
+    """In-memory stand-in for the Redis list commands used for staging."""
+
+    def __init__(self) -> None:
+        self.lists: dict[str, list[bytes]] = {}
+
+    async def rpush(self, key: str, value: bytes) -> None:
+        self.lists.setdefault(key, []).append(value)
+
+    async def lpop(self, key: str) -> bytes | None:
+        items = self.lists.get(key)
+        return items.pop(0) if items else None
+
+    async def expire(self, key: str, seconds: int) -> None:
+        pass
+
+    async def delete(self, key: str) -> None:
+        self.lists.pop(key, None)
+
+
+async def _chunks(body: bytes, size: int = 7):
+    """Yield a body in small chunks so lines and records straddle boundaries."""
+    for start in range(0, len(body), size):
+        yield body[start : start + size]
+
+
+@pytest.fixture
+async def test_user(db_session: AsyncSession) -> User:
+    """Importing user."""
+    user = User(github_id=12345, username="testuser", email="test@example.com")
+    db_session.add(user)
+    await db_session.flush()
+    return user
+
+
+@pytest.fixture
+async def test_board(db_session: AsyncSession, test_user: User) -> Board:
+    """Board with three columns in a workspace the user belongs to."""
+    workspace = Workspace(name="Test Workspace", created_by=test_user.id)
+    db_session.add(workspace)
+    await db_session.flush()
+    db_session.add(
+        WorkspaceMember(user_id=test_user.id, workspace_id=workspace.id, role=RoleEnum.MEMBER)
+    )
+    board = Board(
+        workspace_id=workspace.id,
+        name="Test Board",
+        columns=[
+            {"id": str(uuid.uuid4()), "name": "Done", "position": 2},
+            {"id": str(uuid.uuid4()), "name": "To Do", "position": 0},
+            {"id": str(uuid.uuid4()), "name": "In Progress", "position": 1},
+        ],
+    )
+    db_session.add(board)
+    await db_session.commit()
+    return board
+
+
+def _column_id(board: Board, name: str) -> str:
+    return next(col["id"] for col in board.columns if col["name"] == name)
+
+
+async def _validate(db_session: AsyncSession, board: Board, fmt: ImportFormat, body: bytes):
+    batches: list[list[dict]] = []
+
+    async def collect(batch: list[dict]) -> None:
+        batches.append(list(batch))
+
+    total, errors = await CardImportService(db_session).validate_stream(
+        board.columns, fmt, _chunks(body), collect
+    )
+    return total, errors, [row for batch in batches for row in batch]
+
+
+@pytest.mark.asyncio
+async def test_validate_ndjson_resolves_columns(db_session: AsyncSession, test_board: Board):
+    """Test NDJSON rows resolve columns by id or name and default to the first column."""
+    in_progress = _column_id(test_board, "In Progress")
+    body = (
+        b'{"title": "First"}\n'
+        b"\n"
+        b'{"title": "Second", "column": "done", "priority": "HIGH", "story_points": 3}\n'
+        + f'{{"title": "Third", "column": "{in_progress}", "due_date": "2026-03-01"}}'.encode()
+    )
+
+    total, errors, rows = await _validate(db_session, test_board, ImportFormat.NDJSON, body)
+
+    assert errors == []
+    assert total == 3
+    assert [row["column_id"] for row in rows] == [
+        _column_id(test_board, "To Do"),
+        _column_id(test_board, "Done"),
+        in_progress,
+    ]
+    assert rows[1]["priority"] == "high"
+    assert rows[1]["story_points"] == 3
+    assert rows[2]["due_date"] == "2026-03-01"
+
+
+@pytest.mark.asyncio
+async def test_validate_csv_handles_quoted_newlines(db_session: AsyncSession, test_board: Board):
+    """Test CSV parsing with a BOM, CRLF endings and multi-line quoted fields."""
+    body = (
+        b"\xef\xbb\xbfTitle,Description,Column,Priority\r\n"
+        b'Fix login,"Steps:\r\n1. open ""app""\r\n2. crash",In Progress,urgent\r\n'
+        b"Write docs,,,\r\n"
+    )
+
+    total, errors, rows = await _validate(db_session, test_board, ImportFormat.CSV, body)
+
+    assert errors == []
+    assert total == 2
+    assert rows[0]["description"] == 'Steps:\n1. open "app"\n2. crash'
+    assert rows[0]["column_id"] == _column_id(test_board, "In Progress")
+    assert rows[0]["priority"] == "urgent"
+    assert rows[1]["description"] is None
+    assert rows[1]["column_id"] == _column_id(test_board, "To Do")
+
+
+@pytest.mark.asyncio
+async def test_validate_reports_line_numbers(db_session: AsyncSession, test_board: Board):
+    """Test invalid rows are reported by line and nothing is staged."""
+    body = (
+        b'{"title": "ok"}\n'
+        b"not json\n"
+        b'{"title": ""}\n'
+        b'{"title": "x", "column": "Backlog"}\n'
+        b'{"title": "y", "story_points": 500}\n'
+        b"[1, 2]\n"
+    )
+
+    total, errors, rows = await _validate(db_session, test_board, ImportFormat.NDJSON, body)
+
+    assert rows == []
+    assert total == 1
+    assert [error["line"] for error in errors] == [2, 3, 4, 5, 6]
+    assert errors[0]["error"] == "Invalid JSON"
+    assert errors[2]["error"] == "Unknown column: Backlog"
+    assert errors[3]["error"].startswith("story_points:")
+
+
+@pytest.mark.asyncio
+async def test_validate_batches_and_row_limit(db_session: AsyncSession, test_board: Board):
+    """Test rows are handed over in batches and the row cap is enforced."""
+    body = b"".join(b'{"title": "card %d"}\n' % i for i in range(5))
+
+    with patch.object(card_import_service, "IMPORT_BATCH_SIZE", 2):
+        total, errors, rows = await _validate(db_session, test_board, ImportFormat.NDJSON, body)
+    assert (total, errors, len(rows)) == (5, [], 5)
+
+    with patch.object(card_import_service.settings, "CARD_IMPORT_MAX_ROWS", 3):
+        _, errors, rows = await _validate(db_session, test_board, ImportFormat.NDJSON, body)
+    assert errors == [{"line": 4, "error": "Import exceeds 3 rows"}]
+    assert rows == []
+
+
+@pytest.mark.asyncio
+async def test_stage_import_rejects_unsupported_content_type(
+    db_session: AsyncSession, test_board: Board, test_user: User
+):
+    """Test only NDJSON and CSV bodies are accepted."""
+    with pytest.raises(HTTPException) as exc_info:
+        await CardImportService(db_session).stage_import(
+            test_board.id, test_user.id, "application/json", _chunks(b"[]"), _ListRedis()
+        )
+    assert exc_info.value.status_code == 415
+
+
+@pytest.mark.asyncio
+async def test_stage_and_import_appends_to_columns(
+    db_session: AsyncSession, test_board: Board, test_user: User
+):
+    """Test staged rows are inserted in batched INSERTs after existing cards."""
+    todo = _column_id(test_board, "To Do")
+    for position in range(2):
+        db_session.add(
+            Card(
+                board_id=test_board.id,
+                column_id=uuid.UUID(todo),
+                title=f"existing {position}",
+                position=position,
+                created_by=test_user.id,
+            )
+        )
+    await db_session.commit()
+
+    body = b"title,column,priority,due_date\n" + b"".join(
+        b"imported %d,%s,low,2026-05-0%d\n" % (i, b"To Do" if i % 2 else b"Done", i % 9 + 1)
+        for i in range(5)
+    )
+    redis = _ListRedis()
+    service = CardImportService(db_session)
+
+    with patch.object(card_import_service, "IMPORT_BATCH_SIZE", 2):
+        task_id, total = await service.stage_import(
+            test_board.id, test_user.id, "text/csv; charset=utf-8", _chunks(body), redis
+        )
+    assert total == 5
+    assert len(redis.lists[card_import_service.import_staging_key(task_id)]) == 3
+
+    inserts = []
+
+    def count_inserts(conn, cursor, statement, parameters, context, executemany):
+        if "INSERT INTO cards" in statement:
+            inserts.append(statement)
+
+    progress: list[int] = []
+    event.listen(db_session.bind.sync_engine, "before_cursor_execute", count_inserts)
+    try:
+        imported = await service.import_staged(
+            test_board.id, test_user.id, task_id, redis, on_progress=progress.append
+        )
+    finally:
+        event.remove(db_session.bind.sync_engine, "before_cursor_execute", count_inserts)
+
+    assert imported == 5
+    assert progress == [2, 4, 5]
+    assert len(inserts) == 3
+    assert redis.lists == {}
+
+    result = await db_session.execute(
+        select(Card).where(Card.board_id == test_board.id).order_by(Card.column_id, Card.position)
+    )
+    cards = result.scalars().all()
+    by_column: dict[str, list[tuple[str, int]]] = {}
+    for card in cards:
+        by_column.setdefault(str(card.column_id), []).append((card.title, card.position))
+
+    assert by_column[todo] == [
+        ("existing 0", 0),
+        ("existing 1", 1),
+        ("imported 1", 2),
+        ("imported 3", 3),
+    ]
+    assert by_column[_column_id(test_board, "Done")] == [
+        ("imported 0", 0),
+        ("imported 2", 1),
+        ("imported 4", 2),
+    ]
+    imported_card = next(card for card in cards if card.title == "imported 0")
+    assert imported_card.priority == PriorityEnum.LOW
+    assert imported_card.due_date == date(2026, 5, 1)
+    assert imported_card.created_by == test_user.id
@@ -1,13 +1,17 @@
 """Unit tests for CardMovementService."""
 
+import asyncio
+import random
 import uuid
+from unittest.mock import AsyncMock, patch
 
 import pytest
 from fastapi import HTTPException
-from sqlalchemy import select
-from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import case, select, update
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
 from app.models.board import Board
+from app.models.board_column import BoardColumn
 from app.models.card import Card
 from app.models.card_activity import CardActivity
 from app.models.user import User
@@ -417,3 +421,214 @@ async def test_bulk_move_cards(
     # Card2 should remain in column A, shifted up
     assert card2.column_id == col_a_id
     assert card2.position == 0  # Shifted up from position 1
+
+
+@pytest.mark.asyncio
+async def test_move_card_rejects_stale_version(
+    movement_service: CardMovementService,
+    test_board: Board,
+    test_user: User,
+    db_session: AsyncSession,
+) -> None:
+    """Test moves bump the version and a stale If-Match fails with 412."""
+    col_id = uuid.UUID(test_board.columns[0]["id"])
+    card = Card(board_id=test_board.id, column_id=col_id, title="Card", position=0)
+    db_session.add(card)
+    await db_session.commit()
+    assert card.version == 1
+
+    moved = await movement_service.move_card(
+        card_id=card.id,
+        target_column_id=uuid.UUID(test_board.columns[1]["id"]),
+        target_position=0,
+        moved_by=test_user.id,
+        expected_version=1,
+    )
+    assert moved.version == 2
+
+    with pytest.raises(HTTPException) as exc_info:
+        await movement_service.move_card(
+            card_id=card.id,
+            target_column_id=col_id,
+            target_position=0,
+            moved_by=test_user.id,
+            expected_version=1,
+        )
+    assert exc_info.value.status_code == 412
+
+    await db_session.refresh(moved)
+    assert moved.column_id == uuid.UUID(test_board.columns[1]["id"])
+
+
+@pytest.mark.asyncio
+async def test_move_card_shifts_from_current_position(
+    movement_service: CardMovementService,
+    test_board: Board,
+    test_user: User,
+    db_session: AsyncSession,
+) -> None:
+    """Test neighbour shifts use the card's stored slot, not a stale loaded one."""
+    col_id = uuid.UUID(test_board.columns[0]["id"])
+    cards = [
+        Card(board_id=test_board.id, column_id=col_id, title=f"Card {i}", position=i)
+        for i in range(4)
+    ]
+    db_session.add_all(cards)
+    await db_session.commit()
+
+    # Another request moved Card 0 to the bottom; this session still holds position 0
+    await db_session.execute(
+        update(Card)
+        .where(Card.column_id == col_id)
+        .values(position=(Card.position + 3) % 4)
+        .execution_options(synchronize_session=False)
+    )
+    await db_session.commit()
+
+    await movement_service.move_card(
+        card_id=cards[0].id,
+        target_column_id=col_id,
+        target_position=1,
+        moved_by=test_user.id,
+    )
+
+    result = await db_session.execute(
+        select(Card.title, Card.position).where(Card.column_id == col_id).order_by(Card.position)
+    )
+    assert result.all() == [("Card 1", 0), ("Card 0", 1), ("Card 2", 2), ("Card 3", 3)]
+
+
+@pytest.mark.asyncio
+async def test_move_card_clamps_position_to_column_end(
+    movement_service: CardMovementService,
+    test_board: Board,
+    test_user: User,
+    db_session: AsyncSession,
+) -> None:
+    """Test a target past the end of the column appends instead of leaving a gap."""
+    col_a = uuid.UUID(test_board.columns[0]["id"])
+    col_b = uuid.UUID(test_board.columns[1]["id"])
+    card = Card(board_id=test_board.id, column_id=col_a, title="Card", position=0)
+    other = Card(board_id=test_board.id, column_id=col_b, title="Other", position=0)
+    db_session.add_all([card, other])
+    await db_session.commit()
+
+    moved = await movement_service.move_card(
+        card_id=card.id, target_column_id=col_b, target_position=10, moved_by=test_user.id
+    )
+
+    assert moved.position == 1
+
+
+@pytest.mark.asyncio
+async def test_concurrent_moves_keep_positions_dense_and_unique(
+    test_board: Board,
+    test_user: User,
+    db_session: AsyncSession,
+) -> None:
+    """Stress test: many concurrent moves on separate connections never corrupt positions."""
+    columns = [uuid.UUID(col["id"]) for col in test_board.columns]
+    cards = [
+        Card(
+            board_id=test_board.id,
+            column_id=columns[i % len(columns)],
+            title=f"Card {i}",
+            position=i // len(columns),
+        )
+        for i in range(18)
+    ]
+    db_session.add_all(cards)
+    await db_session.commit()
+
+    rng = random.Random(36)
+    moves = [
+        (rng.choice(cards).id, rng.choice(columns), rng.randint(0, 8)) for _ in range(60)
+    ]
+    sessions = async_sessionmaker(db_session.bind, expire_on_commit=False)
+
+    async def move(card_id: uuid.UUID, column_id: uuid.UUID, position: int) -> int:
+        async with sessions() as session:
+            try:
+                await CardMovementService(session).move_card(
+                    card_id=card_id,
+                    target_column_id=column_id,
+                    target_position=position,
+                    moved_by=test_user.id,
+                )
+            except HTTPException as e:
+                return e.status_code
+            return 200
+
+    with patch(
+        "app.services.card_movement_service.manager.broadcast_to_board",
+        new_callable=AsyncMock,
+    ):
+        statuses = await asyncio.gather(*(move(*m) for m in moves))
+
+    # A card moved to another column while a request waited for its lock gets
+    # 412; everything else (including deadlock-prone overlapping shifts) succeeds
+    assert set(statuses) <= {200, 412}
+    assert statuses.count(200) >= len(moves) // 2
+
+    result = await db_session.execute(
+        select(Card.column_id, Card.position).where(Card.board_id == test_board.id)
+    )
+    positions: dict[uuid.UUID, list[int]] = {}
+    for column_id, position in result.all():
+        positions.setdefault(column_id, []).append(position)
+
+    assert sum(len(p) for p in positions.values()) == len(cards)
+    for column_positions in positions.values():
+        assert sorted(column_positions) == list(range(len(column_positions)))
+
+
+@pytest.mark.asyncio
+async def test_move_card_enforces_target_wip_limit(
+    movement_service: CardMovementService,
+    test_board: Board,
+    test_user: User,
+    db_session: AsyncSession,
+) -> None:
+    """Test moves shift column counts and can't push a column past its WIP limit."""
+    col_a = uuid.UUID(test_board.columns[0]["id"])
+    col_b = uuid.UUID(test_board.columns[1]["id"])
+    cards = [
+        Card(board_id=test_board.id, column_id=col_a, title=f"Card {i}", position=i)
+        for i in range(2)
+    ]
+    db_session.add_all(cards)
+    await db_session.execute(
+        update(BoardColumn)
+        .where(BoardColumn.board_id == test_board.id)
+        .values(card_count=case({col_a: 2}, value=BoardColumn.id, else_=0))
+    )
+    await db_session.execute(
+        update(BoardColumn)
+        .where(BoardColumn.board_id == test_board.id, BoardColumn.id == col_b)
+        .values(wip_limit=1)
+    )
+    await db_session.commit()
+
+    await movement_service.move_card(
+        card_id=cards[0].id, target_column_id=col_b, target_position=0, moved_by=test_user.id
+    )
+    # Reordering within a full column is still allowed
+    await movement_service.move_card(
+        card_id=cards[0].id, target_column_id=col_b, target_position=0, moved_by=test_user.id
+    )
+
+    with pytest.raises(HTTPException) as exc_info:
+        await movement_service.move_card(
+            card_id=cards[1].id, target_column_id=col_b, target_position=0, moved_by=test_user.id
+        )
+    assert exc_info.value.status_code == 409
+
+    result = await db_session.execute(
+        select(BoardColumn.id, BoardColumn.card_count).where(
+            BoardColumn.board_id == test_board.id
+        )
+    )
+    counts = dict(result.all())
+    assert (counts[col_a], counts[col_b]) == (1, 1)
+    await db_session.refresh(cards[1])
+    assert (cards[1].column_id, cards[1].position) == (col_a, 0)
@@ -1,16 +1,28 @@
 """Unit tests for CardService."""
 
-from datetime import date
+from datetime import UTC, date, datetime
+import json
 import uuid
+from unittest.mock import AsyncMock, patch
+
 import pytest
 from fastapi import HTTPException
+from pydantic import ValidationError
+from sqlalchemy import event, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.api.responses import model_response
 from app.models.board import Board
+from app.models.board_column import BoardColumn
 from app.models.card import Card, PriorityEnum
+from app.models.card_activity import CardActivity
+from app.models.card_assignee import CardAssignee
+from app.models.card_label import CardLabel
 from app.models.user import User
 from app.models.workspace import Workspace
+from app.models.workspace_label import WorkspaceLabel
 from app.models.workspace_member import RoleEnum, WorkspaceMember
+from app.schemas.card import BulkCardEditRequest, CardResponse
 from app.services.card_service import CardService
 
 
@@ -109,6 +121,42 @@ async def test_create_card_at_position_zero(
     assert card1.position == 1
 
 
+@pytest.mark.asyncio
+async def test_create_card_reads_server_defaults_from_insert(
+    card_service: CardService,
+    test_board: Board,
+    test_user: User,
+    db_session: AsyncSession,
+):
+    """Test the INSERT returns server defaults, so nothing is read back after it."""
+    statements = []
+
+    def count(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    engine = db_session.bind.sync_engine
+    event.listen(engine, "before_cursor_execute", count)
+    try:
+        card = await card_service.create_card(
+            board_id=test_board.id,
+            column_id=test_board.columns[0]["id"],
+            title="Card 1",
+            user_id=test_user.id,
+        )
+    finally:
+        event.remove(engine, "before_cursor_execute", count)
+
+    insert_index = next(i for i, s in enumerate(statements) if "INSERT INTO cards" in s)
+    assert "RETURNING" in statements[insert_index]
+    # The "created" activity is written by the same statement
+    assert "INSERT INTO card_activities" in statements[insert_index]
+    assert not [s for s in statements[insert_index + 1 :] if s.startswith("SELECT")]
+    assert card.created_at is not None
+    assert card.updated_at is not None
+    assert card.version == 1
+    assert CardResponse.model_validate(card).assignees == []
+
+
 @pytest.mark.asyncio
 async def test_create_card_invalid_column(
     card_service: CardService,
@@ -310,3 +358,485 @@ async def test_get_card_not_found(
 
     assert exc_info.value.status_code == 404
     assert "Card not found" in exc_info.value.detail
+
+
+@pytest.mark.asyncio
+async def test_get_cards_by_ids_checks_each_board_once(
+    card_service: CardService,
+    test_board: Board,
+    test_user: User,
+    db_session: AsyncSession,
+):
+    """Test a multi-get answers every id in request order with a fixed number of queries."""
+    column_id = test_board.columns[0]["id"]
+    with patch("app.services.card_service.manager.broadcast_to_board", new_callable=AsyncMock):
+        first = await card_service.create_card(test_board.id, column_id, "First", test_user.id)
+        second = await card_service.create_card(test_board.id, column_id, "Second", test_user.id)
+
+    # A card in a workspace the user doesn't belong to
+    outsider = User(github_id=99999, username="outsider", email="outsider@example.com")
+    db_session.add(outsider)
+    await db_session.flush()
+    other_workspace = Workspace(name="Other", created_by=outsider.id)
+    db_session.add(other_workspace)
+    await db_session.flush()
+    other_column = str(uuid.uuid4())
+    other_board = Board(
+        workspace_id=other_workspace.id,
+        name="Other Board",
+        columns=[{"id": other_column, "name": "To Do", "position": 0}],
+    )
+    db_session.add(other_board)
+    await db_session.flush()
+    foreign = Card(
+        board_id=other_board.id, column_id=uuid.UUID(other_column), title="Hidden", position=0
+    )
+    db_session.add(foreign)
+    await db_session.commit()
+
+    missing = uuid.uuid4()
+    statements = []
+
+    def count(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    engine = db_session.bind.sync_engine
+    event.listen(engine, "before_cursor_execute", count)
+    try:
+        lookups = await card_service.get_cards_by_ids(
+            [second.id, missing, first.id, foreign.id, second.id], test_user.id
+        )
+    finally:
+        event.remove(engine, "before_cursor_execute", count)
+
+    assert [(lookup.id, lookup.status_code) for lookup in lookups] == [
+        (second.id, 200),
+        (missing, 404),
+        (first.id, 200),
+        (foreign.id, 403),
+    ]
+    assert lookups[0].card.title == "Second"
+    assert lookups[0].card.assignees == []
+    assert lookups[3].card is None
+    # Cards with membership, then assignees and labels
+    assert len(statements) == 3
+
+
+@pytest.mark.asyncio
+async def test_get_board_cards_window_returns_first_page_per_column(
+    card_service: CardService,
+    test_board: Board,
+    test_user: User,
+):
+    """Test windowed listing returns up to limit cards for every column."""
+    column1_id = test_board.columns[0]["id"]
+    column2_id = test_board.columns[1]["id"]
+
+    for i in range(5):
+        await card_service.create_card(test_board.id, column1_id, f"Card {i}", test_user.id)
+    await card_service.create_card(test_board.id, column2_id, "Only card", test_user.id)
+
+    pages = await card_service.get_board_cards_window(
+        board_id=test_board.id, user_id=test_user.id, limit=3
+    )
+
+    assert [str(p.column_id) for p in pages] == [c["id"] for c in test_board.columns]
+    assert [c.position for c in pages[0].cards] == [0, 1, 2]
+    assert pages[0].next_cursor is not None
+    assert len(pages[1].cards) == 1
+    assert pages[1].next_cursor is None
+    assert pages[2].cards == []
+    assert pages[2].next_cursor is None
+
+
+@pytest.mark.asyncio
+async def test_get_column_cards_page_follows_cursor(
+    card_service: CardService,
+    test_board: Board,
+    test_user: User,
+):
+    """Test loading more cards in a column with keyset cursors."""
+    column_id = test_board.columns[0]["id"]
+    for i in range(5):
+        await card_service.create_card(test_board.id, column_id, f"Card {i}", test_user.id)
+
+    first = await card_service.get_column_cards_page(
+        board_id=test_board.id,
+        column_id=uuid.UUID(column_id),
+        user_id=test_user.id,
+        limit=2,
+    )
+    second = await card_service.get_column_cards_page(
+        board_id=test_board.id,
+        column_id=uuid.UUID(column_id),
+        user_id=test_user.id,
+        limit=2,
+        cursor=first.next_cursor,
+    )
+    third = await card_service.get_column_cards_page(
+        board_id=test_board.id,
+        column_id=uuid.UUID(column_id),
+        user_id=test_user.id,
+        limit=2,
+        cursor=second.next_cursor,
+    )
+
+    assert [c.position for c in first.cards] == [0, 1]
+    assert [c.position for c in second.cards] == [2, 3]
+    assert [c.position for c in third.cards] == [4]
+    assert third.next_cursor is None
+
+
+@pytest.mark.asyncio
+async def test_get_column_cards_page_resolves_column_by_primary_key(
+    card_service: CardService,
+    test_workspace: Workspace,
+    test_user: User,
+    db_session: AsyncSession,
+):
+    """Test columns resolve whatever case their id is stored in, and unknown ones 404."""
+    column_id = uuid.uuid4()
+    board = Board(
+        workspace_id=test_workspace.id,
+        name="Upper",
+        columns=[{"id": str(column_id).upper(), "name": "To Do", "position": 0}],
+    )
+    db_session.add(board)
+    await db_session.flush()
+
+    page = await card_service.get_column_cards_page(board.id, column_id, test_user.id, limit=2)
+    assert page.cards == []
+
+    with pytest.raises(HTTPException) as exc_info:
+        await card_service.get_column_cards_page(board.id, uuid.uuid4(), test_user.id, limit=2)
+    assert exc_info.value.status_code == 404
+
+
+@pytest.mark.asyncio
+async def test_get_column_cards_page_invalid_cursor(
+    card_service: CardService,
+    test_board: Board,
+    test_user: User,
+):
+    """Test malformed cursor raises 400."""
+    column_id = test_board.columns[0]["id"]
+
+    with pytest.raises(HTTPException) as exc_info:
+        await card_service.get_column_cards_page(
+            board_id=test_board.id,
+            column_id=uuid.UUID(column_id),
+            user_id=test_user.id,
+            limit=2,
+            cursor="not-a-cursor",
+        )
+    assert exc_info.value.status_code == 400
+
+
+@pytest.mark.asyncio
+async def test_get_board_cards_json_matches_orm_serialization(
+    card_service: CardService,
+    db_session: AsyncSession,
+    test_board: Board,
+    test_user: User,
+    test_workspace: Workspace,
+):
+    """Test Postgres-built JSON matches CardResponse serialization."""
+    column1_id = test_board.columns[0]["id"]
+    column2_id = test_board.columns[1]["id"]
+
+    card1 = await card_service.create_card(test_board.id, column1_id, "Card 1", test_user.id)
+    await card_service.create_card(test_board.id, column1_id, "Card 2", test_user.id)
+    await card_service.create_card(test_board.id, column2_id, "Card 3", test_user.id)
+    await card_service.update_card(
+        card1.id,
+        test_user.id,
+        {"priority": PriorityEnum.HIGH, "due_date": date(2026, 1, 15), "story_points": 5},
+    )
+
+    # A whole-second timestamp, which is encoded without a fraction
+    label = WorkspaceLabel(
+        workspace_id=test_workspace.id,
+        name="bug",
+        color="#FF0000",
+        created_at=datetime(2026, 1, 1, 9, 30, tzinfo=UTC),
+    )
+    db_session.add(label)
+    await db_session.flush()
+    db_session.add(CardLabel(card_id=card1.id, label_id=label.id))
+    db_session.add(CardAssignee(card_id=card1.id, user_id=test_user.id))
+    await db_session.flush()
+    # Drop cached collections so the ORM path reloads assignees and labels
+    db_session.expunge_all()
+
+    # Encoded as the other endpoints encode it, timestamps included
+    expected = json.loads(
+        model_response(
+            [
+                CardResponse.model_validate(c)
+                for c in await card_service.get_board_cards(test_board.id, test_user.id)
+            ]
+        ).body
+    )
+    payload = await card_service.get_board_cards_json(test_board.id, test_user.id)
+    actual = json.loads(payload)
+
+    key = lambda c: (c["position"], c["id"])  # noqa: E731
+    assert sorted(actual, key=key) == sorted(expected, key=key)
+    assert actual == sorted(actual, key=key)
+    first = next(c for c in actual if c["id"] == str(card1.id))
+    assert first["priority"] == "high"
+    assert first["labels"][0]["name"] == "bug"
+    assert first["labels"][0]["created_at"] == "2026-01-01T09:30:00Z"
+    assert first["created_at"].endswith("Z")
+    assert first["assignees"][0]["id"] == str(test_user.id)
+
+    column2 = json.loads(
+        await card_service.get_board_cards_json(test_board.id, test_user.id, column_id=column2_id)
+    )
+    assert [c["title"] for c in column2] == ["Card 3"]
+
+
+@pytest.mark.asyncio
+async def test_get_board_cards_json_empty_board(
+    card_service: CardService,
+    test_board: Board,
+    test_user: User,
+):
+    """Test JSON path returns an empty array for a board without cards."""
+    payload = await card_service.get_board_cards_json(test_board.id, test_user.id)
+    assert json.loads(payload) == []
+
+
+@pytest.mark.asyncio
+async def test_bulk_update_cards_single_statement(
+    card_service: CardService,
+    db_session: AsyncSession,
+    test_board: Board,
+    test_user: User,
+):
+    """Test bulk edit applies per-row expressions and records activities in one statement."""
+    column_id = uuid.UUID(test_board.columns[0]["id"])
+    cards = [
+        Card(
+            board_id=test_board.id,
+            column_id=column_id,
+            title=f"Card {i}",
+            description="Existing" if i == 0 else None,
+            story_points=[98, None, 3][i],
+            due_date=date(2026, 1, 10) if i != 1 else None,
+            position=i,
+        )
+        for i in range(3)
+    ]
+    db_session.add_all(cards)
+    await db_session.flush()
+    card_ids = [c.id for c in cards]
+
+    data = BulkCardEditRequest(
+        card_ids=card_ids,
+        title_prefix="[Q3] ",
+        title_suffix=" (bulk)",
+        description_append="Moved to Q3",
+        priority=PriorityEnum.HIGH,
+        story_points_delta=2,
+        due_date_offset_days=7,
+    )
+
+    statements = []
+
+    def count(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    engine = db_session.bind.sync_engine
+    event.listen(engine, "before_cursor_execute", count)
+    try:
+        with patch(
+            "app.services.card_service.manager.broadcast_to_board", new_callable=AsyncMock
+        ) as broadcast:
+            updated_ids = await card_service.bulk_update_cards(data, test_user.id)
+    finally:
+        event.remove(engine, "before_cursor_execute", count)
+
+    assert sorted(updated_ids) == sorted(card_ids)
+    # One scope/permission query plus one UPDATE+INSERT statement
+    assert len([s for s in statements if "UPDATE cards" in s]) == 1
+    assert len(statements) == 2
+    broadcast.assert_awaited_once()
+    assert broadcast.await_args.kwargs["message"]["updates"]["priority"] == "high"
+
+    rows = {
+        c.id: c
+        for c in (
+            await db_session.execute(
+                select(Card).where(Card.id.in_(card_ids)).execution_options(populate_existing=True)
+            )
+        ).scalars()
+    }
+    first, second, third = (rows[cid] for cid in card_ids)
+    assert first.title == "[Q3] Card 0 (bulk)"
+    assert first.description == "Existing\n\nMoved to Q3"
+    assert second.description == "Moved to Q3"
+    assert [c.story_points for c in (first, second, third)] == [99, 2, 5]
+    assert first.due_date == date(2026, 1, 17)
+    assert second.due_date is None
+    assert all(c.priority == PriorityEnum.HIGH for c in rows.values())
+
+    activities = (
+        await db_session.execute(select(CardActivity).where(CardActivity.card_id.in_(card_ids)))
+    ).scalars().all()
+    assert len(activities) == 3
+    assert all(a.action == "updated" and a.activity_metadata["bulk"] for a in activities)
+
+
+@pytest.mark.asyncio
+async def test_bulk_update_cards_rejects_unknown_card(
+    card_service: CardService,
+    test_board: Board,
+    test_user: User,
+):
+    """Test bulk edit fails with 404 if any card does not exist."""
+    card = await card_service.create_card(
+        test_board.id, test_board.columns[0]["id"], "Card", test_user.id
+    )
+    data = BulkCardEditRequest(card_ids=[card.id, uuid.uuid4()], priority=PriorityEnum.LOW)
+
+    with pytest.raises(HTTPException) as exc_info:
+        await card_service.bulk_update_cards(data, test_user.id)
+    assert exc_info.value.status_code == 404
+
+
+def test_bulk_card_edit_request_validation():
+    """Test bulk edit request rejects empty and conflicting operations."""
+    card_ids = [uuid.uuid4()]
+    with pytest.raises(ValidationError, match="At least one edit"):
+        BulkCardEditRequest(card_ids=card_ids)
+    with pytest.raises(ValidationError, match="story_points_delta"):
+        BulkCardEditRequest(card_ids=card_ids, story_points=3, story_points_delta=1)
+    with pytest.raises(ValidationError, match="due_date_offset_days"):
+        BulkCardEditRequest(card_ids=card_ids, due_date=date(2026, 1, 1), due_date_offset_days=1)
+
+
+@pytest.mark.asyncio
+async def test_update_card_honours_expected_version(
+    card_service: CardService,
+    test_board: Board,
+    test_user: User,
+):
+    """Test updates bump the version and reject a stale If-Match with 412."""
+    card = await card_service.create_card(
+        board_id=test_board.id,
+        column_id=test_board.columns[0]["id"],
+        title="Versioned",
+        user_id=test_user.id,
+    )
+    assert card.version == 1
+
+    updated = await card_service.update_card(
+        card_id=card.id,
+        user_id=test_user.id,
+        updates={"title": "  First edit  "},
+        expected_version=1,
+    )
+    assert updated.title == "First edit"
+    assert updated.version == 2
+    assert updated.labels == []
+
+    with pytest.raises(HTTPException) as exc_info:
+        await card_service.update_card(
+            card_id=card.id,
+            user_id=test_user.id,
+            updates={"title": "Lost update"},
+            expected_version=1,
+        )
+    assert exc_info.value.status_code == 412
+
+    current = await card_service.get_card_by_id(card.id, test_user.id)
+    assert (current.title, current.version) == ("First edit", 2)
+
+
+@pytest.mark.asyncio
+async def test_update_card_checks_membership_before_version(
+    card_service: CardService,
+    test_board: Board,
+    test_user: User,
+    db_session: AsyncSession,
+):
+    """Test non-members get 403, not 412, even with a stale If-Match."""
+    card = await card_service.create_card(
+        board_id=test_board.id,
+        column_id=test_board.columns[0]["id"],
+        title="Private",
+        user_id=test_user.id,
+    )
+    outsider = User(github_id=67890, username="outsider", email="outsider@example.com")
+    db_session.add(outsider)
+    await db_session.flush()
+
+    with pytest.raises(HTTPException) as exc_info:
+        await card_service.update_card(
+            card_id=card.id, user_id=outsider.id, updates={"title": "x"}, expected_version=7
+        )
+    assert exc_info.value.status_code == 403
+
+
+@pytest.mark.asyncio
+async def test_delete_card_rejects_stale_version(
+    card_service: CardService,
+    test_board: Board,
+    test_user: User,
+    db_session: AsyncSession,
+):
+    """Test a stale If-Match leaves the card in place."""
+    card = await card_service.create_card(
+        board_id=test_board.id,
+        column_id=test_board.columns[0]["id"],
+        title="Keep me",
+        user_id=test_user.id,
+    )
+    await card_service.update_card(card.id, test_user.id, {"title": "Edited"})
+
+    with pytest.raises(HTTPException) as exc_info:
+        await card_service.delete_card(card.id, test_user.id, expected_version=1)
+    assert exc_info.value.status_code == 412
+    assert await db_session.get(Card, card.id) is not None
+
+    await card_service.delete_card(card.id, test_user.id, expected_version=2)
+    result = await db_session.execute(select(Card).where(Card.id == card.id))
+    assert result.scalar_one_or_none() is None
+
+
+@pytest.mark.asyncio
+async def test_card_writes_maintain_column_count_and_wip_limit(
+    card_service: CardService,
+    test_board: Board,
+    test_user: User,
+    db_session: AsyncSession,
+):
+    """Test creates and deletes keep the column's count and respect its WIP limit."""
+    column_id = uuid.UUID(test_board.columns[0]["id"])
+    await db_session.execute(
+        update(BoardColumn)
+        .where(BoardColumn.board_id == test_board.id, BoardColumn.id == column_id)
+        .values(wip_limit=1)
+    )
+
+    async def card_count() -> int:
+        return await db_session.scalar(
+            select(BoardColumn.card_count).where(
+                BoardColumn.board_id == test_board.id, BoardColumn.id == column_id
+            )
+        )
+
+    card = await card_service.create_card(test_board.id, column_id, "First", test_user.id)
+    assert await card_count() == 1
+
+    with pytest.raises(HTTPException) as exc_info:
+        await card_service.create_card(test_board.id, column_id, "Second", test_user.id)
+    assert exc_info.value.status_code == 409
+    assert "WIP limit" in exc_info.value.detail
+    assert await card_count() == 1
+
+    await card_service.delete_card(card.id, test_user.id)
+    assert await card_count() == 0
+    await card_service.create_card(test_board.id, column_id, "Second", test_user.id)
+    assert await card_count() == 1
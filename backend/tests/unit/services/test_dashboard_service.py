@@ -0,0 +1,91 @@
+"""Unit tests for DashboardService."""
+
+import uuid
+
+import pytest
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.board import Board
+from app.models.user import User
+from app.models.workspace import Workspace
+from app.models.workspace_member import RoleEnum, WorkspaceMember
+from app.services.board_service import template_columns
+from app.services.card_service import CardService
+from app.services.dashboard_service import DashboardService
+
+
+@pytest.fixture
+async def test_user(db_session: AsyncSession) -> User:
+    """User viewing the dashboard."""
+    user = User(github_id=12345, username="testuser", email="test@example.com")
+    db_session.add(user)
+    await db_session.flush()
+    return user
+
+
+async def _add_workspace(db_session: AsyncSession, user: User, name: str, boards: int) -> Workspace:
+    """Add a workspace the user administers, with kanban boards."""
+    workspace = Workspace(name=name, created_by=user.id)
+    db_session.add(workspace)
+    await db_session.flush()
+    db_session.add(WorkspaceMember(user_id=user.id, workspace_id=workspace.id, role=RoleEnum.ADMIN))
+    for i in range(boards):
+        db_session.add(
+            Board(workspace_id=workspace.id, name=f"Board {i}", columns=template_columns("kanban"))
+        )
+    await db_session.commit()
+    return workspace
+
+
+@pytest.mark.asyncio
+async def test_dashboard_aggregates_counts_and_caches_them(
+    db_session: AsyncSession, test_user: User
+):
+    """Test one grouped query fills every workspace and writes refresh the counts."""
+    await _add_workspace(db_session, test_user, "Busy", boards=2)
+    await _add_workspace(db_session, test_user, "Empty", boards=0)
+    statements = []
+
+    def count(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    engine = db_session.bind.sync_engine
+    event.listen(engine, "before_cursor_execute", count)
+    try:
+        first = await DashboardService(db_session).get_dashboard(test_user.id)
+        second = await DashboardService(db_session).get_dashboard(test_user.id)
+    finally:
+        event.remove(engine, "before_cursor_execute", count)
+
+    # Then: Memberships are read each time, counts once by a single GROUP BY
+    assert len([s for s in statements if "GROUP BY" in s]) == 1
+    assert len(statements) == 3
+    assert first == second
+    summaries = {w["name"]: w for w in first}
+    assert summaries["Busy"]["board_count"] == 2
+    assert summaries["Busy"]["member_count"] == 1
+    assert summaries["Busy"]["last_activity_at"] is None
+    assert summaries["Empty"]["boards"] == []
+    busy_board = summaries["Busy"]["boards"][0]
+    assert [c["name"] for c in busy_board["columns"]] == [
+        "To Do",
+        "In Progress",
+        "In Review",
+        "Done",
+    ]
+
+    # When: A card is created
+    board = await db_session.get(Board, uuid.UUID(busy_board["id"]))
+    await CardService(db_session).create_card(
+        board.id, board.columns[1]["id"], "Card", test_user.id
+    )
+
+    # Then: The write invalidated the summary
+    summaries = {
+        w["name"]: w for w in await DashboardService(db_session).get_dashboard(test_user.id)
+    }
+    busy_board = next(b for b in summaries["Busy"]["boards"] if b["id"] == str(board.id))
+    assert busy_board["card_count"] == 1
+    assert [c["card_count"] for c in busy_board["columns"]] == [0, 1, 0, 0]
+    assert summaries["Busy"]["last_activity_at"] is not None
@@ -1,7 +1,11 @@
 """Unit tests for LabelService."""
 
 import uuid
+from unittest.mock import AsyncMock, patch
+
+import orjson
 import pytest
+from sqlalchemy import event
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models.board import Board
@@ -10,6 +14,7 @@ from app.models.user import User
 from app.models.workspace import Workspace
 from app.models.workspace_label import WorkspaceLabel
 from app.models.workspace_member import RoleEnum, WorkspaceMember
+from app.repositories.label_repository import LabelRepository
 from app.schemas.label import LabelCreate, LabelUpdate
 from app.services.label_service import LabelService
 
@@ -212,6 +217,36 @@ async def test_update_label(
     assert updated.color == "#990000"
 
 
+@pytest.mark.asyncio
+async def test_label_writes_are_single_statements(
+    test_workspace: Workspace,
+    db_session: AsyncSession,
+):
+    """Test creating and updating a label each cost one RETURNING round-trip."""
+    repo = LabelRepository(db_session)
+    statements = []
+
+    def count(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    engine = db_session.bind.sync_engine
+    event.listen(engine, "before_cursor_execute", count)
+    try:
+        label = await repo.create_label(test_workspace.id, "Bug", "#FF0000")
+        assert len(statements) == 1
+        assert label.created_at is not None
+
+        updated = await repo.update_label(label.id, color="#00FF00")
+        assert len(statements) == 2
+        assert "RETURNING" in statements[1]
+        assert updated is label
+        assert (updated.name, updated.color) == ("Bug", "#00FF00")
+
+        assert await repo.update_label(uuid.uuid4(), name="Missing") is None
+    finally:
+        event.remove(engine, "before_cursor_execute", count)
+
+
 @pytest.mark.asyncio
 async def test_update_label_unauthorized(
     label_service: LabelService,
@@ -393,3 +428,205 @@ async def test_add_duplicate_label_raises_error(
             label_id=label.id,
             user_id=test_user.id,
         )
+
+
+@pytest.mark.asyncio
+async def test_add_label_to_card_is_single_statement(
+    label_service: LabelService,
+    test_workspace: Workspace,
+    test_user: User,
+    test_card: Card,
+    db_session: AsyncSession,
+):
+    """Test attaching a label costs one round-trip, including duplicates."""
+    label = WorkspaceLabel(workspace_id=test_workspace.id, name="Bug", color="#FF0000")
+    db_session.add(label)
+    await db_session.flush()
+
+    statements = []
+
+    def count(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    engine = db_session.bind.sync_engine
+    event.listen(engine, "before_cursor_execute", count)
+    try:
+        result = await label_service.add_label_to_card(test_card.id, label.id, test_user.id)
+        assert result.id == label.id
+        assert len(statements) == 1
+        assert "ON CONFLICT" in statements[0]
+
+        with pytest.raises(ValueError, match="already added"):
+            await label_service.add_label_to_card(test_card.id, label.id, test_user.id)
+        assert len(statements) == 2
+    finally:
+        event.remove(engine, "before_cursor_execute", count)
+
+
+@pytest.mark.asyncio
+async def test_add_label_to_card_from_other_workspace_raises_error(
+    label_service: LabelService,
+    test_user: User,
+    test_card: Card,
+    db_session: AsyncSession,
+):
+    """Test a label cannot be attached to a card outside its workspace."""
+    other_workspace = Workspace(name="Other Workspace", created_by=test_user.id)
+    db_session.add(other_workspace)
+    await db_session.flush()
+    db_session.add(
+        WorkspaceMember(
+            user_id=test_user.id, workspace_id=other_workspace.id, role=RoleEnum.ADMIN
+        )
+    )
+    label = WorkspaceLabel(workspace_id=other_workspace.id, name="Bug", color="#FF0000")
+    db_session.add(label)
+    await db_session.flush()
+
+    with pytest.raises(ValueError, match="Card not found"):
+        await label_service.add_label_to_card(test_card.id, label.id, test_user.id)
+
+
+@pytest.mark.asyncio
+async def test_label_writes_detach_in_flight_board_card_lists(
+    label_service: LabelService,
+    test_workspace: Workspace,
+    test_user: User,
+    test_card: Card,
+    db_session: AsyncSession,
+):
+    """Test renames invalidate the workspace's card lists, attachments only the card's board."""
+    label = WorkspaceLabel(workspace_id=test_workspace.id, name="Bug", color="#FF0000")
+    db_session.add(label)
+    await db_session.flush()
+
+    with (
+        patch(
+            "app.services.label_service.invalidate_workspace_board_cards", new=AsyncMock()
+        ) as invalidate_workspace,
+        patch("app.services.label_service.invalidate_board_cards", new=AsyncMock()) as invalidate,
+    ):
+        await label_service.update_label(label.id, LabelUpdate(name="Defect"), test_user.id)
+        await label_service.add_label_to_card(test_card.id, label.id, test_user.id)
+        assert await label_service.remove_label_from_card(test_card.id, label.id, test_user.id)
+        assert not await label_service.remove_label_from_card(
+            test_card.id, label.id, test_user.id
+        )
+
+    invalidate_workspace.assert_awaited_once_with(test_workspace.id)
+    assert invalidate.await_args_list == [((test_card.board_id,),)] * 2
+
+
+@pytest.mark.asyncio
+async def test_bulk_update_card_labels(
+    label_service: LabelService,
+    test_workspace: Workspace,
+    test_user: User,
+    test_board: Board,
+    test_card: Card,
+    db_session: AsyncSession,
+):
+    """Test adding and removing labels across cards with one broadcast per board."""
+    second_card = Card(
+        board_id=test_board.id,
+        column_id=test_card.column_id,
+        title="Second Card",
+        position=1,
+    )
+    bug = WorkspaceLabel(workspace_id=test_workspace.id, name="Bug", color="#FF0000")
+    feature = WorkspaceLabel(workspace_id=test_workspace.id, name="Feature", color="#00FF00")
+    db_session.add_all([second_card, bug, feature])
+    await db_session.flush()
+    await label_service.add_label_to_card(test_card.id, feature.id, test_user.id)
+
+    card_ids = [test_card.id, second_card.id]
+    with patch(
+        "app.services.label_service.manager.broadcast_to_board", new_callable=AsyncMock
+    ) as broadcast:
+        result = await label_service.bulk_update_card_labels(
+            card_ids, add=[bug.id], remove=[feature.id], user_id=test_user.id
+        )
+
+    assert (result.card_count, result.added, result.removed) == (2, 2, 1)
+    broadcast.assert_awaited_once()
+    message = broadcast.await_args.kwargs["message"]
+    assert message["event_type"] == "card_labels_bulk_updated"
+    assert set(message["card_ids"]) == {str(cid) for cid in card_ids}
+
+    # Re-applying the same change is a no-op
+    with patch("app.services.label_service.manager.broadcast_to_board", new_callable=AsyncMock):
+        again = await label_service.bulk_update_card_labels(
+            card_ids, add=[bug.id], remove=[feature.id], user_id=test_user.id
+        )
+    assert (again.added, again.removed) == (0, 0)
+
+
+@pytest.mark.asyncio
+async def test_bulk_update_card_labels_validation(
+    label_service: LabelService,
+    test_workspace: Workspace,
+    test_user: User,
+    other_user: User,
+    test_card: Card,
+    db_session: AsyncSession,
+):
+    """Test bulk label update rejects unknown labels/cards and non-members."""
+    label = WorkspaceLabel(workspace_id=test_workspace.id, name="Bug", color="#FF0000")
+    db_session.add(label)
+    await db_session.flush()
+
+    with pytest.raises(LookupError, match="Label not found"):
+        await label_service.bulk_update_card_labels(
+            [test_card.id], add=[uuid.uuid4()], remove=[], user_id=test_user.id
+        )
+    with pytest.raises(LookupError, match="Card not found"):
+        await label_service.bulk_update_card_labels(
+            [test_card.id, uuid.uuid4()], add=[label.id], remove=[], user_id=test_user.id
+        )
+    # Non-members learn nothing about which of the cards exist
+    with pytest.raises(PermissionError):
+        await label_service.bulk_update_card_labels(
+            [test_card.id, uuid.uuid4()], add=[label.id], remove=[], user_id=other_user.id
+        )
+
+
+@pytest.mark.asyncio
+async def test_label_catalog_is_cached_and_invalidated_by_writes(
+    label_service: LabelService,
+    test_workspace: Workspace,
+    test_user: User,
+    db_session: AsyncSession,
+):
+    """Test listings come from the cached catalog, which every label write refreshes."""
+    bug = await label_service.create_label(
+        test_workspace.id, LabelCreate(name="Bug", color="#FF0000"), test_user.id
+    )
+    labels = await label_service.get_workspace_labels(test_workspace.id, test_user.id)
+    assert [label.name for label in labels] == ["Bug"]
+
+    statements = []
+
+    def count(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    engine = db_session.bind.sync_engine
+    event.listen(engine, "before_cursor_execute", count)
+    try:
+        catalog = await label_service.get_workspace_labels_json(test_workspace.id, test_user.id)
+        assert statements == []
+        assert orjson.loads(catalog)[0]["id"] == str(bug.id)
+
+        # Label mutations resolve the label's workspace from cache too
+        await label_service.update_label(bug.id, LabelUpdate(color="#00FF00"), test_user.id)
+        assert len(statements) == 1
+        assert "UPDATE workspace_labels" in statements[0]
+    finally:
+        event.remove(engine, "before_cursor_execute", count)
+
+    labels = await label_service.get_workspace_labels(test_workspace.id, test_user.id)
+    assert [label.color for label in labels] == ["#00FF00"]
+
+    await label_service.delete_label(bug.id, test_user.id)
+    assert await label_service.get_workspace_labels(test_workspace.id, test_user.id) == []
+    with pytest.raises(ValueError, match="Label not found"):
+        await label_service.update_label(bug.id, LabelUpdate(name="Gone"), test_user.id)
@@ -0,0 +1,171 @@
+"""Unit tests for PartitionService."""
+
+import uuid
+from datetime import UTC, datetime, timedelta
+from unittest.mock import patch
+
+import pytest
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.board import Board
+from app.models.card_activity import CardActivity
+from app.models.user import User
+from app.models.workspace import Workspace
+from app.models.workspace_audit_log import AuditActionEnum, WorkspaceAuditLog
+from app.models.workspace_member import RoleEnum, WorkspaceMember
+from app.services import partition_service
+from app.services.activity_service import ActivityService
+from app.services.partition_service import PartitionService
+from app.utils.partitions import add_months, month_start, partition_name, upcoming_months
+
+
+@pytest.fixture
+async def test_user(db_session: AsyncSession) -> User:
+    """User recording history."""
+    user = User(github_id=12345, username="testuser", email="test@example.com")
+    db_session.add(user)
+    await db_session.flush()
+    return user
+
+
+async def _add_workspace(
+    db_session: AsyncSession, user: User, retention_days: int | None = None
+) -> Board:
+    """Add a workspace the user belongs to, returning its only board."""
+    workspace = Workspace(name="Workspace", created_by=user.id, retention_days=retention_days)
+    db_session.add(workspace)
+    await db_session.flush()
+    db_session.add(WorkspaceMember(user_id=user.id, workspace_id=workspace.id, role=RoleEnum.ADMIN))
+    board = Board(workspace_id=workspace.id, name="Board", columns=[])
+    db_session.add(board)
+    await db_session.flush()
+    return board
+
+
+def _add_history(db_session: AsyncSession, board: Board, user: User, created_at: datetime) -> None:
+    """Add one activity and one audit entry at the given time."""
+    db_session.add(
+        CardActivity(
+            board_id=board.id,
+            workspace_id=board.workspace_id,
+            user_id=user.id,
+            action="created",
+            activity_metadata={},
+            created_at=created_at,
+        )
+    )
+    db_session.add(
+        WorkspaceAuditLog(
+            workspace_id=board.workspace_id,
+            actor_id=user.id,
+            action=AuditActionEnum.MEMBER_REMOVED,
+            resource_type="member",
+            resource_id=uuid.uuid4(),
+            created_at=created_at,
+        )
+    )
+
+
+async def _count(db_session: AsyncSession, model: type, workspace_id: uuid.UUID) -> int:
+    return await db_session.scalar(
+        select(func.count()).select_from(model).where(model.workspace_id == workspace_id)
+    )
+
+
+@pytest.mark.asyncio
+async def test_ensure_partitions_creates_missing_months_ahead(db_session: AsyncSession):
+    """Test partitions exist for the coming months and only missing ones are created."""
+    service = PartitionService(db_session)
+    months = upcoming_months()
+    for table in ("card_activities", "workspace_audit_logs"):
+        assert set(months) <= set((await service.list_partitions(table)).values())
+
+    later = add_months(months[0], 2)
+    created = await service.ensure_partitions(today=later)
+
+    expected = [add_months(months[-1], 1), add_months(months[-1], 2)]
+    assert created == [
+        partition_name(table, month)
+        for table in ("card_activities", "workspace_audit_logs")
+        for month in expected
+    ]
+    assert await service.ensure_partitions(today=later) == []
+
+
+@pytest.mark.asyncio
+async def test_rows_without_a_partition_land_in_default_and_are_split_out(
+    db_session: AsyncSession, test_user: User
+):
+    """Test inserts succeed for months nobody created, and maintenance moves them out."""
+    board = await _add_workspace(db_session, test_user)
+    service = PartitionService(db_session)
+    late = datetime.combine(add_months(upcoming_months()[-1], 2), datetime.min.time(), UTC)
+    _add_history(db_session, board, test_user, late)
+    await db_session.commit()
+    assert await service.default_partition_months("card_activities") == [late.date()]
+
+    created = await service.ensure_partitions()
+
+    assert created == [
+        partition_name(table, late.date()) for table in ("card_activities", "workspace_audit_logs")
+    ]
+    for table in ("card_activities", "workspace_audit_logs"):
+        assert await service.default_partition_months(table) == []
+        assert late.date() in (await service.list_partitions(table)).values()
+    assert await _count(db_session, CardActivity, board.workspace_id) == 1
+    assert await _count(db_session, WorkspaceAuditLog, board.workspace_id) == 1
+
+
+@pytest.mark.asyncio
+async def test_retention_drops_expired_partitions(db_session: AsyncSession, test_user: User):
+    """Test months past every workspace's retention are detached and dropped whole."""
+    board = await _add_workspace(db_session, test_user)
+    service = PartitionService(db_session)
+    old = datetime.now(UTC) - timedelta(days=500)
+    for table in ("card_activities", "workspace_audit_logs"):
+        await service.create_partition(table, month_start(old))
+    _add_history(db_session, board, test_user, old)
+    _add_history(db_session, board, test_user, datetime.now(UTC))
+    await db_session.commit()
+
+    with patch.object(partition_service.settings, "HISTORY_RETENTION_DAYS", 400):
+        stats = await service.apply_retention()
+
+    assert stats == {"partitions_dropped": 2, "rows_deleted": 0}
+    assert month_start(old) not in (await service.list_partitions("card_activities")).values()
+    assert await _count(db_session, CardActivity, board.workspace_id) == 1
+    assert await _count(db_session, WorkspaceAuditLog, board.workspace_id) == 1
+
+
+@pytest.mark.asyncio
+async def test_shorter_workspace_retention_deletes_rows_and_hides_them(
+    db_session: AsyncSession, test_user: User
+):
+    """Test a workspace keeping less history loses its old rows while others keep theirs."""
+    short = await _add_workspace(db_session, test_user, retention_days=30)
+    default = await _add_workspace(db_session, test_user)
+    service = PartitionService(db_session)
+    old = datetime.now(UTC) - timedelta(days=60)
+    for table in ("card_activities", "workspace_audit_logs"):
+        await service.create_partition(table, month_start(old))
+    for board in (short, default):
+        _add_history(db_session, board, test_user, old)
+        _add_history(db_session, board, test_user, datetime.now(UTC))
+    await db_session.commit()
+
+    # Expired rows are filtered from reads before cleanup runs
+    page = await ActivityService(db_session).get_workspace_activity(
+        short.workspace_id, test_user.id, limit=10
+    )
+    assert len(page.activities) == 1
+
+    with patch.object(partition_service.settings, "HISTORY_RETENTION_DAYS", 365):
+        stats = await service.apply_retention()
+
+    assert stats == {"partitions_dropped": 0, "rows_deleted": 2}
+    assert await _count(db_session, CardActivity, short.workspace_id) == 1
+    assert await _count(db_session, WorkspaceAuditLog, short.workspace_id) == 1
+    assert await _count(db_session, CardActivity, default.workspace_id) == 2
+    assert await _count(db_session, WorkspaceAuditLog, default.workspace_id) == 2
+
@@ -0,0 +1,171 @@
+"""Unit tests for PositionRepairService."""
+
+import uuid
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.board import Board
+from app.models.card import Card
+from app.models.dirty_column import DirtyColumn
+from app.models.user import User
+from app.models.workspace import Workspace
+from app.models.workspace_member import RoleEnum, WorkspaceMember
+from app.services.card_movement_service import CardMovementService
+from app.services.position_repair_service import PositionRepairService, mark_columns_dirty
+
+
+@pytest.fixture
+async def test_user(db_session: AsyncSession) -> User:
+    """Test user owning the cards."""
+    user = User(github_id=12345, username="testuser", email="test@example.com")
+    db_session.add(user)
+    await db_session.flush()
+    return user
+
+
+@pytest.fixture
+async def test_board(db_session: AsyncSession, test_user: User) -> Board:
+    """Board with three columns in a workspace the user belongs to."""
+    workspace = Workspace(name="Test Workspace", created_by=test_user.id)
+    db_session.add(workspace)
+    await db_session.flush()
+    db_session.add(
+        WorkspaceMember(user_id=test_user.id, workspace_id=workspace.id, role=RoleEnum.MEMBER)
+    )
+    board = Board(
+        workspace_id=workspace.id,
+        name="Test Board",
+        columns=[
+            {"id": str(uuid.uuid4()), "name": "To Do", "position": 0},
+            {"id": str(uuid.uuid4()), "name": "In Progress", "position": 1},
+            {"id": str(uuid.uuid4()), "name": "Done", "position": 2},
+        ],
+    )
+    db_session.add(board)
+    await db_session.flush()
+    return board
+
+
+def _column(board: Board, index: int) -> uuid.UUID:
+    return uuid.UUID(board.columns[index]["id"])
+
+
+async def _add_cards(
+    db_session: AsyncSession, board: Board, user: User, index: int, positions: list[int]
+) -> list[Card]:
+    """Add cards to the index-th column with ids increasing in list order."""
+    cards = [
+        Card(
+            id=uuid.UUID(int=100 * index + i + 1),
+            board_id=board.id,
+            column_id=_column(board, index),
+            title=f"card {i}",
+            position=position,
+            created_by=user.id,
+        )
+        for i, position in enumerate(positions)
+    ]
+    db_session.add_all(cards)
+    await db_session.flush()
+    return cards
+
+
+async def _positions(db_session: AsyncSession, column_id: uuid.UUID) -> list[tuple[str, int]]:
+    result = await db_session.execute(
+        select(Card.title, Card.position)
+        .where(Card.column_id == column_id)
+        .order_by(Card.position, Card.id)
+        .execution_options(populate_existing=True)
+    )
+    return [tuple(row) for row in result]
+
+
+@pytest.mark.asyncio
+async def test_repair_renumbers_only_dirty_columns(
+    db_session: AsyncSession, test_board: Board, test_user: User
+):
+    """Test gaps and duplicates are closed in dirty columns and other columns are not scanned."""
+    todo, in_progress, done = (_column(test_board, i) for i in range(3))
+    # Gap after 0 and a duplicate at 4; ties break by card id
+    await _add_cards(db_session, test_board, test_user, 0, [0, 4, 2, 4])
+    await _add_cards(db_session, test_board, test_user, 1, [0, 1, 2])
+    await _add_cards(db_session, test_board, test_user, 2, [3, 3])
+    await mark_columns_dirty(db_session, test_board.id, [todo, in_progress])
+    await db_session.commit()
+
+    with patch(
+        "app.services.position_repair_service.manager.broadcast_to_board",
+        new_callable=AsyncMock,
+    ) as mock_broadcast:
+        stats = await PositionRepairService(db_session).repair_dirty_columns()
+
+    assert stats == {"columns_checked": 2, "columns_repaired": 1, "cards_renumbered": 3}
+    assert await _positions(db_session, todo) == [
+        ("card 0", 0),
+        ("card 2", 1),
+        ("card 1", 2),
+        ("card 3", 3),
+    ]
+    assert await _positions(db_session, in_progress) == [("card 0", 0), ("card 1", 1), ("card 2", 2)]
+    # Not on the dirty list, so left alone
+    assert await _positions(db_session, done) == [("card 0", 3), ("card 1", 3)]
+    assert (await db_session.execute(select(DirtyColumn))).first() is None
+
+    mock_broadcast.assert_awaited_once()
+    message = mock_broadcast.call_args.kwargs["message"]
+    assert message["event_type"] == "cards_reordered"
+    assert message["column_ids"] == [str(todo)]
+
+
+@pytest.mark.asyncio
+async def test_repair_respects_batch_limit(
+    db_session: AsyncSession, test_board: Board, test_user: User
+):
+    """Test a run drains at most the requested number of columns, oldest first."""
+    for index in range(3):
+        await _add_cards(db_session, test_board, test_user, index, [1])
+        await mark_columns_dirty(db_session, test_board.id, [_column(test_board, index)])
+        await db_session.commit()
+
+    with patch(
+        "app.services.position_repair_service.manager.broadcast_to_board",
+        new_callable=AsyncMock,
+    ):
+        stats = await PositionRepairService(db_session).repair_dirty_columns(limit=2)
+
+    assert stats["columns_repaired"] == 2
+    remaining = (await db_session.execute(select(DirtyColumn.column_id))).scalars().all()
+    assert remaining == [_column(test_board, 2)]
+
+
+@pytest.mark.asyncio
+async def test_move_marks_columns_and_clean_columns_are_untouched(
+    db_session: AsyncSession, test_board: Board, test_user: User
+):
+    """Test moves queue both columns and consistent columns are left unchanged."""
+    todo, in_progress = _column(test_board, 0), _column(test_board, 1)
+    cards = await _add_cards(db_session, test_board, test_user, 0, [0, 1])
+    await db_session.commit()
+
+    with patch(
+        "app.services.card_movement_service.manager.broadcast_to_board",
+        new_callable=AsyncMock,
+    ):
+        await CardMovementService(db_session).move_card(cards[0].id, in_progress, 0, test_user.id)
+
+    dirty = (await db_session.execute(select(DirtyColumn.column_id))).scalars().all()
+    assert set(dirty) == {todo, in_progress}
+
+    with patch(
+        "app.services.position_repair_service.manager.broadcast_to_board",
+        new_callable=AsyncMock,
+    ) as mock_broadcast:
+        stats = await PositionRepairService(db_session).repair_dirty_columns()
+
+    assert stats == {"columns_checked": 2, "columns_repaired": 0, "cards_renumbered": 0}
+    assert await _positions(db_session, todo) == [("card 1", 0)]
+    assert await _positions(db_session, in_progress) == [("card 0", 0)]
+    mock_broadcast.assert_not_awaited()
@@ -0,0 +1,165 @@
+"""Unit tests for PurgeService."""
+
+import uuid
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from sqlalchemy import event, func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.board import Board
+from app.models.card import Card
+from app.models.card_activity import CardActivity
+from app.models.card_assignee import CardAssignee
+from app.models.user import User
+from app.models.workspace import Workspace
+from app.models.workspace_audit_log import AuditActionEnum, WorkspaceAuditLog
+from app.models.workspace_member import RoleEnum, WorkspaceMember
+from app.services import purge_service
+from app.services.board_service import BoardService
+from app.services.purge_service import PurgeService
+from app.services.workspace_service import WorkspaceService
+
+
+@pytest.fixture
+async def test_admin(db_session: AsyncSession) -> User:
+    """Workspace admin."""
+    user = User(github_id=12345, username="admin", email="admin@example.com")
+    db_session.add(user)
+    await db_session.flush()
+    return user
+
+
+@pytest.fixture
+async def test_workspace(db_session: AsyncSession, test_admin: User) -> Workspace:
+    """Workspace administered by test_admin."""
+    workspace = Workspace(name="Test Workspace", created_by=test_admin.id)
+    db_session.add(workspace)
+    await db_session.flush()
+    db_session.add(
+        WorkspaceMember(user_id=test_admin.id, workspace_id=workspace.id, role=RoleEnum.ADMIN)
+    )
+    await db_session.flush()
+    return workspace
+
+
+async def _add_board(
+    db_session: AsyncSession, workspace: Workspace, user: User, card_count: int
+) -> Board:
+    """Add a board whose cards each have an activity and an assignee."""
+    column_id = uuid.uuid4()
+    board = Board(
+        workspace_id=workspace.id,
+        name="Board",
+        columns=[{"id": str(column_id), "name": "To Do", "position": 0}],
+    )
+    db_session.add(board)
+    await db_session.flush()
+    cards = [
+        Card(
+            board_id=board.id,
+            column_id=column_id,
+            title=f"card {i}",
+            position=i,
+            created_by=user.id,
+        )
+        for i in range(card_count)
+    ]
+    db_session.add_all(cards)
+    await db_session.flush()
+    for card in cards:
+        db_session.add(
+            CardActivity(
+                card_id=card.id,
+                board_id=board.id,
+                workspace_id=workspace.id,
+                user_id=user.id,
+                action="created",
+            )
+        )
+        db_session.add(CardAssignee(card_id=card.id, user_id=user.id))
+    await db_session.commit()
+    return board
+
+
+async def _count(db_session: AsyncSession, model: type) -> int:
+    return await db_session.scalar(select(func.count()).select_from(model))
+
+
+@pytest.mark.asyncio
+async def test_purge_board_deletes_in_chunks(
+    db_session: AsyncSession, test_workspace: Workspace, test_admin: User
+):
+    """Test a soft-deleted board is purged chunk by chunk, leaving other boards alone."""
+    board = await _add_board(db_session, test_workspace, test_admin, card_count=5)
+    other = await _add_board(db_session, test_workspace, test_admin, card_count=2)
+    await BoardService(db_session).delete_board(board.id, test_admin.id)
+
+    deletes = []
+
+    def count_deletes(conn, cursor, statement, parameters, context, executemany):
+        if statement.startswith("DELETE"):
+            deletes.append(statement.split()[2])
+
+    event.listen(db_session.bind.sync_engine, "before_cursor_execute", count_deletes)
+    try:
+        with patch.object(purge_service.settings, "PURGE_CHUNK_SIZE", 2):
+            cards_deleted = await PurgeService(db_session).purge_board(board.id)
+    finally:
+        event.remove(db_session.bind.sync_engine, "before_cursor_execute", count_deletes)
+
+    assert cards_deleted == 5
+    # ceil(5 / 2) chunks per table, then the board row
+    assert deletes == ["card_activities"] * 3 + ["cards"] * 3 + ["boards"]
+    assert await db_session.scalar(select(Board.id).where(Board.id == board.id)) is None
+    assert await _count(db_session, Card) == 2
+    assert await _count(db_session, CardActivity) == 2
+    assert await _count(db_session, CardAssignee) == 2
+    assert await db_session.scalar(select(Board.id).where(Board.id == other.id)) == other.id
+
+
+@pytest.mark.asyncio
+async def test_purge_board_skips_live_board(
+    db_session: AsyncSession, test_workspace: Workspace, test_admin: User
+):
+    """Test purging a board that was never soft-deleted does nothing."""
+    board = await _add_board(db_session, test_workspace, test_admin, card_count=2)
+
+    assert await PurgeService(db_session).purge_board(board.id) == 0
+    assert await _count(db_session, Card) == 2
+
+
+@pytest.mark.asyncio
+async def test_workspace_delete_hides_everything_then_sweep_purges(
+    db_session: AsyncSession, test_workspace: Workspace, test_admin: User
+):
+    """Test workspace soft delete hides its boards at once and the sweep purges it all."""
+    board = await _add_board(db_session, test_workspace, test_admin, card_count=3)
+    db_session.add(
+        WorkspaceAuditLog(
+            workspace_id=test_workspace.id,
+            actor_id=test_admin.id,
+            action=AuditActionEnum.MEMBER_REMOVED,
+            resource_type="member",
+            resource_id=uuid.uuid4(),
+        )
+    )
+    await db_session.commit()
+
+    with patch(
+        "app.services.workspace_service.manager.broadcast_to_workspace",
+        new_callable=AsyncMock,
+    ):
+        await WorkspaceService(db_session).delete_workspace(test_workspace.id, test_admin.id)
+
+    hidden = await db_session.scalar(
+        select(Board.id).where(Board.id == board.id, Board.deleted_at.is_(None))
+    )
+    assert hidden is None
+    assert await _count(db_session, Card) == 3
+
+    result = await PurgeService(db_session).purge_pending()
+
+    assert result == {"workspaces_purged": 1, "boards_purged": 0}
+    for model in (Workspace, Board, Card, CardActivity, WorkspaceAuditLog, WorkspaceMember):
+        assert await _count(db_session, model) == 0
@@ -1,14 +1,14 @@
 """Unit tests for WorkspaceService."""
 
 import pytest
-from sqlalchemy import select
+from sqlalchemy import select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 from fastapi import HTTPException
 
 from app.models.user import User
 from app.models.workspace import Workspace
 from app.models.workspace_member import RoleEnum, WorkspaceMember
-from app.services.workspace_service import WorkspaceService
+from app.services.workspace_service import WorkspaceService, invalidate_membership
 
 
 @pytest.fixture
@@ -232,15 +232,15 @@ async def test_delete_workspace_succeeds_for_admin(
         user_id=test_admin_user.id,
     )
 
-    # Then: Workspace is deleted from database
+    # Then: Workspace is soft-deleted and no longer found
     result = await db_session.execute(
-        select(Workspace).where(Workspace.id == workspace_id)
+        select(Workspace.deleted_at).where(Workspace.id == workspace_id)
     )
-    deleted_workspace = result.scalar_one_or_none()
+    assert result.scalar_one() is not None
+    assert await workspace_service.get_workspace_by_id(workspace_id) is None
+    assert await workspace_service.get_user_workspaces(test_admin_user.id) == []
 
-    assert deleted_workspace is None
-
-    # And: Membership is also deleted (cascade)
+    # And: Membership is deleted immediately
     membership_result = await db_session.execute(
         select(WorkspaceMember).where(WorkspaceMember.workspace_id == workspace_id)
     )
@@ -318,3 +318,37 @@ async def test_workspace_name_validation_strips_whitespace(
     assert workspace.name == expected_name
     assert workspace.name == workspace_name_with_whitespace.strip()
     assert workspace.name != workspace_name_with_whitespace
+
+
+@pytest.mark.asyncio
+async def test_member_roles_are_cached_until_invalidated(
+    workspace_service: WorkspaceService,
+    test_workspace_with_member: Workspace,
+    test_member_user: User,
+    db_session: AsyncSession,
+) -> None:
+    """Test roles are served from the membership cache and refreshed on invalidation."""
+    workspace_id = test_workspace_with_member.id
+    assert await workspace_service.get_member_role(workspace_id, test_member_user.id) == (
+        RoleEnum.MEMBER
+    )
+
+    # Given: The role changes without invalidating
+    await db_session.execute(
+        update(WorkspaceMember)
+        .where(WorkspaceMember.user_id == test_member_user.id)
+        .values(role=RoleEnum.ADMIN)
+    )
+
+    # Then: The cached role is served until the writer invalidates it
+    assert await workspace_service.get_member_role(workspace_id, test_member_user.id) == (
+        RoleEnum.MEMBER
+    )
+    await invalidate_membership(workspace_id, test_member_user.id)
+    assert await workspace_service.get_member_role(workspace_id, test_member_user.id) == (
+        RoleEnum.ADMIN
+    )
+
+    # And: Deleting the workspace revokes every cached membership
+    await workspace_service.delete_workspace(workspace_id, test_member_user.id)
+    assert not await workspace_service.check_workspace_member(workspace_id, test_member_user.id)
@@ -0,0 +1,19 @@
+"""Tests for the Celery app the worker and beat services run."""
+
+from app.tasks.celery_app import celery_app
+
+
+def test_beat_schedule_only_names_tasks_the_worker_registers():
+    """Test every periodic task is scheduled on the app its task is registered on."""
+    celery_app.loader.import_default_modules()
+
+    scheduled = {entry["task"] for entry in celery_app.conf.beat_schedule.values()}
+
+    assert scheduled == {
+        "app.tasks.cleanup_invitations.cleanup_expired_invitations",
+        "app.tasks.repair_positions.repair_card_positions",
+        "app.tasks.purge_deleted.purge_deleted_resources",
+        "app.tasks.reconcile_board_stats.reconcile_board_stats",
+        "app.tasks.maintain_partitions.maintain_history_partitions",
+    }
+    assert scheduled <= set(celery_app.tasks)
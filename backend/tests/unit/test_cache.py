@@ -0,0 +1,400 @@
+"""Unit tests for the two-tier cache."""
+
+import asyncio
+import uuid
+from unittest.mock import patch
+
+import pytest
+from redis.exceptions import ConnectionError as RedisConnectionError
+
+from app.core import cache as cache_module
+from app.core.cache import (
+    INVALIDATION_CHANNEL,
+    Cache,
+    InvalidationBus,
+    cache_stats,
+    cached,
+    task_redis,
+)
+
+
+class _DictRedis:
+    """In-memory stand-in for the Redis string commands the cache uses."""
+
+    def __init__(self) -> None:
+        self.values: dict[str, str] = {}
+        self.published: list[tuple[str, bytes]] = []
+
+    async def get(self, key: str) -> str | None:
+        return self.values.get(key)
+
+    async def mget(self, keys: list[str]) -> list[str | None]:
+        return [self.values.get(key) for key in keys]
+
+    async def set(self, key: str, value: bytes | str, ex: int | None = None) -> None:
+        self.values[key] = value.decode() if isinstance(value, bytes) else value
+
+    async def delete(self, *keys: str) -> None:
+        for key in keys:
+            self.values.pop(key, None)
+
+    async def incr(self, key: str) -> int:
+        self.values[key] = str(int(self.values.get(key, 0)) + 1)
+        return int(self.values[key])
+
+    async def publish(self, channel: str, message: bytes) -> int:
+        self.published.append((channel, message))
+        return 1
+
+
+class _DownRedis:
+    """Redis client whose every command fails to connect."""
+
+    def __getattr__(self, name):
+        async def fail(*args, **kwargs):
+            raise RedisConnectionError("connection refused")
+
+        return fail
+
+
+def _cache(redis, **kwargs) -> Cache:
+    return Cache(f"test-{uuid.uuid4().hex[:8]}", redis=redis, **kwargs)
+
+
+@pytest.mark.asyncio
+async def test_read_through_fills_both_tiers():
+    """Test a miss loads once, then the local tier, then Redis serve the value."""
+    redis = _DictRedis()
+    cache = _cache(redis)
+    loads = []
+
+    async def load():
+        loads.append(1)
+        return {"id": "a", "count": 1}
+
+    assert await cache.get_or_set("k", load) == {"id": "a", "count": 1}
+    assert await cache.get_or_set("k", load) == {"id": "a", "count": 1}
+    assert len(loads) == 1
+    assert cache.key_for("k", 0) in redis.values
+
+    # Another process sharing Redis starts with an empty local tier
+    other = Cache(cache.namespace, redis=redis)
+    assert await other.get_or_set("k", load) == {"id": "a", "count": 1}
+    assert len(loads) == 1
+    assert (cache.stats.misses, cache.stats.local_hits) == (1, 1)
+    assert other.stats.remote_hits == 1
+
+
+@pytest.mark.asyncio
+async def test_values_are_copies_and_none_is_cached():
+    """Test callers can't mutate cached values and a cached None is still a hit."""
+    cache = _cache(_DictRedis())
+
+    async def load_list():
+        return [1, 2]
+
+    first = await cache.get_or_set("list", load_list)
+    first.append(3)
+    assert await cache.get_or_set("list", load_list) == [1, 2]
+
+    loads = []
+
+    async def load_none():
+        loads.append(1)
+        return None
+
+    assert await cache.get_or_set("none", load_none) is None
+    assert await cache.get_or_set("none", load_none) is None
+    assert len(loads) == 1
+
+
+@pytest.mark.asyncio
+async def test_concurrent_misses_load_once():
+    """Test simultaneous misses for one key share a single load, errors included."""
+    cache = _cache(_DictRedis())
+    started = asyncio.Event()
+    release = asyncio.Event()
+    loads = []
+
+    async def slow_load():
+        loads.append(1)
+        started.set()
+        await release.wait()
+        return "value"
+
+    first = asyncio.create_task(cache.get_or_set("k", slow_load))
+    await started.wait()
+    others = [asyncio.create_task(cache.get_or_set("k", slow_load)) for _ in range(5)]
+    await asyncio.sleep(0)
+    release.set()
+
+    assert await asyncio.gather(first, *others) == ["value"] * 6
+    assert len(loads) == 1
+    assert cache.stats.coalesced == 5
+
+    started.clear()
+
+    async def failing_load():
+        started.set()
+        await asyncio.sleep(0)
+        raise ValueError("boom")
+
+    leader = asyncio.create_task(cache.get_or_set("bad", failing_load))
+    await started.wait()
+    waiter = asyncio.create_task(cache.get_or_set("bad", failing_load))
+    for task in (leader, waiter):
+        with pytest.raises(ValueError):
+            await task
+
+
+@pytest.mark.asyncio
+async def test_get_many_loads_all_misses_in_one_call():
+    """Test a multi-get serves hits from both tiers and batches the misses."""
+    redis = _DictRedis()
+    cache = _cache(redis)
+    batches = []
+
+    async def load_many(keys):
+        batches.append(keys)
+        return {key: key.upper() for key in keys if key != "gone"}
+
+    await cache.set("a", "cached")
+    assert await cache.get_many(["a", "b", "c", "gone"], load_many) == {
+        "a": "cached",
+        "b": "B",
+        "c": "C",
+        "gone": None,
+    }
+    assert batches == [["b", "c", "gone"]]
+
+    # Another process finds them all in Redis
+    other = Cache(cache.namespace, redis=redis)
+    assert (await other.get_many(["b", "gone"], load_many))["b"] == "B"
+    assert len(batches) == 1
+    assert other.stats.remote_hits == 2
+
+
+@pytest.mark.asyncio
+async def test_invalidation_by_key_and_by_version():
+    """Test invalidate drops one key and invalidate_all stales the whole namespace."""
+    redis = _DictRedis()
+    cache = _cache(redis)
+    values = {"a": 1, "b": 1}
+
+    def loader(key):
+        async def load():
+            return values[key]
+
+        return load
+
+    for key in values:
+        await cache.get_or_set(key, loader(key))
+    values.update(a=2, b=2)
+
+    await cache.invalidate("a")
+    assert await cache.get_or_set("a", loader("a")) == 2
+    assert await cache.get_or_set("b", loader("b")) == 1
+
+    values.update(a=3, b=3)
+    await cache.invalidate_all()
+    assert await cache.get_or_set("a", loader("a")) == 3
+    assert await cache.get_or_set("b", loader("b")) == 3
+    assert redis.values[cache.version_key] == "1"
+
+    # A process that cached the old version picks up the bump once its copy expires
+    other = Cache(cache.namespace, redis=redis, local_ttl=0)
+    assert await other.get_or_set("a", loader("a")) == 3
+
+
+@pytest.mark.asyncio
+async def test_load_racing_an_invalidation_is_not_stored():
+    """Test a value read before a concurrent write isn't cached after it."""
+    redis = _DictRedis()
+    cache = _cache(redis)
+    other = Cache(cache.namespace, redis=redis)
+    values = {"k": 1}
+
+    async def stale_load():
+        value = values["k"]
+        # A writer in another process commits and invalidates mid-load
+        values["k"] = 2
+        await other.invalidate("k")
+        return value
+
+    async def load():
+        return values["k"]
+
+    assert await cache.get_or_set("k", stale_load) == 1
+    assert await cache.get_or_set("k", load) == 2
+
+
+@pytest.mark.asyncio
+async def test_redis_outage_degrades_to_local_tier():
+    """Test Redis failures are counted, backed off from and served from memory."""
+    cache = _cache(_DownRedis())
+    loads = []
+
+    async def load():
+        loads.append(1)
+        return "value"
+
+    assert await cache.get_or_set("k", load) == "value"
+    assert await cache.get_or_set("k", load) == "value"
+    assert len(loads) == 1
+    # Only the first command hit the dead server; the rest waited out the back-off
+    assert cache.stats.errors == 1
+
+    await cache.invalidate_all()
+    assert await cache.get_or_set("k", load) == "value"
+    assert len(loads) == 2
+
+
+def test_task_redis_gives_each_task_run_its_own_client():
+    """Test caches use the run's client in task_redis, since each Celery run has its own loop."""
+    cache = Cache(f"test-{uuid.uuid4().hex[:8]}")
+    clients = []
+
+    class _TaskRedis(_DictRedis):
+        closed = False
+
+        async def aclose(self) -> None:
+            self.closed = True
+
+    def from_url(*args, **kwargs):
+        clients.append(_TaskRedis())
+        return clients[-1]
+
+    async def run_task():
+        async with task_redis():
+            await cache.invalidate("k")
+
+    with patch.object(cache_module.Redis, "from_url", from_url):
+        for _ in range(2):
+            loop = asyncio.new_event_loop()
+            try:
+                loop.run_until_complete(run_task())
+            finally:
+                loop.close()
+
+    assert [(len(client.published), client.closed) for client in clients] == [(1, True)] * 2
+    assert cache.redis is cache_module.redis_client
+
+
+@pytest.mark.asyncio
+async def test_local_tier_is_bounded_lru():
+    """Test the local tier evicts least recently used entries beyond its size."""
+    cache = _cache(_DownRedis(), local_maxsize=2)
+
+    async def load():
+        return "v"
+
+    for key in ("a", "b"):
+        await cache.get_or_set(key, load)
+    await cache.get_or_set("a", load)  # a is now most recent
+    await cache.get_or_set("c", load)
+
+    assert cache.local.get(cache.key_for("a", 0)) is not None
+    assert cache.local.get(cache.key_for("b", 0)) is None
+
+
+@pytest.mark.asyncio
+async def test_cached_decorator_keys_on_arguments():
+    """Test the decorator caches per argument list, ignoring self."""
+    cache = _cache(_DictRedis())
+    calls = []
+
+    class Service:
+        @cached(cache)
+        async def lookup(self, board_id: uuid.UUID, user_id: uuid.UUID) -> str:
+            calls.append((board_id, user_id))
+            return f"{board_id}/{user_id}"
+
+    board_id, user_id, other_id = uuid.uuid4(), uuid.uuid4(), uuid.uuid4()
+    assert await Service().lookup(board_id, user_id) == f"{board_id}/{user_id}"
+    assert await Service().lookup(board_id, user_id=user_id) == f"{board_id}/{user_id}"
+    assert await Service().lookup(board_id, other_id) == f"{board_id}/{other_id}"
+    assert len(calls) == 2
+    assert Service.lookup.cache is cache
+
+    await cache.invalidate(f"{board_id}:{user_id}")
+    await Service().lookup(board_id, user_id)
+    assert len(calls) == 3
+
+    with patch.object(cache_module, "_caches", {cache.namespace: cache}):
+        assert cache_stats()[cache.namespace]["misses"] == 3
+
+
+@pytest.mark.asyncio
+async def test_bus_evicts_invalidations_from_other_processes():
+    """Test invalidations published by one process evict the local tier of another."""
+    redis = _DictRedis()
+    writer = _cache(redis)
+    # Another process: a long local TTL, so only the bus can evict its entries
+    reader = Cache(writer.namespace, redis=redis, local_ttl=60)
+    bus = InvalidationBus(redis=redis)
+    values = {"a": 1, "b": 1}
+
+    def loader(key):
+        async def load():
+            return values[key]
+
+        return load
+
+    async def deliver():
+        for channel, message in redis.published:
+            assert channel == INVALIDATION_CHANNEL
+            bus.handle(message)
+        redis.published.clear()
+
+    for key in values:
+        await reader.get_or_set(key, loader(key))
+    values.update(a=2, b=2)
+
+    await writer.invalidate("a")
+    assert await reader.get_or_set("a", loader("a")) == 1
+    await deliver()
+    assert await reader.get_or_set("a", loader("a")) == 2
+    assert await reader.get_or_set("b", loader("b")) == 1
+
+    await writer.invalidate_all()
+    await deliver()
+    assert await reader.get_or_set("b", loader("b")) == 2
+
+
+@pytest.mark.asyncio
+async def test_bus_drops_local_tier_after_missed_messages():
+    """Test an epoch gap or a resync mismatch drops the whole local tier."""
+    redis = _DictRedis()
+    writer = _cache(redis)
+    reader = Cache(writer.namespace, redis=redis, local_ttl=60)
+    bus = InvalidationBus(redis=redis)
+    values = {"a": 1, "b": 1}
+
+    def loader(key):
+        async def load():
+            return values[key]
+
+        return load
+
+    await bus.resync()
+    for key in values:
+        await reader.get_or_set(key, loader(key))
+    values.update(a=2, b=2)
+
+    # Given: The message for "b" is lost, then "a" is delivered
+    await writer.invalidate("b")
+    await writer.invalidate("a")
+    bus.handle(redis.published[-1][1])
+
+    # Then: The gap in epochs evicts "b" too
+    assert await reader.get_or_set("a", loader("a")) == 2
+    assert await reader.get_or_set("b", loader("b")) == 2
+
+    # Given: A message is lost and nothing follows it
+    values["a"] = 3
+    await writer.invalidate("a")
+    assert await reader.get_or_set("a", loader("a")) == 2
+
+    # Then: The periodic resync catches up
+    await bus.resync()
+    assert await reader.get_or_set("a", loader("a")) == 3
@@ -0,0 +1,139 @@
+"""Unit tests for single-flight coalescing."""
+
+import asyncio
+import uuid
+from unittest.mock import AsyncMock, patch
+
+import orjson
+import pytest
+
+from app.core import single_flight as single_flight_module
+from app.core.cache import INVALIDATION_CHANNEL, InvalidationBus, clear_local_caches
+from app.core.single_flight import SingleFlight, single_flight_stats
+
+
+def _group() -> SingleFlight:
+    return SingleFlight(f"test-{uuid.uuid4().hex[:8]}")
+
+
+class _Gate:
+    """Computation that runs until released, counting how often it started."""
+
+    def __init__(self, result: str = "value") -> None:
+        self.result = result
+        self.started = asyncio.Event()
+        self.release = asyncio.Event()
+        self.calls = 0
+
+    async def __call__(self) -> str:
+        self.calls += 1
+        call = self.calls
+        self.started.set()
+        await self.release.wait()
+        return f"{self.result}-{call}"
+
+
+@pytest.mark.asyncio
+async def test_concurrent_calls_share_one_computation():
+    """Test identical concurrent calls get the leader's result, others run their own."""
+    group = _group()
+    gate = _Gate()
+
+    leader = asyncio.create_task(group.run("all", gate))
+    await gate.started.wait()
+    followers = [asyncio.create_task(group.run("all", gate)) for _ in range(5)]
+    other_key = asyncio.create_task(group.run("column", gate))
+    await asyncio.sleep(0)
+    gate.release.set()
+
+    assert await asyncio.gather(leader, *followers) == ["value-1"] * 6
+    assert await other_key == "value-2"
+    assert (group.stats.leads, group.stats.coalesced) == (2, 5)
+
+    # Nothing is kept: a later call computes again
+    assert await group.run("all", gate) == "value-3"
+    assert single_flight_stats()[group.name]["inflight"] == 0
+
+
+@pytest.mark.asyncio
+async def test_invalidate_detaches_computations_of_written_scopes():
+    """Test calls after invalidate() start fresh, and the invalidation is published."""
+    group = _group()
+    gate = _Gate()
+    publish = AsyncMock()
+
+    before = asyncio.create_task(group.run("all", gate, scopes=("board:1", "workspace:1")))
+    unrelated = asyncio.create_task(group.run("other", gate, scopes=("board:2",)))
+    await gate.started.wait()
+    waiter = asyncio.create_task(group.run("all", gate))
+    await asyncio.sleep(0)
+
+    with patch.object(single_flight_module, "publish_invalidation", publish):
+        # Matches either tag of the computation
+        await group.invalidate("workspace:1")
+    after = asyncio.create_task(group.run("all", gate))
+    await asyncio.sleep(0)
+    gate.release.set()
+
+    assert await before == "value-1"
+    assert await waiter == "value-1"
+    assert await unrelated == "value-2"
+    assert await after == "value-3"
+    assert group.stats.forgotten == 1
+    publish.assert_awaited_once_with(group.namespace, ["workspace:1"])
+
+
+@pytest.mark.asyncio
+async def test_bus_detaches_computations_invalidated_by_other_processes():
+    """Test invalidations published elsewhere, and bus disconnects, reach the group."""
+    group = _group()
+    gate = _Gate()
+    bus = InvalidationBus(redis=object())
+
+    first = asyncio.create_task(group.run("a", gate, scopes=("board:1",)))
+    second = asyncio.create_task(group.run("b", gate, scopes=("board:2",)))
+    await gate.started.wait()
+
+    message = {"namespace": group.namespace, "keys": ["board:1"], "epoch": None}
+    bus.handle(orjson.dumps(message))
+    assert single_flight_stats()[group.name]["inflight"] == 1
+
+    # A lost connection may have lost messages: detach everything
+    clear_local_caches()
+    assert single_flight_stats()[group.name]["inflight"] == 0
+
+    gate.release.set()
+    assert await asyncio.gather(first, second) == ["value-1", "value-2"]
+    assert INVALIDATION_CHANNEL == "cache:invalidations"
+
+
+@pytest.mark.asyncio
+async def test_errors_are_shared_and_cancelled_leaders_are_replaced():
+    """Test waiters re-raise the leader's error and retry when only the leader is cancelled."""
+    group = _group()
+    started = asyncio.Event()
+
+    async def failing():
+        started.set()
+        await asyncio.sleep(0)
+        raise ValueError("boom")
+
+    leader = asyncio.create_task(group.run("all", failing))
+    await started.wait()
+    waiter = asyncio.create_task(group.run("all", failing))
+    for task in (leader, waiter):
+        with pytest.raises(ValueError):
+            await task
+
+    gate = _Gate()
+    leader = asyncio.create_task(group.run("all", gate))
+    await gate.started.wait()
+    waiter = asyncio.create_task(group.run("all", gate))
+    await asyncio.sleep(0)
+    leader.cancel()
+    await asyncio.sleep(0)
+    gate.release.set()
+
+    with pytest.raises(asyncio.CancelledError):
+        await leader
+    assert await waiter == "value-2"